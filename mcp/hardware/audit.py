@@ -4,16 +4,47 @@ ADR-032: Phase 1 - Hardware Server
 
 Provides structured audit logging for all station operations including
 locking, connections, flashing, and other hardware interactions.
+
+Entries are stored in a SQLite database (WAL mode) indexed by station
+and time, so history queries for any station and time window are index
+lookups. log() only enqueues the entry; a background writer thread
+inserts queued entries in batches and appends them to the daily JSONL
+files. Entries older than the retention period are deleted once a day.
+The global instance writes pending entries at interpreter exit.
 """
+import atexit
 import json
 import logging
+import queue
+import sqlite3
 import threading
 import time
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+import yaml
+
+logger = logging.getLogger("helix.hardware.audit")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    station TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    result TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS audit_station_timestamp ON audit (station, timestamp);
+CREATE INDEX IF NOT EXISTS audit_timestamp ON audit (timestamp);
+"""
+
+_COLUMNS = ("timestamp", "station", "operation", "session_id", "result", "duration_ms", "details")
+
 
 @dataclass
 class AuditEntry:
@@ -30,27 +61,103 @@ class AuditEntry:
 class AuditLogger:
     """Thread-safe audit logger for station operations."""
 
-    def __init__(self, log_dir: Optional[Path] = None):
+    # Seconds between retention runs
+    COMPACT_INTERVAL_S = 24 * 3600
+
+    def __init__(
+        self,
+        log_dir: Optional[Path] = None,
+        retention_days: int = 30,
+        batch_size: int = 200,
+        jsonl: bool = True,
+    ):
         """Initialize audit logger.
 
         Args:
             log_dir: Directory for audit logs (default: ./logs/audit)
+            retention_days: Days to keep entries (0: keep forever)
+            batch_size: Maximum entries per write transaction
+            jsonl: Also append entries to daily audit-YYYY-MM-DD.jsonl files
         """
         self._lock = threading.Lock()
         self._log_dir = log_dir or Path(__file__).parent / "logs" / "audit"
-        self._log_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self._log_dir / "audit.db"
+        self.retention_days = retention_days
+        self._batch_size = batch_size
+        self._jsonl = jsonl
 
-        # Configure Python logging
-        self._logger = logging.getLogger("helix.hardware.audit")
-        self._logger.setLevel(logging.INFO)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_compact = 0.0
+        self._queue: queue.Queue[Optional[AuditEntry]] = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
 
-        # Add file handler if not already configured
-        if not self._logger.handlers:
-            handler = logging.FileHandler(self._log_dir / "audit.log")
-            handler.setFormatter(logging.Formatter(
-                "%(asctime)s - %(message)s"
-            ))
-            self._logger.addHandler(handler)
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> "AuditLogger":
+        """Create a logger from the config.yaml 'audit' section.
+
+        Args:
+            config: Dict with log_dir (relative to this directory) and
+                retention_days
+        """
+        config = config or {}
+        log_dir = None
+        if config.get("log_dir"):
+            log_dir = Path(__file__).parent / config["log_dir"]
+        return cls(log_dir=log_dir, retention_days=config.get("retention_days", 30))
+
+    def _start(self) -> None:
+        """Open the database and start the writer on first use."""
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._log_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = self._open()
+            self._writer = threading.Thread(
+                target=self._write_loop, name="audit-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open the database, importing existing JSONL files when new."""
+        is_new = not self.db_path.exists()
+        conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        if is_new:
+            self._import_jsonl(conn)
+        return conn
+
+    def _import_jsonl(self, conn: sqlite3.Connection) -> None:
+        """Import daily JSONL files written before the database existed."""
+        rows = []
+        for path in sorted(self._log_dir.glob("audit-*.jsonl")):
+            with open(path, "r") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        rows.append(self._row(AuditEntry(**json.loads(line))))
+                    except (json.JSONDecodeError, TypeError):
+                        continue
+        if rows:
+            with conn:
+                conn.executemany(self._insert_sql(), rows)
+            logger.info(f"Imported {len(rows)} audit entries from JSONL files")
+
+    @staticmethod
+    def _insert_sql() -> str:
+        return (
+            f"INSERT INTO audit ({', '.join(_COLUMNS)})"
+            f" VALUES ({', '.join('?' * len(_COLUMNS))})"
+        )
+
+    @staticmethod
+    def _row(entry: AuditEntry) -> tuple:
+        details = json.dumps(entry.details) if entry.details is not None else None
+        return (entry.timestamp, entry.station, entry.operation, entry.session_id,
+                entry.result, entry.duration_ms, details)
 
     def log(
         self,
@@ -63,6 +170,9 @@ class AuditLogger:
     ) -> AuditEntry:
         """Log a station operation.
 
+        The entry is written by the background writer; queries flush
+        pending entries first.
+
         Args:
             station: Name of the station
             operation: Operation performed (acquire, release, connect, etc.)
@@ -83,18 +193,177 @@ class AuditLogger:
             duration_ms=duration_ms,
             details=details
         )
+        self._start()
+        self._queue.put(entry)
+        if not self._writer.is_alive():
+            self._drain()
+        return entry
+
+    def _write_loop(self) -> None:
+        """Write queued entries in batches until close().
+
+        Each batch is whatever queued up while the previous one was
+        written, so bursts share one transaction without delaying
+        single entries.
+        """
+        while self._write_batch(self._queue.get()):
+            pass
+
+    def _write_batch(self, entry: Optional[AuditEntry]) -> bool:
+        """Write an entry and the entries queued behind it.
 
+        Returns:
+            False once close() asked the writer to stop
+        """
+        batch = [entry]
+        while entry is not None and len(batch) < self._batch_size:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(entry)
+
+        entries = [e for e in batch if e is not None]
+        try:
+            if entries:
+                self._write(entries)
+            if time.monotonic() - self._last_compact > self.COMPACT_INTERVAL_S:
+                self.compact()
+        except Exception as e:
+            # A bad batch (e.g. details that are not JSON) must not stop the writer
+            logger.warning(f"Could not write {len(entries)} audit entries: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+        return batch[-1] is not None
+
+    def _drain(self) -> None:
+        """Write all queued entries in the calling thread."""
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._write_batch(entry)
+
+    def _write(self, entries: list[AuditEntry]) -> None:
+        """Insert a batch and append it to the daily JSONL files."""
         with self._lock:
-            # Log to file
-            self._logger.info(json.dumps(asdict(entry)))
+            with self._conn:
+                self._conn.executemany(self._insert_sql(), [self._row(e) for e in entries])
 
-            # Also write to daily log file
-            date_str = datetime.utcnow().strftime("%Y-%m-%d")
-            daily_file = self._log_dir / f"audit-{date_str}.jsonl"
-            with open(daily_file, "a") as f:
-                f.write(json.dumps(asdict(entry)) + "\n")
+        if not self._jsonl:
+            return
+        by_day: dict[str, list[str]] = {}
+        for e in entries:
+            by_day.setdefault(e.timestamp[:10], []).append(json.dumps(asdict(e)) + "\n")
+        for day, lines in by_day.items():
+            with open(self._log_dir / f"audit-{day}.jsonl", "a") as f:
+                f.writelines(lines)
 
-        return entry
+    def flush(self) -> None:
+        """Wait until all logged entries are written."""
+        self._start()
+        if self._writer.is_alive():
+            self._queue.join()
+        else:
+            self._drain()
+
+    def close(self) -> None:
+        """Write pending entries and stop the writer.
+
+        The logger can still be used afterwards; it reopens the database
+        on the next call.
+        """
+        if self._writer is None:
+            return
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        else:
+            self._drain()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+            self._writer = None
+
+    def compact(self) -> int:
+        """Delete entries and JSONL files older than the retention period.
+
+        Returns:
+            Number of deleted entries
+        """
+        self._start()
+        self._last_compact = time.monotonic()
+        if self.retention_days <= 0:
+            return 0
+        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        cutoff_ts = cutoff.isoformat() + "Z"
+
+        with self._lock:
+            with self._conn:
+                deleted = self._conn.execute(
+                    "DELETE FROM audit WHERE timestamp < ?", (cutoff_ts,)
+                ).rowcount
+            if deleted:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        cutoff_day = cutoff.strftime("%Y-%m-%d")
+        for path in self._log_dir.glob("audit-*.jsonl"):
+            if path.stem[len("audit-"):] < cutoff_day:
+                path.unlink(missing_ok=True)
+        return deleted
+
+    def query(
+        self,
+        station: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        operation: Optional[str] = None,
+        limit: int = 100,
+    ) -> list[dict]:
+        """Query audit entries, newest first.
+
+        Args:
+            station: Only this station
+            since: Earliest timestamp (ISO 8601, e.g. '2024-01-15' or
+                '2024-01-15T10:00:00')
+            until: Latest timestamp (ISO 8601, exclusive)
+            operation: Only this operation
+            limit: Maximum number of entries
+
+        Returns:
+            List of audit entries (newest first)
+        """
+        self.flush()
+
+        where, params = [], []
+        for column, value in (("station", station), ("operation", operation)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            where.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            where.append("timestamp < ?")
+            params.append(until)
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM audit"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        entries = []
+        for row in rows:
+            entry = dict(row)
+            entry["details"] = json.loads(entry["details"]) if entry["details"] else None
+            entries.append(entry)
+        return entries
 
     def get_recent(self, limit: int = 100) -> list[dict]:
         """Get recent audit entries.
@@ -105,39 +374,39 @@ class AuditLogger:
         Returns:
             List of recent audit entries (newest first)
         """
-        entries = []
+        return self.query(limit=limit)
 
-        with self._lock:
-            # Read from today's log file
-            date_str = datetime.utcnow().strftime("%Y-%m-%d")
-            daily_file = self._log_dir / f"audit-{date_str}.jsonl"
-
-            if daily_file.exists():
-                with open(daily_file, "r") as f:
-                    for line in f:
-                        if line.strip():
-                            try:
-                                entries.append(json.loads(line))
-                            except json.JSONDecodeError:
-                                continue
-
-        # Return newest first, limited
-        return list(reversed(entries[-limit:]))
-
-    def get_station_history(self, station: str, limit: int = 50) -> list[dict]:
+    def get_station_history(
+        self,
+        station: str,
+        limit: int = 50,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> list[dict]:
         """Get audit history for a specific station.
 
         Args:
             station: Station name to filter by
             limit: Maximum number of entries
+            since: Earliest timestamp (ISO 8601)
+            until: Latest timestamp (ISO 8601, exclusive)
 
         Returns:
-            List of audit entries for the station
+            List of audit entries for the station (newest first)
         """
-        all_entries = self.get_recent(limit=1000)
-        station_entries = [e for e in all_entries if e.get("station") == station]
-        return station_entries[:limit]
+        return self.query(station=station, since=since, until=until, limit=limit)
+
+
+def _load_audit_config() -> dict:
+    """Read the 'audit' section of config.yaml."""
+    try:
+        with open(Path(__file__).parent / "config.yaml") as f:
+            return (yaml.safe_load(f) or {}).get("audit") or {}
+    except OSError:
+        return {}
 
 
 # Global audit logger instance
-audit = AuditLogger()
+audit = AuditLogger.from_config(_load_audit_config())
+# The writer is a daemon thread: write what is still queued before exiting
+atexit.register(audit.close)
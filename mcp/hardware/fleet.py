@@ -0,0 +1,147 @@
+"""Fleet operations across several hardware stations.
+
+ADR-032: Phase 1 - Hardware Server
+
+Runs one per-station operation on many stations concurrently (bounded
+by max_parallel) and summarizes the outcome as one compact table, so
+"flash all stations" is one tool call instead of one per station.
+
+Stations locked by another session are skipped; unlocked stations and
+stations held by the calling session are operated on, like the
+single-station tools do. Unlocked stations are locked for the calling
+session while the operation runs, so a session that locks a queued
+station in the meantime is not interfered with.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, Optional
+
+from locking import StationLocker
+
+# (result, message) of one station, e.g. ("success", "PC=0x08000100")
+StationOperation = Callable[[str], Awaitable[tuple[str, str]]]
+
+
+@dataclass
+class FleetResult:
+    """Outcome of a fleet operation on one station."""
+    station: str
+    result: str
+    message: str = ""
+    duration_ms: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.result in ("success", "skipped_identical")
+
+
+def select_stations(
+    available: Iterable[str],
+    requested: Optional[list[str]],
+    locker: StationLocker,
+    session_id: str,
+) -> tuple[list[str], list[FleetResult]]:
+    """Pick the stations a fleet operation may touch.
+
+    Args:
+        available: Configured station names
+        requested: Requested stations (None: all configured stations)
+        locker: Station locker
+        session_id: Calling session
+
+    Returns:
+        (stations to run on, skipped results for unknown stations and
+        stations locked by other sessions)
+    """
+    available = list(available)
+    runnable, skipped = [], []
+    for station in dict.fromkeys(requested or available):
+        if station not in available:
+            skipped.append(FleetResult(station, "unknown", "not in config.yaml"))
+            continue
+        lock = locker.is_locked(station)
+        if lock and lock.session_id != session_id:
+            skipped.append(FleetResult(station, "skipped", f"locked by {lock.session_id}"))
+            continue
+        runnable.append(station)
+    return runnable, skipped
+
+
+def hold_lock(
+    operation: StationOperation,
+    locker: StationLocker,
+    session_id: str,
+    timeout: int = 300,
+) -> StationOperation:
+    """Wrap an operation to run with the station locked for a session.
+
+    Stations the session already holds keep their lock. Other stations
+    are locked just before the operation and released after it; if
+    another session took the station since select_stations(), it is
+    skipped.
+
+    Args:
+        operation: Per-station operation
+        locker: Station locker
+        session_id: Calling session
+        timeout: Lock timeout in seconds while the operation runs
+    """
+    async def run(station: str) -> tuple[str, str]:
+        lock = locker.is_locked(station)
+        if lock and lock.session_id == session_id:
+            return await operation(station)
+        if not locker.acquire(station, session_id, timeout):
+            lock = locker.is_locked(station)
+            return "skipped", f"locked by {lock.session_id if lock else 'another session'}"
+        try:
+            return await operation(station)
+        finally:
+            locker.release(station, session_id)
+
+    return run
+
+
+async def run_fleet(
+    stations: list[str],
+    operation: StationOperation,
+    max_parallel: int = 4,
+) -> list[FleetResult]:
+    """Run an operation on several stations concurrently.
+
+    Args:
+        stations: Station names
+        operation: Coroutine function returning (result, message)
+        max_parallel: Stations operated on at the same time
+
+    Returns:
+        One FleetResult per station, in the given order
+    """
+    semaphore = asyncio.Semaphore(max(max_parallel, 1))
+
+    async def run_one(station: str) -> FleetResult:
+        async with semaphore:
+            start = time.time()
+            try:
+                result, message = await operation(station)
+            except Exception as e:
+                result, message = "error", str(e)
+            return FleetResult(station, result, message, int((time.time() - start) * 1000))
+
+    return list(await asyncio.gather(*(run_one(station) for station in stations)))
+
+
+def format_fleet_table(operation: str, results: list[FleetResult], duration_ms: int) -> str:
+    """Format fleet results as one line per station.
+
+    Args:
+        operation: Operation name for the summary line
+        results: Per-station results
+        duration_ms: Wall time of the whole fleet operation
+    """
+    ok = sum(1 for r in results if r.ok)
+    lines = [f"{operation}: {ok}/{len(results)} stations ok ({duration_ms}ms)"]
+    width = max((len(r.station) for r in results), default=0)
+    for r in results:
+        lines.append(f"  {r.station:<{width}} | {r.result:<17} | {r.duration_ms:>6}ms | {r.message}")
+    return "\n".join(lines)
@@ -4,12 +4,27 @@ ADR-032: Phase 1 - Hardware Server
 
 Provides session-based locking to prevent concurrent access to hardware
 test stations. Only one session can hold a lock at a time.
+
+Sessions can wait for a busy station instead of polling: waiters queue
+per station and get the lock in FIFO order. Holders keep their lease
+alive with renew() heartbeats; an expired lease passes to the next
+waiter. The lock table is persisted to a JSON state file, so locks
+survive a server restart (the wait queues do not - waiters are live
+tool calls).
 """
+import asyncio
+import json
+import logging
+import os
 import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger("helix.hardware.locking")
+
 
 @dataclass
 class Lock:
@@ -20,45 +35,139 @@ class Lock:
     expires_at: float
 
 
+@dataclass
+class WaitStats:
+    """Lock contention statistics of one station."""
+    acquisitions: int = 0
+    waited: int = 0
+    timeouts: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "acquisitions": self.acquisitions,
+            "waited": self.waited,
+            "timeouts": self.timeouts,
+            "avg_wait_s": round(self.total_wait_s / self.waited, 2) if self.waited else 0.0,
+            "max_wait_s": round(self.max_wait_s, 2),
+        }
+
+
 class StationLocker:
-    """Thread-safe station locking manager."""
+    """Thread-safe station locking manager with FIFO wait queues."""
+
+    # Poll interval of acquire_async (the wait queue keeps the order)
+    ASYNC_POLL_S = 0.05
 
-    def __init__(self):
+    def __init__(self, state_file: Optional[Path] = None):
+        """Initialize the locker.
+
+        Args:
+            state_file: JSON file the lock table is persisted to (None: memory only)
+        """
         self._locks: dict[str, Lock] = {}
+        self._queues: dict[str, deque[str]] = {}
+        self._stats: dict[str, WaitStats] = {}
         self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._state_file = state_file
+        with self._lock:
+            self._load()
 
-    def acquire(self, station: str, session_id: str, timeout: int = 300) -> bool:
+    def acquire(
+        self,
+        station: str,
+        session_id: str,
+        timeout: int = 300,
+        wait: float = 0,
+    ) -> bool:
         """Acquire exclusive lock on a station.
 
         Args:
             station: Name of the station to lock
             session_id: Unique identifier for the session
             timeout: Lock timeout in seconds (default 5 minutes)
+            wait: Seconds to wait in the station's queue if it is busy
+                (default 0: fail immediately)
 
         Returns:
-            True if lock acquired, False if station already locked
+            True if lock acquired, False if station still locked
         """
+        start = time.time()
+        deadline = start + wait
         with self._lock:
-            # Clean expired locks
-            self._cleanup_expired()
+            if self._try_acquire(station, session_id, timeout, start, queue=wait > 0):
+                return True
+            if wait <= 0:
+                return False
 
-            # Check if already locked
-            if station in self._locks:
-                existing = self._locks[station]
-                if existing.session_id == session_id:
-                    # Same session - extend lock
-                    existing.expires_at = time.time() + timeout
+            while True:
+                now = time.time()
+                if now >= deadline:
+                    self._leave_queue(station, session_id, timed_out=True)
+                    return False
+                # Wake up when the holder's lease runs out at the latest
+                holder = self._locks.get(station)
+                next_check = min(deadline, holder.expires_at) if holder else deadline
+                self._changed.wait(max(next_check - now, 0.01))
+                if self._try_acquire(station, session_id, timeout, start, queue=True):
                     return True
-                return False
 
-            # Acquire new lock
-            now = time.time()
-            self._locks[station] = Lock(
-                station=station,
-                session_id=session_id,
-                acquired_at=now,
-                expires_at=now + timeout
-            )
+    async def acquire_async(
+        self,
+        station: str,
+        session_id: str,
+        timeout: int = 300,
+        wait: float = 0,
+    ) -> bool:
+        """Async variant of acquire() that doesn't block the event loop.
+
+        Cancelling the call removes the session from the wait queue.
+        """
+        start = time.time()
+        deadline = start + wait
+        with self._lock:
+            if self._try_acquire(station, session_id, timeout, start, queue=wait > 0):
+                return True
+        if wait <= 0:
+            return False
+
+        try:
+            while time.time() < deadline:
+                await asyncio.sleep(self.ASYNC_POLL_S)
+                with self._lock:
+                    if self._try_acquire(station, session_id, timeout, start, queue=True):
+                        return True
+        except asyncio.CancelledError:
+            with self._lock:
+                self._leave_queue(station, session_id, timed_out=False)
+            raise
+
+        with self._lock:
+            if self._try_acquire(station, session_id, timeout, start, queue=True):
+                return True
+            self._leave_queue(station, session_id, timed_out=True)
+        return False
+
+    def renew(self, station: str, session_id: str, timeout: int = 300) -> bool:
+        """Extend a held lock (lease heartbeat).
+
+        Args:
+            station: Name of the locked station
+            session_id: Session that holds the lock
+            timeout: New lock timeout in seconds from now
+
+        Returns:
+            True if renewed, False if the lock is not held by this session
+        """
+        with self._lock:
+            self._cleanup_expired()
+            lock = self._locks.get(station)
+            if lock is None or lock.session_id != session_id:
+                return False
+            lock.expires_at = time.time() + timeout
+            self._save()
             return True
 
     def release(self, station: str, session_id: str) -> bool:
@@ -80,6 +189,8 @@ class StationLocker:
                 return False  # Different session holds lock
 
             del self._locks[station]
+            self._save()
+            self._changed.notify_all()
             return True
 
     def is_locked(self, station: str) -> Optional[Lock]:
@@ -95,6 +206,106 @@ class StationLocker:
             self._cleanup_expired()
             return self._locks.get(station)
 
+    def queue_position(self, station: str, session_id: str) -> Optional[int]:
+        """Position of a session in a station's wait queue.
+
+        Returns:
+            1 for the next session to get the lock, None if not waiting
+        """
+        with self._lock:
+            queue = self._queues.get(station, ())
+            if session_id in queue:
+                return list(queue).index(session_id) + 1
+            return None
+
+    def waiting(self, station: str) -> list[str]:
+        """Sessions waiting for a station, in FIFO order."""
+        with self._lock:
+            return list(self._queues.get(station, ()))
+
+    def stats(self, station: Optional[str] = None) -> dict[str, dict]:
+        """Wait-time statistics per station.
+
+        Args:
+            station: Only this station (default: all stations seen)
+
+        Returns:
+            Dict of station to acquisitions, waited, timeouts,
+            avg_wait_s and max_wait_s
+        """
+        with self._lock:
+            stations = [station] if station else list(self._stats)
+            return {
+                name: self._stats.get(name, WaitStats()).to_dict()
+                for name in stations
+            }
+
+    def _try_acquire(
+        self,
+        station: str,
+        session_id: str,
+        timeout: int,
+        start: float,
+        queue: bool,
+    ) -> bool:
+        """Take the lock if free and it's this session's turn (called with lock held)."""
+        self._cleanup_expired()
+        now = time.time()
+
+        existing = self._locks.get(station)
+        if existing is not None:
+            if existing.session_id == session_id:
+                # Same session - extend lock
+                existing.expires_at = now + timeout
+                self._save()
+                return True
+            if queue:
+                self._enqueue(station, session_id)
+            return False
+
+        waiters = self._queues.get(station)
+        if waiters and waiters[0] != session_id:
+            # Free, but others queued first
+            if queue:
+                self._enqueue(station, session_id)
+            return False
+
+        queued = bool(waiters)
+        if queued:
+            waiters.popleft()
+            self._changed.notify_all()
+        self._locks[station] = Lock(
+            station=station,
+            session_id=session_id,
+            acquired_at=now,
+            expires_at=now + timeout
+        )
+        self._save()
+
+        stats = self._stats.setdefault(station, WaitStats())
+        stats.acquisitions += 1
+        if queued:
+            waited_s = now - start
+            stats.waited += 1
+            stats.total_wait_s += waited_s
+            stats.max_wait_s = max(stats.max_wait_s, waited_s)
+        return True
+
+    def _enqueue(self, station: str, session_id: str) -> None:
+        """Append a session to a station's wait queue (called with lock held)."""
+        queue = self._queues.setdefault(station, deque())
+        if session_id not in queue:
+            queue.append(session_id)
+
+    def _leave_queue(self, station: str, session_id: str, timed_out: bool) -> None:
+        """Remove a session from a station's wait queue (called with lock held)."""
+        queue = self._queues.get(station)
+        if queue and session_id in queue:
+            queue.remove(session_id)
+            self._changed.notify_all()
+        if timed_out:
+            self._stats.setdefault(station, WaitStats()).timeouts += 1
+
     def _cleanup_expired(self) -> None:
         """Remove expired locks (internal, called with lock held)."""
         now = time.time()
@@ -104,6 +315,33 @@ class StationLocker:
         ]
         for station in expired:
             del self._locks[station]
+        if expired:
+            self._save()
+            self._changed.notify_all()
+
+    def _load(self) -> None:
+        """Load unexpired locks from the state file (called with lock held)."""
+        if self._state_file is None or not self._state_file.exists():
+            return
+        try:
+            entries = json.loads(self._state_file.read_text())
+            self._locks = {entry["station"]: Lock(**entry) for entry in entries}
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable lock state {self._state_file}: {e}")
+            return
+        self._cleanup_expired()
+
+    def _save(self) -> None:
+        """Write the lock table to the state file (called with lock held)."""
+        if self._state_file is None:
+            return
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._state_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps([asdict(lock) for lock in self._locks.values()]))
+            os.replace(tmp, self._state_file)
+        except OSError as e:
+            logger.warning(f"Could not persist lock state to {self._state_file}: {e}")
 
     def list_locks(self) -> list[Lock]:
         """List all active locks.
@@ -117,4 +355,4 @@ class StationLocker:
 
 
 # Global locker instance
-locker = StationLocker()
+locker = StationLocker(Path(__file__).parent / "logs" / "locks.json")
@@ -0,0 +1,289 @@
+"""Pooled HTTP clients for station FPGA controllers.
+
+ADR-032: Phase 1 - Hardware Server
+
+Debug sessions issue long sequences of halt/read/go calls. Instead of a
+new httpx.AsyncClient (and TCP connection) per call, each station gets
+one keep-alive client with:
+
+- a per-station concurrency limit (the FPGA controller serializes
+  J-Link commands anyway)
+- reconnect backoff: after a network failure, calls fail fast until
+  the backoff expires, doubling up to max_backoff
+- health probing: while a station is down, a background probe retries
+  with the same backoff and clears the failure state once the
+  controller answers again
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+
+
+class StationUnavailable(httpx.ConnectError):
+    """Raised while a station is in reconnect backoff."""
+
+
+@dataclass
+class PoolSettings:
+    """Connection pool settings (config.yaml 'pool' section)."""
+    timeout: float = 30.0
+    max_concurrent: int = 2
+    keepalive_expiry: float = 60.0
+    initial_backoff: float = 0.5
+    max_backoff: float = 30.0
+    health_path: str = "/"
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> "PoolSettings":
+        """Create settings from a config dict, ignoring unknown keys."""
+        config = config or {}
+        return cls(**{k: v for k, v in config.items() if k in cls.__dataclass_fields__})
+
+
+@dataclass
+class StationStats:
+    """Request statistics of one station."""
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    connections_opened: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "connections_opened": self.connections_opened,
+        }
+
+
+class StationClient:
+    """Keep-alive HTTP client of one station's FPGA controller."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        settings: PoolSettings,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the station client.
+
+        Args:
+            name: Station name
+            base_url: FPGA controller URL (http://host:port)
+            settings: Pool settings
+            transport: Optional httpx transport (tests)
+        """
+        self.name = name
+        self.base_url = base_url
+        self.settings = settings
+        self.stats = StationStats()
+        # Optional controller endpoints that answered 404 (see transfer.py)
+        self.missing_endpoints: set[str] = set()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        # Requests in flight per client; a replaced client is closed when idle
+        self._in_flight: dict[httpx.AsyncClient, int] = {}
+        self._semaphore = asyncio.Semaphore(settings.max_concurrent)
+        self._failures = 0
+        self._retry_at = 0.0
+        self._probe_task: Optional[asyncio.Task] = None
+
+    @property
+    def healthy(self) -> bool:
+        """False while the station is in reconnect backoff."""
+        return self._failures == 0
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until requests are sent again (0 when healthy)."""
+        if not self._failures:
+            return 0.0
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.settings.max_concurrent,
+                max_keepalive_connections=self.settings.max_concurrent,
+                keepalive_expiry=self.settings.keepalive_expiry,
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.settings.timeout,
+                limits=limits,
+                transport=self._transport,
+                event_hooks={"request": [self._on_request]},
+            )
+        return self._client
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        # httpcore reports each new TCP connection through the trace extension
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.connections_opened += 1
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request over the pooled connection.
+
+        Args:
+            method: HTTP method
+            path: Path on the FPGA controller (e.g. /jlink/halt)
+            **kwargs: Further httpx request arguments (json, params, files, timeout)
+
+        Returns:
+            The httpx Response
+
+        Raises:
+            StationUnavailable: While the station is in reconnect backoff
+            httpx.HTTPError: On transport errors
+        """
+        if self.retry_in > 0:
+            raise StationUnavailable(
+                f"{self.name} unreachable, retrying in {self.retry_in:.1f}s"
+            )
+
+        async with self._semaphore:
+            start = time.perf_counter()
+            try:
+                response = await self._send(method, path, **kwargs)
+            except httpx.TransportError:
+                self._record(start, error=True)
+                await self._mark_failed()
+                raise
+            self._record(start, error=False)
+            self._failures = 0
+            return response
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, tracking it as in flight on its client."""
+        client = self._get_client()
+        self._in_flight[client] = self._in_flight.get(client, 0) + 1
+        try:
+            return await client.request(method, path, **kwargs)
+        finally:
+            self._in_flight[client] -= 1
+            if not self._in_flight[client]:
+                del self._in_flight[client]
+                if client is not self._client:
+                    await client.aclose()
+
+    def _record(self, start: float, error: bool) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats.requests += 1
+        self.stats.errors += int(error)
+        self.stats.total_ms += elapsed_ms
+        self.stats.max_ms = max(self.stats.max_ms, elapsed_ms)
+
+    def _backoff(self) -> float:
+        return min(
+            self.settings.initial_backoff * 2 ** max(self._failures - 1, 0),
+            self.settings.max_backoff,
+        )
+
+    async def _mark_failed(self) -> None:
+        """Enter backoff, drop the connections and start probing."""
+        self._failures += 1
+        self._retry_at = time.monotonic() + self._backoff()
+        await self._replace_client()
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def probe(self) -> bool:
+        """Check whether the FPGA controller answers HTTP at all."""
+        try:
+            await self._send("GET", self.settings.health_path, timeout=5.0)
+            return True
+        except httpx.HTTPError:
+            await self._replace_client()
+            return False
+
+    async def _probe_loop(self) -> None:
+        """Probe with backoff until the station answers again."""
+        while self._failures:
+            await asyncio.sleep(max(self._retry_at - time.monotonic(), 0.0))
+            if await self.probe():
+                self._failures = 0
+                return
+            self._failures += 1
+            self._retry_at = time.monotonic() + self._backoff()
+
+    async def _replace_client(self) -> None:
+        """Make new requests use a fresh client.
+
+        The old client is closed right away if it is idle, otherwise by
+        the last of its in-flight requests, so one transport error does
+        not abort the other concurrent requests.
+        """
+        client, self._client = self._client, None
+        if client is not None and client not in self._in_flight:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Stop probing and close all connections."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        await self._replace_client()
+
+    def status(self) -> dict:
+        """Health and request statistics."""
+        status = {"healthy": self.healthy, **self.stats.to_dict()}
+        if not self.healthy:
+            status["retry_in_s"] = round(self.retry_in, 1)
+        return status
+
+
+class StationPool:
+    """Station clients by station name, created on first use."""
+
+    def __init__(
+        self,
+        settings: Optional[PoolSettings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.settings = settings or PoolSettings()
+        self._transport = transport
+        self._clients: dict[str, StationClient] = {}
+        self._closing: set[asyncio.Task] = set()
+
+    def get(self, station: str, fpga: dict) -> StationClient:
+        """Get the client of a station.
+
+        If the station's controller address changed, the old client is
+        closed in the background once its in-flight requests are done.
+
+        Args:
+            station: Station name
+            fpga: The station's fpga config (host, port)
+        """
+        base_url = f"http://{fpga['host']}:{fpga['port']}"
+        client = self._clients.get(station)
+        if client is None or client.base_url != base_url:
+            old, client = client, StationClient(station, base_url, self.settings, self._transport)
+            self._clients[station] = client
+            if old is not None:
+                task = asyncio.get_running_loop().create_task(old.aclose())
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+        return client
+
+    def status(self) -> dict[str, dict]:
+        """Status of all stations used so far."""
+        return {name: client.status() for name, client in self._clients.items()}
+
+    async def aclose(self) -> None:
+        """Close all station clients."""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+        if self._closing:
+            await asyncio.gather(*self._closing)
@@ -7,18 +7,36 @@ Provides MCP tools for controlling hardware test stations including:
 - Connection management
 - Debug operations (registers, memory, flash)
 - Recovery from error states
+- Fleet operations across many stations in one call
+
+FPGA controller calls go through one keep-alive client per station
+(pool.py) instead of a new connection per tool call.
 """
 import asyncio
 import sys
 import time
 from pathlib import Path
+from typing import Awaitable, Callable
 
 import httpx
 import yaml
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from locking import locker
 from audit import audit
+from fleet import format_fleet_table, hold_lock, run_fleet, select_stations
+from pool import PoolSettings, StationPool
+from transfer import (
+    MEMORY_FORMATS,
+    FlashHistory,
+    TransferError,
+    file_sha256,
+    format_memory,
+    parse_address,
+    parse_region,
+    read_regions,
+    upload_firmware,
+)
 
 mcp = FastMCP(
     name="helix-hardware",
@@ -26,6 +44,9 @@ mcp = FastMCP(
 )
 
 _config = None
+_pool = None
+
+flash_history = FlashHistory(Path(__file__).parent / "logs" / "flash_history.json")
 
 
 def load_config() -> dict:
@@ -58,16 +79,60 @@ def get_station(name: str) -> dict:
     return station
 
 
+def get_pool() -> StationPool:
+    """Get the station connection pool (config.yaml 'pool' section)."""
+    global _pool
+    if _pool is None:
+        _pool = StationPool(PoolSettings.from_config(load_config().get("pool")))
+    return _pool
+
+
+async def fpga_request(station: str, cfg: dict, method: str, path: str, **kwargs) -> dict:
+    """Call a station's FPGA controller over its pooled connection.
+
+    Args:
+        station: Station name
+        cfg: Station configuration
+        method: HTTP method
+        path: Controller path (e.g. /jlink/halt)
+        **kwargs: Further httpx request arguments
+
+    Returns:
+        Decoded JSON response
+    """
+    client = get_pool().get(station, cfg["fpga"])
+    r = await client.request(method, path, **kwargs)
+    return r.json()
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.time() - start) * 1000)
+
+
+def _identified(stdout: str) -> bool:
+    """Whether J-Link connect output reports an identified target."""
+    return "Cortex-M33 identified" in stdout or "identified" in stdout.lower()
+
+
 # === Lock Tools ===
 
 @mcp.tool
-def station_acquire(station: str, session_id: str, timeout: int = 300) -> str:
+async def station_acquire(
+    station: str,
+    session_id: str,
+    timeout: int = 300,
+    wait: int = 0
+) -> str:
     """Acquire exclusive access to a hardware test station.
 
+    Waiting sessions are served in FIFO order, so prefer a wait time
+    over calling this tool repeatedly.
+
     Args:
         station: Name of the station (e.g., 'station-alpha')
         session_id: Unique identifier for your session
         timeout: Lock timeout in seconds (default 300 = 5 minutes)
+        wait: Seconds to wait in the queue if the station is busy (default 0)
 
     Returns:
         Success message or lock conflict information
@@ -80,15 +145,42 @@ def station_acquire(station: str, session_id: str, timeout: int = 300) -> str:
     except ValueError as e:
         return str(e)
 
-    if locker.acquire(station, session_id, timeout):
+    if await locker.acquire_async(station, session_id, timeout, wait):
         duration = int((time.time() - start) * 1000)
         audit.log(station, "acquire", session_id, "success", duration)
         return f"Lock acquired on {station} for {timeout}s"
 
+    duration = int((time.time() - start) * 1000)
+    if wait > 0:
+        audit.log(station, "acquire", session_id, "wait_timeout", duration)
+
     lock = locker.is_locked(station)
+    waiting = len(locker.waiting(station))
+    queued = f", {waiting} session(s) waiting" if waiting else ""
     if lock:
-        return f"Station {station} locked by session {lock.session_id}"
-    return f"Failed to acquire lock on {station}"
+        return f"Station {station} locked by session {lock.session_id}{queued}"
+    return f"Failed to acquire lock on {station}{queued}"
+
+
+@mcp.tool
+def station_renew(station: str, session_id: str, timeout: int = 300) -> str:
+    """Extend your lock on a station (heartbeat during long operations).
+
+    Args:
+        station: Name of the station
+        session_id: Session that holds the lock
+        timeout: New lock timeout in seconds from now (default 300)
+
+    Returns:
+        Success or failure message
+    """
+    if locker.renew(station, session_id, timeout):
+        return f"Lock on {station} renewed for {timeout}s"
+
+    lock = locker.is_locked(station)
+    if lock:
+        return f"Cannot renew - locked by different session: {lock.session_id}"
+    return f"Station {station} is not locked - acquire it again"
 
 
 @mcp.tool
@@ -130,6 +222,9 @@ def list_stations() -> str:
     for name, station in config["stations"].items():
         lock = locker.is_locked(name)
         lock_status = f" [LOCKED by {lock.session_id}]" if lock else " [available]"
+        waiting = len(locker.waiting(name))
+        if waiting:
+            lock_status += f" [{waiting} waiting]"
         desc = station.get("description", "No description")
         lines.append(f"  {name}: {desc}{lock_status}")
 
@@ -153,14 +248,8 @@ async def station_connect(station: str) -> str:
     except ValueError as e:
         return str(e)
 
-    fpga = cfg["fpga"]
-
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.post(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/connect"
-            )
-            data = r.json()
+        data = await fpga_request(station, cfg, "POST", "/jlink/connect")
     except httpx.TimeoutException:
         duration = int((time.time() - start) * 1000)
         audit.log(station, "connect", "unknown", "timeout", duration)
@@ -177,7 +266,7 @@ async def station_connect(station: str) -> str:
     duration = int((time.time() - start) * 1000)
     stdout = data.get("stdout", "")
 
-    if "Cortex-M33 identified" in stdout or "identified" in stdout.lower():
+    if _identified(stdout):
         audit.log(station, "connect", "unknown", "success", duration)
         return f"Connected to {station}"
     elif "0xFFFFFFFF" in stdout:
@@ -209,21 +298,17 @@ async def station_recover(station: str) -> str:
     voltage = fpga.get("voltage", 3.3)
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            # Power cycle
-            await client.post(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/power",
-                json={"action": "cycle", "voltage": voltage}
-            )
+        # Power cycle
+        await fpga_request(
+            station, cfg, "POST", "/jlink/power",
+            json={"action": "cycle", "voltage": voltage}
+        )
 
-            # Wait for target to stabilize
-            await asyncio.sleep(0.5)
+        # Wait for target to stabilize
+        await asyncio.sleep(0.5)
 
-            # Reconnect
-            r = await client.post(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/connect"
-            )
-            data = r.json()
+        # Reconnect
+        data = await fpga_request(station, cfg, "POST", "/jlink/connect")
     except Exception as e:
         duration = int((time.time() - start) * 1000)
         audit.log(station, "recover", "unknown", "error", duration, {"error": str(e)})
@@ -232,7 +317,7 @@ async def station_recover(station: str) -> str:
     duration = int((time.time() - start) * 1000)
     stdout = data.get("stdout", "")
 
-    if "Cortex-M33 identified" in stdout or "identified" in stdout.lower():
+    if _identified(stdout):
         audit.log(station, "recover", "unknown", "success", duration)
         return f"Recovery successful! {station} reconnected."
 
@@ -257,14 +342,8 @@ async def station_registers(station: str) -> str:
     except ValueError as e:
         return str(e)
 
-    fpga = cfg["fpga"]
-
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.get(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/registers"
-            )
-            data = r.json()
+        data = await fpga_request(station, cfg, "GET", "/jlink/registers")
     except Exception as e:
         duration = int((time.time() - start) * 1000)
         audit.log(station, "registers", "unknown", "error", duration)
@@ -297,24 +376,23 @@ async def station_halt(station: str) -> str:
     Returns:
         Halt status message
     """
+    start = time.time()
+
     try:
         cfg = get_station(station)
     except ValueError as e:
         return str(e)
 
-    fpga = cfg["fpga"]
-
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.post(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/halt"
-            )
-            data = r.json()
+        data = await fpga_request(station, cfg, "POST", "/jlink/halt")
     except Exception as e:
+        audit.log(station, "halt", "unknown", "error", _elapsed_ms(start), {"error": str(e)})
         return f"Error: {e}"
 
     if data.get("success"):
+        audit.log(station, "halt", "unknown", "success", _elapsed_ms(start))
         return f"CPU halted on {station}"
+    audit.log(station, "halt", "unknown", "failed", _elapsed_ms(start))
     return f"Halt failed: {data.get('error')}"
 
 
@@ -328,24 +406,23 @@ async def station_go(station: str) -> str:
     Returns:
         Resume status message
     """
+    start = time.time()
+
     try:
         cfg = get_station(station)
     except ValueError as e:
         return str(e)
 
-    fpga = cfg["fpga"]
-
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.post(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/go"
-            )
-            data = r.json()
+        data = await fpga_request(station, cfg, "POST", "/jlink/go")
     except Exception as e:
+        audit.log(station, "go", "unknown", "error", _elapsed_ms(start), {"error": str(e)})
         return f"Error: {e}"
 
     if data.get("success"):
+        audit.log(station, "go", "unknown", "success", _elapsed_ms(start))
         return f"CPU running on {station}"
+    audit.log(station, "go", "unknown", "failed", _elapsed_ms(start))
     return f"Resume failed: {data.get('error')}"
 
 
@@ -359,24 +436,23 @@ async def station_reset(station: str) -> str:
     Returns:
         Reset status message
     """
+    start = time.time()
+
     try:
         cfg = get_station(station)
     except ValueError as e:
         return str(e)
 
-    fpga = cfg["fpga"]
-
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.post(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/reset"
-            )
-            data = r.json()
+        data = await fpga_request(station, cfg, "POST", "/jlink/reset")
     except Exception as e:
+        audit.log(station, "reset", "unknown", "error", _elapsed_ms(start), {"error": str(e)})
         return f"Error: {e}"
 
     if data.get("success"):
+        audit.log(station, "reset", "unknown", "success", _elapsed_ms(start))
         return f"Target reset on {station}"
+    audit.log(station, "reset", "unknown", "failed", _elapsed_ms(start))
     return f"Reset failed: {data.get('error')}"
 
 
@@ -384,7 +460,8 @@ async def station_reset(station: str) -> str:
 async def station_memory_read(
     station: str,
     address: str,
-    length: int = 64
+    length: int = 64,
+    format: str = "hexdump"
 ) -> str:
     """Read memory from the station's target.
 
@@ -392,61 +469,119 @@ async def station_memory_read(
         station: Name of the station
         address: Memory address (hex string like '0x20000000')
         length: Number of bytes to read (default 64)
+        format: 'hexdump' (default), 'hex' or 'base64' (compact, for large dumps)
 
     Returns:
-        Hex dump of memory or error message
+        Memory contents or error message
     """
+    start = time.time()
+
     try:
         cfg = get_station(station)
     except ValueError as e:
         return str(e)
 
-    fpga = cfg["fpga"]
-
     # Parse address
     try:
-        addr = int(address, 16) if address.startswith("0x") else int(address)
+        addr = parse_address(address)
     except ValueError:
         return f"Invalid address format: {address}"
 
+    if format not in MEMORY_FORMATS:
+        return f"Invalid format: {format}. Use one of {list(MEMORY_FORMATS)}"
+
+    details = {"address": f"0x{addr:08X}", "length": length}
+
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            r = await client.get(
-                f"http://{fpga['host']}:{fpga['port']}/jlink/memory",
-                params={"address": addr, "length": length}
-            )
-            data = r.json()
+        data = await fpga_request(
+            station, cfg, "GET", "/jlink/memory",
+            params={"address": addr, "length": length}
+        )
     except Exception as e:
+        audit.log(station, "memory_read", "unknown", "error", _elapsed_ms(start),
+                  {**details, "error": str(e)})
         return f"Error: {e}"
 
     if not data.get("success"):
+        audit.log(station, "memory_read", "unknown", "failed", _elapsed_ms(start), details)
         return f"Read failed: {data.get('error')}"
 
-    # Format as hex dump
-    memory = bytes.fromhex(data.get("data", ""))
-    lines = [f"Memory at 0x{addr:08X} ({len(memory)} bytes):"]
+    audit.log(station, "memory_read", "unknown", "success", _elapsed_ms(start), details)
 
-    for i in range(0, len(memory), 16):
-        chunk = memory[i:i + 16]
-        hex_str = " ".join(f"{b:02X}" for b in chunk)
-        ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"  {addr + i:08X}: {hex_str:<48} {ascii_str}")
+    return format_memory(bytes.fromhex(data.get("data", "")), addr, format)
 
-    return "\n".join(lines)
+
+@mcp.tool
+async def station_memory_read_batch(
+    station: str,
+    regions: list[str],
+    format: str = "hexdump"
+) -> str:
+    """Read several memory regions from the station's target in one call.
+
+    Args:
+        station: Name of the station
+        regions: Regions as 'address:length' (e.g. ['0x40000000:32', '0x50000000:16'])
+        format: 'hexdump' (default), 'hex' or 'base64' (compact, for large dumps)
+
+    Returns:
+        Contents of each region or error message
+    """
+    start = time.time()
+
+    try:
+        cfg = get_station(station)
+    except ValueError as e:
+        return str(e)
+
+    try:
+        parsed = [parse_region(spec) for spec in regions]
+    except ValueError as e:
+        return str(e)
+
+    if format not in MEMORY_FORMATS:
+        return f"Invalid format: {format}. Use one of {list(MEMORY_FORMATS)}"
+
+    details = {"regions": len(parsed), "bytes": sum(length for _, length in parsed)}
+
+    try:
+        results = await read_regions(get_pool().get(station, cfg["fpga"]), parsed)
+    except Exception as e:
+        audit.log(station, "memory_read_batch", "unknown", "error", _elapsed_ms(start),
+                  {**details, "error": str(e)})
+        return f"Error: {e}"
+
+    failed = sum(1 for r in results if r.error)
+    result = "success" if not failed else "partial" if failed < len(results) else "failed"
+    audit.log(station, "memory_read_batch", "unknown", result, _elapsed_ms(start),
+              {**details, "failed": failed})
+
+    return "\n\n".join(
+        f"Memory at 0x{r.address:08X}: read failed: {r.error}" if r.error
+        else format_memory(r.data, r.address, format)
+        for r in results
+    )
 
 
 @mcp.tool
 async def station_flash(
     station: str,
     firmware_path: str,
-    verify: bool = True
+    verify: bool = True,
+    skip_if_identical: bool = False,
+    ctx: Context | None = None
 ) -> str:
     """Flash firmware to the station's target.
 
+    The image is uploaded in chunks with progress reporting; an
+    interrupted upload resumes where it stopped.
+
     Args:
         station: Name of the station
         firmware_path: Path to firmware file (.hex or .bin)
         verify: Whether to verify after flashing (default True)
+        skip_if_identical: Skip if the image equals the last one flashed
+            to this station (default False)
 
     Returns:
         Flash status message
@@ -458,22 +593,38 @@ async def station_flash(
     except ValueError as e:
         return str(e)
 
-    fpga = cfg["fpga"]
-
     # Check file exists
     fw_path = Path(firmware_path)
     if not fw_path.exists():
         return f"Firmware file not found: {firmware_path}"
 
+    sha256 = file_sha256(fw_path)
+    if skip_if_identical and flash_history.last_sha256(station) == sha256:
+        audit.log(station, "flash", "unknown", "skipped", _elapsed_ms(start), {
+            "firmware": fw_path.name,
+            "sha256": sha256
+        })
+        return f"Firmware {fw_path.name} already flashed to {station} - skipped"
+
+    async def on_progress(sent: int, total: int) -> None:
+        if ctx is not None:
+            await ctx.report_progress(progress=sent, total=total)
+
+    flash_cfg = load_config().get("flash", {})
+
     try:
-        async with httpx.AsyncClient(timeout=120) as client:
-            with open(fw_path, "rb") as f:
-                r = await client.post(
-                    f"http://{fpga['host']}:{fpga['port']}/jlink/flash",
-                    files={"firmware": (fw_path.name, f)},
-                    data={"verify": str(verify).lower()}
-                )
-                data = r.json()
+        data = await upload_firmware(
+            get_pool().get(station, cfg["fpga"]),
+            fw_path,
+            verify=verify,
+            sha256=sha256,
+            chunk_size=flash_cfg.get("chunk_size", 64 * 1024),
+            max_retries=flash_cfg.get("max_retries", 3),
+            on_progress=on_progress,
+        )
+    except TransferError as e:
+        audit.log(station, "flash", "unknown", "failed", _elapsed_ms(start), {"error": str(e)})
+        return f"Flash failed: {e}"
     except Exception as e:
         duration = int((time.time() - start) * 1000)
         audit.log(station, "flash", "unknown", "error", duration, {"error": str(e)})
@@ -482,8 +633,10 @@ async def station_flash(
     duration = int((time.time() - start) * 1000)
 
     if data.get("success"):
+        flash_history.record(station, fw_path.name, sha256)
         audit.log(station, "flash", "unknown", "success", duration, {
             "firmware": fw_path.name,
+            "sha256": sha256,
             "verified": verify
         })
         return f"Firmware flashed to {station} ({duration}ms)"
@@ -492,18 +645,279 @@ async def station_flash(
     return f"Flash failed: {data.get('error')}"
 
 
+# === Fleet Tools ===
+
+async def _fleet(
+    operation: str,
+    session_id: str,
+    stations: list[str] | None,
+    max_parallel: int | None,
+    run: Callable[[str, dict], Awaitable[tuple[str, str]]],
+) -> str:
+    """Run a per-station operation on the fleet and audit each station.
+
+    Args:
+        operation: Audit operation name (e.g. 'fleet_halt')
+        session_id: Calling session (stations it doesn't own are skipped)
+        stations: Stations to operate on (None: all configured stations)
+        max_parallel: Concurrency limit (None: config.yaml fleet.max_parallel)
+        run: Coroutine function (station, cfg) -> (result, message)
+
+    Returns:
+        Per-station result table
+    """
+    start = time.time()
+    config = load_config()
+    if max_parallel is None:
+        max_parallel = config.get("fleet", {}).get("max_parallel", 4)
+
+    runnable, skipped = select_stations(config["stations"], stations, locker, session_id)
+
+    async def run_station(station: str) -> tuple[str, str]:
+        station_start = time.time()
+        try:
+            result, message = await run(station, get_station(station))
+        except Exception as e:
+            result, message = "error", str(e)
+        audit.log(station, operation, session_id, result, _elapsed_ms(station_start),
+                  {"message": message[:200]} if result != "success" else None)
+        return result, message
+
+    results = await run_fleet(
+        runnable, hold_lock(run_station, locker, session_id), max_parallel
+    )
+    return format_fleet_table(operation, results + skipped, _elapsed_ms(start))
+
+
+@mcp.tool
+async def fleet_halt(
+    session_id: str,
+    stations: list[str] | None = None,
+    max_parallel: int | None = None
+) -> str:
+    """Halt the CPU on many stations at once.
+
+    Stations locked by other sessions are skipped.
+
+    Args:
+        session_id: Your session identifier
+        stations: Station names (default: all stations)
+        max_parallel: Stations handled concurrently (default from config)
+
+    Returns:
+        Per-station result table
+    """
+    async def halt(station: str, cfg: dict) -> tuple[str, str]:
+        data = await fpga_request(station, cfg, "POST", "/jlink/halt")
+        if data.get("success"):
+            return "success", "CPU halted"
+        return "failed", str(data.get("error"))
+
+    return await _fleet("fleet_halt", session_id, stations, max_parallel, halt)
+
+
 @mcp.tool
-def station_audit_history(station: str, limit: int = 20) -> str:
+async def fleet_registers(
+    session_id: str,
+    stations: list[str] | None = None,
+    registers: list[str] | None = None,
+    max_parallel: int | None = None
+) -> str:
+    """Read CPU registers from many stations at once.
+
+    Stations locked by other sessions are skipped.
+
+    Args:
+        session_id: Your session identifier
+        stations: Station names (default: all stations)
+        registers: Register names to show (default: PC, SP, LR)
+        max_parallel: Stations handled concurrently (default from config)
+
+    Returns:
+        Per-station register values
+    """
+    names = registers or ["PC", "SP", "LR"]
+
+    async def read(station: str, cfg: dict) -> tuple[str, str]:
+        data = await fpga_request(station, cfg, "GET", "/jlink/registers")
+        if not data.get("success"):
+            return "failed", str(data.get("error"))
+        regs = data.get("registers", {})
+        return "success", " ".join(f"{n}=0x{regs[n]:08X}" for n in names if n in regs)
+
+    return await _fleet("fleet_registers", session_id, stations, max_parallel, read)
+
+
+@mcp.tool
+async def fleet_flash(
+    firmware_path: str,
+    session_id: str,
+    stations: list[str] | None = None,
+    verify: bool = True,
+    skip_if_identical: bool = True,
+    max_parallel: int | None = None
+) -> str:
+    """Flash the same firmware to many stations at once.
+
+    Stations locked by other sessions are skipped.
+
+    Args:
+        firmware_path: Path to firmware file (.hex or .bin)
+        session_id: Your session identifier
+        stations: Station names (default: all stations)
+        verify: Whether to verify after flashing (default True)
+        skip_if_identical: Skip stations already running this image (default True)
+        max_parallel: Stations flashed concurrently (default from config)
+
+    Returns:
+        Per-station result table
+    """
+    fw_path = Path(firmware_path)
+    if not fw_path.exists():
+        return f"Firmware file not found: {firmware_path}"
+
+    sha256 = file_sha256(fw_path)
+    flash_cfg = load_config().get("flash", {})
+
+    async def flash(station: str, cfg: dict) -> tuple[str, str]:
+        if skip_if_identical and flash_history.last_sha256(station) == sha256:
+            return "skipped_identical", f"{fw_path.name} already flashed"
+        try:
+            data = await upload_firmware(
+                get_pool().get(station, cfg["fpga"]),
+                fw_path,
+                verify=verify,
+                sha256=sha256,
+                chunk_size=flash_cfg.get("chunk_size", 64 * 1024),
+                max_retries=flash_cfg.get("max_retries", 3),
+            )
+        except TransferError as e:
+            return "failed", str(e)
+        if data.get("success"):
+            flash_history.record(station, fw_path.name, sha256)
+            return "success", data.get("message", "Flashed")
+        return "failed", str(data.get("error"))
+
+    return await _fleet("fleet_flash", session_id, stations, max_parallel, flash)
+
+
+@mcp.tool
+async def fleet_recover(
+    session_id: str,
+    stations: list[str] | None = None,
+    max_parallel: int | None = None
+) -> str:
+    """Connect to many stations and power-cycle those with a locked target.
+
+    Stations locked by other sessions are skipped.
+
+    Args:
+        session_id: Your session identifier
+        stations: Station names (default: all stations)
+        max_parallel: Stations handled concurrently (default from config)
+
+    Returns:
+        Per-station result table
+    """
+    async def recover(station: str, cfg: dict) -> tuple[str, str]:
+        data = await fpga_request(station, cfg, "POST", "/jlink/connect")
+        stdout = data.get("stdout", "")
+        if _identified(stdout):
+            return "success", "connected"
+        if "0xFFFFFFFF" not in stdout:
+            return "failed", stdout[-120:]
+
+        await fpga_request(
+            station, cfg, "POST", "/jlink/power",
+            json={"action": "cycle", "voltage": cfg["fpga"].get("voltage", 3.3)}
+        )
+        await asyncio.sleep(0.5)
+        data = await fpga_request(station, cfg, "POST", "/jlink/connect")
+        if _identified(data.get("stdout", "")):
+            return "success", "recovered (power-cycled)"
+        return "failed", "target not responding after power-cycle"
+
+    return await _fleet("fleet_recover", session_id, stations, max_parallel, recover)
+
+
+@mcp.tool
+def station_lock_status(station: str) -> str:
+    """Show a station's lock holder, wait queue and wait-time statistics.
+
+    Args:
+        station: Name of the station
+
+    Returns:
+        Formatted lock status
+    """
+    try:
+        get_station(station)
+    except ValueError as e:
+        return str(e)
+
+    lock = locker.is_locked(station)
+    if lock:
+        remaining = int(lock.expires_at - time.time())
+        lines = [f"{station}: locked by {lock.session_id} ({remaining}s left)"]
+    else:
+        lines = [f"{station}: available"]
+
+    for position, session_id in enumerate(locker.waiting(station), 1):
+        lines.append(f"  {position}. {session_id} waiting")
+
+    s = locker.stats(station)[station]
+    lines.append(
+        f"  {s['acquisitions']} acquisitions, {s['waited']} waited"
+        f" (avg {s['avg_wait_s']}s, max {s['max_wait_s']}s), {s['timeouts']} wait timeouts"
+    )
+
+    return "\n".join(lines)
+
+
+@mcp.tool
+def station_pool_status() -> str:
+    """Show connection health and FPGA request latency per station.
+
+    Returns:
+        Formatted pool status of the stations used so far
+    """
+    status = get_pool().status()
+
+    if not status:
+        return "No station connections yet"
+
+    lines = ["Station connections:"]
+
+    for name, s in status.items():
+        health = "healthy" if s["healthy"] else f"backoff ({s['retry_in_s']}s)"
+        lines.append(
+            f"  {name}: {health} | {s['requests']} requests, {s['errors']} errors"
+            f" | avg {s['avg_ms']}ms, max {s['max_ms']}ms"
+            f" | {s['connections_opened']} connections opened"
+        )
+
+    return "\n".join(lines)
+
+
+@mcp.tool
+def station_audit_history(
+    station: str,
+    limit: int = 20,
+    since: str | None = None,
+    until: str | None = None
+) -> str:
     """Get recent audit history for a station.
 
     Args:
         station: Name of the station
         limit: Maximum number of entries (default 20)
+        since: Only entries from this UTC time on (ISO 8601, e.g. '2024-01-15')
+        until: Only entries before this UTC time (ISO 8601)
 
     Returns:
         Formatted audit history
     """
-    entries = audit.get_station_history(station, limit)
+    entries = audit.get_station_history(station, limit, since=since, until=until)
 
     if not entries:
         return f"No audit history for {station}"
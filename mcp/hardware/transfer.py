@@ -0,0 +1,313 @@
+"""Bulk memory reads and chunked firmware upload.
+
+ADR-032: Phase 1 - Hardware Server
+
+Memory: read_regions() reads many (address, length) regions in one
+POST /jlink/memory/batch round trip. Controllers without the batch
+endpoint get concurrent GET /jlink/memory requests over the pooled
+connection instead.
+
+Flash: upload_firmware() streams the image in chunks through
+/jlink/flash/upload. The controller keeps partial uploads by SHA-256,
+so an interrupted upload resumes at the last received offset.
+Controllers without the upload endpoints get the single multipart
+POST /jlink/flash request.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from pool import StationClient
+
+logger = logging.getLogger("helix.hardware.transfer")
+
+MEMORY_FORMATS = ("hexdump", "hex", "base64")
+
+# Printable ASCII stays, everything else becomes "."
+_ASCII = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+class TransferError(Exception):
+    """Raised when the FPGA controller rejects a transfer."""
+
+
+def parse_address(value: str | int) -> int:
+    """Parse a decimal or 0x-prefixed hex address.
+
+    Raises:
+        ValueError: If the address is not a number
+    """
+    if isinstance(value, int):
+        return value
+    return int(value, 16) if value.lower().startswith("0x") else int(value)
+
+
+def parse_region(spec: str) -> tuple[int, int]:
+    """Parse an 'address:length' region (e.g. '0x40000000:32').
+
+    Raises:
+        ValueError: If the region is malformed
+    """
+    address, sep, length = spec.partition(":")
+    if not sep:
+        raise ValueError(f"Invalid region '{spec}', expected address:length")
+    return parse_address(address.strip()), int(length.strip(), 0)
+
+
+def hexdump(data: bytes, address: int) -> list[str]:
+    """Format bytes as hex dump lines (16 bytes per line)."""
+    lines = []
+    for i in range(0, len(data), 16):
+        chunk = data[i:i + 16]
+        lines.append(
+            f"  {address + i:08X}: {chunk.hex(' ').upper():<48} {chunk.translate(_ASCII).decode()}"
+        )
+    return lines
+
+
+def format_memory(data: bytes, address: int, fmt: str = "hexdump") -> str:
+    """Format one memory region.
+
+    Args:
+        data: Region contents
+        address: Start address
+        fmt: 'hexdump', 'hex' (plain hex string) or 'base64'
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    header = f"Memory at 0x{address:08X} ({len(data)} bytes):"
+    if fmt == "hexdump":
+        return "\n".join([header, *hexdump(data, address)])
+    if fmt == "hex":
+        return f"{header}\n{data.hex().upper()}"
+    if fmt == "base64":
+        return f"{header}\n{base64.b64encode(data).decode()}"
+    raise ValueError(f"Unknown format '{fmt}', expected one of {MEMORY_FORMATS}")
+
+
+@dataclass
+class RegionResult:
+    """Contents of one memory region, or the error reading it."""
+    address: int
+    length: int
+    data: bytes = b""
+    error: Optional[str] = None
+
+
+async def _read_region(client: StationClient, address: int, length: int) -> RegionResult:
+    r = await client.request(
+        "GET", "/jlink/memory", params={"address": address, "length": length}
+    )
+    data = r.json()
+    if not data.get("success"):
+        return RegionResult(address, length, error=str(data.get("error")))
+    return RegionResult(address, length, bytes.fromhex(data.get("data", "")))
+
+
+async def read_regions(
+    client: StationClient,
+    regions: list[tuple[int, int]],
+) -> list[RegionResult]:
+    """Read several memory regions, in one round trip if supported.
+
+    Args:
+        client: Station client
+        regions: (address, length) pairs
+
+    Returns:
+        One RegionResult per region, in request order
+    """
+    batch = "/jlink/memory/batch"
+    if batch not in client.missing_endpoints:
+        r = await client.request("POST", batch, json={
+            "regions": [{"address": a, "length": n} for a, n in regions]
+        })
+        if r.status_code in (404, 405):
+            client.missing_endpoints.add(batch)
+        else:
+            data = r.json()
+            if not data.get("success"):
+                raise TransferError(str(data.get("error")))
+            items = data.get("regions", [])
+            results = [
+                RegionResult(a, n, bytes.fromhex(item.get("data") or ""), item.get("error"))
+                for (a, n), item in zip(regions, items)
+            ]
+            if len(items) < len(regions):
+                # Truncated batch response: read the rest one by one
+                logger.warning(
+                    f"Batch read returned {len(items)} of {len(regions)} regions, "
+                    f"reading the rest individually"
+                )
+                results += await asyncio.gather(
+                    *(_read_region(client, a, n) for a, n in regions[len(items):])
+                )
+            return results
+
+    # Fallback: one request per region, concurrent up to the station limit
+    return list(await asyncio.gather(
+        *(_read_region(client, address, length) for address, length in regions)
+    ))
+
+
+class FlashHistory:
+    """Last flashed image per station, persisted to a JSON file."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the history.
+
+        Args:
+            path: JSON file (None: memory only)
+        """
+        self._path = path
+        self._entries: dict[str, dict] = {}
+        if path is not None and path.exists():
+            try:
+                self._entries = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable flash history {path}: {e}")
+
+    def last_sha256(self, station: str) -> Optional[str]:
+        """SHA-256 of the image last flashed to a station."""
+        return self._entries.get(station, {}).get("sha256")
+
+    def record(self, station: str, firmware: str, sha256: str) -> None:
+        """Record a successful flash."""
+        self._entries[station] = {
+            "firmware": firmware,
+            "sha256": sha256,
+            "flashed_at": time.time(),
+        }
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._entries, indent=2))
+            os.replace(tmp, self._path)
+        except OSError as e:
+            logger.warning(f"Could not persist flash history to {self._path}: {e}")
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+async def upload_firmware(
+    client: StationClient,
+    fw_path: Path,
+    verify: bool = True,
+    sha256: Optional[str] = None,
+    chunk_size: int = 64 * 1024,
+    max_retries: int = 3,
+    on_progress: Optional[ProgressCallback] = None,
+) -> dict:
+    """Upload and flash a firmware image in resumable chunks.
+
+    Args:
+        client: Station client
+        fw_path: Firmware file (.hex or .bin)
+        verify: Whether the controller verifies after flashing
+        sha256: SHA-256 of the file (computed if not given)
+        chunk_size: Bytes per chunk
+        max_retries: Network errors tolerated before giving up; each
+            retry resumes at the controller's offset
+        on_progress: Awaited with (bytes_sent, total_bytes) after each chunk
+
+    Returns:
+        The controller's final JSON response
+
+    Raises:
+        TransferError: If the controller rejects the upload or stops
+            advancing the offset
+        httpx.HTTPError: If the network fails more than max_retries times
+    """
+    upload = "/jlink/flash/upload"
+    if upload in client.missing_endpoints:
+        return await _flash_single(client, fw_path, verify, on_progress)
+
+    total = fw_path.stat().st_size
+    sha256 = sha256 or file_sha256(fw_path)
+    retries = 0
+
+    while True:
+        try:
+            r = await client.request("POST", upload, json={
+                "filename": fw_path.name, "size": total, "sha256": sha256,
+            })
+            if r.status_code in (404, 405):
+                client.missing_endpoints.add(upload)
+                return await _flash_single(client, fw_path, verify, on_progress)
+            data = r.json()
+            if not data.get("success"):
+                raise TransferError(str(data.get("error")))
+
+            upload_id, offset = data["upload_id"], int(data.get("offset", 0))
+            with open(fw_path, "rb") as f:
+                f.seek(offset)
+                while offset < total:
+                    chunk = f.read(chunk_size)
+                    r = await client.request(
+                        "PUT", f"{upload}/{upload_id}",
+                        params={"offset": offset}, content=chunk,
+                    )
+                    data = r.json()
+                    if not data.get("success"):
+                        raise TransferError(str(data.get("error")))
+                    next_offset = int(data.get("offset", offset + len(chunk)))
+                    if next_offset <= offset:
+                        raise TransferError(
+                            f"Controller did not accept the chunk at offset {offset}"
+                        )
+                    offset = next_offset
+                    f.seek(offset)
+                    if on_progress is not None:
+                        await on_progress(offset, total)
+
+            r = await client.request(
+                "POST", f"{upload}/{upload_id}/commit", json={"verify": verify}, timeout=120,
+            )
+            return r.json()
+        except httpx.TransportError:
+            retries += 1
+            if retries > max_retries:
+                raise
+            logger.info(f"Resuming upload of {fw_path.name} (retry {retries}/{max_retries})")
+            await asyncio.sleep(client.retry_in)
+
+
+async def _flash_single(
+    client: StationClient,
+    fw_path: Path,
+    verify: bool,
+    on_progress: Optional[ProgressCallback],
+) -> dict:
+    """Flash with a single multipart POST /jlink/flash."""
+    total = fw_path.stat().st_size
+    with open(fw_path, "rb") as f:
+        r = await client.request(
+            "POST", "/jlink/flash",
+            files={"firmware": (fw_path.name, f)},
+            data={"verify": str(verify).lower()},
+            timeout=120,
+        )
+    if on_progress is not None:
+        await on_progress(total, total)
+    return r.json()
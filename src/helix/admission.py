@@ -0,0 +1,326 @@
+"""Admission control for Claude CLI processes in HELIX v4.
+
+Every Claude CLI process (chat completions, orchestrator jobs, approval
+sub-agents, verifiers, planning) asks one process-wide controller for a
+slot before it is spawned. At most ``max_concurrent`` processes run at
+once; everyone else waits in line instead of being rejected.
+
+Waiting requests are served by:
+
+1. Priority class: INTERACTIVE (chat) before VERIFICATION before
+   BACKGROUND (project and evolution jobs).
+2. Fair queuing within a class: round robin over the waiting keys
+   (users, jobs), so one key with many requests cannot starve others.
+
+The controller tracks queue depth, admissions and wait times per
+priority class (see ``snapshot()``).
+
+Works for asyncio and for synchronous callers (threads) alike.
+
+Configuration:
+    HELIX_MAX_CLAUDE_PROCESSES: Global concurrency cap (default: 4)
+
+Example:
+    controller = get_admission_controller()
+
+    async with controller.slot(Priority.INTERACTIVE, key="10.0.0.5"):
+        ...  # spawn and run the Claude CLI
+
+    with controller.slot_blocking(Priority.VERIFICATION, key="consultant"):
+        subprocess.run(...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+
+# Default global cap for concurrently running Claude CLI processes
+DEFAULT_MAX_CONCURRENT = 4
+
+
+class Priority(IntEnum):
+    """Priority classes, lower value is served first."""
+    INTERACTIVE = 0
+    VERIFICATION = 1
+    BACKGROUND = 2
+
+
+@dataclass
+class PriorityStats:
+    """Admission statistics of one priority class.
+
+    Attributes:
+        admitted: Requests that got a slot
+        queued_total: Requests that had to wait for their slot
+        wait_seconds_total: Summed wait time of all admitted requests
+        wait_seconds_max: Longest wait time of an admitted request
+    """
+    admitted: int = 0
+    queued_total: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        """Record an admission after waiting wait_seconds."""
+        self.admitted += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+
+class _Waiter:
+    """A request waiting for a slot."""
+
+    __slots__ = ("priority", "key", "enqueued_at", "wake", "granted")
+
+    def __init__(self, priority: Priority, key: str, wake: Callable[[], None]) -> None:
+        self.priority = priority
+        self.key = key
+        self.enqueued_at = time.monotonic()
+        self.wake = wake
+        self.granted = False
+
+
+class AdmissionController:
+    """Global concurrency cap with priority classes and fair queuing.
+
+    Attributes:
+        max_concurrent: Maximum number of concurrently admitted requests
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT) -> None:
+        """Initialize the AdmissionController.
+
+        Args:
+            max_concurrent: Maximum number of concurrently admitted requests
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be >= 1, got {max_concurrent}")
+        self.max_concurrent = max_concurrent
+        self._lock = threading.Lock()
+        self._active = 0
+        # Per priority: key -> waiters of that key, in round-robin order
+        self._queues: dict[Priority, OrderedDict[str, deque[_Waiter]]] = {
+            priority: OrderedDict() for priority in Priority
+        }
+        self._stats: dict[Priority, PriorityStats] = {
+            priority: PriorityStats() for priority in Priority
+        }
+
+    @property
+    def active(self) -> int:
+        """Number of currently admitted requests."""
+        return self._active
+
+    def queue_depth(self, priority: Optional[Priority] = None) -> int:
+        """Number of waiting requests (of one class, or in total)."""
+        with self._lock:
+            return self._queue_depth_locked(priority)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: Priority = Priority.BACKGROUND,
+        key: str = "default",
+    ) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block (asyncio).
+
+        Args:
+            priority: Priority class of the request
+            key: Fair-queuing key (user, job, ...)
+        """
+        await self.acquire(priority, key)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def slot_blocking(
+        self,
+        priority: Priority = Priority.BACKGROUND,
+        key: str = "default",
+    ) -> Iterator[None]:
+        """Hold a slot for the duration of the block (threads).
+
+        Args:
+            priority: Priority class of the request
+            key: Fair-queuing key (user, job, ...)
+        """
+        event = threading.Event()
+        with self._lock:
+            waiter = self._admit_or_enqueue_locked(priority, key, event.set)
+        if waiter is not None:
+            event.wait()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(
+        self,
+        priority: Priority = Priority.BACKGROUND,
+        key: str = "default",
+    ) -> None:
+        """Wait for a slot. Must be paired with release().
+
+        Args:
+            priority: Priority class of the request
+            key: Fair-queuing key (user, job, ...)
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(_resolve, future)
+
+        with self._lock:
+            waiter = self._admit_or_enqueue_locked(priority, key, wake)
+        if waiter is None:
+            return
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    # Slot was granted while we were being cancelled
+                    self._release_locked()
+                else:
+                    self._remove_locked(waiter)
+            raise
+
+    def release(self) -> None:
+        """Give a slot back and admit the next waiting request."""
+        with self._lock:
+            self._release_locked()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current load and per-class admission statistics.
+
+        Returns:
+            Dict with max_concurrent, active, queued and per-priority
+            stats (admitted, queued, wait times in seconds)
+        """
+        with self._lock:
+            priorities = {}
+            for priority, stats in self._stats.items():
+                priorities[priority.name.lower()] = {
+                    "queued": self._queue_depth_locked(priority),
+                    "admitted": stats.admitted,
+                    "queued_total": stats.queued_total,
+                    "wait_seconds_total": round(stats.wait_seconds_total, 3),
+                    "wait_seconds_max": round(stats.wait_seconds_max, 3),
+                    "wait_seconds_avg": round(
+                        stats.wait_seconds_total / stats.admitted, 3
+                    ) if stats.admitted else 0.0,
+                }
+            return {
+                "max_concurrent": self.max_concurrent,
+                "active": self._active,
+                "queued": self._queue_depth_locked(None),
+                "priorities": priorities,
+            }
+
+    def _admit_or_enqueue_locked(
+        self,
+        priority: Priority,
+        key: str,
+        wake: Callable[[], None],
+    ) -> Optional[_Waiter]:
+        """Admit immediately if possible, otherwise enqueue a waiter.
+
+        Returns:
+            None if admitted, the queued waiter otherwise
+        """
+        if self._active < self.max_concurrent and not self._queue_depth_locked(None):
+            self._active += 1
+            self._stats[priority].record(0.0)
+            return None
+
+        waiter = _Waiter(priority, key, wake)
+        self._queues[priority].setdefault(key, deque()).append(waiter)
+        self._stats[priority].queued_total += 1
+        return waiter
+
+    def _release_locked(self) -> None:
+        """Free a slot and hand free slots to the next waiters."""
+        self._active = max(0, self._active - 1)
+        while self._active < self.max_concurrent:
+            waiter = self._next_waiter_locked()
+            if waiter is None:
+                break
+            waiter.granted = True
+            self._active += 1
+            self._stats[waiter.priority].record(time.monotonic() - waiter.enqueued_at)
+            waiter.wake()
+
+    def _next_waiter_locked(self) -> Optional[_Waiter]:
+        """Pop the next waiter: highest priority, round robin over keys."""
+        for priority in Priority:
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            key, waiters = next(iter(queue.items()))
+            waiter = waiters.popleft()
+            if waiters:
+                queue.move_to_end(key)
+            else:
+                del queue[key]
+            return waiter
+        return None
+
+    def _remove_locked(self, waiter: _Waiter) -> None:
+        """Drop a waiter that gave up before it got a slot."""
+        queue = self._queues[waiter.priority]
+        waiters = queue.get(waiter.key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del queue[waiter.key]
+
+    def _queue_depth_locked(self, priority: Optional[Priority]) -> int:
+        """Number of waiting requests (caller holds the lock)."""
+        priorities = [priority] if priority is not None else list(Priority)
+        return sum(
+            len(waiters)
+            for p in priorities
+            for waiters in self._queues[p].values()
+        )
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    """Wake an async waiter unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
+
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide admission controller.
+
+    Created on first use with HELIX_MAX_CLAUDE_PROCESSES as cap.
+    """
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            max_concurrent = int(
+                os.environ.get("HELIX_MAX_CLAUDE_PROCESSES", DEFAULT_MAX_CONCURRENT)
+            )
+            _controller = AdmissionController(max_concurrent)
+        return _controller
@@ -0,0 +1,284 @@
+"""Corpus-wide ADR validation for HELIX v4.
+
+Validates all ADRs of a directory in one call instead of one Python
+invocation per file. Each ADR runs through the template validator
+(Layer 1, ADRValidator) and the contextual completeness rules
+(Layer 2, CompletenessValidator) in a process pool. Results are yielded
+as they complete, so callers can stream them (e.g. as JSON lines).
+
+ADRs whose content and rules are unchanged since the last run are
+answered from a content-hash cache stored in
+``.helix/adr-validation-cache.json`` below the project root.
+
+Example:
+    >>> from helix.adr.batch import validate_corpus
+    >>> for result in validate_corpus(Path("adr")):
+    ...     print(result.adr_file, result.valid)
+
+CLI:
+    helix validate-adrs [ADR_DIR] [--workers N] [--no-cache]
+
+See Also:
+    - validator.py: Layer 1 template validation
+    - completeness.py: Layer 2 contextual rules
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .completeness import CompletenessValidator
+from .validator import ADRValidator, IssueLevel
+
+# Bump when the result format or validation logic changes
+CACHE_VERSION = 1
+
+# Below this many ADRs to validate, a process pool costs more than it saves
+MIN_PARALLEL_ADRS = 8
+
+# Files in the ADR directory that are not ADRs
+NON_ADR_FILES = {"INDEX.md", "README.md"}
+
+
+@dataclass
+class ADRBatchResult:
+    """Validation result of a single ADR in a corpus run.
+
+    Attributes:
+        adr_file: Path of the ADR file (as given to the run)
+        valid: True if neither layer reported errors
+        errors: Error messages of both layers
+        warnings: Warning messages of both layers
+        cached: True if the result was taken from the cache
+    """
+    adr_file: str
+    valid: bool
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+    def to_json(self) -> str:
+        """Serialize as a single JSON line."""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+
+@dataclass
+class CorpusSummary:
+    """Aggregated outcome of a corpus run.
+
+    Attributes:
+        total: Number of ADRs validated
+        valid: Number of valid ADRs
+        invalid: Number of ADRs with errors
+        cached: Number of results served from the cache
+    """
+    total: int = 0
+    valid: int = 0
+    invalid: int = 0
+    cached: int = 0
+
+    @property
+    def passed(self) -> bool:
+        """True if no ADR has errors."""
+        return self.invalid == 0
+
+    def add(self, result: ADRBatchResult) -> None:
+        """Count a single result."""
+        self.total += 1
+        if result.valid:
+            self.valid += 1
+        else:
+            self.invalid += 1
+        if result.cached:
+            self.cached += 1
+
+
+# Per-process validators, built once per worker
+_worker_validators: Optional[tuple[ADRValidator, CompletenessValidator]] = None
+
+
+def _init_worker(rules_path: Optional[str]) -> None:
+    """Build the validators once per worker process."""
+    global _worker_validators
+    _worker_validators = (
+        ADRValidator(),
+        CompletenessValidator.shared(Path(rules_path) if rules_path else None),
+    )
+
+
+def _validate_one(adr_file: str) -> dict[str, Any]:
+    """Validate a single ADR with the worker validators.
+
+    Args:
+        adr_file: Path to the ADR file
+
+    Returns:
+        Result dict (see ADRBatchResult)
+    """
+    assert _worker_validators is not None
+    validator, completeness = _worker_validators
+
+    result = validator.validate_file(Path(adr_file))
+    errors = [str(issue) for issue in result.errors]
+    warnings = [str(issue) for issue in result.warnings]
+
+    if result.adr is not None:
+        for issue in completeness.check(result.adr).issues:
+            level = getattr(issue.level, "value", issue.level)
+            message = f"[Layer 2] {issue.message}"
+            if level == IssueLevel.ERROR.value:
+                errors.append(message)
+            else:
+                warnings.append(message)
+
+    return {
+        "adr_file": adr_file,
+        "valid": not errors,
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+
+def _content_hash(content: bytes, rules_hash: str) -> str:
+    """Hash an ADR's content together with the rules it is checked against."""
+    digest = hashlib.sha256(content)
+    digest.update(rules_hash.encode())
+    return digest.hexdigest()
+
+
+def _load_cache(cache_file: Path) -> dict[str, dict[str, Any]]:
+    """Load the persisted results, or an empty dict if missing or stale."""
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(cache_file: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """Persist the results atomically (temp file + rename)."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(".json.tmp")
+        temp_file.write_text(
+            json.dumps({"version": CACHE_VERSION, "entries": entries}, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        temp_file.replace(cache_file)
+    except OSError:
+        # Cache is an optimization only
+        pass
+
+
+def find_adr_files(adr_dir: Path) -> list[Path]:
+    """List the ADR files of a directory.
+
+    Args:
+        adr_dir: Directory containing ADR markdown files
+
+    Returns:
+        Sorted list of ADR file paths (INDEX.md and README.md excluded)
+    """
+    if not adr_dir.is_dir():
+        return []
+    return sorted(
+        Path(entry.path)
+        for entry in os.scandir(adr_dir)
+        if entry.is_file() and entry.name.endswith(".md") and entry.name not in NON_ADR_FILES
+    )
+
+
+def validate_corpus(
+    adr_dir: Path,
+    workers: Optional[int] = None,
+    rules_path: Optional[Path] = None,
+    cache_file: Optional[Path] = None,
+    use_cache: bool = True,
+) -> Iterator[ADRBatchResult]:
+    """Validate all ADRs of a directory in parallel.
+
+    Results are yielded as they become available: cached results first,
+    then freshly validated ADRs in completion order.
+
+    Args:
+        adr_dir: Directory containing ADR markdown files
+        workers: Number of worker processes (default: CPU count).
+            With 1 worker, or only a few ADRs to validate, runs in-process.
+        rules_path: Completeness rules file. Default:
+            config/adr-completeness-rules.yaml next to adr_dir.
+        cache_file: Result cache. Default: .helix/adr-validation-cache.json
+            next to adr_dir.
+        use_cache: Reuse cached results of ADRs whose content and rules
+            are unchanged. Fresh results are written back either way.
+
+    Yields:
+        ADRBatchResult per ADR
+    """
+    adr_dir = Path(adr_dir)
+    project_root = adr_dir.resolve().parent
+    if rules_path is None:
+        rules_path = project_root / CompletenessValidator.DEFAULT_RULES_PATH
+    if cache_file is None:
+        cache_file = project_root / ".helix" / "adr-validation-cache.json"
+
+    try:
+        rules_hash = hashlib.sha256(rules_path.read_bytes()).hexdigest()
+    except OSError:
+        rules_hash = ""
+
+    cache = _load_cache(cache_file) if use_cache else {}
+    entries: dict[str, dict[str, Any]] = {}
+    pending: dict[str, str] = {}
+
+    for adr_file in find_adr_files(adr_dir):
+        key = adr_file.name
+        try:
+            digest = _content_hash(adr_file.read_bytes(), rules_hash)
+        except OSError:
+            digest = ""
+
+        cached = cache.get(key)
+        if digest and cached and cached.get("hash") == digest:
+            entries[key] = cached
+            yield ADRBatchResult(**{**cached["result"], "adr_file": str(adr_file)}, cached=True)
+        else:
+            pending[str(adr_file)] = digest
+
+    def record(result_data: dict[str, Any]) -> ADRBatchResult:
+        digest = pending[result_data["adr_file"]]
+        if digest:
+            entries[Path(result_data["adr_file"]).name] = {"hash": digest, "result": result_data}
+        return ADRBatchResult(**result_data)
+
+    rules_arg = str(rules_path) if rules_path else None
+    workers = workers or os.cpu_count() or 1
+
+    try:
+        if workers <= 1 or len(pending) < MIN_PARALLEL_ADRS:
+            _init_worker(rules_arg)
+            for adr_file in pending:
+                yield record(_validate_one(adr_file))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(pending)),
+                initializer=_init_worker,
+                initargs=(rules_arg,),
+            ) as executor:
+                futures = [executor.submit(_validate_one, adr_file) for adr_file in pending]
+                for future in as_completed(futures):
+                    yield record(future.result())
+    finally:
+        _save_cache(cache_file, entries)
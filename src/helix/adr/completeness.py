@@ -19,6 +19,11 @@ Example:
     ...     for issue in result.issues:
     ...         print(issue)
 
+Rules are compiled once per rules file: regex patterns are pre-compiled
+and validators are shared via CompletenessValidator.shared(), so gate calls
+do not re-read the YAML. Each ADR is indexed once into a SectionMap that
+all rules are evaluated against. For corpus-wide runs use check_many().
+
 See Also:
     - ADR-015: Approval & Validation System
     - config/adr-completeness-rules.yaml: Rule definitions
@@ -26,8 +31,9 @@ See Also:
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 import re
+import threading
 
 import yaml
 
@@ -104,6 +110,139 @@ class CompletenessResult:
     rules_passed: int = 0
 
 
+class SectionMap:
+    """Per-ADR index of sections, computed once and shared by all rules.
+
+    Maps lowercased section names to their ADRSection and to the
+    (start, end) character offsets of the section text in raw_content,
+    including sub-sections. Search texts are sliced from these offsets.
+    Offsets are computed on first use per section and then cached.
+
+    Attributes:
+        adr: The indexed ADR document
+        spans: Dict mapping lowercased section names to (start, end) offsets
+    """
+
+    def __init__(self, adr: "ADRDocument"):
+        """Index the ADR.
+
+        Args:
+            adr: The ADR document to index
+        """
+        self.adr = adr
+        self.raw_content: str = adr.raw_content
+        self._lower_content: Optional[str] = None
+        self._metadata_text: Optional[str] = None
+
+        # First section wins on case-insensitive name collisions
+        self._sections: dict[str, Any] = {}
+        for sec_name, section in adr.sections.items():
+            self._sections.setdefault(sec_name.lower(), section)
+
+        # Line start offsets and heading lines (index, level, line)
+        lines = self.raw_content.split('\n')
+        self._line_offsets: list[int] = []
+        offset = 0
+        for line in lines:
+            self._line_offsets.append(offset)
+            offset += len(line) + 1
+        self._headings: list[tuple[int, int, str]] = [
+            (i, len(line) - len(line.lstrip('#')), line)
+            for i, line in enumerate(lines)
+            if line.startswith('#')
+        ]
+
+        self.spans: dict[str, tuple[int, int]] = {}
+
+    @property
+    def lower_content(self) -> str:
+        """Lowercased raw content (computed on first use)."""
+        if self._lower_content is None:
+            self._lower_content = self.raw_content.lower()
+        return self._lower_content
+
+    @property
+    def metadata_text(self) -> str:
+        """String form of the metadata, used for location "header"."""
+        if self._metadata_text is None:
+            self._metadata_text = str(self.adr.metadata)
+        return self._metadata_text
+
+    def find_section(self, name: str) -> Optional[Any]:
+        """Find section by name (case-insensitive).
+
+        Args:
+            name: Section name to find
+
+        Returns:
+            ADRSection object or None
+        """
+        return self._sections.get(name.lower())
+
+    def section_text(self, name: str) -> str:
+        """Get the text of a section including its sub-sections.
+
+        Args:
+            name: Section name (case-insensitive)
+
+        Returns:
+            Section text, or empty string if the section does not exist
+        """
+        key = name.lower()
+        span = self.spans.get(key)
+        if span is None:
+            section = self._sections.get(key)
+            if section is None:
+                return ""
+            span = self._compute_span(section)
+            self.spans[key] = span
+        start, end = span
+        return self.raw_content[start:end]
+
+    def _compute_span(self, section: Any) -> tuple[int, int]:
+        """Compute the character offsets of a section in raw_content.
+
+        The section starts at the first heading line matching its name
+        (line_start in ADRSection may be incorrect for some documents) and
+        ends at the next heading of the same or a higher level.
+
+        Args:
+            section: ADRSection to locate
+
+        Returns:
+            Tuple of (start, end) character offsets
+        """
+        line_count = len(self._line_offsets)
+        header_pattern = f"{'#' * section.level} {section.name}"
+
+        start_line = None
+        for i, _, line in self._headings:
+            if line.strip() == header_pattern or section.name in line:
+                start_line = i
+                break
+
+        if start_line is None:
+            # Fallback: use section.line_start
+            start_line = section.line_start
+
+        end_line = line_count
+        for i, level, _ in self._headings:
+            if i > start_line and level <= section.level:
+                end_line = i
+                break
+
+        if start_line >= line_count:
+            return (len(self.raw_content), len(self.raw_content))
+
+        start = self._line_offsets[start_line]
+        end = (
+            self._line_offsets[end_line] - 1
+            if end_line < line_count
+            else len(self.raw_content)
+        )
+        return (start, max(start, end))
+
+
 class CompletenessValidator:
     """Validates ADRs against contextual rules.
 
@@ -127,6 +266,10 @@ class CompletenessValidator:
     # Default path relative to HELIX root
     DEFAULT_RULES_PATH = Path("config/adr-completeness-rules.yaml")
 
+    # Shared validators keyed by (resolved rules path, mtime_ns)
+    _shared: dict[tuple[str, int], "CompletenessValidator"] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, rules_path: Optional[Path] = None):
         """Initialize with rule file.
 
@@ -137,8 +280,54 @@ class CompletenessValidator:
         self.rules_path = rules_path or self.DEFAULT_RULES_PATH
         self.rules: list[CompletenessRule] = []
         self.base_rules: dict = {}
+        self._patterns: dict[str, re.Pattern] = {}
         self._load_rules()
 
+    @classmethod
+    def shared(cls, rules_path: Optional[Path] = None) -> "CompletenessValidator":
+        """Get a validator for a rules file, compiled once and reused.
+
+        The cached validator is rebuilt when the rules file changes.
+
+        Args:
+            rules_path: Path to YAML rules file.
+                        Default: config/adr-completeness-rules.yaml
+
+        Returns:
+            Shared CompletenessValidator instance
+        """
+        path = Path(rules_path or cls.DEFAULT_RULES_PATH)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        key = (str(path.resolve()), mtime_ns)
+
+        with cls._shared_lock:
+            validator = cls._shared.get(key)
+            if validator is None:
+                # Drop stale entries for the same file
+                for stale in [k for k in cls._shared if k[0] == key[0]]:
+                    del cls._shared[stale]
+                validator = cls(path)
+                cls._shared[key] = validator
+            return validator
+
+    def _compile(self, pattern: str) -> re.Pattern:
+        """Get the compiled case-insensitive regex for a pattern.
+
+        Args:
+            pattern: Regex pattern string from the rules
+
+        Returns:
+            Compiled pattern (cached per validator)
+        """
+        compiled = self._patterns.get(pattern)
+        if compiled is None:
+            compiled = re.compile(pattern, re.IGNORECASE)
+            self._patterns[pattern] = compiled
+        return compiled
+
     def _load_rules(self) -> None:
         """Load rules from YAML file.
 
@@ -180,6 +369,14 @@ class CompletenessValidator:
                 print(f"Warning: Invalid rule definition (missing {e}): {rule_def}")
                 continue
 
+        # Pre-compile all regexes used by the rules
+        for rule in self.rules:
+            for sec_req in rule.require.get("sections", []) or []:
+                for element in sec_req.get("required_elements", []) or []:
+                    self._compile(element)
+            for pattern_req in rule.require.get("content_patterns", []) or []:
+                self._compile(pattern_req["pattern"])
+
     def check(self, adr: "ADRDocument") -> CompletenessResult:
         """Check ADR against all applicable rules.
 
@@ -195,11 +392,12 @@ class CompletenessValidator:
         issues: list[ValidationIssue] = []
         rules_triggered = 0
         rules_passed = 0
+        section_map = SectionMap(adr)
 
         for rule in self.rules:
-            if self._matches_condition(rule.when, adr):
+            if self._matches_condition(rule.when, adr, section_map):
                 rules_triggered += 1
-                rule_issues = self._check_requirements(rule, adr)
+                rule_issues = self._check_requirements(rule, adr, section_map)
 
                 if not rule_issues:
                     rules_passed += 1
@@ -222,7 +420,23 @@ class CompletenessValidator:
             rules_passed=rules_passed,
         )
 
-    def _matches_condition(self, when: dict, adr: "ADRDocument") -> bool:
+    def check_many(self, adrs: Iterable["ADRDocument"]) -> list[CompletenessResult]:
+        """Check several ADRs against the compiled rules.
+
+        Args:
+            adrs: The ADR documents to check
+
+        Returns:
+            List of CompletenessResult in input order
+        """
+        return [self.check(adr) for adr in adrs]
+
+    def _matches_condition(
+        self,
+        when: dict,
+        adr: "ADRDocument",
+        section_map: Optional[SectionMap] = None,
+    ) -> bool:
         """Check if a rule applies to the ADR.
 
         Evaluates all conditions in the `when` dict against the ADR.
@@ -231,6 +445,7 @@ class CompletenessValidator:
         Args:
             when: Dict of conditions to check
             adr: The ADR document
+            section_map: Precomputed SectionMap of the ADR (built if omitted)
 
         Returns:
             True if all conditions match
@@ -239,6 +454,8 @@ class CompletenessValidator:
         if not when:
             return True
 
+        if section_map is None:
+            section_map = SectionMap(adr)
         metadata = adr.metadata
 
         for key, expected in when.items():
@@ -248,7 +465,7 @@ class CompletenessValidator:
             if key == "any":
                 if not isinstance(expected, list):
                     expected = [expected]
-                if not any(self._matches_condition(cond, adr) for cond in expected):
+                if not any(self._matches_condition(cond, adr, section_map) for cond in expected):
                     return False
                 continue
 
@@ -257,19 +474,21 @@ class CompletenessValidator:
                 if not isinstance(expected, list):
                     expected = [expected]
                 # Empty list means "always true"
-                if expected and not all(self._matches_condition(cond, adr) for cond in expected):
+                if expected and not all(
+                    self._matches_condition(cond, adr, section_map) for cond in expected
+                ):
                     return False
                 continue
 
             # content_contains: Check if content contains text
             if key == "content_contains":
-                if expected.lower() not in adr.raw_content.lower():
+                if expected.lower() not in section_map.lower_content:
                     return False
                 continue
 
             # section_exists: Check if section exists
             if key == "section_exists":
-                if not self._find_section(adr, expected):
+                if not section_map.find_section(expected):
                     return False
                 continue
 
@@ -328,7 +547,8 @@ class CompletenessValidator:
     def _check_requirements(
         self,
         rule: CompletenessRule,
-        adr: "ADRDocument"
+        adr: "ADRDocument",
+        section_map: Optional[SectionMap] = None,
     ) -> list[ValidationIssue]:
         """Check the requirements of a triggered rule.
 
@@ -337,12 +557,15 @@ class CompletenessValidator:
         Args:
             rule: The rule to check
             adr: The ADR document
+            section_map: Precomputed SectionMap of the ADR (built if omitted)
 
         Returns:
             List of ValidationIssue objects for failed requirements
         """
         issues: list[ValidationIssue] = []
         require = rule.require
+        if section_map is None:
+            section_map = SectionMap(adr)
 
         # Determine issue level based on severity
         if hasattr(IssueLevel, 'ERROR') and not isinstance(IssueLevel.ERROR, str):
@@ -354,7 +577,7 @@ class CompletenessValidator:
         if "sections" in require:
             for sec_req in require["sections"]:
                 section_name = sec_req["name"]
-                section = self._find_section(adr, section_name)
+                section = section_map.find_section(section_name)
 
                 if not section:
                     issues.append(self._create_issue(
@@ -376,7 +599,7 @@ class CompletenessValidator:
 
                     # Check required elements
                     for element in sec_req.get("required_elements", []):
-                        if not re.search(element, section.content, re.IGNORECASE):
+                        if not self._compile(element).search(section.content):
                             issues.append(self._create_issue(
                                 level=level,
                                 category="missing_criteria",
@@ -391,8 +614,13 @@ class CompletenessValidator:
                 min_matches = pattern_req.get("min_matches", 1)
                 location = pattern_req.get("location", "any")
 
-                search_text = self._get_search_text(adr, location)
-                matches = len(re.findall(pattern, search_text, re.IGNORECASE))
+                search_text = self._get_search_text(adr, location, section_map)
+                # Stop scanning once enough matches are found
+                matches = 0
+                for _ in self._compile(pattern).finditer(search_text):
+                    matches += 1
+                    if matches >= min_matches:
+                        break
 
                 if matches < min_matches:
                     issues.append(self._create_issue(
@@ -406,7 +634,7 @@ class CompletenessValidator:
         if "acceptance_criteria_keywords" in require:
             keywords = require["acceptance_criteria_keywords"]
             criteria_text = ""
-            akz_section = self._find_section(adr, "Akzeptanzkriterien")
+            akz_section = section_map.find_section("Akzeptanzkriterien")
             if akz_section:
                 criteria_text = akz_section.content.lower()
 
@@ -459,75 +687,31 @@ class CompletenessValidator:
             location=location,
         )
 
-    def _find_section(self, adr: "ADRDocument", name: str) -> Optional[Any]:
-        """Find section by name (case-insensitive).
-
-        Args:
-            adr: The ADR document
-            name: Section name to find
-
-        Returns:
-            ADRSection object or None
-        """
-        name_lower = name.lower()
-        for sec_name, section in adr.sections.items():
-            if sec_name.lower() == name_lower:
-                return section
-        return None
-
-    def _get_search_text(self, adr: "ADRDocument", location: str) -> str:
+    def _get_search_text(
+        self,
+        adr: "ADRDocument",
+        location: str,
+        section_map: Optional[SectionMap] = None,
+    ) -> str:
         """Get text to search based on location.
 
         Args:
             adr: The ADR document
             location: Where to search ("any", "header", "content", or section name)
+            section_map: Precomputed SectionMap of the ADR (built if omitted)
 
         Returns:
             Text to search in (includes sub-sections for section locations)
         """
-        if location == "any":
+        if location in ("any", "content"):
             return adr.raw_content
+        if section_map is None:
+            section_map = SectionMap(adr)
         if location == "header":
-            return str(adr.metadata)
-        if location == "content":
-            return adr.raw_content
+            return section_map.metadata_text
 
         # Location is a section name - include sub-sections
-        section = self._find_section(adr, location)
-        if not section:
-            return ""
-        
-        # Find section by searching for the header in raw_content
-        # (line_start in ADRSection may be incorrect for some documents)
-        lines = adr.raw_content.split('\n')
-        
-        # Find the actual line where this section header appears
-        header_pattern = f"{'#' * section.level} {section.name}"
-        start_line = None
-        for i, line in enumerate(lines):
-            if line.strip() == header_pattern or section.name in line:
-                if line.startswith('#'):
-                    start_line = i
-                    break
-        
-        if start_line is None:
-            # Fallback: use section.line_start
-            start_line = section.line_start
-        
-        end_line = len(lines)
-        
-        # Find where this section ends (next section at same or higher level)
-        for i, line in enumerate(lines[start_line + 1:], start=start_line + 1):
-            if line.startswith('#'):
-                # Count the level
-                level = len(line) - len(line.lstrip('#'))
-                if level <= section.level:
-                    end_line = i
-                    break
-        
-        # Extract text from start to end
-        section_text = '\n'.join(lines[start_line:end_line])
-        return section_text
+        return section_map.section_text(location)
 
 
 def validate_completeness(
@@ -554,5 +738,5 @@ def validate_completeness(
     parser = ADRParser()
     adr = parser.parse_file(adr_path)
 
-    validator = CompletenessValidator(rules_path)
+    validator = CompletenessValidator.shared(rules_path)
     return validator.check(adr)
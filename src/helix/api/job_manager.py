@@ -7,6 +7,7 @@ from typing import Any, AsyncGenerator
 from dataclasses import dataclass, field
 
 from .models import JobStatus, PhaseStatus, JobInfo, PhaseEvent
+from ..observability.registry import registry
 
 
 @dataclass
@@ -206,6 +207,14 @@ class JobManager:
         )[:limit]
         return [j.to_info() for j in jobs]
 
+    def queued_events(self) -> int:
+        """Number of events waiting in all job queues."""
+        return sum(job.event_queue.qsize() for job in list(self._jobs.values()))
+
 
 # Global instance
 job_manager = JobManager()
+
+registry.gauge(
+    "helix_sse_queue_depth", "Events queued for SSE subscribers across all jobs",
+).set_function(job_manager.queued_events)
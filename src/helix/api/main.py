@@ -11,19 +11,22 @@ ADR-030 Fix 8: Global Exception Handler with structured logging.
 import os
 import sys
 import logging
+import time
 import traceback
 from pathlib import Path
 from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
 
 from .middleware import limiter, RateLimitExceededHandler
 
 from helix.config.paths import PathConfig
+from helix.admission import get_admission_controller
+from helix.observability.registry import CONTENT_TYPE, FAST_BUCKETS, registry
 
 from .routes import openai, helix, stream, evolution
 
@@ -113,18 +116,42 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "helix_http_request_duration_seconds",
+    "HTTP handler latency (until response headers for streaming responses)",
+    labelnames=("method", "route"),
+    buckets=FAST_BUCKETS,
+)
+HTTP_REQUESTS = registry.counter(
+    "helix_http_requests", "HTTP requests by response status",
+    labelnames=("method", "route", "status"),
+)
+registry.gauge(
+    "helix_claude_processes_active", "Claude CLI processes currently admitted",
+).set_function(lambda: get_admission_controller().active)
+registry.gauge(
+    "helix_claude_processes_queued", "Claude CLI requests waiting for admission",
+).set_function(lambda: get_admission_controller().queue_depth())
+
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all requests for debugging."""
-    start_time = datetime.now()
+    """Log all requests for debugging and record request metrics."""
+    start_time = time.perf_counter()
     
     response = await call_next(request)
     
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = time.perf_counter() - start_time
+
+    # Label by route template (/helix/jobs/{job_id}) to keep cardinality low
+    route = request.scope.get("route")
+    route_path = getattr(route, "path", None) or "unmatched"
+    HTTP_REQUEST_SECONDS.labels(request.method, route_path).observe(duration)
+    HTTP_REQUESTS.labels(request.method, route_path, str(response.status_code)).inc()
     
     # Only log non-health requests or if DEBUG
-    if DEBUG or request.url.path not in ["/health", "/docs", "/openapi.json"]:
+    if DEBUG or request.url.path not in ["/health", "/docs", "/openapi.json", "/metrics"]:
         logger.debug(
             f"{request.method} {request.url.path} -> {response.status_code} ({duration:.3f}s)"
         )
@@ -163,6 +190,7 @@ async def root():
             "execute": "/helix/execute",
             "jobs": "/helix/jobs",
             "stream": "/helix/stream/{job_id}",
+            "metrics": "/metrics",
         },
     }
 
@@ -173,6 +201,12 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (OpenMetrics text format)."""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8001))
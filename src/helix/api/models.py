@@ -91,6 +91,7 @@ class ExecuteRequest(BaseModel):
     """Request to execute a HELIX project."""
     project_path: str = Field(..., description="Path to project directory")
     phase_filter: list[str] | None = Field(default=None, description="Run only these phases")
+    no_cache: bool = Field(default=False, description="Re-run phases even if their inputs are unchanged")
 
 
 class JobInfo(BaseModel):
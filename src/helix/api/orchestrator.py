@@ -9,18 +9,41 @@ Consolidates:
 - Event callbacks for SSE streaming
 - Escalation from orchestrator_legacy.py
 
+Retries after failed verification or quality gates resume the previous
+Claude session (--resume) with a compact feedback prompt instead of
+starting a cold run that rebuilds all context. If the resume fails, the
+retry falls back to a cold run. Every CLI run, including a failed
+resume, reports its mode, duration and token usage (attempt_complete
+event and phase_results[].attempts).
+
+Successful phase runs are memoized in a content-hashed phase cache
+(see phase_cache.py). When a phase's configuration, CLAUDE.md, input
+files and upstream outputs are unchanged, its outputs are restored and
+the Claude invocation is skipped (phase_cached event). use_cache=False
+(helix run --no-cache) forces a full re-run.
+
+Escalation state is kept per phase across attempts. When the escalation
+switches models and the phase config enables hedging (``hedge`` in the
+phase config), the next escalation models race each other in isolated
+phase copies and the first one to pass the gate wins (see hedging.py).
+
 See: ADR-022 for architectural decision.
 """
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, AsyncGenerator, Callable, Awaitable
 
-from helix.claude_runner import ClaudeRunner, ClaudeResult
+from helix.claude_runner import ClaudeRunner, ClaudeResult, OutputCallback
+from helix.observability import MetricsCollector, tracing
+from helix.observability.registry import registry
+from .phase_cache import PhaseCache
 from helix.phase_loader import PhaseLoader, PhaseConfig
 from helix.quality_gates import QualityGateRunner, GateResult
+from helix.hedging import HedgedPhaseRunner, HedgeCandidate, HedgeResult
 from helix.evolution.verification import PhaseVerifier, VerificationResult
 from helix.escalation import (
     EscalationManager,
@@ -31,6 +54,14 @@ from helix.escalation import (
 )
 
 
+PHASE_SECONDS = registry.histogram(
+    "helix_phase_duration_seconds",
+    "Duration of a project phase including retries and gates",
+    labelnames=("status",),
+    buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0),
+)
+
+
 @dataclass
 class PhaseEvent:
     """Event emitted during phase execution.
@@ -126,12 +157,18 @@ class UnifiedOrchestrator:
 
     MAX_RETRIES = 2
 
+    # Timeout for a single Claude run (cold or resumed)
+    PHASE_TIMEOUT = 600
+
     def __init__(
         self,
         claude_runner: ClaudeRunner | None = None,
         gate_runner: QualityGateRunner | None = None,
         phase_loader: PhaseLoader | None = None,
         escalation_manager: EscalationManager | None = None,
+        resume_retries: bool = True,
+        use_cache: bool = True,
+        metrics: MetricsCollector | None = None,
     ) -> None:
         """Initialize the UnifiedOrchestrator.
 
@@ -140,11 +177,21 @@ class UnifiedOrchestrator:
             gate_runner: QualityGateRunner for quality gate checks
             phase_loader: PhaseLoader for loading phase configurations
             escalation_manager: EscalationManager for handling failures
+            resume_retries: Resume the previous Claude session on retries
+                instead of starting a cold run
+            use_cache: Skip phases whose inputs are unchanged since their
+                last successful run and restore their outputs. Results
+                are recorded either way.
+            metrics: Optional collector credited with the tokens of each
+                phase's Claude runs and of every hedge candidate
         """
         self.claude_runner = claude_runner or ClaudeRunner()
         self.gate_runner = gate_runner or QualityGateRunner()
         self.phase_loader = phase_loader or PhaseLoader()
         self.escalation_manager = escalation_manager or EscalationManager()
+        self.resume_retries = resume_retries
+        self.use_cache = use_cache
+        self.metrics = metrics
 
     async def run_project(
         self,
@@ -158,6 +205,7 @@ class UnifiedOrchestrator:
         - Phase execution via ClaudeRunner
         - Post-phase verification (ADR-011)
         - Quality gates with escalation (ADR-004)
+        - Phase result cache for unchanged phases
         - Event streaming for progress updates
 
         Args:
@@ -169,8 +217,32 @@ class UnifiedOrchestrator:
             ProjectResult with execution details
         """
         project_path = Path(project_path)
+        with tracing.trace(
+            project_path / "logs" / "trace.jsonl",
+            "project.run",
+            project=project_path.name,
+        ) as span:
+            result = await self._run_project(project_path, on_event, phase_filter)
+            span.set(
+                success=result.success,
+                phases_completed=result.phases_completed,
+                phases_total=result.phases_total,
+            )
+            return result
+
+    async def _run_project(
+        self,
+        project_path: Path,
+        on_event: EventCallback | None,
+        phase_filter: list[str] | None,
+    ) -> ProjectResult:
+        """Execute a project (see run_project)."""
         started_at = datetime.now(timezone.utc)
 
+        # Queue this project's Claude runs fairly against other jobs
+        if isinstance(self.claude_runner, ClaudeRunner):
+            self.claude_runner.admission_key = f"project:{project_path.name}"
+
         # Emit project start event
         await self._emit_event(on_event, PhaseEvent(
             event_type="project_start",
@@ -190,6 +262,12 @@ class UnifiedOrchestrator:
                 completed_at=datetime.now(timezone.utc),
             )
 
+        # Upstream phase of each phase (for the cache fingerprint chain)
+        upstream_ids = {
+            phase.id: phases[i - 1].id if i else None
+            for i, phase in enumerate(phases)
+        }
+
         # Apply phase filter if provided
         if phase_filter:
             phases = [p for p in phases if p.id in phase_filter]
@@ -200,8 +278,11 @@ class UnifiedOrchestrator:
 
         # Create verifier for this project
         verifier = PhaseVerifier(project_path)
+        phase_cache = PhaseCache(project_path)
 
         for phase in phases:
+            phase_started = time.perf_counter()
+            phase_span = tracing.span("phase", phase_id=phase.id, phase_type=phase.type)
             phase_dir = project_path / "phases" / phase.id
             phase_dir.mkdir(parents=True, exist_ok=True)
 
@@ -212,15 +293,97 @@ class UnifiedOrchestrator:
                 data={"name": phase.name, "type": phase.type}
             ))
 
+            upstream_id = upstream_ids.get(phase.id)
+            fingerprint = phase_cache.fingerprint(
+                phase,
+                phase_dir,
+                phase_cache.output_hash(upstream_id) if upstream_id else "",
+            )
+
+            # Skip the phase if its inputs are unchanged since the last success
+            cache_entry = (
+                phase_cache.lookup(phase.id, fingerprint) if self.use_cache else None
+            )
+            if cache_entry and phase_cache.restore(cache_entry):
+                completed += 1
+                phase_results.append({
+                    "phase_id": phase.id,
+                    "success": True,
+                    "error": None,
+                    "attempts": [],
+                    "cached": True,
+                })
+                await self._emit_event(on_event, PhaseEvent(
+                    event_type="phase_cached",
+                    phase_id=phase.id,
+                    data={
+                        "fingerprint": fingerprint,
+                        "restored_files": sorted(cache_entry.outputs),
+                        "gate": cache_entry.gate,
+                    }
+                ))
+                await self._emit_event(on_event, PhaseEvent(
+                    event_type="phase_complete",
+                    phase_id=phase.id,
+                    data={"success": True, "cached": True}
+                ))
+                PHASE_SECONDS.labels("cached").observe(time.perf_counter() - phase_started)
+                phase_span.end(status="cached")
+                continue
+
+            if self.metrics is not None:
+                self.metrics.start_phase(phase.id)
+
             # Execute phase with retry loop
             phase_success = False
             phase_error: str | None = None
+            gate_verdict: dict[str, Any] | None = None
+            attempts: list[dict[str, Any]] = []
+            # Session and feedback of the last failed attempt (for --resume)
+            resume_session_id: str | None = None
+            feedback: str | None = None
+            # Escalation progresses across the attempts of this phase
+            escalation_state = EscalationState(
+                phase_id=phase.id,
+                context={
+                    "current_model": phase.config.get("model"),
+                    "hedge": phase.config.get("hedge"),
+                },
+            )
 
             for attempt in range(self.MAX_RETRIES + 1):
-                # 1. Run Claude
-                claude_result = await self._run_claude_phase(
-                    phase_dir, phase, on_event
+                # 1. Run Claude (resume the previous session on retries)
+                runs = await self._run_claude_attempt(
+                    phase_dir, phase, on_event, resume_session_id, feedback
                 )
+                resume_session_id = None
+                feedback = None
+
+                # Every CLI run is accounted, including a failed resume
+                for claude_result, mode in runs:
+                    attempt_data = {
+                        "attempt": attempt + 1,
+                        "mode": mode,
+                        "success": claude_result.success,
+                        "duration_seconds": round(claude_result.duration_seconds, 2),
+                        "input_tokens": claude_result.input_tokens,
+                        "output_tokens": claude_result.output_tokens,
+                        "cost_usd": claude_result.cost_usd,
+                    }
+                    attempts.append(attempt_data)
+                    await self._emit_event(on_event, PhaseEvent(
+                        event_type="attempt_complete",
+                        phase_id=phase.id,
+                        data=attempt_data,
+                    ))
+                    if self.metrics is not None:
+                        self.metrics.record_tokens(
+                            claude_result.input_tokens,
+                            claude_result.output_tokens,
+                            escalation_state.context.get("current_model") or "",
+                            phase_id=phase.id,
+                        )
+                claude_result, mode = runs[-1]
 
                 if not claude_result.success:
                     phase_error = f"Claude execution failed: {claude_result.stderr[:200]}"
@@ -257,6 +420,10 @@ class UnifiedOrchestrator:
                             verifier.write_retry_file(
                                 phase_dir, verify_result, attempt + 1
                             )
+                            resume_session_id = claude_result.session_id
+                            feedback = verifier.format_retry_prompt(
+                                verify_result, attempt + 1, self.MAX_RETRIES
+                            )
                             continue  # Retry
                         else:
                             phase_error = verify_result.message
@@ -286,19 +453,54 @@ class UnifiedOrchestrator:
 
                         # Handle escalation (ADR-004)
                         escalation_action = await self._handle_escalation(
-                            phase_dir, phase, gate_result, on_event
+                            phase_dir, phase, gate_result, on_event, escalation_state
                         )
 
                         if escalation_action.requires_human:
                             phase_error = f"Requires human intervention: {escalation_action.message}"
                             break
 
+                        if escalation_action.parameters.get("hedged"):
+                            hedge_result = await self._run_hedged_escalation(
+                                phase_dir, phase, gate_result, escalation_action, on_event
+                            )
+                            attempts.extend(
+                                {"attempt": attempt + 1, "mode": "hedge", **c.to_dict()}
+                                for c in hedge_result.candidates
+                            )
+                            if hedge_result.winner is not None:
+                                escalation_state.context["current_model"] = hedge_result.winner.model
+                                gate_verdict = {
+                                    "gate_type": hedge_result.gate_result.gate_type,
+                                    "passed": True,
+                                    "message": hedge_result.gate_result.message,
+                                }
+                                await self._emit_event(on_event, PhaseEvent(
+                                    event_type="gate_passed",
+                                    phase_id=phase.id,
+                                    data={
+                                        "gate_type": hedge_result.gate_result.gate_type,
+                                        "model": hedge_result.winner.model,
+                                    }
+                                ))
+                                phase_success = True
+                                break
+
                         if attempt < self.MAX_RETRIES:
+                            resume_session_id = claude_result.session_id
+                            feedback = self._build_gate_feedback(
+                                gate_result, escalation_action
+                            )
                             continue  # Retry based on escalation
                         else:
                             phase_error = gate_result.message
                             break
                     else:
+                        gate_verdict = {
+                            "gate_type": gate_result.gate_type,
+                            "passed": True,
+                            "message": gate_result.message,
+                        }
                         await self._emit_event(on_event, PhaseEvent(
                             event_type="gate_passed",
                             phase_id=phase.id,
@@ -314,17 +516,37 @@ class UnifiedOrchestrator:
                 "phase_id": phase.id,
                 "success": phase_success,
                 "error": phase_error,
+                "attempts": attempts,
+                "cached": False,
             }
             phase_results.append(phase_result_data)
+            PHASE_SECONDS.labels("success" if phase_success else "failed").observe(
+                time.perf_counter() - phase_started
+            )
+            phase_span.end(
+                status="success" if phase_success else "failed",
+                attempts=len(attempts),
+                error=phase_error,
+            )
+            if self.metrics is not None:
+                self.metrics.end_phase(phase_success, phase_id=phase.id)
 
             if phase_success:
                 completed += 1
+                phase_cache.store(
+                    phase,
+                    phase_dir,
+                    fingerprint,
+                    self._get_expected_files(phase),
+                    gate=gate_verdict,
+                )
                 await self._emit_event(on_event, PhaseEvent(
                     event_type="phase_complete",
                     phase_id=phase.id,
                     data={"success": True}
                 ))
             else:
+                phase_cache.invalidate(phase.id)
                 errors.append(f"Phase {phase.id}: {phase_error}")
                 await self._emit_event(on_event, PhaseEvent(
                     event_type="phase_failed",
@@ -416,6 +638,76 @@ class UnifiedOrchestrator:
         if on_event:
             await on_event(event)
 
+    @tracing.traced("phase.attempt")
+    async def _run_claude_attempt(
+        self,
+        phase_dir: Path,
+        phase: PhaseConfig,
+        on_event: EventCallback | None,
+        resume_session_id: str | None = None,
+        feedback: str | None = None,
+    ) -> list[tuple[ClaudeResult, str]]:
+        """Run one attempt of a phase, resuming the previous session if possible.
+
+        Args:
+            phase_dir: Phase working directory
+            phase: Phase configuration
+            on_event: Optional event callback for output streaming
+            resume_session_id: Session of the failed previous attempt
+            feedback: Feedback prompt describing what to fix
+
+        Returns:
+            List of (ClaudeResult, mode) for every CLI run, where mode is
+            "cold" or "resume". The last run is the attempt's result; a
+            failed resume is followed by a cold run.
+        """
+        runs: list[tuple[ClaudeResult, str]] = []
+        if self.resume_retries and resume_session_id and feedback:
+            result = await self._resume_claude_phase(
+                phase_dir, phase, on_event, resume_session_id, feedback
+            )
+            runs.append((result, "resume"))
+            if result.success:
+                return runs
+
+            await self._emit_event(on_event, PhaseEvent(
+                event_type="resume_failed",
+                phase_id=phase.id,
+                data={
+                    "session_id": resume_session_id,
+                    "error": result.stderr[:200],
+                },
+            ))
+
+        runs.append((await self._run_claude_phase(phase_dir, phase, on_event), "cold"))
+        return runs
+
+    def _output_callback(
+        self,
+        phase: PhaseConfig,
+        on_event: EventCallback | None,
+    ) -> OutputCallback | None:
+        """Create an output callback that streams lines as events.
+
+        Args:
+            phase: Phase configuration
+            on_event: Optional event callback
+
+        Returns:
+            Output callback, or None if no event callback is given
+        """
+        if not on_event:
+            return None
+
+        async def output_callback(stream: str, line: str) -> None:
+            await self._emit_event(on_event, PhaseEvent(
+                event_type="output",
+                phase_id=phase.id,
+                data={"stream": stream, "text": line}
+            ))
+
+        return output_callback
+
     async def _run_claude_phase(
         self,
         phase_dir: Path,
@@ -433,29 +725,82 @@ class UnifiedOrchestrator:
             ClaudeResult from execution
         """
         model = phase.config.get("model")
+        output_callback = self._output_callback(phase, on_event)
 
-        if on_event:
+        if output_callback:
             # Stream output via events
-            async def output_callback(stream: str, line: str) -> None:
-                await self._emit_event(on_event, PhaseEvent(
-                    event_type="output",
-                    phase_id=phase.id,
-                    data={"stream": stream, "text": line}
-                ))
-
             return await self.claude_runner.run_phase_streaming(
                 phase_dir=phase_dir,
                 on_output=output_callback,
                 model=model,
-                timeout=600,
+                timeout=self.PHASE_TIMEOUT,
             )
         else:
             return await self.claude_runner.run_phase(
                 phase_dir=phase_dir,
                 model=model,
-                timeout=600,
+                timeout=self.PHASE_TIMEOUT,
             )
 
+    async def _resume_claude_phase(
+        self,
+        phase_dir: Path,
+        phase: PhaseConfig,
+        on_event: EventCallback | None,
+        session_id: str,
+        feedback: str,
+    ) -> ClaudeResult:
+        """Resume the previous Claude session of a phase with feedback.
+
+        Claude keeps the context of the failed attempt, so only the
+        feedback has to be sent instead of re-reading CLAUDE.md.
+
+        Args:
+            phase_dir: Phase working directory
+            phase: Phase configuration
+            on_event: Optional event callback for output streaming
+            session_id: Claude CLI session ID of the failed attempt
+            feedback: Feedback prompt describing what to fix
+
+        Returns:
+            ClaudeResult from execution
+        """
+        return await self.claude_runner.continue_session(
+            session_id=session_id,
+            prompt=feedback,
+            model=phase.config.get("model"),
+            timeout=self.PHASE_TIMEOUT,
+            cwd=phase_dir,
+            on_output=self._output_callback(phase, on_event),
+        )
+
+    def _build_gate_feedback(
+        self,
+        gate_result: GateResult,
+        action: EscalationAction,
+    ) -> str:
+        """Build the feedback prompt for a failed quality gate.
+
+        Args:
+            gate_result: Failed gate result
+            action: Escalation action chosen for the failure
+
+        Returns:
+            Markdown-formatted feedback prompt
+        """
+        lines = [
+            "# Quality Gate Failed - Please Fix",
+            "",
+            f"The `{gate_result.gate_type}` quality gate failed:",
+            "",
+            gate_result.message,
+            "",
+        ]
+        if action.message:
+            lines.extend([f"**Hint:** {action.message}", ""])
+        lines.append("Fix the issues above, then complete the phase as before.")
+        return "\n".join(lines)
+
     async def _check_quality_gate(
         self,
         phase_dir: Path,
@@ -486,6 +831,7 @@ class UnifiedOrchestrator:
         phase: PhaseConfig,
         gate_result: GateResult,
         on_event: EventCallback | None,
+        state: EscalationState | None = None,
     ) -> EscalationAction:
         """Handle a quality gate failure with escalation.
 
@@ -494,14 +840,16 @@ class UnifiedOrchestrator:
             phase: Phase configuration
             gate_result: Failed gate result
             on_event: Optional event callback
+            state: Escalation state of the phase (fresh state if None)
 
         Returns:
             EscalationAction to take
         """
-        state = EscalationState(
-            phase_id=phase.id,
-            level=EscalationLevel.NONE,
-        )
+        if state is None:
+            state = EscalationState(
+                phase_id=phase.id,
+                level=EscalationLevel.NONE,
+            )
 
         action = await self.escalation_manager.handle_gate_failure(
             phase_dir, gate_result, state
@@ -520,6 +868,77 @@ class UnifiedOrchestrator:
 
         return action
 
+    @tracing.traced("escalation.hedge")
+    async def _run_hedged_escalation(
+        self,
+        phase_dir: Path,
+        phase: PhaseConfig,
+        gate_result: GateResult,
+        action: EscalationAction,
+        on_event: EventCallback | None,
+    ) -> HedgeResult:
+        """Race the escalation models of a hedged model switch.
+
+        Args:
+            phase_dir: Phase working directory
+            phase: Phase configuration
+            gate_result: Failed gate result
+            action: Hedged MODEL_SWITCH action
+            on_event: Optional event callback
+
+        Returns:
+            HedgeResult; on a winner, phase_dir holds the winner's output
+        """
+        models = action.parameters["models"]
+        runner = HedgedPhaseRunner(
+            self.claude_runner,
+            self.gate_runner,
+            max_cost_usd=action.parameters.get("max_cost_usd"),
+            timeout=self.PHASE_TIMEOUT,
+        )
+
+        await self._emit_event(on_event, PhaseEvent(
+            event_type="hedge_start",
+            phase_id=phase.id,
+            data={"models": models, "max_cost_usd": runner.max_cost_usd},
+        ))
+
+        async def on_candidate(candidate: HedgeCandidate) -> None:
+            # Losing and cancelled candidates count towards the phase cost
+            if self.metrics is not None:
+                self.metrics.record_hedge_candidate(
+                    candidate.model,
+                    candidate.input_tokens,
+                    candidate.output_tokens,
+                    candidate.cost_usd,
+                    candidate.status,
+                    phase_id=phase.id,
+                )
+            await self._emit_event(on_event, PhaseEvent(
+                event_type="hedge_candidate_complete",
+                phase_id=phase.id,
+                data=candidate.to_dict(),
+            ))
+
+        prompt = "\n\n".join([
+            "Read CLAUDE.md and execute all tasks described there.",
+            self._build_gate_feedback(gate_result, action),
+        ])
+        result = await runner.run(
+            phase_dir,
+            models,
+            phase.quality_gate,
+            prompt=prompt,
+            on_candidate=on_candidate,
+        )
+
+        await self._emit_event(on_event, PhaseEvent(
+            event_type="hedge_complete",
+            phase_id=phase.id,
+            data=result.to_dict(),
+        ))
+        return result
+
     def _get_expected_files(self, phase: PhaseConfig) -> list[str]:
         """Get expected output files from phase configuration.
 
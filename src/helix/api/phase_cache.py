@@ -0,0 +1,301 @@
+"""Phase result cache for the Unified Orchestrator.
+
+Memoizes successful phase runs so re-running a project only executes
+phases whose inputs changed. Each phase is fingerprinted from:
+
+- its phase configuration (including the model)
+- the phase's CLAUDE.md
+- all files below the phase's input/ directory
+- the output hash of the upstream phase
+
+On a hit, the recorded output files are restored from a content-addressed
+blob store and the Claude invocation, verification and quality gate are
+skipped. The recorded gate verdict is reported instead.
+
+Layout below the project root::
+
+    .helix/phase-cache/
+        index.json          {"version": 1, "phases": {phase_id: entry}}
+        blobs/<sha256>      output file contents
+
+Example:
+    cache = PhaseCache(project_path)
+    fingerprint = cache.fingerprint(phase, phase_dir, upstream_hash)
+    entry = cache.lookup(phase.id, fingerprint)
+    if entry and cache.restore(entry):
+        ...  # skip phase
+
+See Also:
+    - orchestrator.py: Uses the cache in run_project()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from helix.phase_loader import PhaseConfig
+
+# Bump when the fingerprint inputs or entry format change
+CACHE_VERSION = 1
+
+# Candidate locations of expected output files, relative to the project
+# (mirrors PhaseVerifier.verify_phase_output)
+_OUTPUT_PREFIXES = ("new/", "modified/", "output/")
+
+
+@dataclass
+class PhaseCacheEntry:
+    """Recorded result of a successful phase run.
+
+    Attributes:
+        fingerprint: Input fingerprint the result belongs to
+        outputs: Project-relative output path -> content hash
+        output_hash: Combined hash of all outputs (upstream input of
+            the next phase)
+        gate: Quality gate verdict (gate_type, passed, message) or None
+    """
+    fingerprint: str
+    outputs: dict[str, str] = field(default_factory=dict)
+    output_hash: str = ""
+    gate: Optional[dict[str, Any]] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+
+def _hash_file(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _walk_files(directory: Path) -> list[Path]:
+    """All regular files below a directory, in a stable order."""
+    if not directory.is_dir():
+        return []
+    files: list[Path] = []
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        files.extend(Path(root) / name for name in sorted(names))
+    return files
+
+
+class PhaseCache:
+    """Content-hashed cache of phase outputs and gate verdicts.
+
+    Attributes:
+        project_path: Project root
+        cache_dir: Cache directory (.helix/phase-cache)
+    """
+
+    def __init__(self, project_path: Path, cache_dir: Optional[Path] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            project_path: Project root directory
+            cache_dir: Cache directory. Default: .helix/phase-cache below
+                the project root.
+        """
+        self.project_path = Path(project_path)
+        self.cache_dir = cache_dir or self.project_path / ".helix" / "phase-cache"
+        self._index_file = self.cache_dir / "index.json"
+        self._blob_dir = self.cache_dir / "blobs"
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+
+    def fingerprint(
+        self,
+        phase: PhaseConfig,
+        phase_dir: Path,
+        upstream_hash: str = "",
+    ) -> str:
+        """Fingerprint everything a phase run depends on.
+
+        Args:
+            phase: Phase configuration
+            phase_dir: Phase working directory
+            upstream_hash: Output hash of the preceding phase
+
+        Returns:
+            Hex digest identifying the phase inputs
+        """
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_VERSION}\n".encode())
+        digest.update(json.dumps(asdict(phase), sort_keys=True, default=str).encode())
+        digest.update(f"\nupstream:{upstream_hash}\n".encode())
+
+        claude_md = phase_dir / "CLAUDE.md"
+        if claude_md.is_file():
+            digest.update(f"CLAUDE.md:{_hash_file(claude_md)}\n".encode())
+
+        input_dir = phase_dir / "input"
+        for path in _walk_files(input_dir):
+            rel = path.relative_to(input_dir).as_posix()
+            digest.update(f"input/{rel}:{_hash_file(path)}\n".encode())
+
+        return digest.hexdigest()
+
+    def lookup(self, phase_id: str, fingerprint: str) -> Optional[PhaseCacheEntry]:
+        """Find the recorded result of a phase for a fingerprint.
+
+        Args:
+            phase_id: Phase ID
+            fingerprint: Current input fingerprint
+
+        Returns:
+            PhaseCacheEntry if the inputs are unchanged, None otherwise
+        """
+        data = self._load().get(phase_id)
+        if not data or data.get("fingerprint") != fingerprint:
+            return None
+        try:
+            return PhaseCacheEntry(**data)
+        except TypeError:
+            return None
+
+    def output_hash(self, phase_id: str) -> str:
+        """Output hash of the last recorded run of a phase ("" if none)."""
+        data = self._load().get(phase_id) or {}
+        return data.get("output_hash", "")
+
+    def restore(self, entry: PhaseCacheEntry) -> bool:
+        """Write the recorded outputs back into the project.
+
+        Files that already have the recorded content are left untouched.
+
+        Args:
+            entry: Cache entry to restore
+
+        Returns:
+            True if all outputs were restored, False if a blob is missing
+        """
+        if any(not (self._blob_dir / sha).is_file() for sha in entry.outputs.values()):
+            return False
+
+        for rel, sha in entry.outputs.items():
+            target = self.project_path / rel
+            if target.is_file() and _hash_file(target) == sha:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = target.with_name(target.name + ".tmp")
+            temp_file.write_bytes((self._blob_dir / sha).read_bytes())
+            temp_file.replace(target)
+        return True
+
+    def store(
+        self,
+        phase: PhaseConfig,
+        phase_dir: Path,
+        fingerprint: str,
+        expected_files: list[str],
+        gate: Optional[dict[str, Any]] = None,
+    ) -> PhaseCacheEntry:
+        """Record the outputs of a successful phase run.
+
+        Outputs are all files below the phase's output/ directory plus
+        the expected files found elsewhere in the project (same candidate
+        locations as PhaseVerifier).
+
+        Args:
+            phase: Phase configuration
+            phase_dir: Phase working directory
+            fingerprint: Input fingerprint of the run
+            expected_files: Expected output files of the phase
+            gate: Quality gate verdict, if the phase has a gate
+
+        Returns:
+            The stored PhaseCacheEntry
+        """
+        outputs: dict[str, str] = {}
+        for path in self._output_files(phase_dir, expected_files):
+            rel = path.relative_to(self.project_path).as_posix()
+            sha = _hash_file(path)
+            blob = self._blob_dir / sha
+            if not blob.is_file():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                blob.write_bytes(path.read_bytes())
+            outputs[rel] = sha
+
+        combined = hashlib.sha256()
+        for rel in sorted(outputs):
+            combined.update(f"{rel}:{outputs[rel]}\n".encode())
+
+        entry = PhaseCacheEntry(
+            fingerprint=fingerprint,
+            outputs=outputs,
+            output_hash=combined.hexdigest(),
+            gate=gate,
+        )
+        self._load()[phase.id] = entry.to_dict()
+        self._save()
+        return entry
+
+    def invalidate(self, phase_id: str) -> None:
+        """Drop the recorded result of a phase."""
+        if self._load().pop(phase_id, None) is not None:
+            self._save()
+
+    def _output_files(self, phase_dir: Path, expected_files: list[str]) -> list[Path]:
+        """Collect the output files of a phase run."""
+        files = {path.resolve(): path for path in _walk_files(phase_dir / "output")}
+
+        for file_path in expected_files:
+            if any(c in file_path for c in "*?["):
+                # Globs are covered by the output/ directory walk
+                continue
+            clean_path = file_path
+            for prefix in _OUTPUT_PREFIXES:
+                if clean_path.startswith(prefix):
+                    clean_path = clean_path[len(prefix):]
+                    break
+            for candidate in (
+                phase_dir / "output" / clean_path,
+                phase_dir / clean_path,
+                self.project_path / "new" / clean_path,
+                self.project_path / clean_path,
+            ):
+                if candidate.is_file():
+                    files.setdefault(candidate.resolve(), candidate)
+                    break
+
+        project_root = self.project_path.resolve()
+        return [
+            self.project_path / resolved.relative_to(project_root)
+            for resolved in sorted(files)
+            if resolved.is_relative_to(project_root)
+        ]
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load the index, or an empty one if missing or stale."""
+        if self._entries is None:
+            try:
+                data = json.loads(self._index_file.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            phases = data.get("phases") if isinstance(data, dict) else None
+            if not isinstance(phases, dict) or data.get("version") != CACHE_VERSION:
+                phases = {}
+            self._entries = phases
+        return self._entries
+
+    def _save(self) -> None:
+        """Persist the index atomically (temp file + rename)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self._index_file.with_suffix(".json.tmp")
+            temp_file.write_text(
+                json.dumps({"version": CACHE_VERSION, "phases": self._load()}, indent=2),
+                encoding="utf-8",
+            )
+            temp_file.replace(self._index_file)
+        except OSError:
+            # Cache is an optimization only
+            pass
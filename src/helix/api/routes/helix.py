@@ -6,6 +6,8 @@ This module provides REST endpoints:
 - GET /helix/jobs - List all jobs
 - GET /helix/jobs/{job_id} - Get job status
 - DELETE /helix/jobs/{job_id} - Stop/cancel a job
+- GET /helix/admission - Claude process admission queue metrics
+- GET /helix/usage - Token usage and cost rollups across projects
 - POST /helix/discuss - Start consultant discussion (TODO)
 
 See routes/stream.py for SSE streaming endpoint.
@@ -13,8 +15,10 @@ See routes/stream.py for SSE streaming endpoint.
 
 import asyncio
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 
+from helix.admission import get_admission_controller
+from helix.observability.ledger import get_usage_ledger
 from ..models import (
     DiscussRequest,
     ExecuteRequest,
@@ -77,6 +81,7 @@ async def execute_project(
         job,
         project_path,
         request.phase_filter,
+        request.no_cache,
     )
     
     return job.to_info()
@@ -136,3 +141,40 @@ async def stop_job(job_id: str) -> dict:
         "status": "cancelled",
         "job_id": job_id,
     }
+
+
+@router.get("/admission")
+async def admission_status() -> dict:
+    """Get Claude process admission metrics.
+
+    Returns the global concurrency cap, running processes, queue depth
+    and wait times per priority class.
+    """
+    return get_admission_controller().snapshot()
+
+
+@router.get("/usage")
+async def usage(
+    by: list[str] = Query(default=["day", "model"]),
+    project: str | None = None,
+    phase: str | None = None,
+    model: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> dict:
+    """Get token usage and cost from the usage ledger.
+
+    Groups by the given columns (day, project, phase, model, source),
+    e.g. /helix/usage?by=day&by=model for spend per model per day.
+    """
+    ledger = get_usage_ledger()
+    filters = {"project": project, "phase": phase, "model": model, "since": since, "until": until}
+    try:
+        rows = ledger.query(by, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "group_by": by,
+        "rows": rows,
+        "totals": ledger.totals(**filters),
+    }
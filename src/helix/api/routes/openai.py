@@ -22,6 +22,7 @@ Refactored with ADR-034 LLM-Native flow:
 """
 
 import asyncio
+import hashlib
 import logging
 import json
 import os
@@ -35,6 +36,7 @@ from fastapi import APIRouter, Header, Request
 from fastapi.responses import StreamingResponse
 from jinja2 import Environment, FileSystemLoader
 
+from helix.admission import Priority
 from helix.claude_runner import ClaudeRunner
 from helix.config.paths import PathConfig
 from helix.enforcement.response_enforcer import ResponseEnforcer
@@ -47,7 +49,7 @@ from helix.enforcement.validators import (
 # HELIX root for file existence validation
 HELIX_ROOT = PathConfig.HELIX_ROOT
 
-from ..middleware import InputValidator, limiter, CHAT_COMPLETIONS_LIMIT
+from ..middleware import InputValidator, limiter, CHAT_COMPLETIONS_LIMIT, get_client_ip
 from ..models import (
     ChatCompletionRequest,
     ChatCompletionResponse,
@@ -149,17 +151,21 @@ async def chat_completions(
 
     session_path = session_manager.get_session_path(session_id)
 
+    # Fair-queuing key for the Claude process admission (per user)
+    client_key = request.headers.get("X-OpenWebUI-User-Id") or get_client_ip(request)
+
     if chat_request.stream:
         # Use live streaming - events are sent as Claude works
         return StreamingResponse(
             _run_consultant_streaming(
-                session_path, session_id, completion_id, created, chat_request.model
+                session_path, session_id, completion_id, created, chat_request.model,
+                client_key=client_key,
             ),
             media_type="text/event-stream",
         )
 
     # Non-streaming: wait for complete response
-    response_text = await _run_consultant(session_id, session_state)
+    response_text = await _run_consultant(session_id, session_state, client_key=client_key)
 
     # ADR-034: Extract step from LLM response and update session
     _update_step_from_response(session_id, response_text)
@@ -211,10 +217,10 @@ async def _generate_session_claude_md(
     
     Bug-006 Fix: Now includes full chat history so Claude sees
     all messages, not just the original request.
-    """
-    template = jinja_env.get_template("consultant/session.md.j2")
 
-    content = template.render(
+    Skipped if CLAUDE.md was already rendered from the same inputs.
+    """
+    template_args = dict(
         session_id=session_id,
         status=state.status,
         step=state.step,
@@ -225,9 +231,18 @@ async def _generate_session_claude_md(
         helix_root=str(PathConfig.HELIX_ROOT),
         messages=messages or [],  # Bug-006: Pass chat history to template
     )
+    render_key = hashlib.sha256(
+        json.dumps(template_args, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    if session_manager.claude_md_is_current(session_id, render_key):
+        return
+
+    template = jinja_env.get_template("consultant/session.md.j2")
+    content = template.render(**template_args)
 
     session_path = session_manager.get_session_path(session_id)
     (session_path / "CLAUDE.md").write_text(content)
+    session_manager.mark_claude_md_rendered(session_id, render_key)
 
 
 async def _run_consultant_streaming(
@@ -236,6 +251,7 @@ async def _run_consultant_streaming(
     completion_id: str,
     created: int,
     model: str,
+    client_key: str = "default",
 ) -> AsyncGenerator[str, None]:
     """Run Claude Code with live streaming to Open WebUI.
 
@@ -265,10 +281,12 @@ async def _run_consultant_streaming(
     # Set paths via PathConfig
     PathConfig.ensure_claude_path()
 
-    # Create runner
+    # Create runner (chat runs are admitted before background jobs)
     runner = ClaudeRunner(
         claude_cmd=PathConfig.CLAUDE_CMD,
         use_stdbuf=True,
+        priority=Priority.INTERACTIVE,
+        admission_key=client_key,
     )
 
     # Check availability
@@ -286,6 +304,24 @@ async def _run_consultant_streaming(
     last_tool: str | None = None
     stdout_buffer: list[str] = []
 
+    # ADR-038: Enforcer with all 3 validators, created up front so the
+    # response can be validated as soon as it is written
+    enforcer = ResponseEnforcer(
+        runner=runner,
+        max_retries=2,
+        validators=[
+            StepMarkerValidator(),
+            ADRStructureValidator(),
+            FileExistenceValidator(helix_root=HELIX_ROOT),
+        ]
+    )
+
+    # Validation context for FileExistenceValidator
+    validation_context = {"helix_root": HELIX_ROOT}
+
+    # Validation of the response.md content as soon as it is written
+    stream_validation = enforcer.start_stream_validation(validation_context)
+
     # ADR-042: Queue for real-time streaming events
     from asyncio import Queue
     event_queue: Queue[str | None] = Queue()
@@ -310,6 +346,13 @@ async def _run_consultant_streaming(
                             if tool_name != last_tool:
                                 last_tool = tool_name
                                 await event_queue.put(f"\n[{tool_name}] ")
+
+                            # Validate each (re)write of the response
+                            tool_input = block.get("input") or {}
+                            if tool_name == "Write" and str(
+                                tool_input.get("file_path", "")
+                            ).endswith("output/response.md"):
+                                stream_validation.reset(str(tool_input.get("content", "")))
                                 
             except json.JSONDecodeError:
                 pass  # Not JSON, ignore
@@ -342,6 +385,14 @@ async def _run_consultant_streaming(
         # NOTE: claude_task.done() waits for process.wait() = real process end
         # No need for status.json check - that was sugar coating!
         while not claude_task.done():
+            # ADR-038: Cut a doomed generation short and retry sooner
+            if stream_validation.should_abort:
+                claude_task.cancel()
+                try:
+                    await claude_task
+                except asyncio.CancelledError:
+                    pass
+                break
             try:
                 # Wait for event with timeout
                 event = await asyncio.wait_for(event_queue.get(), timeout=1.0)
@@ -358,8 +409,15 @@ async def _run_consultant_streaming(
         except asyncio.CancelledError:
             pass
         
-        # Get result from claude task
-        result = await claude_task
+        # Get result from claude task (None if cut short)
+        result = None if claude_task.cancelled() else await claude_task
+
+        if result is None:
+            codes = ", ".join(i.code for i in stream_validation.errors)
+            yield _make_chunk(
+                completion_id, created, model,
+                f"\n[Antwort abgebrochen ({codes}) - starte Korrektur...]\n",
+            )
 
         # === FIX 2: Validate response file timestamp ===
         if response_file.exists():
@@ -369,6 +427,10 @@ async def _run_consultant_streaming(
                 response_text = response_file.read_text()
             # else: File is stale, don't use it
 
+        if not response_text and result is None:
+            # Cut short before the Write landed - use the streamed content
+            response_text = stream_validation.text
+
         if not response_text:
             # Try to extract from stdout
             stdout = "\n".join(stdout_buffer)
@@ -413,23 +475,9 @@ async def _run_consultant_streaming(
         # =====================================================================
         logger = logging.getLogger(__name__)
 
-        # Create enforcer with all validators
-        enforcer = ResponseEnforcer(
-            runner=runner,
-            max_retries=2,
-            validators=[
-                StepMarkerValidator(),
-                ADRStructureValidator(),
-                FileExistenceValidator(helix_root=HELIX_ROOT),
-            ]
-        )
-
-        # Validation context for FileExistenceValidator
-        validation_context = {"helix_root": HELIX_ROOT}
-
         # Extract session_id for retry continuation
         # The session_id allows --resume to continue the conversation
-        claude_session_id = result.session_id
+        claude_session_id = result.session_id if result else None
         if not claude_session_id:
             # Fallback: try to extract from stdout buffer
             for line in stdout_buffer:
@@ -456,6 +504,7 @@ async def _run_consultant_streaming(
             runner=runner,
             context=validation_context,
             max_retries=2,
+            early_issues=stream_validation.errors if result is None else None,
         )
 
         # Log enforcement results
@@ -560,7 +609,11 @@ def _make_final_chunk(completion_id: str, created: int, model: str) -> str:
     return f"data: {json.dumps(chunk.model_dump())}\n\n"
 
 
-async def _run_consultant(session_id: str, state: SessionState) -> str:
+async def _run_consultant(
+    session_id: str,
+    state: SessionState,
+    client_key: str = "default",
+) -> str:
     """Run Claude Code for the consultant session (non-streaming).
 
     ADR-038: Full enforcement with all 3 validators, retry logic, and fallbacks.
@@ -571,10 +624,12 @@ async def _run_consultant(session_id: str, state: SessionState) -> str:
     # Set paths via PathConfig
     PathConfig.ensure_claude_path()
 
-    # Create runner
+    # Create runner (chat runs are admitted before background jobs)
     runner = ClaudeRunner(
         claude_cmd=PathConfig.CLAUDE_CMD,
         use_stdbuf=True,
+        priority=Priority.INTERACTIVE,
+        admission_key=client_key,
     )
 
     # Check availability
@@ -0,0 +1,231 @@
+"""Persistent index of consultant sessions.
+
+Maps conversation IDs (X-OpenWebUI-Chat-Id) and first-message hashes to
+session IDs and keeps sessions ordered by updated_at, so lookups and
+list_sessions() pagination don't scan every directory under
+projects/sessions.
+
+The index is a SQLite database (WAL mode) next to the sessions
+directory. It is only an index: the session directories stay the
+source of truth, and rebuild() recreates it from their status.json
+files.
+
+Example:
+    index = SessionIndex(Path("projects/.sessions-index.db"))
+    index.upsert(state, message_hash="5d41402a")
+    index.find(conversation_id="550e8400-e29b-41d4-a716-446655440000")
+    index.list_ids(limit=20, offset=40)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .session_manager import SessionState
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    conversation_id TEXT,
+    message_hash TEXT,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    archived INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_conversation ON sessions (conversation_id);
+CREATE INDEX IF NOT EXISTS sessions_message_hash ON sessions (message_hash);
+CREATE INDEX IF NOT EXISTS sessions_recent ON sessions (archived, updated_at);
+"""
+
+_UPSERT = """
+INSERT INTO sessions (session_id, conversation_id, message_hash, status, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (session_id) DO UPDATE SET
+    conversation_id = excluded.conversation_id,
+    message_hash = COALESCE(excluded.message_hash, message_hash),
+    status = excluded.status,
+    updated_at = excluded.updated_at,
+    archived = 0
+"""
+
+
+def message_hash(first_message: str) -> str:
+    """Hash of a first user message, as used in legacy session IDs.
+
+    Only sessions whose ID contains this hash are indexed by it.
+    """
+    return hashlib.md5(first_message.encode()).hexdigest()[:8]
+
+
+class SessionIndex:
+    """SQLite index of session IDs by conversation, message hash and recency.
+
+    Attributes:
+        db_path: SQLite database file
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the SessionIndex.
+
+        Args:
+            db_path: SQLite database file (created on first use)
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.created = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.created = not self.db_path.exists()
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def open(self) -> bool:
+        """Open the database.
+
+        Returns:
+            True if the database was newly created (and needs a rebuild)
+        """
+        with self._lock:
+            self._connect()
+            return self.created
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def upsert(self, state: "SessionState", message_hash: str | None = None) -> None:
+        """Add or update a session.
+
+        Args:
+            state: Current session state
+            message_hash: Hash of the first message (kept if None)
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(_UPSERT, (
+                        state.session_id, state.conversation_id, message_hash,
+                        state.status, state.created_at.isoformat(), state.updated_at.isoformat(),
+                    ))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not index session {state.session_id}: {e}")
+
+    def find(
+        self,
+        conversation_id: str | None = None,
+        message_hash: str | None = None,
+    ) -> str | None:
+        """Most recently updated active session with a conversation ID or message hash."""
+        if conversation_id is not None:
+            column, value = "conversation_id", conversation_id
+        elif message_hash is not None:
+            column, value = "message_hash", message_hash
+        else:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT session_id FROM sessions WHERE {column} = ? AND archived = 0"
+                " ORDER BY updated_at DESC LIMIT 1",
+                (value,),
+            ).fetchone()
+        return row["session_id"] if row else None
+
+    def list_ids(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        status: str | None = None,
+    ) -> list[str]:
+        """Active session IDs, most recently updated first."""
+        sql = "SELECT session_id FROM sessions WHERE archived = 0"
+        params: list = []
+        if status is not None:
+            sql += " AND status = ?"
+            params.append(status)
+        sql += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+        params += [limit, offset]
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [row["session_id"] for row in rows]
+
+    def stale_ids(self, updated_before: datetime) -> list[str]:
+        """Active session IDs not updated since a point in time."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT session_id FROM sessions WHERE archived = 0 AND updated_at < ?"
+                " ORDER BY updated_at",
+                (updated_before.isoformat(),),
+            ).fetchall()
+        return [row["session_id"] for row in rows]
+
+    def mark_archived(self, session_id: str) -> None:
+        """Exclude an archived session from lookups and listings."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE sessions SET archived = 1 WHERE session_id = ?", (session_id,)
+                )
+
+    def remove(self, session_id: str) -> None:
+        """Drop a session whose directory no longer exists."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def rebuild(self, base_path: Path) -> int:
+        """Recreate the index from the sessions' status.json files.
+
+        Args:
+            base_path: Sessions directory
+
+        Returns:
+            Number of indexed sessions
+        """
+        rows = []
+        for session_dir in base_path.iterdir():
+            status_file = session_dir / "status.json"
+            if not status_file.is_file():
+                continue
+            try:
+                data = json.loads(status_file.read_text())
+                msg_hash = message_hash(data.get("original_request", ""))
+                rows.append((
+                    data["session_id"], data.get("conversation_id"),
+                    msg_hash if msg_hash in data["session_id"] else None, data["status"],
+                    data["created_at"], data["updated_at"],
+                ))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping unreadable session {session_dir.name}: {e}")
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE archived = 0")
+                conn.executemany(_UPSERT, rows)
+        return len(rows)
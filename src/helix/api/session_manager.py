@@ -11,18 +11,34 @@ Uses stable conversation IDs from headers for persistent session mapping.
 Refactored with ADR-034: LLM-Native flow instead of State-Machine.
 Removed index-based step detection and trigger-word matching.
 The LLM now determines the conversation step and reports it via markers.
+
+Per-session state, context and transcript bookkeeping is cached in memory
+(LRU), validated against file stats, so a chat request does not re-read
+or rewrite the whole session. The transcript (context/messages.json) is
+appended to in place instead of being rewritten.
+
+Session lookups by conversation ID or first-message hash and
+list_sessions() go through a persistent SQLite index (session_index.py)
+instead of scanning the sessions directory.
 """
 
 import hashlib
 import json
+import os
 import re
+import shutil
+import threading
 import uuid
-from datetime import datetime
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
 from pydantic import BaseModel
 
+from .session_index import SessionIndex, message_hash
+
 
 class SessionState(BaseModel):
     """State of a consultant session."""
@@ -36,6 +52,32 @@ class SessionState(BaseModel):
     conversation_id: str | None = None  # X-OpenWebUI-Chat-Id from Open WebUI
 
 
+@dataclass
+class _CachedSession:
+    """In-memory view of a session's files.
+
+    Attributes:
+        state: Last loaded/saved state
+        state_mtime: mtime_ns of status.json the state belongs to
+        context: Last loaded context files
+        context_signature: (name, mtime_ns, size) of the context files
+        message_digests: Digest of every message in messages.json
+        render_key: Digest of the inputs CLAUDE.md was last rendered from
+    """
+    state: Optional[SessionState] = None
+    state_mtime: Optional[int] = None
+    context: Optional[dict[str, str]] = None
+    context_signature: Optional[tuple] = None
+    message_digests: Optional[list[str]] = None
+    render_key: Optional[str] = None
+
+
+def _message_digest(message: dict) -> str:
+    """Stable digest of one chat message."""
+    encoded = json.dumps(message, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 class SessionManager:
     """Manages consultant sessions on filesystem.
 
@@ -58,7 +100,15 @@ class SessionManager:
     MAX_CONVERSATION_ID_LENGTH = 64
     LOCK_TIMEOUT = 5  # seconds
 
-    def __init__(self, base_path: Path | None = None):
+    # Sessions kept in the in-memory cache (least recently used are evicted)
+    CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        cache_size: int | None = None,
+        index_path: Path | None = None,
+    ):
         if base_path is None:
             # Default to helix-v4/projects/sessions
             base_path = Path(__file__).parent.parent.parent.parent / "projects" / "sessions"
@@ -66,6 +116,46 @@ class SessionManager:
         self.base_path.mkdir(parents=True, exist_ok=True)
         # Cache for conversation_id -> session_id mapping
         self._conversation_cache: dict[str, str] = {}
+        # Per-session state/context/transcript cache (LRU)
+        self.cache_size = cache_size if cache_size is not None else self.CACHE_SIZE
+        self._sessions: OrderedDict[str, _CachedSession] = OrderedDict()
+        # Session index, kept next to (not inside) the sessions directory
+        if index_path is None:
+            index_path = self.base_path.parent / f".{self.base_path.name}-index.db"
+        self.index = SessionIndex(index_path)
+        self._index_ready = False
+        self._index_lock = threading.Lock()
+
+    def _get_index(self) -> SessionIndex:
+        """Open the session index, building it from disk if it is new."""
+        if not self._index_ready:
+            # Only the first caller builds a new index, others wait for it
+            with self._index_lock:
+                if not self._index_ready:
+                    if self.index.open():
+                        self.index.rebuild(self.base_path)
+                    self._index_ready = True
+        return self.index
+
+    def rebuild_index(self) -> int:
+        """Recreate the session index from the session directories.
+
+        Returns:
+            Number of indexed sessions
+        """
+        return self._get_index().rebuild(self.base_path)
+
+    def _cached(self, session_id: str) -> _CachedSession:
+        """Get (or create) the cache entry of a session, marking it recently used."""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            entry = _CachedSession()
+            self._sessions[session_id] = entry
+            while len(self._sessions) > max(self.cache_size, 1):
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        return entry
 
     def _normalize_conversation_id(self, conversation_id: str) -> str:
         """Normalize conversation ID to valid directory name.
@@ -185,13 +275,16 @@ class SessionManager:
         if conversation_id:
             session_id = self._normalize_conversation_id(conversation_id)
 
-            # Check cache first
-            if conversation_id in self._conversation_cache:
-                cached_id = self._conversation_cache[conversation_id]
-                if self.session_exists(cached_id):
-                    state = self.get_state(cached_id)
-                    if state:
-                        return cached_id, state
+            # Check cache first, then the persistent index
+            cached_id = (
+                self._conversation_cache.get(conversation_id)
+                or self._get_index().find(conversation_id=conversation_id)
+            )
+            if cached_id and self.session_exists(cached_id):
+                state = self.get_state(cached_id)
+                if state:
+                    self._conversation_cache[conversation_id] = cached_id
+                    return cached_id, state
 
             # Check if session exists on disk
             if self.session_exists(session_id):
@@ -228,14 +321,14 @@ class SessionManager:
     def _find_or_create_session_id(self, first_message: str, messages: list[dict]) -> str:
         """Find existing session or create new ID.
 
-        Searches for session matching first message hash.
+        Looks up the session matching the first message hash in the index.
         """
-        msg_hash = hashlib.md5(first_message.encode()).hexdigest()[:8]
-
-        # Search existing sessions
-        for session_dir in self.base_path.iterdir():
-            if session_dir.is_dir() and msg_hash in session_dir.name:
-                return session_dir.name
+        index = self._get_index()
+        session_id = index.find(message_hash=message_hash(first_message))
+        if session_id:
+            if self.session_exists(session_id):
+                return session_id
+            index.remove(session_id)
 
         # No existing session - create new ID
         return self.generate_session_id(first_message)
@@ -288,25 +381,47 @@ class SessionManager:
             conversation_id=conversation_id,
         )
 
-        self._save_state(session_id, state)
+        # Only legacy (hash-named) sessions are found by their first message
+        msg_hash = message_hash(original_request)
+        self._save_state(session_id, state, msg_hash if msg_hash in session_id else None)
 
         return state
 
     def get_state(self, session_id: str) -> SessionState | None:
-        """Load session state from status.json."""
+        """Load session state from status.json.
+
+        Served from the cache while status.json is unchanged.
+        """
         status_file = self.base_path / session_id / "status.json"
-        if not status_file.exists():
+        try:
+            mtime = status_file.stat().st_mtime_ns
+        except OSError:
+            self._sessions.pop(session_id, None)
             return None
 
-        data = json.loads(status_file.read_text())
-        return SessionState(**data)
+        entry = self._cached(session_id)
+        if entry.state is None or entry.state_mtime != mtime:
+            data = json.loads(status_file.read_text())
+            entry.state = SessionState(**data)
+            entry.state_mtime = mtime
+        return entry.state.model_copy()
 
-    def _save_state(self, session_id: str, state: SessionState) -> None:
-        """Save session state to status.json."""
+    def _save_state(
+        self,
+        session_id: str,
+        state: SessionState,
+        first_message_hash: str | None = None,
+    ) -> None:
+        """Save session state to status.json and update the index."""
         status_file = self.base_path / session_id / "status.json"
         state.updated_at = datetime.now()
         status_file.write_text(state.model_dump_json(indent=2))
 
+        entry = self._cached(session_id)
+        entry.state = state.model_copy()
+        entry.state_mtime = status_file.stat().st_mtime_ns
+        self._get_index().upsert(state, first_message_hash)
+
     def update_state(
         self,
         session_id: str,
@@ -330,9 +445,79 @@ class SessionManager:
         return state
 
     def save_messages(self, session_id: str, messages: list[dict]) -> None:
-        """Save complete message history."""
+        """Save complete message history.
+
+        messages.json stays a JSON array with one message per line. When
+        the saved history is a prefix of messages (the usual case: one new
+        turn), only the new messages are appended in place; otherwise the
+        file is rewritten.
+        """
+        messages_file = self.base_path / session_id / "context" / "messages.json"
+        entry = self._cached(session_id)
+        digests = [_message_digest(m) for m in messages]
+
+        saved = entry.message_digests
+        if saved is None and messages_file.exists():
+            saved = self._load_message_digests(messages_file)
+
+        if (
+            saved is not None
+            and len(saved) <= len(digests)
+            and digests[:len(saved)] == saved
+            and messages_file.exists()
+        ):
+            if len(saved) < len(digests):
+                try:
+                    self._append_messages(messages_file, messages[len(saved):], bool(saved))
+                except (OSError, ValueError):
+                    self._write_messages(messages_file, messages)
+        else:
+            self._write_messages(messages_file, messages)
+
+        entry.message_digests = digests
+
+    def load_messages(self, session_id: str) -> list[dict]:
+        """Load the saved message history (empty if none)."""
         messages_file = self.base_path / session_id / "context" / "messages.json"
-        messages_file.write_text(json.dumps(messages, indent=2, default=str))
+        try:
+            return json.loads(messages_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return []
+
+    def _load_message_digests(self, messages_file: Path) -> list[str] | None:
+        """Digests of the messages on disk (None if the file is unreadable)."""
+        try:
+            return [_message_digest(m) for m in json.loads(messages_file.read_text())]
+        except (OSError, json.JSONDecodeError, TypeError):
+            return None
+
+    def _write_messages(self, messages_file: Path, messages: list[dict]) -> None:
+        """Rewrite messages.json with the full history."""
+        lines = ",\n".join(json.dumps(m, default=str) for m in messages)
+        messages_file.write_text(f"[\n{lines}\n]\n" if messages else "[]\n")
+
+    def _append_messages(self, messages_file: Path, new: list[dict], has_items: bool) -> None:
+        """Append messages before the closing bracket of messages.json.
+
+        Raises:
+            ValueError: If the file does not end with a JSON array
+        """
+        encoded = ",\n".join(json.dumps(m, default=str) for m in new).encode("utf-8")
+        with open(messages_file, "r+b") as f:
+            # Find the closing bracket (skipping trailing whitespace)
+            pos = f.seek(0, os.SEEK_END)
+            tail = b""
+            while pos > 0 and not tail.strip():
+                step = min(64, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+            stripped = tail.rstrip()
+            if not stripped.endswith(b"]"):
+                raise ValueError(f"Not a JSON array: {messages_file}")
+            f.seek(pos + len(stripped) - 1)
+            f.write((b",\n" if has_items else b"\n") + encoded + b"\n]\n")
+            f.truncate()
 
     def save_context(self, session_id: str, key: str, content: str) -> None:
         """Save context file (what.md, why.md, constraints.md)."""
@@ -340,14 +525,49 @@ class SessionManager:
         context_file.write_text(content)
 
     def get_context(self, session_id: str) -> dict[str, str]:
-        """Load all context files."""
+        """Load all context files.
+
+        Served from the cache while no context file was added, removed
+        or modified (checked via one directory scan).
+        """
         context_dir = self.base_path / session_id / "context"
-        context = {}
+        signature = []
+        try:
+            with os.scandir(context_dir) as it:
+                for f in it:
+                    if f.name.endswith(".md") and f.is_file():
+                        stat = f.stat()
+                        signature.append((f.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            return {}
+        signature_key = tuple(sorted(signature))
+
+        entry = self._cached(session_id)
+        if entry.context is None or entry.context_signature != signature_key:
+            entry.context = {
+                name[:-len(".md")]: (context_dir / name).read_text()
+                for name, _, _ in signature_key
+            }
+            entry.context_signature = signature_key
+        return dict(entry.context)
+
+    def claude_md_is_current(self, session_id: str, render_key: str) -> bool:
+        """Check whether CLAUDE.md was last rendered from the same inputs.
 
-        for f in context_dir.glob("*.md"):
-            context[f.stem] = f.read_text()
+        Args:
+            session_id: The session ID.
+            render_key: Digest of the template inputs.
+        """
+        entry = self._sessions.get(session_id)
+        return (
+            entry is not None
+            and entry.render_key == render_key
+            and (self.base_path / session_id / "CLAUDE.md").exists()
+        )
 
-        return context
+    def mark_claude_md_rendered(self, session_id: str, render_key: str) -> None:
+        """Remember the inputs CLAUDE.md was rendered from."""
+        self._cached(session_id).render_key = render_key
 
     def get_output(self, session_id: str, filename: str) -> str | None:
         """Read output file."""
@@ -433,18 +653,76 @@ class SessionManager:
             return match.group(1).lower()
         return None
 
-    def list_sessions(self, limit: int = 20) -> list[SessionState]:
-        """List recent sessions."""
+    def list_sessions(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        status: str | None = None,
+    ) -> list[SessionState]:
+        """List sessions, most recently updated first.
+
+        Args:
+            limit: Maximum number of sessions.
+            offset: Number of sessions to skip (pagination).
+            status: Only sessions with this status.
+        """
+        index = self._get_index()
         sessions = []
-        for session_dir in sorted(self.base_path.iterdir(), reverse=True):
-            if session_dir.is_dir():
-                state = self.get_state(session_dir.name)
-                if state:
-                    sessions.append(state)
-                if len(sessions) >= limit:
-                    break
+        for session_id in index.list_ids(limit, offset, status):
+            state = self.get_state(session_id)
+            if state:
+                sessions.append(state)
+            else:
+                index.remove(session_id)
         return sessions
 
+    def archive_stale_sessions(
+        self,
+        older_than_days: int = 30,
+        archive_dir: Path | None = None,
+        dry_run: bool = False,
+    ) -> list[str]:
+        """Compress sessions not updated for a while into an archive directory.
+
+        Each session becomes {archive_dir}/{session_id}.tar.gz and its
+        directory is removed; archived sessions are no longer found or
+        listed.
+
+        Args:
+            older_than_days: Archive sessions not updated for this many days.
+            archive_dir: Target directory (default: sessions-archive next
+                to the sessions directory).
+            dry_run: Only return the sessions that would be archived.
+
+        Returns:
+            IDs of the archived sessions.
+        """
+        if archive_dir is None:
+            archive_dir = self.base_path.parent / f"{self.base_path.name}-archive"
+        index = self._get_index()
+        stale = index.stale_ids(datetime.now() - timedelta(days=older_than_days))
+        if dry_run:
+            return stale
+
+        archived = []
+        for session_id in stale:
+            session_path = self.base_path / session_id
+            if session_path.is_dir():
+                archive_dir.mkdir(parents=True, exist_ok=True)
+                shutil.make_archive(
+                    str(archive_dir / session_id), "gztar",
+                    root_dir=self.base_path, base_dir=session_id,
+                )
+                shutil.rmtree(session_path)
+            index.mark_archived(session_id)
+            self._sessions.pop(session_id, None)
+            archived.append(session_id)
+
+        self._conversation_cache = {
+            conv: sid for conv, sid in self._conversation_cache.items() if sid not in archived
+        }
+        return archived
+
 
 # Global instance
 session_manager = SessionManager()
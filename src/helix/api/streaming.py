@@ -14,12 +14,21 @@ See: ADR-031 for status synchronization integration.
 import asyncio
 import json
 import traceback
+from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator
 
 from .orchestrator import UnifiedOrchestrator, PhaseEvent as OrchestratorEvent
 from .models import PhaseEvent, JobStatus, PhaseStatus
 from .job_manager import job_manager, Job
+from ..observability.registry import FAST_BUCKETS, registry
+
+
+SSE_LAG_SECONDS = registry.histogram(
+    "helix_sse_subscriber_lag_seconds",
+    "Time from event creation to delivery to an SSE subscriber",
+    buckets=FAST_BUCKETS,
+)
 
 
 def format_sse(event_type: str, data: dict) -> str:
@@ -40,6 +49,7 @@ async def run_project_with_streaming(
     job: Job,
     project_path: Path,
     phase_filter: list[str] | None = None,
+    no_cache: bool = False,
 ) -> None:
     """Run a HELIX project with streaming events via UnifiedOrchestrator.
 
@@ -52,6 +62,8 @@ async def run_project_with_streaming(
         job: Job instance for tracking
         project_path: Path to project directory
         phase_filter: Optional list of phase IDs to run
+        no_cache: Re-run all phases instead of restoring unchanged ones
+            from the phase cache
     """
     print(f"[STREAMING] Starting job {job.job_id} for {project_path}")
 
@@ -65,7 +77,7 @@ async def run_project_with_streaming(
         ))
 
         # Create orchestrator
-        orchestrator = UnifiedOrchestrator()
+        orchestrator = UnifiedOrchestrator(use_cache=not no_cache)
 
         # Event callback - forwards orchestrator events to job manager
         async def on_event(event: OrchestratorEvent) -> None:
@@ -168,6 +180,7 @@ async def generate_sse_stream(job_id: str) -> AsyncGenerator[str, None]:
         SSE-formatted event strings
     """
     async for event in job_manager.stream_events(job_id):
+        SSE_LAG_SECONDS.observe(max(0.0, (datetime.utcnow() - event.timestamp).total_seconds()))
         yield format_sse(event.event_type, {
             "phase_id": event.phase_id,
             **event.data,
@@ -243,8 +256,10 @@ async def run_evolution_pipeline(
     """
     print(f"[EVOLUTION] Starting pipeline for {project.name}")
 
-    # ADR-031: Initialize StatusSynchronizer for unified status tracking
-    status_sync = StatusSynchronizer(project.path)
+    # ADR-031: Shared StatusSynchronizer for unified status tracking.
+    # Write-behind coalesces phase updates; terminal states are written through
+    # and the finally block flushes whatever is still pending.
+    status_sync = StatusSynchronizer.for_project(project.path, write_behind=True)
 
     try:
         # Pre-check: Already integrated?
@@ -459,6 +474,8 @@ async def run_evolution_pipeline(
             event_type="pipeline_failed",
             data={"error": str(e)}
         ))
+    finally:
+        status_sync.close()
 
 
 async def _emit_pipeline_failed(job_id: str, step: str, error: str) -> None:
@@ -34,6 +34,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from helix.admission import Priority, get_admission_controller
+from helix.observability import tracing
+
 from .result import ApprovalResult, Finding, Severity
 
 
@@ -113,6 +116,7 @@ class ApprovalRunner:
         self.approvals_base = approvals_base or self.APPROVALS_DIR
         self.claude_cmd = claude_cmd or self.CLAUDE_CMD
 
+    @tracing.traced("approval.run")
     async def run_approval(
         self,
         approval_type: str,
@@ -281,6 +285,7 @@ class ApprovalRunner:
 
             os.symlink(abs_path, link_path)
 
+    @tracing.traced("approval.agent")
     async def _spawn_agent(
         self,
         approval_dir: Path,
@@ -291,7 +296,8 @@ class ApprovalRunner:
 
         Runs Claude CLI with --print flag to get non-interactive
         execution. The sub-agent runs in the approval directory
-        and follows the CLAUDE.md instructions.
+        and follows the CLAUDE.md instructions. It waits for a slot
+        of the process-wide admission controller first.
 
         Args:
             approval_dir: Working directory for the agent.
@@ -309,29 +315,30 @@ class ApprovalRunner:
             "--dangerously-skip-permissions",
         ]
 
-        # Spawn process
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=approval_dir,
-        )
-
-        # Send prompt and wait for completion
-        try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(input=prompt.encode()),
-                timeout=timeout,
+        async with get_admission_controller().slot(Priority.VERIFICATION, "approval"):
+            # Spawn process
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=approval_dir,
             )
-        except asyncio.TimeoutError:
-            # Kill the process on timeout
+
+            # Send prompt and wait for completion
             try:
-                process.kill()
-                await process.wait()
-            except Exception:
-                pass
-            raise
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input=prompt.encode()),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                # Kill the process on timeout
+                try:
+                    process.kill()
+                    await process.wait()
+                except Exception:
+                    pass
+                raise
 
         # Check return code
         if process.returncode != 0:
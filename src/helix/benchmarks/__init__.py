@@ -0,0 +1,42 @@
+"""Benchmarks for HELIX v4.
+
+This package provides a deterministic Claude CLI simulator and a
+benchmark suite on top of it:
+- SimulatorConfig / install_simulator for a fake stream-json CLI
+- run_suite for the runner, orchestrator, SSE and chat benchmarks
+- save_results / compare_results for regression tracking between commits
+
+Usage:
+    from helix.benchmarks import run_suite, save_results, compare_results
+
+    results = await run_suite(quick=True)
+    save_results(results, Path("bench.json"))
+"""
+
+from helix.benchmarks.simulator import (
+    SimulatorConfig,
+    generate_events,
+    install_simulator,
+)
+from helix.benchmarks.suite import (
+    BENCHMARKS,
+    BenchmarkResult,
+    Regression,
+    compare_results,
+    load_results,
+    run_suite,
+    save_results,
+)
+
+__all__ = [
+    "SimulatorConfig",
+    "generate_events",
+    "install_simulator",
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "Regression",
+    "compare_results",
+    "load_results",
+    "run_suite",
+    "save_results",
+]
@@ -0,0 +1,395 @@
+"""Deterministic Claude CLI simulator for HELIX v4 benchmarks.
+
+Stands in for the Claude Code CLI: reads the prompt from stdin (or the
+last positional argument), emits a scripted stream-json NDJSON session
+on stdout and exits. The output is fully determined by the configuration
+and the seed, so runs can be compared between commits.
+
+Every event carries both the flat fields ``StreamParser`` reads
+(``text``, ``tool``, ``tool_input``, ``cost_usd``, ...) and the
+``message.content`` blocks / ``usage`` the ClaudeRunner and the chat
+route read, so all consumers see a well-formed stream:
+
+    {"type":"system","subtype":"init","session_id":"...","tools":[...]}
+    {"type":"assistant","subtype":"text","text":"...","message":{...}}
+    {"type":"assistant","subtype":"tool_use","tool":"Read","tool_input":{...},...}
+    {"type":"user","subtype":"tool_result","tool_use_id":"toolu_...","content":"..."}
+    {"type":"result","subtype":"success","cost_usd":0.01,"usage":{...},...}
+
+Files listed in ``write_files`` are written (relative to the working
+directory) when their Write tool call is emitted, so phase verification
+and the chat route's ``output/response.md`` see real output.
+
+Configuration:
+    HELIX_FAKE_CLAUDE_CONFIG: Inline JSON object or path to a JSON file
+        with SimulatorConfig fields. Unknown fields are ignored.
+
+Example:
+    executable = install_simulator(tmp_dir, SimulatorConfig(turns=5))
+    runner = ClaudeRunner(claude_cmd=str(executable), use_stdbuf=False)
+    result = await runner.run_phase(phase_dir)
+
+    # or directly:
+    HELIX_FAKE_CLAUDE_CONFIG='{"turns": 2}' python -m helix.benchmarks.simulator
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import stat
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+CONFIG_ENV = "HELIX_FAKE_CLAUDE_CONFIG"
+
+VERSION = "0.0.0 (HELIX simulator)"
+
+# Pricing used for the reported cost (USD per million tokens)
+INPUT_PRICE_PER_MTOK = 3.0
+OUTPUT_PRICE_PER_MTOK = 15.0
+
+_WORDS = (
+    "phase", "gate", "output", "spec", "module", "test", "review", "config",
+    "session", "context", "result", "verify", "build", "check", "file",
+)
+
+
+@dataclass
+class SimulatorConfig:
+    """Shape and timing of a simulated Claude CLI session.
+
+    Attributes:
+        seed: Seed for all random choices (same seed, same stream)
+        turns: Number of assistant turns (text + tool calls each)
+        tools_per_turn: Tool calls per turn
+        tool_mix: Relative weights of the simulated tools
+        text_bytes: Size of the assistant text per turn
+        tool_input_bytes: Size of each tool input payload
+        tool_result_bytes: Size of each tool result payload
+        startup_latency: Seconds before the first event
+        event_rate: Events per second (0 = as fast as possible)
+        jitter: Relative random variation of the event interval (0..1)
+        write_files: Files (relative path -> content) written via Write
+            tool calls in the last turn
+        result_text: Final text of the result event
+        model: Model name reported in the init event
+        exit_code: Exit code of the process (non-zero = error result)
+    """
+    seed: int = 0
+    turns: int = 3
+    tools_per_turn: int = 2
+    tool_mix: dict[str, float] = field(
+        default_factory=lambda: {"Read": 0.5, "Bash": 0.3, "Grep": 0.2}
+    )
+    text_bytes: int = 200
+    tool_input_bytes: int = 64
+    tool_result_bytes: int = 1000
+    startup_latency: float = 0.0
+    event_rate: float = 0.0
+    jitter: float = 0.0
+    write_files: dict[str, str] = field(default_factory=dict)
+    result_text: str = "Done."
+    model: str = "claude-sonnet-4"
+    exit_code: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SimulatorConfig":
+        """Create a config from a dict, ignoring unknown fields."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    @classmethod
+    def from_env(cls, environ: Optional[dict[str, str]] = None) -> "SimulatorConfig":
+        """Load the config from HELIX_FAKE_CLAUDE_CONFIG (JSON or file path)."""
+        raw = (environ if environ is not None else os.environ).get(CONFIG_ENV, "").strip()
+        if not raw:
+            return cls()
+        if not raw.startswith("{"):
+            raw = Path(raw).read_text(encoding="utf-8")
+        return cls.from_dict(json.loads(raw))
+
+    def to_json(self) -> str:
+        """Serialize for HELIX_FAKE_CLAUDE_CONFIG."""
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @property
+    def event_count(self) -> int:
+        """Number of events one session emits."""
+        tool_calls = self.turns * self.tools_per_turn + len(self.write_files)
+        return 2 + self.turns + 2 * tool_calls
+
+    @property
+    def simulated_seconds(self) -> float:
+        """Nominal time the session spends sleeping (without jitter)."""
+        interval = 1.0 / self.event_rate if self.event_rate > 0 else 0.0
+        return self.startup_latency + interval * self.event_count
+
+
+def _payload(rng: random.Random, size: int) -> str:
+    """Deterministic filler text of exactly size characters."""
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def _tool_input(tool: str, rng: random.Random, size: int) -> dict[str, Any]:
+    """Tool input payload in the shape of the real tool."""
+    payload = _payload(rng, size)
+    if tool == "Bash":
+        return {"command": f"echo {payload}"}
+    if tool in ("Grep", "Glob"):
+        return {"pattern": payload}
+    if tool in ("Write", "Edit"):
+        return {"file_path": "output/scratch.txt", "content": payload}
+    return {"file_path": f"src/{payload.split(' ')[0]}.py"}
+
+
+def _assistant(session_id: str, block: dict[str, Any], **flat: Any) -> dict[str, Any]:
+    """Assistant event with flat fields and a message content block."""
+    subtype = block["type"]
+    return {
+        "type": "assistant",
+        "subtype": subtype,
+        **flat,
+        "session_id": session_id,
+        "message": {"role": "assistant", "content": [block]},
+    }
+
+
+def _tool_events(
+    session_id: str, tool_use_id: str, tool: str, tool_input: dict[str, Any], result: str
+) -> list[dict[str, Any]]:
+    """A tool_use event and its tool_result."""
+    return [
+        _assistant(
+            session_id,
+            {"type": "tool_use", "id": tool_use_id, "name": tool, "input": tool_input},
+            tool=tool,
+            tool_input=tool_input,
+            tool_use_id=tool_use_id,
+        ),
+        {
+            "type": "user",
+            "subtype": "tool_result",
+            "tool_use_id": tool_use_id,
+            "content": result,
+            "session_id": session_id,
+            "message": {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": tool_use_id, "content": result}
+                ],
+            },
+        },
+    ]
+
+
+def generate_events(
+    config: SimulatorConfig,
+    prompt: str = "",
+    session_id: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """Generate the NDJSON events of one simulated session.
+
+    Args:
+        config: Session shape
+        prompt: Prompt the session answers (counts towards input tokens)
+        session_id: Session to continue (--resume), new one if None
+
+    Yields:
+        Event dicts in emission order
+    """
+    rng = random.Random(config.seed)
+    session_id = session_id or str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    tools = sorted(config.tool_mix)
+    weights = [config.tool_mix[t] for t in tools]
+
+    yield {
+        "type": "system",
+        "subtype": "init",
+        "session_id": session_id,
+        "tools": sorted(set(tools) | {"Write"}),
+        "model": config.model,
+    }
+
+    input_bytes = len(prompt)
+    output_bytes = 0
+    counter = 0
+    for turn in range(config.turns):
+        text = _payload(rng, config.text_bytes)
+        output_bytes += len(text)
+        yield _assistant(session_id, {"type": "text", "text": text}, text=text)
+
+        calls = [
+            (tool, _tool_input(tool, rng, config.tool_input_bytes))
+            for tool in (
+                rng.choices(tools, weights=weights, k=config.tools_per_turn) if tools else []
+            )
+        ]
+        if turn == config.turns - 1:
+            calls += [
+                ("Write", {"file_path": path, "content": content})
+                for path, content in config.write_files.items()
+            ]
+        for tool, tool_input in calls:
+            counter += 1
+            result = (
+                f"File written: {tool_input['file_path']}"
+                if tool == "Write"
+                else _payload(rng, config.tool_result_bytes)
+            )
+            output_bytes += len(json.dumps(tool_input))
+            input_bytes += len(result)
+            yield from _tool_events(
+                session_id, f"toolu_{counter:04d}", tool, tool_input, result
+            )
+
+    input_tokens = input_bytes // 4
+    output_tokens = output_bytes // 4
+    cost = round(
+        (input_tokens * INPUT_PRICE_PER_MTOK + output_tokens * OUTPUT_PRICE_PER_MTOK)
+        / 1_000_000,
+        6,
+    )
+    failed = config.exit_code != 0
+    yield {
+        "type": "result",
+        "subtype": "error" if failed else "success",
+        "is_error": failed,
+        "result": config.result_text,
+        "session_id": session_id,
+        "num_turns": config.turns,
+        "cost_usd": cost,
+        "total_cost_usd": cost,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+    }
+
+
+def _parse_args(argv: list[str]) -> tuple[Optional[str], Optional[str], bool]:
+    """Pick the options the simulator cares about out of a CLI command line.
+
+    Returns:
+        Tuple of (resume session id, positional prompt, --version given)
+    """
+    resume = None
+    prompt = None
+    version = False
+    # Options of the real CLI that take a value
+    with_value = {"--resume", "--output-format", "--model", "--input-format"}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--version":
+            version = True
+        elif arg in with_value:
+            if arg == "--resume" and i + 1 < len(argv):
+                resume = argv[i + 1]
+            i += 1
+        elif not arg.startswith("-"):
+            prompt = arg
+        i += 1
+    return resume, prompt, version
+
+
+def _write_file(cwd: Path, file_path: str, content: str) -> None:
+    """Write the file of a simulated Write tool call."""
+    target = Path(file_path)
+    if not target.is_absolute():
+        target = cwd / target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run one simulated Claude CLI session.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    resume, prompt, version = _parse_args(sys.argv[1:] if argv is None else argv)
+    if version:
+        print(VERSION)
+        return 0
+
+    config = SimulatorConfig.from_env()
+    if prompt is None:
+        prompt = "" if sys.stdin is None or sys.stdin.isatty() else sys.stdin.read()
+
+    rng = random.Random(config.seed)
+    interval = 1.0 / config.event_rate if config.event_rate > 0 else 0.0
+    write_paths = set(config.write_files)
+    cwd = Path.cwd()
+
+    if config.startup_latency > 0:
+        time.sleep(config.startup_latency)
+    for event in generate_events(config, prompt, resume):
+        if interval:
+            time.sleep(max(0.0, interval * (1 + config.jitter * rng.uniform(-1, 1))))
+        if event.get("subtype") == "tool_use" and event.get("tool") == "Write":
+            file_path = event["tool_input"]["file_path"]
+            if file_path in write_paths:
+                _write_file(cwd, file_path, event["tool_input"]["content"])
+        sys.stdout.write(json.dumps(event) + "\n")
+        sys.stdout.flush()
+
+    return config.exit_code
+
+
+def install_simulator(
+    directory: Path,
+    config: Optional[SimulatorConfig] = None,
+    name: str = "claude",
+) -> Path:
+    """Write an executable that runs the simulator.
+
+    The executable uses the current Python interpreter. With a config,
+    it is baked into the executable; otherwise HELIX_FAKE_CLAUDE_CONFIG
+    is read at run time.
+
+    Args:
+        directory: Directory for the executable
+        config: Optional fixed session config
+        name: File name of the executable
+
+    Returns:
+        Path to the executable (usable as claude_cmd)
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    executable = directory / name
+
+    src_dir = Path(__file__).resolve().parents[2]
+    lines = [
+        f"#!{sys.executable}",
+        "import os, sys",
+        f"sys.path.insert(0, {str(src_dir)!r})",
+    ]
+    if config is not None:
+        lines.append(f"os.environ[{CONFIG_ENV!r}] = {config.to_json()!r}")
+    lines += [
+        "from helix.benchmarks.simulator import main",
+        "sys.exit(main())",
+    ]
+    executable.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    executable.chmod(executable.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return executable
+
+
+if __name__ == "__main__":
+    sys.exit(main())
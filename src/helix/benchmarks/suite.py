@@ -0,0 +1,547 @@
+"""Benchmark suite for HELIX v4.
+
+Measures the hot paths around the Claude CLI against the deterministic
+simulator (see simulator.py), so the numbers reflect HELIX's own
+overhead rather than model latency:
+
+- runner_streaming: ClaudeRunner.run_phase_streaming, one CLI run each
+- orchestrator: UnifiedOrchestrator.run_project over a generated project
+- sse_fanout: events through JobManager and generate_sse_stream
+- chat_completions: concurrent /v1/chat/completions requests
+
+Results are plain JSON (commit, timestamp, per-benchmark params and
+metrics) so runs can be stored and compared between commits with
+compare_results(). Metrics ending in ``_seconds`` are lower-is-better,
+metrics ending in ``_per_second`` are higher-is-better.
+
+Example:
+    results = await run_suite(Path("/tmp/helix-bench"))
+    save_results(results, Path("bench.json"))
+
+    regressions = compare_results(load_results(Path("baseline.json")), results)
+    for regression in regressions:
+        print(regression.describe())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+import yaml
+
+from ..admission import AdmissionController
+from .simulator import SimulatorConfig, install_simulator
+
+
+RESULTS_VERSION = 1
+
+# Relative change that counts as a regression in compare_results()
+DEFAULT_THRESHOLD = 0.10
+
+# Response of the simulated consultant, valid for the chat validators
+CHAT_RESPONSE = (
+    "<!-- STEP: what -->\n\n"
+    "Was genau soll gebaut werden? Beschreibe kurz Ziel und Umfang.\n"
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of one benchmark.
+
+    Attributes:
+        name: Benchmark name
+        params: Parameters the benchmark ran with
+        metrics: Measured values (seconds, rates, counts)
+    """
+    name: str
+    params: dict[str, Any] = field(default_factory=dict)
+    metrics: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "params": self.params,
+            "metrics": {k: round(v, 6) for k, v in self.metrics.items()},
+        }
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline.
+
+    Attributes:
+        benchmark: Benchmark name
+        metric: Metric name
+        baseline: Baseline value
+        current: Current value
+        change: Relative change in the bad direction (0.25 = 25% worse)
+    """
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+    def describe(self) -> str:
+        """One-line description for reports."""
+        return (
+            f"{self.benchmark}.{self.metric}: {self.baseline:.4g} -> "
+            f"{self.current:.4g} ({self.change:+.0%})"
+        )
+
+
+def _timing_metrics(prefix: str, samples: list[float]) -> dict[str, float]:
+    """Mean, p50, p95 and max of a list of durations."""
+    ordered = sorted(samples)
+    p95_index = max(0, round(0.95 * len(ordered)) - 1)
+    return {
+        f"{prefix}_mean_seconds": statistics.fmean(ordered),
+        f"{prefix}_p50_seconds": statistics.median(ordered),
+        f"{prefix}_p95_seconds": ordered[p95_index],
+        f"{prefix}_max_seconds": ordered[-1],
+    }
+
+
+def _runner(claude_cmd: Path, admission: AdmissionController) -> Any:
+    """ClaudeRunner for the simulator, independent of the global controller."""
+    from ..claude_runner import ClaudeRunner
+
+    return ClaudeRunner(
+        claude_cmd=str(claude_cmd),
+        use_stdbuf=False,
+        admission=admission,
+    )
+
+
+async def bench_runner_streaming(
+    work_dir: Path,
+    config: SimulatorConfig,
+    runs: int = 5,
+) -> BenchmarkResult:
+    """Benchmark ClaudeRunner.run_phase_streaming against the simulator.
+
+    Args:
+        work_dir: Scratch directory
+        config: Simulated session
+        runs: Number of sequential runs
+
+    Returns:
+        BenchmarkResult with run durations, event throughput and the
+        overhead on top of the simulated latency
+    """
+    claude_cmd = install_simulator(work_dir / "bin", config, name="claude-runner")
+    phase_dir = work_dir / "runner-phase"
+    phase_dir.mkdir(parents=True, exist_ok=True)
+    runner = _runner(claude_cmd, AdmissionController(max_concurrent=1))
+
+    durations: list[float] = []
+    lines = 0
+
+    async def on_output(stream: str, line: str) -> None:
+        nonlocal lines
+        if stream == "stdout":
+            lines += 1
+
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await runner.run_phase_streaming(phase_dir, on_output, prompt="benchmark")
+        durations.append(time.perf_counter() - started)
+        if not result.success:
+            raise RuntimeError(f"Simulator run failed: {result.stderr[:200]}")
+
+    total = sum(durations)
+    return BenchmarkResult(
+        name="runner_streaming",
+        params={"runs": runs, "events_per_run": config.event_count},
+        metrics={
+            **_timing_metrics("run", durations),
+            "overhead_seconds": statistics.fmean(durations) - config.simulated_seconds,
+            "events_per_second": lines / total if total else 0.0,
+            "events": float(lines),
+        },
+    )
+
+
+def _write_project(project_dir: Path, phases: int) -> None:
+    """Generate a project with development phases writing output/result.md."""
+    project_dir.mkdir(parents=True, exist_ok=True)
+    (project_dir / "phases.yaml").write_text(yaml.safe_dump({
+        "name": "benchmark",
+        "phases": [
+            {
+                "id": f"{i + 1:02d}-bench",
+                "name": f"Benchmark phase {i + 1}",
+                "type": "development",
+                "output": ["output/result.md"],
+            }
+            for i in range(phases)
+        ],
+    }))
+    for i in range(phases):
+        phase_dir = project_dir / "phases" / f"{i + 1:02d}-bench"
+        phase_dir.mkdir(parents=True, exist_ok=True)
+        (phase_dir / "CLAUDE.md").write_text(f"# Benchmark phase {i + 1}\n")
+
+
+async def bench_orchestrator(
+    work_dir: Path,
+    config: SimulatorConfig,
+    phases: int = 3,
+) -> BenchmarkResult:
+    """Benchmark UnifiedOrchestrator.run_project over a generated project.
+
+    The phase cache is disabled, so every phase runs the simulator.
+
+    Args:
+        work_dir: Scratch directory
+        config: Simulated session (output/result.md is added)
+        phases: Number of phases in the project
+
+    Returns:
+        BenchmarkResult with the project duration and per-phase overhead
+    """
+    from ..api.orchestrator import UnifiedOrchestrator
+
+    config = replace(
+        config, write_files={**config.write_files, "output/result.md": "# Result\n"}
+    )
+    claude_cmd = install_simulator(work_dir / "bin", config, name="claude-orchestrator")
+    project_dir = work_dir / "orchestrator-project"
+    shutil.rmtree(project_dir, ignore_errors=True)
+    _write_project(project_dir, phases)
+
+    events = 0
+
+    async def on_event(event: Any) -> None:
+        nonlocal events
+        events += 1
+
+    orchestrator = UnifiedOrchestrator(
+        claude_runner=_runner(claude_cmd, AdmissionController(max_concurrent=1)),
+        use_cache=False,
+    )
+    started = time.perf_counter()
+    result = await orchestrator.run_project(project_dir, on_event=on_event)
+    wall = time.perf_counter() - started
+    if not result.success:
+        raise RuntimeError(f"Benchmark project failed: {result.errors}")
+
+    return BenchmarkResult(
+        name="orchestrator",
+        params={"phases": phases, "events_per_run": config.event_count},
+        metrics={
+            "project_seconds": wall,
+            "phase_mean_seconds": wall / phases,
+            "phase_overhead_seconds": wall / phases - config.simulated_seconds,
+            "orchestrator_events": float(events),
+        },
+    )
+
+
+async def bench_sse_fanout(
+    jobs: int = 10,
+    events: int = 200,
+    payload_bytes: int = 200,
+) -> BenchmarkResult:
+    """Benchmark event delivery through JobManager and generate_sse_stream.
+
+    Every job has one producer emitting events and one SSE consumer,
+    all running concurrently.
+
+    Args:
+        jobs: Number of concurrent jobs
+        events: Events per job
+        payload_bytes: Size of each event's payload
+
+    Returns:
+        BenchmarkResult with throughput and producer-to-SSE latency
+    """
+    from ..api.job_manager import job_manager
+    from ..api.models import JobStatus, PhaseEvent
+    from ..api.streaming import generate_sse_stream
+
+    payload = "x" * payload_bytes
+    latencies: list[float] = []
+    sse_bytes = 0
+
+    async def produce(job_id: str) -> None:
+        for i in range(events):
+            await job_manager.emit_event(job_id, PhaseEvent(
+                event_type="output",
+                phase_id="01-bench",
+                data={"line": payload, "seq": i, "sent_at": time.perf_counter()},
+            ))
+            if i % 20 == 0:
+                await asyncio.sleep(0)
+        await job_manager.update_job(job_id, status=JobStatus.COMPLETED)
+        await job_manager.emit_event(job_id, PhaseEvent(event_type="job_completed"))
+
+    async def consume(job_id: str) -> None:
+        nonlocal sse_bytes
+        async for chunk in generate_sse_stream(job_id):
+            received = time.perf_counter()
+            sse_bytes += len(chunk)
+            data = json.loads(chunk.split("data: ", 1)[1])
+            if "sent_at" in data:
+                latencies.append(received - data["sent_at"])
+
+    job_ids = [(await job_manager.create_job()).job_id for _ in range(jobs)]
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(consume(job_id) for job_id in job_ids),
+        *(produce(job_id) for job_id in job_ids),
+    )
+    wall = time.perf_counter() - started
+
+    return BenchmarkResult(
+        name="sse_fanout",
+        params={"jobs": jobs, "events_per_job": events, "payload_bytes": payload_bytes},
+        metrics={
+            "wall_seconds": wall,
+            "events_per_second": len(latencies) / wall if wall else 0.0,
+            "latency_p50_seconds": statistics.median(latencies),
+            "latency_max_seconds": max(latencies),
+            "sse_bytes": float(sse_bytes),
+        },
+    )
+
+
+@contextmanager
+def _chat_environment(sessions_dir: Path, claude_cmd: Path) -> Iterator[None]:
+    """Point the chat route at scratch sessions and the simulator."""
+    from ..api.routes import openai
+    from ..api.session_manager import SessionManager
+    from ..config.paths import PathConfig
+
+    saved = (openai.session_manager, PathConfig.CLAUDE_CMD)
+    openai.session_manager = SessionManager(sessions_dir)
+    PathConfig.CLAUDE_CMD = str(claude_cmd)
+    try:
+        yield
+    finally:
+        openai.session_manager, PathConfig.CLAUDE_CMD = saved
+
+
+async def bench_chat_completions(
+    work_dir: Path,
+    config: SimulatorConfig,
+    requests: int = 8,
+    concurrency: int = 4,
+) -> BenchmarkResult:
+    """Benchmark concurrent streaming /v1/chat/completions requests.
+
+    Requests go through the ASGI app in-process (httpx ASGITransport);
+    each one is a new conversation and spawns the simulator. Claude
+    processes are admitted by the process-wide admission controller.
+
+    Args:
+        work_dir: Scratch directory
+        config: Simulated session (a valid output/response.md is added)
+        requests: Total number of requests
+        concurrency: Requests in flight at once
+
+    Returns:
+        BenchmarkResult with request latencies and throughput
+    """
+    import httpx
+
+    from ..admission import get_admission_controller
+    from ..api.main import app
+
+    config = replace(
+        config, write_files={**config.write_files, "output/response.md": CHAT_RESPONSE}
+    )
+    claude_cmd = install_simulator(work_dir / "bin", config, name="claude-chat")
+    sessions_dir = work_dir / "chat-sessions"
+    shutil.rmtree(sessions_dir, ignore_errors=True)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async def request(client: httpx.AsyncClient, index: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(
+                "/v1/chat/completions",
+                json={
+                    "model": "helix-consultant",
+                    "stream": True,
+                    "messages": [{"role": "user", "content": f"Benchmark request {index}"}],
+                },
+                headers={"X-OpenWebUI-Chat-Id": f"bench-{index}"},
+            )
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200 or "[DONE]" not in response.text:
+                failures += 1
+
+    with _chat_environment(sessions_dir, claude_cmd):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=600
+        ) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(request(client, i) for i in range(requests)))
+            wall = time.perf_counter() - started
+
+    return BenchmarkResult(
+        name="chat_completions",
+        params={
+            "requests": requests,
+            "concurrency": concurrency,
+            "max_claude_processes": get_admission_controller().max_concurrent,
+        },
+        metrics={
+            **_timing_metrics("request", latencies),
+            "wall_seconds": wall,
+            "requests_per_second": requests / wall if wall else 0.0,
+            "failures": float(failures),
+        },
+    )
+
+
+# name -> benchmark(work_dir, config, quick)
+Benchmark = Callable[[Path, SimulatorConfig, bool], Awaitable[BenchmarkResult]]
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "runner_streaming": lambda work_dir, config, quick: bench_runner_streaming(
+        work_dir, config, runs=2 if quick else 10
+    ),
+    "orchestrator": lambda work_dir, config, quick: bench_orchestrator(
+        work_dir, config, phases=2 if quick else 5
+    ),
+    "sse_fanout": lambda work_dir, config, quick: bench_sse_fanout(
+        jobs=2 if quick else 20, events=20 if quick else 500
+    ),
+    "chat_completions": lambda work_dir, config, quick: bench_chat_completions(
+        work_dir, config, requests=2 if quick else 16, concurrency=2 if quick else 8
+    ),
+}
+
+
+def _git_commit() -> Optional[str]:
+    """Commit of the working tree, None outside of git."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=10,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return output.stdout.strip() or None
+
+
+async def run_suite(
+    work_dir: Optional[Path] = None,
+    config: Optional[SimulatorConfig] = None,
+    only: Optional[list[str]] = None,
+    quick: bool = False,
+) -> dict[str, Any]:
+    """Run the benchmark suite.
+
+    Args:
+        work_dir: Scratch directory (default: temporary, removed afterwards)
+        config: Simulated session shape (default: SimulatorConfig())
+        only: Names of benchmarks to run (default: all)
+        quick: Small sizes for smoke runs
+
+    Returns:
+        Results dict (version, commit, timestamp, simulator, benchmarks)
+
+    Raises:
+        ValueError: If only names an unknown benchmark
+    """
+    config = config or SimulatorConfig()
+    names = only or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = tempfile.mkdtemp(prefix="helix-bench-")
+        work_dir = Path(temp_dir)
+
+    results: dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "quick": quick,
+        "simulator": json.loads(config.to_json()),
+        "benchmarks": {},
+    }
+    try:
+        for name in names:
+            result = await BENCHMARKS[name](Path(work_dir), config, quick)
+            results["benchmarks"][name] = result.to_dict()
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    return results
+
+
+def save_results(results: dict[str, Any], path: Path) -> None:
+    """Write results as JSON (atomically)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+    temp_path.rename(path)
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Read results written by save_results()."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Find metrics that got worse than the baseline by more than threshold.
+
+    Only benchmarks and metrics present in both results are compared.
+    ``*_seconds`` metrics regress when they grow, ``*_per_second``
+    metrics when they shrink; other metrics (counts) are ignored.
+
+    Args:
+        baseline: Results of the reference commit
+        current: Results to check
+        threshold: Tolerated relative change (0.10 = 10%)
+
+    Returns:
+        Regressions, worst first
+    """
+    regressions: list[Regression] = []
+    for name, bench in current.get("benchmarks", {}).items():
+        base_metrics = baseline.get("benchmarks", {}).get(name, {}).get("metrics", {})
+        for metric, value in bench.get("metrics", {}).items():
+            base_value = base_metrics.get(metric)
+            if not base_value or base_value <= 0:
+                continue
+            if metric.endswith("_per_second"):
+                change = (base_value - value) / base_value
+            elif metric.endswith("_seconds"):
+                change = (value - base_value) / base_value
+            else:
+                continue
+            if change > threshold:
+                regressions.append(Regression(name, metric, base_value, value, change))
+    return sorted(regressions, key=lambda r: r.change, reverse=True)
@@ -6,26 +6,69 @@ ADR-030 Fix 1: Added virtualenv PATH support to ensure pytest and other
 Python tools are accessible in Claude Code bash sessions. The helix
 virtualenv's bin directory is prepended to PATH in all subprocess
 environment configurations.
+
+Every CLI run waits for a slot of the process-wide admission controller
+(see admission.py), so concurrent chats and jobs cannot oversubscribe
+the host. The runner's priority and admission key decide its place in
+the queue.
 """
 
 import asyncio
+import functools
 import json
+import logging
 import os
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Awaitable
 
 
+from .admission import AdmissionController, Priority, get_admission_controller
 from .config.paths import PathConfig
+from .debug.stream_parser import EventType, StreamEvent, StreamParser
 from .llm_client import LLMClient
+from .observability import tracing
+from .observability.registry import FAST_BUCKETS, registry
+
+logger = logging.getLogger(__name__)
+
+CLAUDE_SPAWN_SECONDS = registry.histogram(
+    "helix_claude_spawn_seconds",
+    "Time to spawn a Claude CLI process",
+    buckets=FAST_BUCKETS,
+)
+CLAUDE_FIRST_EVENT_SECONDS = registry.histogram(
+    "helix_claude_first_event_seconds",
+    "Time from spawning the Claude CLI to its first stdout line",
+)
 
 
 # Type alias for output callback
 OutputCallback = Callable[[str, str], Awaitable[None]]  # (stream: "stdout"|"stderr", line: str)
 
 
+def _admitted(method):
+    """Run a ClaudeRunner method inside an admission controller slot."""
+    @functools.wraps(method)
+    async def wrapper(self: "ClaudeRunner", *args: Any, **kwargs: Any) -> "ClaudeResult":
+        with tracing.span(f"claude.{method.__name__}", model=kwargs.get("model")) as span:
+            queued = time.perf_counter()
+            async with self.admission.slot(self.priority, self.admission_key):
+                tracing.record_span("claude.admission_wait", queued)
+                result = await method(self, *args, **kwargs)
+            span.set(
+                success=result.success,
+                exit_code=result.exit_code,
+                session_id=result.session_id,
+                cost_usd=result.cost_usd,
+            )
+            return result
+    return wrapper
+
+
 @dataclass
 class ClaudeResult:
     """Result from a Claude Code CLI execution.
@@ -38,6 +81,9 @@ class ClaudeResult:
         output_json: Parsed JSON output if available.
         duration_seconds: Execution duration in seconds.
         session_id: Claude CLI session ID for --resume continuation.
+        usage: Token usage reported by the CLI result event
+            (input_tokens, output_tokens, cache_read_input_tokens, ...).
+        cost_usd: Total cost reported by the CLI result event.
     """
     success: bool
     exit_code: int
@@ -46,6 +92,22 @@ class ClaudeResult:
     output_json: dict[str, Any] | None = None
     session_id: str | None = None
     duration_seconds: float = 0.0
+    usage: dict[str, int] = field(default_factory=dict)
+    cost_usd: float = 0.0
+
+    @property
+    def input_tokens(self) -> int:
+        """Input tokens including cache reads and writes."""
+        return (
+            self.usage.get("input_tokens", 0)
+            + self.usage.get("cache_read_input_tokens", 0)
+            + self.usage.get("cache_creation_input_tokens", 0)
+        )
+
+    @property
+    def output_tokens(self) -> int:
+        """Output tokens."""
+        return self.usage.get("output_tokens", 0)
 
 
 class ClaudeRunner:
@@ -87,6 +149,9 @@ class ClaudeRunner:
         llm_client: LLMClient | None = None,
         use_stdbuf: bool = True,
         venv_path: Path | None = None,
+        priority: Priority = Priority.BACKGROUND,
+        admission_key: str = "default",
+        admission: AdmissionController | None = None,
     ) -> None:
         """Initialize the ClaudeRunner.
 
@@ -97,6 +162,9 @@ class ClaudeRunner:
             use_stdbuf: Whether to use stdbuf for line buffering (default True).
             venv_path: Path to the Python virtualenv. Defaults to helix's .venv.
                       Set to None to disable virtualenv PATH injection.
+            priority: Admission priority class of this runner's CLI runs.
+            admission_key: Fair-queuing key (user, job) within the class.
+            admission: Admission controller. Defaults to the process-wide one.
         """
         # Ensure NVM node is in PATH for Claude CLI
         PathConfig.ensure_claude_path()
@@ -105,6 +173,9 @@ class ClaudeRunner:
         self.llm_client = llm_client or LLMClient()
         self.use_stdbuf = use_stdbuf and self._check_stdbuf_available()
         self.venv_path = venv_path if venv_path is not None else self.DEFAULT_VENV_PATH
+        self.priority = priority
+        self.admission_key = admission_key
+        self.admission = admission or get_admission_controller()
 
     def _check_stdbuf_available(self) -> bool:
         """Check if stdbuf is available on the system."""
@@ -186,6 +257,7 @@ class ClaudeRunner:
 
         return cmd
 
+    @_admitted
     async def run_phase(
         self,
         phase_dir: Path,
@@ -240,13 +312,12 @@ class ClaudeRunner:
                 prompt = "Execute the phase tasks as defined in the spec."
 
         cmd = self._build_command()
+        process = None
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
+            process, _ = await self._spawn(
+                cmd,
                 stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
                 cwd=phase_dir,
                 env={**os.environ, **env},
             )
@@ -262,6 +333,7 @@ class ClaudeRunner:
 
             output_json = self._extract_json_output(stdout, phase_dir)
             session_id = self._extract_session_id(stdout)
+            usage, cost_usd = self._extract_usage(stdout)
 
             duration = time.time() - start_time
 
@@ -273,8 +345,17 @@ class ClaudeRunner:
                 output_json=output_json,
                 session_id=session_id,
                 duration_seconds=duration,
+                usage=usage,
+                cost_usd=cost_usd,
             )
 
+        except asyncio.CancelledError:
+            # Caller no longer needs the result (e.g. a hedged candidate
+            # lost the race) - don't leave the CLI running
+            if process and process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
         except asyncio.TimeoutError:
             duration = time.time() - start_time
             return ClaudeResult(
@@ -303,6 +384,7 @@ class ClaudeRunner:
                 duration_seconds=duration,
             )
 
+    @_admitted
     async def run_phase_streaming(
         self,
         phase_dir: Path,
@@ -363,16 +445,16 @@ class ClaudeRunner:
 
         stdout_lines: list[str] = []
         stderr_lines: list[str] = []
+        process = None
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
+            process, spawned_at = await self._spawn(
+                cmd,
                 stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
                 cwd=phase_dir,
                 env={**os.environ, **env},
             )
+            on_output = self._trace_tools(self._time_first_event(on_output, spawned_at))
 
             # Send prompt to stdin
             if process.stdin:
@@ -423,6 +505,7 @@ class ClaudeRunner:
 
             output_json = self._extract_json_output(stdout, phase_dir)
             session_id = self._extract_session_id(stdout)
+            usage, cost_usd = self._extract_usage(stdout)
 
             duration = time.time() - start_time
 
@@ -434,8 +517,17 @@ class ClaudeRunner:
                 output_json=output_json,
                 session_id=session_id,
                 duration_seconds=duration,
+                usage=usage,
+                cost_usd=cost_usd,
             )
 
+        except asyncio.CancelledError:
+            # Caller cut the generation short (e.g. in-stream validation
+            # found a final error) - don't leave the CLI running
+            if process and process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
         except asyncio.TimeoutError:
             # Kill the process on timeout
             if process and process.returncode is None:
@@ -560,6 +652,33 @@ class ClaudeRunner:
 
         return None
 
+    def _extract_usage(self, stdout: str) -> tuple[dict[str, int], float]:
+        """Extract token usage and cost from the JSONL result event.
+
+        Args:
+            stdout: Standard output containing JSONL events.
+
+        Returns:
+            Tuple of (usage dict, total cost in USD). Empty/0.0 if the
+            output has no result event (e.g. plain text output).
+        """
+        for line in reversed(stdout.strip().split("\n")):
+            line = line.strip()
+            if not line.startswith("{"):
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if data.get("type") != "result":
+                continue
+            usage = data.get("usage") or {}
+            return (
+                {k: v for k, v in usage.items() if isinstance(v, int)},
+                float(data.get("total_cost_usd") or 0.0),
+            )
+        return {}, 0.0
+
     def _extract_session_id(self, stdout: str) -> str | None:
         """Extract Claude CLI session ID from JSONL output.
 
@@ -588,6 +707,119 @@ class ClaudeRunner:
         
         return None
 
+    async def _spawn(
+        self,
+        cmd: list[str],
+        **kwargs: Any,
+    ) -> tuple[asyncio.subprocess.Process, float]:
+        """Start the Claude CLI with piped stdout/stderr, timing the spawn.
+
+        Args:
+            cmd: Command line to execute.
+            **kwargs: Further create_subprocess_exec arguments (stdin, cwd, env).
+
+        Returns:
+            Tuple of (process, perf_counter timestamp before the spawn).
+        """
+        started = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **kwargs,
+        )
+        spawned = time.perf_counter()
+        CLAUDE_SPAWN_SECONDS.observe(spawned - started)
+        tracing.record_span("claude.spawn", started, spawned)
+        return process, started
+
+    def _time_first_event(
+        self,
+        on_output: OutputCallback,
+        spawned_at: float,
+    ) -> OutputCallback:
+        """Wrap an output callback to record the time to the first stdout line."""
+        first = True
+
+        async def callback(stream: str, line: str) -> None:
+            nonlocal first
+            if first and stream == "stdout":
+                first = False
+                now = time.perf_counter()
+                CLAUDE_FIRST_EVENT_SECONDS.observe(now - spawned_at)
+                tracing.record_span("claude.first_event", spawned_at, now)
+            await on_output(stream, line)
+
+        return callback
+
+    def _trace_tools(self, on_output: OutputCallback) -> OutputCallback:
+        """Wrap an output callback to trace tool calls as spans.
+
+        Pairs tool_use and tool_result stream-json events (StreamParser)
+        and records one "tool.<name>" span per call. Returns on_output
+        unchanged when tracing is off.
+        """
+        if not tracing.is_active():
+            return on_output
+
+        parser = StreamParser()
+        pending: dict[str, tuple[str, float]] = {}
+
+        async def on_event(event: StreamEvent) -> None:
+            if event.event_type == EventType.ASSISTANT_TOOL_USE and event.tool_use_id:
+                pending[event.tool_use_id] = (event.tool_name or "unknown", time.perf_counter())
+            elif event.event_type == EventType.USER_TOOL_RESULT and event.tool_use_id:
+                started = pending.pop(event.tool_use_id, None)
+                if started is not None:
+                    tracing.record_span(
+                        f"tool.{started[0]}", started[1], tool_use_id=event.tool_use_id
+                    )
+
+        parser.on_event(on_event)
+
+        async def callback(stream: str, line: str) -> None:
+            if stream == "stdout":
+                await parser.parse_line(line)
+            await on_output(stream, line)
+
+        return callback
+
+    async def _stream_process(
+        self,
+        process: asyncio.subprocess.Process,
+        on_output: OutputCallback,
+    ) -> tuple[bytes, bytes]:
+        """Read a process' output line by line, forwarding each line.
+
+        Args:
+            process: Running process with piped stdout and stderr.
+            on_output: Async callback(stream, line) for each line.
+
+        Returns:
+            Tuple of (stdout bytes, stderr bytes) like communicate().
+        """
+        async def pump(
+            stream: asyncio.StreamReader | None,
+            stream_name: str,
+            chunks: list[bytes],
+        ) -> None:
+            if stream is None:
+                return
+            async for line_bytes in stream:
+                chunks.append(line_bytes)
+                line = line_bytes.decode("utf-8", errors="replace").rstrip("\n\r")
+                await on_output(stream_name, line)
+
+        stdout_chunks: list[bytes] = []
+        stderr_chunks: list[bytes] = []
+        await asyncio.gather(
+            pump(process.stdout, "stdout", stdout_chunks),
+            pump(process.stderr, "stderr", stderr_chunks),
+        )
+        await process.wait()
+        return b"".join(stdout_chunks), b"".join(stderr_chunks)
+
+    @_admitted
     async def continue_session(
         self,
         session_id: str,
@@ -595,6 +827,8 @@ class ClaudeRunner:
         model: str | None = None,
         timeout: int = 300,
         env_overrides: dict[str, str] | None = None,
+        cwd: Path | None = None,
+        on_output: OutputCallback | None = None,
     ) -> ClaudeResult:
         """Continue an existing Claude session with --resume.
 
@@ -607,6 +841,9 @@ class ClaudeRunner:
             model: Optional model spec to use.
             timeout: Timeout in seconds.
             env_overrides: Optional environment variable overrides.
+            cwd: Working directory of the original run. The CLI stores
+                sessions per directory, so phase retries must pass it.
+            on_output: Optional async callback(stream, line) for live output.
 
         Returns:
             ClaudeResult with execution details including new session_id.
@@ -629,18 +866,25 @@ class ClaudeRunner:
         logger.info(f"Continuing session {session_id[:8]}... with prompt: {prompt[:50]}...")
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
+            process, spawned_at = await self._spawn(
+                cmd,
+                cwd=cwd,
+                env={**os.environ, **env},
             )
+            if on_output is not None:
+                on_output = self._trace_tools(self._time_first_event(on_output, spawned_at))
 
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout,
-                )
+                if on_output is None:
+                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                        process.communicate(),
+                        timeout=timeout,
+                    )
+                else:
+                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                        self._stream_process(process, on_output),
+                        timeout=timeout,
+                    )
             except asyncio.TimeoutError:
                 process.kill()
                 await process.wait()
@@ -661,6 +905,7 @@ class ClaudeRunner:
 
             # Extract new session_id (may be same or different)
             new_session_id = self._extract_session_id(stdout) or session_id
+            usage, cost_usd = self._extract_usage(stdout)
 
             logger.info(
                 f"Session continuation completed: exit={exit_code}, "
@@ -674,6 +919,9 @@ class ClaudeRunner:
                 stderr=stderr,
                 output_json=None,  # Don't parse for continuation
                 session_id=new_session_id,
+                duration_seconds=duration,
+                usage=usage,
+                cost_usd=cost_usd,
             )
 
         except Exception as e:
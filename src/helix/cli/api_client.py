@@ -46,12 +46,14 @@ async def check_api_health(base_url: str = API_BASE) -> bool:
 async def start_job(
     project_path: str,
     base_url: str = API_BASE,
+    no_cache: bool = False,
 ) -> str:
     """Start a project execution job.
 
     Args:
         project_path: Path to the project directory
         base_url: API base URL
+        no_cache: Re-run all phases instead of restoring unchanged ones
 
     Returns:
         job_id string
@@ -62,7 +64,7 @@ async def start_job(
     async with httpx.AsyncClient(timeout=None) as client:
         response = await client.post(
             f"{base_url}/helix/execute",
-            json={"project_path": project_path},
+            json={"project_path": project_path, "no_cache": no_cache},
         )
 
         if response.status_code != 200:
@@ -77,6 +79,7 @@ async def run_project(
     project_path: str,
     background: bool = False,
     base_url: str = API_BASE,
+    no_cache: bool = False,
 ) -> AsyncGenerator[dict, None]:
     """Run a project via the API and stream events.
 
@@ -84,6 +87,7 @@ async def run_project(
         project_path: Path to the project directory
         background: If True, just start the job (for background use start_job directly)
         base_url: API base URL
+        no_cache: Re-run all phases instead of restoring unchanged ones
 
     Yields:
         SSE events as dicts
@@ -91,7 +95,7 @@ async def run_project(
     Raises:
         APIError: If API request fails
     """
-    job_id = await start_job(project_path, base_url)
+    job_id = await start_job(project_path, base_url, no_cache=no_cache)
 
     if background:
         # Yield a single event with the job_id for background mode
@@ -272,8 +276,15 @@ def print_event(event: dict) -> None:
             for line in output.splitlines():
                 print(f"   {DIM}{line}{RESET}")
 
+    elif event_type == "phase_cached":
+        restored = len(data.get("restored_files", []))
+        print(f"{DIM}   inputs unchanged, restored {restored} output file(s) from cache{RESET}")
+
     elif event_type == "phase_complete":
         phase_id = event.get("phase_id") or data.get("phase_id", "?")
+        if data.get("cached"):
+            print(f"{GREEN}   ✓ Phase {phase_id} completed (cached){RESET}")
+            return
         duration = data.get("duration", 0)
         print(f"{GREEN}   ✓ Phase {phase_id} completed ({duration:.1f}s){RESET}")
 
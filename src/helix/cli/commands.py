@@ -53,8 +53,16 @@ def require_api(func):
 @click.option("--model", "-m", default="claude-opus-4", help="LLM model to use")
 @click.option("--dry-run", is_flag=True, help="Show what would be done")
 @click.option("--background", "-bg", is_flag=True, help="Run in background, return job ID")
+@click.option("--no-cache", is_flag=True, help="Re-run all phases, even if their inputs are unchanged")
 @handle_error
-def run(project_path: str, phase: Optional[str], model: str, dry_run: bool, background: bool) -> None:
+def run(
+    project_path: str,
+    phase: Optional[str],
+    model: str,
+    dry_run: bool,
+    background: bool,
+    no_cache: bool,
+) -> None:
     """Run a HELIX project workflow.
 
     PROJECT_PATH is the path to the project directory containing ADR and phases.yaml.
@@ -80,19 +88,21 @@ def run(project_path: str, phase: Optional[str], model: str, dry_run: bool, back
     click.secho(f"-> Using model: {model}", fg="blue")
     if phase:
         click.secho(f"-> Starting from phase: {phase}", fg="blue")
+    if no_cache:
+        click.secho("-> Phase cache disabled", fg="blue")
 
     async def execute():
         try:
             if background:
                 # Use start_job directly for background mode
                 from .api_client import start_job
-                job_id = await start_job(str(project))
+                job_id = await start_job(str(project), no_cache=no_cache)
                 click.secho(f"-> Job started: {job_id}", fg="green")
                 click.echo(f"   Track with: helix logs {job_id}")
                 return
 
             # Stream events
-            async for event in run_project(str(project), background=False):
+            async for event in run_project(str(project), background=False, no_cache=no_cache):
                 print_event(event)
         except APIError as e:
             click.secho(f"✗ API error: {e.detail}", fg="red")
@@ -295,6 +305,206 @@ def costs(project_path: str, detailed: bool) -> None:
             )
 
 
+@click.command("validate-adrs")
+@click.argument("adr_dir", type=click.Path(exists=True, file_okay=False), default="adr")
+@click.option("--workers", "-w", type=int, default=None, help="Worker processes (default: CPU count)")
+@click.option("--rules", type=click.Path(exists=True, dir_okay=False), help="Completeness rules file")
+@click.option("--no-cache", is_flag=True, help="Re-validate all ADRs, ignore cached results")
+@handle_error
+def validate_adrs(adr_dir: str, workers: Optional[int], rules: Optional[str], no_cache: bool) -> None:
+    """Validate all ADRs of a directory in parallel.
+
+    ADR_DIR is the ADR directory (default: adr). Prints one JSON line per
+    ADR followed by a summary line. Exits with 1 if any ADR has errors.
+    """
+    from helix.adr.batch import CorpusSummary, validate_corpus
+
+    summary = CorpusSummary()
+    for result in validate_corpus(
+        Path(adr_dir),
+        workers=workers,
+        rules_path=Path(rules) if rules else None,
+        use_cache=not no_cache,
+    ):
+        summary.add(result)
+        click.echo(result.to_json())
+
+    click.echo(json.dumps({
+        "summary": {
+            "total": summary.total,
+            "valid": summary.valid,
+            "invalid": summary.invalid,
+            "cached": summary.cached,
+            "passed": summary.passed,
+        }
+    }))
+
+    if not summary.passed:
+        sys.exit(1)
+
+
+@click.command()
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default="benchmark-results.json",
+              help="Results file (JSON)")
+@click.option("--baseline", "-b", type=click.Path(exists=True, dir_okay=False),
+              help="Results of a previous commit to compare against")
+@click.option("--only", multiple=True, help="Run only this benchmark (repeatable)")
+@click.option("--config", "config_path", type=click.Path(exists=True, dir_okay=False),
+              help="Simulator config (JSON)")
+@click.option("--threshold", type=float, default=0.10, help="Tolerated slowdown (default: 0.10)")
+@click.option("--quick", is_flag=True, help="Small sizes for a smoke run")
+@handle_error
+def benchmark(
+    output: str,
+    baseline: Optional[str],
+    only: tuple[str, ...],
+    config_path: Optional[str],
+    threshold: float,
+    quick: bool,
+) -> None:
+    """Run the benchmark suite against the Claude CLI simulator.
+
+    Writes the results as JSON. With --baseline, exits with 1 if any
+    metric regressed by more than the threshold.
+    """
+    from helix.benchmarks import (
+        SimulatorConfig, compare_results, load_results, run_suite, save_results,
+    )
+
+    config = None
+    if config_path:
+        config = SimulatorConfig.from_dict(json.loads(Path(config_path).read_text()))
+
+    results = asyncio.run(run_suite(config=config, only=list(only) or None, quick=quick))
+    save_results(results, Path(output))
+
+    for name, bench in results["benchmarks"].items():
+        click.secho(name, bold=True)
+        for metric, value in bench["metrics"].items():
+            click.echo(f"  {metric:<28} {value:>14.6g}")
+    click.echo(f"\nResults: {output}")
+
+    if baseline:
+        regressions = compare_results(load_results(Path(baseline)), results, threshold)
+        if regressions:
+            click.secho(f"\n✗ {len(regressions)} regression(s):", fg="red")
+            for regression in regressions:
+                click.echo(f"  {regression.describe()}")
+            sys.exit(1)
+        click.secho("\n✓ No regressions", fg="green")
+
+
+@click.command()
+@click.option("--by", "group_by", multiple=True,
+              type=click.Choice(["day", "project", "phase", "model", "source"]),
+              help="Group by column (repeatable, default: day and model)")
+@click.option("--project", default=None, help="Only this project")
+@click.option("--model", default=None, help="Only this model")
+@click.option("--since", default=None, help="First day (YYYY-MM-DD)")
+@click.option("--until", default=None, help="Last day (YYYY-MM-DD)")
+@click.option("--json", "as_json", is_flag=True, help="Output JSON")
+@handle_error
+def usage(
+    group_by: tuple[str, ...],
+    project: Optional[str],
+    model: Optional[str],
+    since: Optional[str],
+    until: Optional[str],
+    as_json: bool,
+) -> None:
+    """Show token usage and cost across all projects.
+
+    Reads the usage ledger (HELIX_USAGE_LEDGER, default logs/usage.db).
+    """
+    from helix.observability.ledger import get_usage_ledger
+
+    ledger = get_usage_ledger()
+    columns = list(group_by) or ["day", "model"]
+    rows = ledger.query(columns, project=project, model=model, since=since, until=until)
+
+    if as_json:
+        click.echo(json.dumps(rows, indent=2))
+        return
+
+    if not rows:
+        click.secho("Warning: No usage recorded", fg="yellow")
+        return
+
+    header = "".join(f"{c.title():<24}" for c in columns)
+    click.echo(f"{header}{'Input':>14} {'Output':>14} {'Cost':>12}")
+    click.echo("-" * (len(header) + 42))
+    for row in rows:
+        keys = "".join(f"{str(row[c]):<24}" for c in columns)
+        click.echo(
+            f"{keys}{row['input_tokens']:>14,} {row['output_tokens']:>14,} "
+            f"${row['cost_usd']:>11,.4f}"
+        )
+
+    totals = ledger.totals(project=project, model=model, since=since, until=until)
+    click.echo()
+    click.secho(f"Total cost: ${totals['cost_usd']:,.4f}", fg="green")
+
+
+@click.command("archive-sessions")
+@click.option("--days", type=int, default=30, help="Archive sessions not updated for this many days")
+@click.option("--rebuild-index", is_flag=True, help="Rebuild the session index from disk first")
+@click.option("--dry-run", is_flag=True, help="Only list the sessions that would be archived")
+@handle_error
+def archive_sessions(days: int, rebuild_index: bool, dry_run: bool) -> None:
+    """Compress stale consultant sessions into projects/sessions-archive."""
+    from helix.api.session_manager import session_manager
+
+    if rebuild_index:
+        count = session_manager.rebuild_index()
+        click.echo(f"Indexed {count} sessions")
+
+    archived = session_manager.archive_stale_sessions(days, dry_run=dry_run)
+    for session_id in archived:
+        click.echo(f"  {session_id}")
+    verb = "Would archive" if dry_run else "Archived"
+    click.secho(f"{verb} {len(archived)} sessions", fg="green")
+
+
+@click.command()
+@click.argument("project_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None,
+              help="Chrome trace JSON to write (default: logs/trace.json)")
+@click.option("--trace-id", default=None, help="Export only this trace")
+@click.option("--top", type=int, default=10, help="Number of span names in the summary")
+@handle_error
+def trace(project_path: str, output: Optional[str], trace_id: Optional[str], top: int) -> None:
+    """Export a project's span trace for Perfetto / chrome://tracing.
+
+    PROJECT_PATH is the path to the project directory. Traces are
+    recorded when HELIX_TRACE is set (1 = every run, 0.1 = 10%).
+    """
+    from helix.observability.tracing import export_chrome_trace, load_trace_events
+
+    project = Path(project_path).resolve()
+    trace_file = project / "logs" / "trace.jsonl"
+    if not trace_file.exists():
+        click.secho(f"Warning: No trace found at {trace_file} (set HELIX_TRACE=1)", fg="yellow")
+        return
+
+    output_file = Path(output) if output else project / "logs" / "trace.json"
+    count = export_chrome_trace(trace_file, output_file, trace_id)
+    click.echo(f"Exported {count} events to {output_file} (open in https://ui.perfetto.dev)")
+
+    totals: dict[str, list[float]] = {}
+    for event in load_trace_events(trace_file):
+        if trace_id and event.get("args", {}).get("trace_id") != trace_id:
+            continue
+        entry = totals.setdefault(event.get("name", "?"), [0, 0.0])
+        entry[0] += 1
+        entry[1] += event.get("dur", 0) / 1_000_000
+
+    click.echo()
+    click.echo(f"{'Span':<32} {'Count':>7} {'Total (s)':>12}")
+    click.echo("-" * 53)
+    for name, (n, seconds) in sorted(totals.items(), key=lambda kv: -kv[1][1])[:top]:
+        click.echo(f"{name:<32} {n:>7} {seconds:>12.3f}")
+
+
 @click.command()
 @click.argument("project_name")
 @click.option(
@@ -494,8 +704,15 @@ phases:
 @click.argument("project_path", type=click.Path(exists=True))
 @click.option("--request", "-r", help="Path to request.md file or direct request text")
 @click.option("--model", "-m", default="claude-opus-4", help="LLM model for consultant")
+@click.option("--expert-deadline", type=float, default=None,
+              help="Seconds to wait for experts before synthesis starts without them")
 @handle_error
-def discuss(project_path: str, request: Optional[str], model: str) -> None:
+def discuss(
+    project_path: str,
+    request: Optional[str],
+    model: str,
+    expert_deadline: Optional[float],
+) -> None:
     """Start a consultant meeting for a project.
 
     PROJECT_PATH is the path to the project directory.
@@ -525,10 +742,27 @@ def discuss(project_path: str, request: Optional[str], model: str) -> None:
 
     llm_client = LLMClient()
     expert_manager = ExpertManager()
-    meeting = ConsultantMeeting(llm_client, expert_manager)
+    meeting = ConsultantMeeting(llm_client, expert_manager, expert_deadline=expert_deadline)
 
     async def run_meeting():
-        result = await meeting.run(project, user_request)
+        result = None
+        async for event in meeting.run_stream(project, user_request):
+            if event.event_type == "expert_selection":
+                click.secho(f"  -> Experts: {', '.join(event.selection.experts)}", fg="white")
+            elif event.event_type == "analysis":
+                late = " (late)" if event.late else ""
+                click.secho(
+                    f"  ✓ {event.expert_id}: {len(event.analysis.findings)} findings{late}",
+                    fg="green",
+                )
+            elif event.event_type == "expert_late":
+                click.secho(f"  … {event.expert_id} missed the deadline", fg="yellow")
+            elif event.event_type == "expert_dropped":
+                click.secho(f"  ✗ {event.expert_id} dropped", fg="yellow")
+            elif event.event_type == "synthesis":
+                click.secho("  -> Synthesis complete", fg="white")
+            elif event.event_type == "meeting_complete":
+                result = event.result
         return result
 
     try:
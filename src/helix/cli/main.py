@@ -5,7 +5,10 @@ This module provides the main Click group for the HELIX CLI.
 
 import click
 
-from .commands import run, status, debug, costs, new, discuss, jobs, logs, stop
+from .commands import (
+    run, status, debug, costs, new, discuss, jobs, logs, stop, validate_adrs,
+    benchmark, trace, usage, archive_sessions,
+)
 
 
 @click.group()
@@ -29,6 +32,11 @@ cli.add_command(discuss)
 cli.add_command(jobs)
 cli.add_command(logs)
 cli.add_command(stop)
+cli.add_command(validate_adrs)
+cli.add_command(benchmark)
+cli.add_command(trace)
+cli.add_command(usage)
+cli.add_command(archive_sessions)
 
 
 if __name__ == "__main__":
@@ -170,6 +170,12 @@ class PathConfig:
         str(HELIX_ROOT / "config" / "llm-providers.yaml")
     ))
 
+    # Usage ledger (token/cost history of all projects)
+    USAGE_LEDGER: Path = Path(os.environ.get(
+        "HELIX_USAGE_LEDGER",
+        str(HELIX_ROOT / "logs" / "usage.db")
+    ))
+
     # Skills directory
     SKILLS_DIR: Path = Path(os.environ.get(
         "HELIX_SKILLS_DIR",
@@ -5,12 +5,15 @@ This module provides the agentic meeting orchestration system that coordinates
 domain experts to analyze user requests and generate project specifications.
 """
 
-from .meeting import ConsultantMeeting, MeetingResult
+from .meeting import ConsultantMeeting, MeetingEvent, MeetingResult
 from .expert_manager import ExpertManager, ExpertConfig
+from .trigger_matcher import TriggerMatcher
 
 __all__ = [
     "ConsultantMeeting",
+    "MeetingEvent",
     "MeetingResult",
     "ExpertManager",
     "ExpertConfig",
+    "TriggerMatcher",
 ]
@@ -13,7 +13,6 @@ The keyword-based selection serves as hints/suggestions.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -22,6 +21,8 @@ import yaml
 
 from helix.config.paths import PathConfig
 
+from .trigger_matcher import TriggerMatcher
+
 
 @dataclass
 class ExpertConfig:
@@ -33,6 +34,7 @@ class ExpertConfig:
         description: Description of the expert's domain and capabilities.
         skills: List of skills this expert possesses.
         triggers: Keywords that suggest this expert's involvement (advisory).
+        trigger_weights: Optional per-trigger weights (default 1.0).
     """
 
     id: str
@@ -40,11 +42,18 @@ class ExpertConfig:
     description: str
     skills: list[str] = field(default_factory=list)
     triggers: list[str] = field(default_factory=list)
+    trigger_weights: dict[str, float] = field(default_factory=dict)
 
     @classmethod
     def from_dict(cls, expert_id: str, data: dict[str, Any]) -> ExpertConfig:
         """Create an ExpertConfig from a dictionary.
 
+        Triggers may be plain strings or mappings with a weight::
+
+            triggers:
+              - "bom"
+              - {term: "stückliste", weight: 2}
+
         Args:
             expert_id: The unique identifier for this expert.
             data: Dictionary containing expert configuration.
@@ -52,14 +61,38 @@ class ExpertConfig:
         Returns:
             ExpertConfig instance.
         """
+        triggers: list[str] = []
+        trigger_weights: dict[str, float] = {}
+        for trigger in data.get("triggers", []) or []:
+            if isinstance(trigger, dict):
+                term = str(trigger.get("term", "")).strip()
+                if not term:
+                    continue
+                triggers.append(term)
+                trigger_weights[term] = float(trigger.get("weight", 1.0))
+            else:
+                triggers.append(str(trigger))
+
         return cls(
             id=expert_id,
             name=data.get("name", expert_id.title()),
             description=data.get("description", ""),
             skills=data.get("skills", []),
-            triggers=data.get("triggers", [])
+            triggers=triggers,
+            trigger_weights=trigger_weights,
         )
 
+    def weighted_triggers(self) -> dict[str, float]:
+        """Get all triggers with their weights.
+
+        Returns:
+            Mapping of trigger keyword to weight.
+        """
+        return {
+            trigger: self.trigger_weights.get(trigger, 1.0)
+            for trigger in self.triggers
+        }
+
 
 class ExpertManager:
     """
@@ -196,19 +229,33 @@ class ExpertManager:
         """
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
         self._experts_cache: dict[str, ExpertConfig] | None = None
+        self._matcher: TriggerMatcher | None = None
+        self._config_mtime: int | None = None
+
+    def _current_config_mtime(self) -> int | None:
+        """Get the modification time of the config file (None if missing)."""
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
 
     def load_experts(self) -> dict[str, ExpertConfig]:
         """Load expert configurations from YAML file or defaults.
 
         Attempts to load from the configured YAML file. If the file
         doesn't exist, falls back to built-in default configurations.
+        The result is cached and reloaded when the YAML file changes.
 
         Returns:
             Dictionary mapping expert IDs to ExpertConfig instances.
         """
-        if self._experts_cache is not None:
+        mtime = self._current_config_mtime()
+        if self._experts_cache is not None and mtime == self._config_mtime:
             return self._experts_cache
 
+        self._matcher = None
+        self._config_mtime = mtime
+
         experts: dict[str, ExpertConfig] = {}
 
         # Try loading from YAML file
@@ -236,6 +283,23 @@ class ExpertManager:
         self._experts_cache = experts
         return experts
 
+    def get_matcher(self) -> TriggerMatcher:
+        """Get the compiled trigger matcher for the current expert config.
+
+        The matcher is built once per loaded configuration and rebuilt
+        automatically when load_experts() picks up a changed YAML file.
+
+        Returns:
+            TriggerMatcher over all expert triggers.
+        """
+        experts = self.load_experts()
+        if self._matcher is None:
+            self._matcher = TriggerMatcher({
+                expert_id: expert.weighted_triggers()
+                for expert_id, expert in experts.items()
+            })
+        return self._matcher
+
     def suggest_experts(self, request: str) -> list[str]:
         """Suggest experts based on keywords in the request.
 
@@ -244,7 +308,9 @@ class ExpertManager:
         to apply based on full conversation context.
 
         Analyzes the request text and suggests experts whose trigger
-        keywords are found in the request.
+        keywords are found in the request. Whole-word matches score
+        twice as much as matches inside longer words; per-trigger
+        weights from the config multiply the score.
 
         Args:
             request: The user request to analyze.
@@ -252,30 +318,7 @@ class ExpertManager:
         Returns:
             List of expert IDs that might be relevant (advisory).
         """
-        experts = self.load_experts()
-        request_lower = request.lower()
-
-        # Normalize request for better matching
-        request_normalized = re.sub(r'[^\w\s]', ' ', request_lower)
-        words = set(request_normalized.split())
-
-        scores: dict[str, int] = {}
-
-        for expert_id, expert in experts.items():
-            score = 0
-            for trigger in expert.triggers:
-                trigger_lower = trigger.lower()
-
-                # Check for exact word match
-                if trigger_lower in words:
-                    score += 2
-
-                # Check for partial match (substring)
-                elif trigger_lower in request_lower:
-                    score += 1
-
-            if score > 0:
-                scores[expert_id] = score
+        scores = self.get_matcher().score(request)
 
         # Sort by score and return as suggestions
         sorted_experts = sorted(scores.keys(), key=lambda x: scores[x], reverse=True)
@@ -417,6 +460,8 @@ Erstelle eine `output/analysis.json` mit folgendem Format:
     def clear_cache(self) -> None:
         """Clear the experts cache to force reload on next access."""
         self._experts_cache = None
+        self._matcher = None
+        self._config_mtime = None
 
     def get_expert(self, expert_id: str) -> ExpertConfig | None:
         """Get a single expert configuration by ID.
@@ -9,6 +9,12 @@ The meeting process has 4 phases:
 2. Expert Analysis: Each expert analyzes (parallel) and writes analysis.json
 3. Synthesis: Meta-Consultant combines analyses, resolves conflicts
 4. Output: Generates spec.yaml, phases.yaml, quality-gates.yaml
+
+Phases 2 and 3 are pipelined: ``run_stream()`` yields each expert's
+analysis as soon as it arrives, together with a draft synthesis. With an
+``expert_deadline``, the final synthesis starts without late experts; a
+late expert that finishes while the synthesis is still running is folded
+in afterwards, otherwise it is dropped.
 """
 
 from __future__ import annotations
@@ -18,7 +24,7 @@ import json
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 import yaml
 
@@ -74,6 +80,31 @@ class MeetingResult:
     adr_path: Path | None = None  # Path to generated ADR file
 
 
+@dataclass
+class MeetingEvent:
+    """Progress event emitted by ConsultantMeeting.run_stream().
+
+    Event types:
+        expert_selection: Phase 1 finished (``selection`` set)
+        analysis: An expert analysis arrived (``expert_id``, ``analysis``;
+            ``late`` if it arrived after the expert deadline)
+        synthesis_draft: Local merge of all analyses so far (``synthesis``)
+        expert_late: Expert missed the deadline, synthesis starts without it
+        expert_dropped: Late expert was cancelled after synthesis finished
+        synthesis: Final synthesis (``synthesis``, ``analyses``)
+        meeting_complete: Output generated (``result``)
+    """
+
+    event_type: str
+    expert_id: str = ""
+    selection: ExpertSelection | None = None
+    analysis: Analysis | None = None
+    synthesis: Synthesis | None = None
+    analyses: dict[str, Analysis] | None = None
+    result: MeetingResult | None = None
+    late: bool = False
+
+
 class ConsultantMeeting:
     """
     Orchestrates agentic meetings with domain experts.
@@ -84,17 +115,26 @@ class ConsultantMeeting:
     Args:
         llm_client: The LLM client for making AI calls.
         expert_manager: Manager for domain expert configurations.
+        expert_deadline: Seconds after which the synthesis starts without
+            experts that have not answered yet (None = wait for all).
     """
 
-    def __init__(self, llm_client: Any, expert_manager: Any) -> None:
+    def __init__(
+        self,
+        llm_client: Any,
+        expert_manager: Any,
+        expert_deadline: float | None = None,
+    ) -> None:
         """Initialize the consultant meeting.
 
         Args:
             llm_client: LLM client instance for AI interactions.
             expert_manager: ExpertManager instance for expert handling.
+            expert_deadline: Optional per-expert deadline in seconds.
         """
         self.llm_client = llm_client
         self.expert_manager = expert_manager
+        self.expert_deadline = expert_deadline
         self._transcript_lines: list[str] = []
 
     def _log(self, message: str) -> None:
@@ -115,6 +155,8 @@ class ConsultantMeeting:
         3. Synthesis of all analyses
         4. Output generation
 
+        Consumes run_stream(); use that directly to show live progress.
+
         Args:
             project_dir: The project directory for output files.
             user_request: The original user request to analyze.
@@ -122,6 +164,32 @@ class ConsultantMeeting:
         Returns:
             MeetingResult containing all generated specifications.
         """
+        result: MeetingResult | None = None
+        async for event in self.run_stream(project_dir, user_request):
+            if event.event_type == "meeting_complete":
+                result = event.result
+        if result is None:
+            raise RuntimeError("Meeting ended without a result")
+        return result
+
+    async def run_stream(
+        self,
+        project_dir: Path,
+        user_request: str
+    ) -> AsyncIterator[MeetingEvent]:
+        """Run a complete consultant meeting, yielding progress events.
+
+        Same phases as run(), but each expert analysis, the draft synthesis
+        after each arrival and the final result are yielded as MeetingEvents
+        as soon as they are available.
+
+        Args:
+            project_dir: The project directory for output files.
+            user_request: The original user request to analyze.
+
+        Yields:
+            MeetingEvent for each step; the last one is ``meeting_complete``.
+        """
         start_time = time.time()
         self._transcript_lines = []
 
@@ -155,21 +223,36 @@ class ConsultantMeeting:
             }, indent=2, ensure_ascii=False),
             encoding="utf-8"
         )
+        yield MeetingEvent(event_type="expert_selection", selection=selection)
 
-        # Phase 2: Run expert analyses
+        # Phase 2 + 3: Stream expert analyses into the synthesis
         self._log("\n--- Phase 2: Expert Analyses ---")
-        analyses = await self.run_expert_analyses(
+        synthesis: Synthesis | None = None
+        analyses: dict[str, Analysis] = {}
+        async for event in self.stream_analyses_and_synthesis(
             selection.experts,
             user_request,
             selection.questions,
             meeting_dir / "phase-2-analysis"
-        )
-        for expert_id, analysis in analyses.items():
-            self._log(f"Expert '{expert_id}' provided {len(analysis.findings)} findings")
-
-        # Phase 3: Synthesize
+        ):
+            if event.event_type == "analysis" and event.analysis is not None:
+                suffix = " (late)" if event.late else ""
+                self._log(
+                    f"Expert '{event.expert_id}' provided "
+                    f"{len(event.analysis.findings)} findings{suffix}"
+                )
+            elif event.event_type == "expert_late":
+                self._log(f"Expert '{event.expert_id}' missed the deadline")
+            elif event.event_type == "expert_dropped":
+                self._log(f"Expert '{event.expert_id}' dropped from synthesis")
+            elif event.event_type == "synthesis":
+                synthesis = event.synthesis
+                analyses = event.analyses or {}
+            yield event
+
+        if synthesis is None:
+            raise RuntimeError("Expert analyses ended without a synthesis")
         self._log("\n--- Phase 3: Synthesis ---")
-        synthesis = await self.synthesize(analyses)
         self._log(f"Combined {len(synthesis.combined_requirements)} requirements")
         self._log(f"Resolved {len(synthesis.conflicts_resolved)} conflicts")
 
@@ -191,7 +274,7 @@ class ConsultantMeeting:
         result = await self.generate_output(
             synthesis,
             analyses,
-            selection.experts,
+            list(analyses.keys()),
             user_request,
             project_dir
         )
@@ -211,7 +294,7 @@ class ConsultantMeeting:
 
         self._log(f"\n=== Meeting Completed in {duration:.2f}s ===")
 
-        return result
+        yield MeetingEvent(event_type="meeting_complete", result=result)
 
     async def _setup_meeting_directories(self, meeting_dir: Path) -> None:
         """Create the meeting directory structure.
@@ -294,54 +377,53 @@ Respond in JSON format:
                 reasoning="Fallback to keyword-based selection"
             )
 
-    async def run_expert_analyses(
+    async def _analyze_with_expert(
         self,
-        experts: list[str],
+        expert_id: str,
+        expert_config: Any,
         request: str,
         questions: dict[str, str],
         analysis_dir: Path
-    ) -> dict[str, Analysis]:
-        """Run analyses for all selected experts in parallel.
+    ) -> tuple[str, Analysis]:
+        """Run the analysis for a single expert.
 
-        Each expert analyzes the request from their domain perspective
-        and produces an analysis.json file.
+        Writes the expert's CLAUDE.md and, as soon as the LLM answered,
+        its ``output/analysis.json``.
 
         Args:
-            experts: List of expert IDs to consult.
+            expert_id: ID of the expert to consult.
+            expert_config: The expert's ExpertConfig (None if unknown).
             request: The user request to analyze.
             questions: Specific questions for each expert.
             analysis_dir: Directory for storing analysis outputs.
 
         Returns:
-            Dictionary mapping expert IDs to their Analysis results.
+            Tuple of expert ID and its Analysis.
         """
-        async def analyze_with_expert(expert_id: str) -> tuple[str, Analysis]:
-            """Run analysis for a single expert."""
-            expert_config = self.expert_manager.load_experts().get(expert_id)
-            if not expert_config:
-                return expert_id, Analysis(
-                    domain=expert_id,
-                    findings=["Expert not found"],
-                    requirements=[],
-                    constraints=[],
-                    recommendations=[],
-                    dependencies=[],
-                    open_questions=[]
-                )
+        if not expert_config:
+            return expert_id, Analysis(
+                domain=expert_id,
+                findings=["Expert not found"],
+                requirements=[],
+                constraints=[],
+                recommendations=[],
+                dependencies=[],
+                open_questions=[]
+            )
 
-            # Setup expert directory
-            expert_dir = analysis_dir / f"{expert_id}-expert"
-            expert_dir.mkdir(parents=True, exist_ok=True)
+        # Setup expert directory
+        expert_dir = analysis_dir / f"{expert_id}-expert"
+        expert_dir.mkdir(parents=True, exist_ok=True)
 
-            # Generate CLAUDE.md for this expert
-            question = questions.get(expert_id, f"Analyze from {expert_id} perspective")
-            claude_md = self.expert_manager.generate_expert_claude_md(
-                expert_config, question
-            )
-            (expert_dir / "CLAUDE.md").write_text(claude_md, encoding="utf-8")
+        # Generate CLAUDE.md for this expert
+        question = questions.get(expert_id, f"Analyze from {expert_id} perspective")
+        claude_md = self.expert_manager.generate_expert_claude_md(
+            expert_config, question
+        )
+        (expert_dir / "CLAUDE.md").write_text(claude_md, encoding="utf-8")
 
-            # Run expert analysis via LLM
-            prompt = f"""You are a {expert_config.name} expert.
+        # Run expert analysis via LLM
+        prompt = f"""You are a {expert_config.name} expert.
 Your expertise: {expert_config.description}
 Your skills: {', '.join(expert_config.skills)}
 
@@ -364,53 +446,276 @@ Provide your analysis in JSON format:
     "open_questions": ["Questions that need clarification..."]
 }}"""
 
-            try:
-                response = await self.llm_client.complete(prompt)
-                result = json.loads(response)
-
-                analysis = Analysis(
-                    domain=result.get("domain", expert_id),
-                    findings=result.get("findings", []),
-                    requirements=result.get("requirements", []),
-                    constraints=result.get("constraints", []),
-                    recommendations=result.get("recommendations", []),
-                    dependencies=result.get("dependencies", []),
-                    open_questions=result.get("open_questions", [])
+        try:
+            response = await self.llm_client.complete(prompt)
+            result = json.loads(response)
+
+            analysis = Analysis(
+                domain=result.get("domain", expert_id),
+                findings=result.get("findings", []),
+                requirements=result.get("requirements", []),
+                constraints=result.get("constraints", []),
+                recommendations=result.get("recommendations", []),
+                dependencies=result.get("dependencies", []),
+                open_questions=result.get("open_questions", [])
+            )
+        except (json.JSONDecodeError, AttributeError):
+            analysis = Analysis(
+                domain=expert_id,
+                findings=[f"Analysis pending for {expert_id}"],
+                requirements=[],
+                constraints=[],
+                recommendations=[],
+                dependencies=[],
+                open_questions=["LLM response parsing failed"]
+            )
+
+        # Save analysis output
+        output_dir = expert_dir / "output"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        (output_dir / "analysis.json").write_text(
+            json.dumps({
+                "domain": analysis.domain,
+                "findings": analysis.findings,
+                "requirements": analysis.requirements,
+                "constraints": analysis.constraints,
+                "recommendations": analysis.recommendations,
+                "dependencies": analysis.dependencies,
+                "open_questions": analysis.open_questions
+            }, indent=2, ensure_ascii=False),
+            encoding="utf-8"
+        )
+
+        return expert_id, analysis
+
+    async def stream_expert_analyses(
+        self,
+        experts: list[str],
+        request: str,
+        questions: dict[str, str],
+        analysis_dir: Path
+    ) -> AsyncIterator[tuple[str, Analysis]]:
+        """Run all expert analyses in parallel, yielding them as they finish.
+
+        Args:
+            experts: List of expert IDs to consult.
+            request: The user request to analyze.
+            questions: Specific questions for each expert.
+            analysis_dir: Directory for storing analysis outputs.
+
+        Yields:
+            Tuples of expert ID and Analysis in order of completion.
+        """
+        tasks = list(self._start_expert_tasks(experts, request, questions, analysis_dir))
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _start_expert_tasks(
+        self,
+        experts: list[str],
+        request: str,
+        questions: dict[str, str],
+        analysis_dir: Path
+    ) -> dict[asyncio.Future, str]:
+        """Start one analysis task per expert.
+
+        Args:
+            experts: List of expert IDs to consult.
+            request: The user request to analyze.
+            questions: Specific questions for each expert.
+            analysis_dir: Directory for storing analysis outputs.
+
+        Returns:
+            Dictionary mapping the tasks to their expert IDs, in selection order.
+        """
+        available_experts = self.expert_manager.load_experts()
+        return {
+            asyncio.ensure_future(self._analyze_with_expert(
+                expert_id,
+                available_experts.get(expert_id),
+                request,
+                questions,
+                analysis_dir
+            )): expert_id
+            for expert_id in experts
+        }
+
+    async def run_expert_analyses(
+        self,
+        experts: list[str],
+        request: str,
+        questions: dict[str, str],
+        analysis_dir: Path
+    ) -> dict[str, Analysis]:
+        """Run analyses for all selected experts in parallel.
+
+        Each expert analyzes the request from their domain perspective
+        and produces an analysis.json file.
+
+        Args:
+            experts: List of expert IDs to consult.
+            request: The user request to analyze.
+            questions: Specific questions for each expert.
+            analysis_dir: Directory for storing analysis outputs.
+
+        Returns:
+            Dictionary mapping expert IDs to their Analysis results.
+        """
+        results: dict[str, Analysis] = {}
+        async for expert_id, analysis in self.stream_expert_analyses(
+            experts, request, questions, analysis_dir
+        ):
+            results[expert_id] = analysis
+
+        # Keep the selection order, independent of completion order
+        return {exp_id: results[exp_id] for exp_id in experts if exp_id in results}
+
+    async def stream_analyses_and_synthesis(
+        self,
+        experts: list[str],
+        request: str,
+        questions: dict[str, str],
+        analysis_dir: Path
+    ) -> AsyncIterator[MeetingEvent]:
+        """Pipeline expert analyses into the synthesis.
+
+        Yields every analysis as soon as it arrives, followed by a local
+        draft synthesis of everything received so far. Once all experts
+        answered, or ``expert_deadline`` expired, the final synthesis is
+        started. Late experts finishing while it runs are folded into the
+        result; the ones still running afterwards are cancelled.
+
+        Args:
+            experts: List of expert IDs to consult.
+            request: The user request to analyze.
+            questions: Specific questions for each expert.
+            analysis_dir: Directory for storing analysis outputs.
+
+        Yields:
+            MeetingEvents; the last one is ``synthesis``.
+        """
+        loop = asyncio.get_running_loop()
+        task_experts = self._start_expert_tasks(experts, request, questions, analysis_dir)
+        deadline = (
+            loop.time() + self.expert_deadline
+            if self.expert_deadline is not None else None
+        )
+        analyses: dict[str, Analysis] = {}
+        pending: set[asyncio.Future] = set(task_experts)
+
+        try:
+            # On-time analyses
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
                 )
-            except (json.JSONDecodeError, AttributeError):
-                analysis = Analysis(
-                    domain=expert_id,
-                    findings=[f"Analysis pending for {expert_id}"],
-                    requirements=[],
-                    constraints=[],
-                    recommendations=[],
-                    dependencies=[],
-                    open_questions=["LLM response parsing failed"]
+                if not done:
+                    break
+                for task in done:
+                    expert_id, analysis = task.result()
+                    analyses[expert_id] = analysis
+                    yield MeetingEvent(
+                        event_type="analysis", expert_id=expert_id, analysis=analysis
+                    )
+                yield MeetingEvent(
+                    event_type="synthesis_draft",
+                    synthesis=self._merge_analyses(analyses)
                 )
 
-            # Save analysis output
-            output_dir = expert_dir / "output"
-            output_dir.mkdir(parents=True, exist_ok=True)
-            (output_dir / "analysis.json").write_text(
-                json.dumps({
-                    "domain": analysis.domain,
-                    "findings": analysis.findings,
-                    "requirements": analysis.requirements,
-                    "constraints": analysis.constraints,
-                    "recommendations": analysis.recommendations,
-                    "dependencies": analysis.dependencies,
-                    "open_questions": analysis.open_questions
-                }, indent=2, ensure_ascii=False),
-                encoding="utf-8"
+            for task in pending:
+                yield MeetingEvent(event_type="expert_late", expert_id=task_experts[task])
+
+            # Final synthesis, late experts may still arrive meanwhile
+            synthesis_task = asyncio.ensure_future(self.synthesize(dict(analyses)))
+            late_analyses: dict[str, Analysis] = {}
+            while pending and not synthesis_task.done():
+                done, _ = await asyncio.wait(
+                    pending | {synthesis_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done - {synthesis_task}:
+                    pending.discard(task)
+                    expert_id, analysis = task.result()
+                    late_analyses[expert_id] = analysis
+                    yield MeetingEvent(
+                        event_type="analysis",
+                        expert_id=expert_id,
+                        analysis=analysis,
+                        late=True
+                    )
+            synthesis = await synthesis_task
+
+            for expert_id, analysis in late_analyses.items():
+                self._fold_into_synthesis(synthesis, expert_id, analysis)
+                analyses[expert_id] = analysis
+
+            for task in pending:
+                task.cancel()
+                yield MeetingEvent(event_type="expert_dropped", expert_id=task_experts[task])
+
+            yield MeetingEvent(
+                event_type="synthesis",
+                synthesis=synthesis,
+                analyses={exp_id: analyses[exp_id] for exp_id in experts if exp_id in analyses}
             )
+        finally:
+            for task in task_experts:
+                if not task.done():
+                    task.cancel()
 
-            return expert_id, analysis
+    def _merge_analyses(self, analyses: dict[str, Analysis]) -> Synthesis:
+        """Merge analyses locally without the LLM.
 
-        # Run all expert analyses in parallel
-        tasks = [analyze_with_expert(exp_id) for exp_id in experts]
-        results = await asyncio.gather(*tasks)
+        Used as draft synthesis while experts are still answering and
+        as fallback when the LLM synthesis cannot be parsed.
 
-        return dict(results)
+        Args:
+            analyses: Dictionary of expert analyses.
+
+        Returns:
+            Synthesis with de-duplicated requirements and questions.
+        """
+        requirements: list[str] = []
+        open_questions: list[str] = []
+        for analysis in analyses.values():
+            requirements.extend(analysis.requirements)
+            open_questions.extend(analysis.open_questions)
+
+        return Synthesis(
+            combined_requirements=list(dict.fromkeys(requirements)),
+            conflicts_resolved=[],
+            open_questions=list(dict.fromkeys(open_questions)),
+            recommended_phases=["Phase 1: Implementation"],
+            expert_contributions={
+                exp_id: analysis.findings for exp_id, analysis in analyses.items()
+            }
+        )
+
+    def _fold_into_synthesis(
+        self,
+        synthesis: Synthesis,
+        expert_id: str,
+        analysis: Analysis
+    ) -> None:
+        """Add a late expert's analysis to an existing synthesis.
+
+        Args:
+            synthesis: Synthesis to extend in place.
+            expert_id: ID of the late expert.
+            analysis: The late expert's analysis.
+        """
+        for requirement in analysis.requirements:
+            if requirement not in synthesis.combined_requirements:
+                synthesis.combined_requirements.append(requirement)
+        for question in analysis.open_questions:
+            if question not in synthesis.open_questions:
+                synthesis.open_questions.append(question)
+        synthesis.expert_contributions[expert_id] = analysis.findings
 
     async def synthesize(self, analyses: dict[str, Analysis]) -> Synthesis:
         """Synthesize all expert analyses into a coherent result.
@@ -482,13 +787,7 @@ Respond in JSON format:
             )
         except (json.JSONDecodeError, AttributeError):
             # Fallback synthesis
-            return Synthesis(
-                combined_requirements=list(set(all_requirements)),
-                conflicts_resolved=[],
-                open_questions=list(set(all_open_questions)),
-                recommended_phases=["Phase 1: Implementation"],
-                expert_contributions=expert_contributions
-            )
+            return self._merge_analyses(analyses)
 
     async def generate_output(
         self,
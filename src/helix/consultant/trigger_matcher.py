@@ -0,0 +1,174 @@
+"""
+Multi-pattern trigger matching for domain expert suggestions.
+
+The ExpertManager suggests experts by looking for their trigger keywords
+in the user request. Doing a substring scan per trigger per expert costs
+O(triggers * request) on every consultant turn. The TriggerMatcher compiles
+all triggers of all experts into a single Aho-Corasick automaton once, so a
+request is scanned in one pass regardless of how many triggers exist.
+
+Scoring (compatible with the previous substring scan):
+    - A trigger found as a whole word counts ``weight * 2``
+    - A trigger found only inside a longer word counts ``weight * 1``
+    - Each trigger counts at most once per expert (best occurrence wins)
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+# Score multipliers, same values as the original keyword scan
+WORD_MATCH_FACTOR = 2
+SUBSTRING_MATCH_FACTOR = 1
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character belongs to a word (same as regex \\w)."""
+    return char.isalnum() or char == "_"
+
+
+class TriggerMatcher:
+    """
+    Aho-Corasick automaton over the trigger keywords of all experts.
+
+    Build once per expert configuration and reuse it for every request.
+
+    Args:
+        expert_triggers: Mapping of expert ID to ``{trigger: weight}``.
+            Triggers are matched case-insensitively.
+    """
+
+    def __init__(self, expert_triggers: dict[str, dict[str, float]]) -> None:
+        """Compile the automaton.
+
+        Args:
+            expert_triggers: Mapping of expert ID to ``{trigger: weight}``.
+        """
+        self.expert_ids: list[str] = list(expert_triggers.keys())
+
+        # Pattern table: term and the (expert_id, weight) pairs it scores for
+        self._terms: list[str] = []
+        self._owners: list[list[tuple[str, float]]] = []
+        term_index: dict[str, int] = {}
+
+        for expert_id, triggers in expert_triggers.items():
+            for trigger, weight in triggers.items():
+                term = trigger.lower().strip()
+                if not term:
+                    continue
+                if term not in term_index:
+                    term_index[term] = len(self._terms)
+                    self._terms.append(term)
+                    self._owners.append([])
+                self._owners[term_index[term]].append((expert_id, weight))
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        self._build()
+
+    def _build(self) -> None:
+        """Build the trie, failure links and merged output sets."""
+        for pattern_id, term in enumerate(self._terms):
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append(pattern_id)
+
+        # Breadth-first pass to compute failure links
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of distinct trigger terms compiled into the automaton."""
+        return len(self._terms)
+
+    def find_matches(self, text: str) -> dict[str, int]:
+        """Find all triggers occurring in the text.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            Mapping of matched trigger term to its best match factor
+            (WORD_MATCH_FACTOR or SUBSTRING_MATCH_FACTOR).
+        """
+        return {
+            self._terms[pattern_id]: factor
+            for pattern_id, factor in self._scan(text).items()
+        }
+
+    def _scan(self, text: str) -> dict[int, int]:
+        """Run the automaton over the text in a single pass.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            Mapping of pattern ID to its best match factor.
+        """
+        text = text.lower()
+        length = len(text)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        best: dict[int, int] = {}
+
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+
+            for pattern_id in output[state]:
+                if best.get(pattern_id) == WORD_MATCH_FACTOR:
+                    continue
+                start = position - len(self._terms[pattern_id]) + 1
+                at_word_start = start == 0 or not _is_word_char(text[start - 1])
+                at_word_end = position + 1 == length or not _is_word_char(text[position + 1])
+                best[pattern_id] = (
+                    WORD_MATCH_FACTOR if at_word_start and at_word_end
+                    else SUBSTRING_MATCH_FACTOR
+                )
+
+        return best
+
+    def score(self, text: str) -> dict[str, float]:
+        """Score all experts against the text.
+
+        Args:
+            text: The request text to score.
+
+        Returns:
+            Mapping of expert ID to score, only for experts with a score > 0.
+            Keys keep the expert configuration order.
+        """
+        totals: dict[str, float] = {}
+        for pattern_id, factor in self._scan(text).items():
+            for expert_id, weight in self._owners[pattern_id]:
+                totals[expert_id] = totals.get(expert_id, 0) + weight * factor
+
+        return {
+            expert_id: totals[expert_id]
+            for expert_id in self.expert_ids
+            if totals.get(expert_id, 0) > 0
+        }
@@ -19,30 +19,28 @@ Usage:
     # Get project totals
     totals = calc.get_project_totals()
     print(f"Total cost: ${totals['total_cost_usd']:.4f}")
+
+Phases can run concurrently (parallel phases, expert analyses): pass
+phase_id to record_usage/record_tool_call/end_phase to credit a
+specific phase instead of the most recently started one.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 import json
+import threading
 from pathlib import Path
 
+from helix.observability.ledger import UsageLedger, get_usage_ledger
+from helix.observability.pricing import BUILTIN_PRICES, DEFAULT_MODEL, get_price_table
+
 
-# Cost per 1M tokens (USD) - Updated December 2024
+# Cost per 1M tokens (USD), see helix.observability.pricing for lookups
 MODEL_COSTS: dict[str, dict[str, float]] = {
-    # Anthropic
-    "claude-opus-4": {"input": 15.00, "output": 75.00},
-    "claude-opus-4-5": {"input": 15.00, "output": 75.00},
-    "claude-sonnet-4": {"input": 3.00, "output": 15.00},
-    "claude-sonnet-3.5": {"input": 3.00, "output": 15.00},
-    "claude-haiku-3.5": {"input": 0.80, "output": 4.00},
-    # OpenAI
-    "gpt-4o": {"input": 2.50, "output": 10.00},
-    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
-    "o1": {"input": 15.00, "output": 60.00},
-    "o1-mini": {"input": 3.00, "output": 12.00},
+    **BUILTIN_PRICES,
     # Default fallback
-    "default": {"input": 3.00, "output": 15.00},
+    "default": BUILTIN_PRICES[DEFAULT_MODEL],
 }
 
 
@@ -69,6 +67,9 @@ class PhaseCost:
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
     tool_calls: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict.
@@ -76,6 +77,10 @@ class PhaseCost:
         Returns:
             Dictionary with all cost data formatted for serialization.
         """
+        with self._lock:
+            return self._to_dict()
+
+    def _to_dict(self) -> dict[str, Any]:
         return {
             "phase_id": self.phase_id,
             "model": self.model,
@@ -124,7 +129,7 @@ class CostCalculator:
         project_id: The HELIX project identifier.
         default_model: Default model to use for cost calculations.
         _phases: Dictionary of completed phases by phase_id.
-        _current_phase: The currently active phase being tracked.
+        _active: Dictionary of active phases by phase_id, in start order.
 
     Example:
         calc = CostCalculator(project_id="my-project")
@@ -151,17 +156,29 @@ class CostCalculator:
         self,
         project_id: str,
         model: str = "claude-sonnet-4",
+        ledger: UsageLedger | None = None,
     ) -> None:
         """Initialize the cost calculator.
 
         Args:
             project_id: The HELIX project identifier.
             model: Default model for cost calculations.
+            ledger: Usage ledger receiving each completed phase
+                (default: the process-wide ledger).
         """
         self.project_id = project_id
         self.default_model = model
+        self._ledger = ledger
         self._phases: dict[str, PhaseCost] = {}
-        self._current_phase: PhaseCost | None = None
+        self._active: dict[str, PhaseCost] = {}
+        self._lock = threading.Lock()
+
+    def _phase(self, phase_id: str | None) -> PhaseCost | None:
+        """Get an active phase (the most recent one if phase_id is None)."""
+        if phase_id is None:
+            with self._lock:
+                return next(reversed(self._active.values()), None)
+        return self._active.get(phase_id)
 
     def start_phase(
         self,
@@ -181,7 +198,9 @@ class CostCalculator:
             phase_id=phase_id,
             model=model or self.default_model,
         )
-        self._current_phase = phase
+        with self._lock:
+            self._active.pop(phase_id, None)
+            self._active[phase_id] = phase
         return phase
 
     def record_usage(
@@ -189,8 +208,9 @@ class CostCalculator:
         input_tokens: int,
         output_tokens: int,
         cost_usd: float | None = None,
+        phase_id: str | None = None,
     ) -> None:
-        """Record token usage for current phase.
+        """Record token usage for a phase.
 
         If cost_usd is provided (from Claude CLI), use it directly.
         Otherwise, calculate from tokens based on model pricing.
@@ -199,43 +219,65 @@ class CostCalculator:
             input_tokens: Number of input tokens used.
             output_tokens: Number of output tokens generated.
             cost_usd: Direct cost from Claude CLI (preferred).
+            phase_id: Phase to credit (default: the most recent active phase).
         """
-        if not self._current_phase:
+        phase = self._phase(phase_id)
+        if not phase:
             return
 
-        self._current_phase.input_tokens += input_tokens
-        self._current_phase.output_tokens += output_tokens
-
-        if cost_usd is not None:
-            self._current_phase.cost_usd = cost_usd
-        else:
-            # Calculate from tokens
-            self._current_phase.cost_usd = self._calculate_cost(
-                input_tokens=self._current_phase.input_tokens,
-                output_tokens=self._current_phase.output_tokens,
-                model=self._current_phase.model,
-            )
+        price = get_price_table().resolve(phase.model)
+        with phase._lock:
+            phase.input_tokens += input_tokens
+            phase.output_tokens += output_tokens
 
-    def record_tool_call(self) -> None:
-        """Record a tool call for current phase."""
-        if self._current_phase:
-            self._current_phase.tool_calls += 1
+            if cost_usd is not None:
+                phase.cost_usd = cost_usd
+            else:
+                # Calculate from tokens
+                phase.cost_usd = price.cost(phase.input_tokens, phase.output_tokens)
 
-    def end_phase(self) -> PhaseCost | None:
-        """End the current phase and return its cost data.
+    def record_tool_call(self, phase_id: str | None = None) -> None:
+        """Record a tool call for a phase.
 
-        Returns:
-            The completed PhaseCost object, or None if no phase active.
+        Args:
+            phase_id: Phase to credit (default: the most recent active phase).
         """
-        if not self._current_phase:
-            return None
+        phase = self._phase(phase_id)
+        if phase:
+            with phase._lock:
+                phase.tool_calls += 1
+
+    def end_phase(self, phase_id: str | None = None) -> PhaseCost | None:
+        """End an active phase and return its cost data.
 
-        self._current_phase.completed_at = datetime.now()
-        self._phases[self._current_phase.phase_id] = self._current_phase
+        Args:
+            phase_id: Phase to end (default: the most recent active phase).
 
-        result = self._current_phase
-        self._current_phase = None
-        return result
+        Returns:
+            The completed PhaseCost object, or None if no phase active.
+        """
+        with self._lock:
+            if phase_id is None:
+                phase_id = next(reversed(self._active), None)
+            phase = self._active.pop(phase_id, None) if phase_id is not None else None
+            if not phase:
+                return None
+
+            phase.completed_at = datetime.now()
+            self._phases[phase.phase_id] = phase
+
+        # record_usage() keeps running totals, so the ledger gets one entry per phase
+        (self._ledger or get_usage_ledger()).record(
+            self.project_id,
+            phase.phase_id,
+            phase.model,
+            phase.input_tokens,
+            phase.output_tokens,
+            phase.cost_usd,
+            source="cost_calculator",
+            timestamp=phase.completed_at,
+        )
+        return phase
 
     def get_phase(self, phase_id: str) -> PhaseCost | None:
         """Get cost data for a specific phase.
@@ -248,13 +290,26 @@ class CostCalculator:
         """
         return self._phases.get(phase_id)
 
-    def get_current_phase(self) -> PhaseCost | None:
-        """Get the current (in-progress) phase.
+    def get_current_phase(self, phase_id: str | None = None) -> PhaseCost | None:
+        """Get an in-progress phase.
+
+        Args:
+            phase_id: Phase to get (default: the most recent active phase).
 
         Returns:
             The active PhaseCost, or None if no phase is active.
         """
-        return self._current_phase
+        return self._phase(phase_id)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get live cost data of all active phases.
+
+        Returns:
+            Dictionary of PhaseCost.to_dict() results by phase_id.
+        """
+        with self._lock:
+            phases = list(self._active.values())
+        return {phase.phase_id: phase.to_dict() for phase in phases}
 
     def get_all_phases(self) -> list[PhaseCost]:
         """Get all completed phases.
@@ -361,7 +416,7 @@ class CostCalculator:
     ) -> float:
         """Calculate cost in USD for given tokens and model.
 
-        Uses MODEL_COSTS lookup with fuzzy matching for model names.
+        Uses the shared price table, which resolves each model name once.
 
         Args:
             input_tokens: Number of input tokens.
@@ -371,21 +426,7 @@ class CostCalculator:
         Returns:
             Calculated cost in USD.
         """
-        # Find matching model costs
-        costs = MODEL_COSTS.get("default")
-
-        model_lower = model.lower()
-        for model_key, model_costs in MODEL_COSTS.items():
-            if model_key in model_lower or model_lower in model_key:
-                costs = model_costs
-                break
-
-        assert costs is not None  # default always exists
-
-        input_cost = (input_tokens / 1_000_000) * costs["input"]
-        output_cost = (output_tokens / 1_000_000) * costs["output"]
-
-        return input_cost + output_cost
+        return get_price_table().cost(model, input_tokens, output_tokens)
 
     def get_cost_for_tokens(
         self,
@@ -413,5 +454,6 @@ class CostCalculator:
 
     def clear(self) -> None:
         """Clear all tracked phases."""
-        self._phases.clear()
-        self._current_phase = None
+        with self._lock:
+            self._phases.clear()
+            self._active.clear()
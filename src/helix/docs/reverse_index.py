@@ -18,8 +18,17 @@ Usage:
     full_index = index.build()
     for path, info in full_index.items():
         print(f"{path}: {info.status}")
+
+Persistence:
+    The per-ADR contributions (parsed files.create / files.modify lists) are
+    stored in ``.helix/reverse-index.json`` below the project root, keyed by
+    ADR file with its mtime and size. A rebuild only re-parses ADRs that
+    changed; ``exists`` flags are refreshed with one directory listing per
+    distinct parent directory instead of one stat call per declared file.
 """
 
+import json
+import os
 import re
 from dataclasses import dataclass, field
 from enum import Enum
@@ -104,16 +113,38 @@ class ReverseIndex:
         # )
     """
 
-    def __init__(self, adr_dir: Path | None = None, project_root: Path | None = None):
+    # Bump when the persisted format changes
+    INDEX_VERSION = 1
+
+    def __init__(
+        self,
+        adr_dir: Path | None = None,
+        project_root: Path | None = None,
+        index_file: Path | None = None,
+        persist: bool = True,
+        watch: bool = False,
+    ):
         """Initialize the reverse index.
 
         Args:
             adr_dir: Directory containing ADR files. Defaults to "adr".
             project_root: Project root directory. Defaults to current directory.
+            index_file: Persisted index location.
+                Defaults to ".helix/reverse-index.json" below project_root.
+            persist: Load and store per-ADR contributions in index_file.
+            watch: Re-check the ADR directory on every query and rebuild
+                incrementally when an ADR was added, changed or removed.
+                Meant for long-running processes (API server).
         """
         self.project_root = project_root or Path.cwd()
         self.adr_dir = adr_dir or self.project_root / "adr"
+        self.index_file = index_file or self.project_root / ".helix" / "reverse-index.json"
+        self.persist = persist
+        self.watch = watch
         self._cache: dict[str, FileInfo] | None = None
+        self._by_adr: dict[str, list[FileInfo]] = {}
+        self._orphaned: list[FileInfo] = []
+        self._adr_signature: dict[str, tuple[int, int]] = {}
 
     def _parse_adr_header(self, adr_file: Path) -> ADRHeader | None:
         """Parse the YAML frontmatter from an ADR file.
@@ -156,6 +187,102 @@ class ReverseIndex:
         except Exception:
             return None
 
+    def _scan_adr_files(self) -> dict[str, tuple[Path, int, int]]:
+        """List ADR files with their modification signature.
+
+        Returns:
+            Mapping of ADR path relative to project root to
+            (path, mtime_ns, size), sorted by file name.
+        """
+        entries: list[os.DirEntry] = []
+        try:
+            with os.scandir(self.adr_dir) as it:
+                for entry in it:
+                    # Skip INDEX.md and other non-ADR files
+                    if not entry.name.endswith(".md") or entry.name in ("INDEX.md", "README.md"):
+                        continue
+                    if entry.is_file():
+                        entries.append(entry)
+        except OSError:
+            return {}
+
+        result: dict[str, tuple[Path, int, int]] = {}
+        for entry in sorted(entries, key=lambda e: e.name):
+            path = Path(entry.path)
+            stat = entry.stat()
+            rel_path = str(path.relative_to(self.project_root))
+            result[rel_path] = (path, stat.st_mtime_ns, stat.st_size)
+        return result
+
+    def _contribution(self, adr_file: Path) -> dict[str, Any] | None:
+        """Extract the index contribution of one ADR.
+
+        Args:
+            adr_file: Path to ADR markdown file
+
+        Returns:
+            Dict with adr_id, create and modify lists, or None for non-ADRs
+        """
+        header = self._parse_adr_header(adr_file)
+        if not header:
+            return None
+        return {
+            "adr_id": header.adr_id,
+            "create": [str(p) for p in header.files_create or []],
+            "modify": [str(p) for p in header.files_modify or []],
+        }
+
+    def _load_persisted(self) -> dict[str, dict[str, Any]]:
+        """Load persisted per-ADR contributions.
+
+        Returns:
+            Mapping of ADR path to stored entry, empty if missing or outdated
+        """
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.INDEX_VERSION:
+            return {}
+        adrs = data.get("adrs")
+        return adrs if isinstance(adrs, dict) else {}
+
+    def _save_persisted(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Persist per-ADR contributions (temp file + rename).
+
+        Failures are ignored, the index then simply is not reused.
+
+        Args:
+            entries: Mapping of ADR path to entry
+        """
+        temp_file = self.index_file.with_suffix(".json.tmp")
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(
+                json.dumps({"version": self.INDEX_VERSION, "adrs": entries}, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            temp_file.replace(self.index_file)
+        except OSError:
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+    def _adr_files_changed(self) -> bool:
+        """Check whether any ADR was added, changed or removed since build()."""
+        current = {
+            rel_path: (mtime, size)
+            for rel_path, (_, mtime, size) in self._scan_adr_files().items()
+        }
+        return current != self._adr_signature
+
+    def invalidate(self) -> None:
+        """Drop the in-memory index; the next query rebuilds incrementally."""
+        self._cache = None
+        self._by_adr = {}
+        self._orphaned = []
+
     def build(self) -> dict[str, FileInfo]:
         """Build the complete reverse index.
 
@@ -163,98 +290,132 @@ class ReverseIndex:
         - files.create → created_by
         - files.modify → modified_by
 
+        Only ADRs whose mtime or size differ from the persisted index are
+        re-parsed; all others reuse their stored contribution.
+
         Returns:
             Dictionary mapping file paths to FileInfo objects
         """
-        if self._cache is not None:
+        if self._cache is not None and not (self.watch and self._adr_files_changed()):
             return self._cache
 
-        index: dict[str, FileInfo] = {}
+        adr_files = self._scan_adr_files()
+        persisted = self._load_persisted() if self.persist else {}
+
+        entries: dict[str, dict[str, Any]] = {}
+        changed = set(persisted) != set(adr_files)
+        for rel_path, (adr_file, mtime, size) in adr_files.items():
+            entry = persisted.get(rel_path)
+            if (
+                isinstance(entry, dict)
+                and entry.get("mtime_ns") == mtime
+                and entry.get("size") == size
+            ):
+                entries[rel_path] = entry
+                continue
+            entries[rel_path] = {
+                "mtime_ns": mtime,
+                "size": size,
+                "header": self._contribution(adr_file),
+            }
+            changed = True
+
+        if changed and self.persist:
+            self._save_persisted(entries)
+
+        self._adr_signature = {
+            rel_path: (mtime, size) for rel_path, (_, mtime, size) in adr_files.items()
+        }
+        self._cache = self._assemble(entries)
+        return self._cache
 
-        # Find all ADR markdown files (exclude drafts)
-        adr_files = sorted(self.adr_dir.glob("*.md"))
+    def _assemble(self, entries: dict[str, dict[str, Any]]) -> dict[str, FileInfo]:
+        """Assemble the index from per-ADR contributions.
 
-        for adr_file in adr_files:
-            # Skip INDEX.md and other non-ADR files
-            if adr_file.name in ("INDEX.md", "README.md"):
-                continue
+        Args:
+            entries: Mapping of ADR path to entry, in ADR order
 
-            header = self._parse_adr_header(adr_file)
+        Returns:
+            Dictionary mapping file paths to FileInfo objects
+        """
+        index: dict[str, FileInfo] = {}
+
+        for adr_rel_path, entry in entries.items():
+            header = entry.get("header")
             if not header:
                 continue
 
-            adr_ref = f"ADR-{header.adr_id}"
-            adr_rel_path = str(adr_file.relative_to(self.project_root))
+            adr_ref = f"ADR-{header['adr_id']}"
 
             # Process created files
-            for file_path in header.files_create:
-                full_path = self.project_root / file_path
-                exists = full_path.exists()
-
+            for file_path in header["create"]:
+                record = {"adr": adr_ref, "action": "create", "adr_file": adr_rel_path}
                 if file_path in index:
                     # File already tracked, add to history
-                    existing = index[file_path]
-                    existing.history.append(
-                        {
-                            "adr": adr_ref,
-                            "action": "create",
-                            "adr_file": adr_rel_path,
-                        }
-                    )
+                    index[file_path].history.append(record)
                 else:
-                    status = FileStatus.TRACKED if exists else FileStatus.ORPHANED
                     index[file_path] = FileInfo(
                         path=file_path,
-                        status=status,
+                        status=FileStatus.TRACKED,
                         created_by=adr_ref,
                         adr_file=adr_rel_path,
-                        exists=exists,
-                        history=[
-                            {
-                                "adr": adr_ref,
-                                "action": "create",
-                                "adr_file": adr_rel_path,
-                            }
-                        ],
+                        history=[record],
                     )
 
             # Process modified files
-            for file_path in header.files_modify:
-                full_path = self.project_root / file_path
-                exists = full_path.exists()
-
+            for file_path in header["modify"]:
+                record = {"adr": adr_ref, "action": "modify", "adr_file": adr_rel_path}
                 if file_path in index:
                     # Add modification record
                     existing = index[file_path]
                     if adr_ref not in existing.modified_by:
                         existing.modified_by.append(adr_ref)
-                    existing.history.append(
-                        {
-                            "adr": adr_ref,
-                            "action": "modify",
-                            "adr_file": adr_rel_path,
-                        }
-                    )
+                    existing.history.append(record)
                 else:
                     # File only modified, not created by an ADR
-                    status = FileStatus.TRACKED if exists else FileStatus.ORPHANED
                     index[file_path] = FileInfo(
                         path=file_path,
-                        status=status,
+                        status=FileStatus.TRACKED,
                         modified_by=[adr_ref],
-                        exists=exists,
-                        history=[
-                            {
-                                "adr": adr_ref,
-                                "action": "modify",
-                                "adr_file": adr_rel_path,
-                            }
-                        ],
+                        history=[record],
                     )
 
-        self._cache = index
+        self._refresh_exists(index)
+
+        by_adr: dict[str, list[FileInfo]] = {}
+        for info in index.values():
+            refs = dict.fromkeys(([info.created_by] if info.created_by else []) + info.modified_by)
+            for adr_ref in refs:
+                by_adr.setdefault(adr_ref, []).append(info)
+        self._by_adr = by_adr
+
         return index
 
+    def _refresh_exists(self, index: dict[str, FileInfo]) -> None:
+        """Set exists flags and status with one listing per parent directory.
+
+        Args:
+            index: Index whose entries are updated in place
+        """
+        listings: dict[Path, set[str]] = {}
+        for info in index.values():
+            full_path = self.project_root / info.path
+            parent = full_path.parent
+            names = listings.get(parent)
+            if names is None:
+                try:
+                    names = set(os.listdir(parent))
+                except OSError:
+                    names = set()
+                listings[parent] = names
+            info.exists = bool(full_path.name) and full_path.name in names
+            info.status = FileStatus.TRACKED if info.exists else FileStatus.ORPHANED
+        self._orphaned = [info for info in index.values() if not info.exists]
+
+    def refresh_exists(self) -> None:
+        """Re-check which indexed files exist without re-reading ADRs."""
+        self._refresh_exists(self.build())
+
     def lookup(self, file_path: str) -> FileInfo | None:
         """Look up ADR information for a specific file.
 
@@ -273,8 +434,8 @@ class ReverseIndex:
         Returns:
             List of orphaned file entries
         """
-        index = self.build()
-        return [f for f in index.values() if f.status == FileStatus.ORPHANED]
+        self.build()
+        return list(self._orphaned)
 
     def get_tracked(self) -> list[FileInfo]:
         """Get all tracked files (have ADR reference and exist).
@@ -298,12 +459,8 @@ class ReverseIndex:
         adr_id = adr_id.replace("ADR-", "")
         adr_ref = f"ADR-{adr_id}"
 
-        index = self.build()
-        return [
-            f
-            for f in index.values()
-            if f.created_by == adr_ref or adr_ref in f.modified_by
-        ]
+        self.build()
+        return list(self._by_adr.get(adr_ref, []))
 
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics about the reverse index.
@@ -376,10 +533,19 @@ def main():
     by_adr_parser = subparsers.add_parser("by-adr", help="Files by ADR")
     by_adr_parser.add_argument("adr_id", help="ADR ID (e.g., 013)")
 
+    # Rebuild command
+    subparsers.add_parser("rebuild", help="Discard the persisted index and rebuild it")
+
     args = parser.parse_args()
 
     index = ReverseIndex()
 
+    if args.command == "rebuild":
+        index.index_file.unlink(missing_ok=True)
+        stats = index.get_statistics()
+        print(f"Rebuilt {index.index_file} ({stats['total_files']} files)")
+        return
+
     if args.command == "lookup":
         print(index.format_lookup(args.file_path))
     elif args.command == "stats":
@@ -22,8 +22,9 @@ Usage:
     result = await enforcer.run_with_enforcement(session_id, prompt)
 """
 
-from .response_enforcer import ResponseEnforcer, EnforcementResult
+from .response_enforcer import ResponseEnforcer, EnforcementResult, StreamValidation
 from .validators.base import (
+    IncrementalCheck,
     ResponseValidator,
     ValidationIssue,
     ValidationResult,
@@ -32,6 +33,8 @@ from .validators.base import (
 __all__ = [
     "ResponseEnforcer",
     "EnforcementResult",
+    "StreamValidation",
+    "IncrementalCheck",
     "ResponseValidator",
     "ValidationIssue",
     "ValidationResult",
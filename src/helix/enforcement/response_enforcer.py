@@ -9,6 +9,9 @@ ADR-038: Deterministic LLM Response Enforcement
 Integration modes:
 1. run_with_enforcement() - For non-streaming with built-in retry
 2. validate_response() + run_retry_phase() - For post-streaming validation
+3. start_stream_validation() - For in-stream validation: feed chunks while
+   the response streams, cut the generation short on final errors and pass
+   them to enforce_streaming_response(early_issues=...)
 """
 
 import logging
@@ -16,7 +19,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, AsyncIterator, Any, TYPE_CHECKING
 
-from .validators.base import ResponseValidator, ValidationIssue
+from .validators.base import IncrementalCheck, ResponseValidator, ValidationIssue
 
 if TYPE_CHECKING:
     from helix.claude_runner import ClaudeRunner
@@ -48,6 +51,96 @@ class EnforcementResult:
         return self.success
 
 
+class StreamValidation:
+    """
+    Incremental validation of one streaming response.
+
+    Collects text chunks as they arrive and runs the incremental checks
+    of all validators on them. As soon as a check reports an error, the
+    generation is doomed: should_abort becomes True and the caller can
+    stop the generation and start the corrective retry.
+
+    Example:
+        stream = enforcer.start_stream_validation(context)
+        async for chunk in response_chunks:
+            stream.feed(chunk)
+            if stream.should_abort:
+                break
+        result = await enforcer.enforce_streaming_response(
+            response=stream.text,
+            session_id=session_id,
+            runner=runner,
+            early_issues=stream.errors or None,
+        )
+    """
+
+    def __init__(self, checks: list[IncrementalCheck]):
+        """
+        Initialize the stream validation.
+
+        Args:
+            checks: Incremental checks, one per participating validator
+        """
+        self.checks = checks
+        self.text = ""
+        self.issues: list[ValidationIssue] = []
+
+    @property
+    def errors(self) -> list[ValidationIssue]:
+        """Error-level issues found so far."""
+        return [i for i in self.issues if i.severity == "error"]
+
+    @property
+    def should_abort(self) -> bool:
+        """True if a final error was found and the generation can be stopped."""
+        return any(i.severity == "error" for i in self.issues)
+
+    def feed(self, chunk: str) -> list[ValidationIssue]:
+        """
+        Add a chunk of response text and run the pending checks.
+
+        Args:
+            chunk: Newly received response text
+
+        Returns:
+            Issues newly found with this chunk
+        """
+        if not chunk:
+            return []
+        self.text += chunk
+
+        new_issues: list[ValidationIssue] = []
+        for check in self.checks:
+            if not check.done:
+                new_issues.extend(check.feed(self.text))
+
+        if new_issues:
+            self.issues.extend(new_issues)
+            logger.info(
+                f"ADR-038: In-stream validation found: {[i.code for i in new_issues]}"
+            )
+        return new_issues
+
+    def reset(self, text: str = "") -> list[ValidationIssue]:
+        """
+        Replace the response text and check it from scratch.
+
+        Used when the response is rewritten (e.g. a second Write of the
+        same file) instead of extended.
+
+        Args:
+            text: The new response text received so far
+
+        Returns:
+            Issues found in the new text
+        """
+        self.text = ""
+        self.issues = []
+        for check in self.checks:
+            check.reset()
+        return self.feed(text)
+
+
 class ResponseEnforcer:
     """
     Wrapper around ClaudeRunner that enforces LLM output requirements.
@@ -231,6 +324,32 @@ class ResponseEnforcer:
             return self.validators
         return [v for v in self.validators if v.name in names]
 
+    def start_stream_validation(
+        self,
+        context: Optional[dict] = None,
+        validator_names: Optional[list[str]] = None,
+    ) -> StreamValidation:
+        """
+        Start incremental validation of a streaming response.
+
+        Only validators that implement start_incremental() take part;
+        all validators still run on the complete response afterwards.
+
+        Args:
+            context: Additional context for validators
+            validator_names: List of validator names to use (None = all)
+
+        Returns:
+            StreamValidation to feed response chunks into
+        """
+        context = context or {}
+        checks = []
+        for validator in self._get_validators(validator_names):
+            check = validator.start_incremental(context)
+            if check is not None:
+                checks.append(check)
+        return StreamValidation(checks)
+
     def _build_feedback_prompt(self, issues: list[ValidationIssue]) -> str:
         """
         Build feedback prompt for retry.
@@ -491,6 +610,7 @@ class ResponseEnforcer:
         runner: "ClaudeRunner",
         context: Optional[dict] = None,
         max_retries: int = 2,
+        early_issues: Optional[list[ValidationIssue]] = None,
     ) -> EnforcementResult:
         """
         Full enforcement pipeline for post-streaming validation.
@@ -514,6 +634,10 @@ class ResponseEnforcer:
             runner: ClaudeRunner for retry execution.
             context: Validation context.
             max_retries: Maximum retry attempts.
+            early_issues: Errors found by in-stream validation (see
+                start_stream_validation). The generation was cut short,
+                so the corrective retry starts right away; the issues of
+                the full validation of the partial response are merged in.
 
         Returns:
             EnforcementResult with final enforced response.
@@ -526,14 +650,24 @@ class ResponseEnforcer:
         # Initial validation
         result = self.validate_response(current_response, context)
 
-        if result.success:
-            logger.debug("ADR-038: Response passed initial validation")
-            return result
+        if early_issues:
+            seen = {(i.code, i.message) for i in early_issues}
+            all_issues = list(early_issues) + [
+                i for i in result.issues if (i.code, i.message) not in seen
+            ]
+            logger.info(
+                f"ADR-038: Generation cut short by in-stream validation: "
+                f"{[i.code for i in all_issues]}"
+            )
+        else:
+            if result.success:
+                logger.debug("ADR-038: Response passed initial validation")
+                return result
 
-        all_issues = result.issues
-        logger.info(
-            f"ADR-038: Initial validation failed: {[i.code for i in all_issues]}"
-        )
+            all_issues = result.issues
+            logger.info(
+                f"ADR-038: Initial validation failed: {[i.code for i in all_issues]}"
+            )
 
         # Check if all issues can be fixed by fallback (no retry needed)
         # MISSING_STEP_MARKER can always be fixed by fallback - don't waste time retrying
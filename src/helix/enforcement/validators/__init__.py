@@ -17,6 +17,8 @@ Usage:
 """
 
 from .base import (
+    FrontmatterCheck,
+    IncrementalCheck,
     ResponseValidator,
     ValidationIssue,
     ValidationResult,
@@ -26,6 +28,8 @@ from .adr_structure import ADRStructureValidator
 from .file_existence import FileExistenceValidator
 
 __all__ = [
+    "FrontmatterCheck",
+    "IncrementalCheck",
     "ResponseValidator",
     "ValidationIssue",
     "ValidationResult",
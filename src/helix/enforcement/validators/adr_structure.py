@@ -12,7 +12,7 @@ from typing import Optional
 
 import yaml
 
-from .base import ResponseValidator, ValidationIssue
+from .base import FrontmatterCheck, IncrementalCheck, ResponseValidator, ValidationIssue
 
 
 class ADRStructureValidator(ResponseValidator):
@@ -77,6 +77,22 @@ class ADRStructureValidator(ResponseValidator):
 
         return issues
 
+    def start_incremental(self, context: dict) -> Optional[IncrementalCheck]:
+        """
+        Check the YAML header as soon as it has streamed.
+
+        Header errors (invalid YAML, missing required fields) are final
+        once the closing ``---`` has arrived. Sections and criteria are
+        only checked on the complete response.
+
+        Args:
+            context: Validation context (unused)
+
+        Returns:
+            FrontmatterCheck for the header
+        """
+        return FrontmatterCheck(self._validate_yaml_header, applies=self._is_adr)
+
     def _is_adr(self, response: str) -> bool:
         """
         Check if response contains an ADR.
@@ -1,15 +1,17 @@
 """
 Base classes for response validation.
 
-Provides the abstract base class for all validators and
-data classes for validation results.
+Provides the abstract base class for all validators,
+data classes for validation results and the incremental
+check interface for validating responses while they stream.
 
 ADR-038: Deterministic LLM Response Enforcement
 """
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 
 @dataclass
@@ -63,6 +65,98 @@ class ValidationResult:
         return self.valid
 
 
+class IncrementalCheck(ABC):
+    """
+    Per-response state of a validator that checks text while it streams.
+
+    Created by ResponseValidator.start_incremental() for each response.
+    feed() is called with the full text received so far every time a new
+    chunk arrives. It must only report issues that are final, i.e. that
+    the rest of the response can no longer fix, so the enforcer can cut
+    the generation short and retry right away.
+
+    Attributes:
+        done: True once the check has nothing more to inspect
+    """
+
+    def __init__(self) -> None:
+        """Initialize the check."""
+        self.done = False
+
+    def reset(self) -> None:
+        """Start over on a new response text."""
+        self.done = False
+
+    @abstractmethod
+    def feed(self, text: str) -> list[ValidationIssue]:
+        """
+        Inspect the response text received so far.
+
+        Args:
+            text: Full response text received so far
+
+        Returns:
+            New final issues (empty if nothing to report yet)
+        """
+        pass
+
+
+class FrontmatterCheck(IncrementalCheck):
+    """
+    Incremental check that runs once the YAML frontmatter is complete.
+
+    Waits until the response contains a closed ``---`` block and then
+    hands the text to a callback. Only the newly received text is
+    scanned for the closing marker, so feeding is linear overall.
+
+    Example:
+        check = FrontmatterCheck(lambda text: validator._validate_yaml_header(text))
+    """
+
+    FRONTMATTER_PATTERN = re.compile(r"^---\n(.*?)\n---", re.DOTALL | re.MULTILINE)
+
+    def __init__(
+        self,
+        on_complete: Callable[[str], list[ValidationIssue]],
+        applies: Optional[Callable[[str], bool]] = None,
+    ):
+        """
+        Initialize the check.
+
+        Args:
+            on_complete: Called with the text once the frontmatter is closed
+            applies: Optional predicate, the check is skipped if it is False
+                once the frontmatter is closed
+        """
+        super().__init__()
+        self._on_complete = on_complete
+        self._applies = applies
+        self._scanned = 0
+
+    def reset(self) -> None:
+        """Start over on a new response text."""
+        super().reset()
+        self._scanned = 0
+
+    def feed(self, text: str) -> list[ValidationIssue]:
+        """Run the callback once the frontmatter is closed."""
+        if self.done:
+            return []
+
+        # Only look at new text (plus overlap for a split "\n---")
+        start = max(0, self._scanned - 4)
+        self._scanned = len(text)
+        if "\n---" not in text[start:]:
+            return []
+        if not self.FRONTMATTER_PATTERN.search(text):
+            return []
+
+        self.done = True
+        if self._applies is not None and not self._applies(text):
+            return []
+        return self._on_complete(text)
+
+
 class ResponseValidator(ABC):
     """
     Abstract base class for response validators.
@@ -76,6 +170,7 @@ class ResponseValidator(ABC):
 
     Subclasses may override:
         - apply_fallback: Attempt automatic fix when max retries reached
+        - start_incremental: Check the response while it streams
     """
 
     @property
@@ -121,6 +216,22 @@ class ResponseValidator(ABC):
         """
         return None
 
+    def start_incremental(self, context: dict) -> Optional[IncrementalCheck]:
+        """
+        Start checking a streaming response.
+
+        Override this method for validators that can detect final issues
+        before the full response has arrived. Return None if the validator
+        can only judge the complete response.
+
+        Args:
+            context: Additional context
+
+        Returns:
+            IncrementalCheck for one response, or None
+        """
+        return None
+
     def __repr__(self) -> str:
         """String representation."""
         return f"{self.__class__.__name__}(name={self.name!r})"
@@ -13,7 +13,7 @@ from typing import Optional
 
 import yaml
 
-from .base import ResponseValidator, ValidationIssue
+from .base import FrontmatterCheck, IncrementalCheck, ResponseValidator, ValidationIssue
 
 
 class FileExistenceValidator(ResponseValidator):
@@ -79,6 +79,18 @@ class FileExistenceValidator(ResponseValidator):
 
         return issues
 
+    def start_incremental(self, context: dict) -> Optional[IncrementalCheck]:
+        """
+        Check files.modify as soon as the YAML header has streamed.
+
+        Args:
+            context: Validation context
+
+        Returns:
+            FrontmatterCheck for the files.modify references
+        """
+        return FrontmatterCheck(lambda text: self.validate(text, context))
+
     def _extract_modify_files(self, response: str) -> list[str]:
         """
         Extract files.modify list from ADR YAML header.
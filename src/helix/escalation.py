@@ -1,6 +1,11 @@
 """Escalation System for HELIX v4.
 
 Implements 2-stage escalation for handling failures.
+
+The Stufe 1 model switch can optionally be hedged: instead of trying the
+models on the escalation path one at a time, the next 2-3 models run the
+phase concurrently and the first one to pass the gate wins (see
+hedging.py).
 """
 
 import json
@@ -10,6 +15,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .observability import tracing
 from .quality_gates import GateResult
 
 
@@ -82,6 +88,12 @@ class EscalationManager:
     - Request human review and decision
     - Provide full context for human decision
 
+    Hedged model switch:
+    With hedge_width > 1 (or ``hedge.models`` in the state context, taken
+    from the phase config), the model switch action lists several models
+    to race against each other (parameters ``models``, ``hedged`` and
+    ``max_cost_usd``).
+
     Example:
         manager = EscalationManager()
         state = EscalationState(phase_id="01-foundation")
@@ -109,20 +121,32 @@ class EscalationManager:
         "claude-3-opus",
     ]
 
+    # Upper bound for concurrently raced models
+    MAX_HEDGE_WIDTH = 3
+
     def __init__(
         self,
         max_stufe_1_attempts: int | None = None,
         max_stufe_2_attempts: int | None = None,
+        hedge_width: int = 1,
+        hedge_max_cost_usd: float | None = None,
     ) -> None:
         """Initialize the EscalationManager.
 
         Args:
             max_stufe_1_attempts: Max attempts at Stufe 1.
             max_stufe_2_attempts: Max attempts at Stufe 2.
+            hedge_width: Number of models to race on a model switch
+                (1 = sequential, no hedging).
+            hedge_max_cost_usd: Cost cap for all candidates of a hedged
+                model switch (None = no cap).
         """
         self.max_stufe_1_attempts = max_stufe_1_attempts or self.MAX_STUFE_1_ATTEMPTS
         self.max_stufe_2_attempts = max_stufe_2_attempts or self.MAX_STUFE_2_ATTEMPTS
+        self.hedge_width = hedge_width
+        self.hedge_max_cost_usd = hedge_max_cost_usd
 
+    @tracing.traced("escalation.gate_failure")
     async def handle_gate_failure(
         self,
         phase_dir: Path,
@@ -185,6 +209,7 @@ class EscalationManager:
             requires_human=True,
         )
 
+    @tracing.traced("escalation.stufe_1")
     async def trigger_stufe_1(
         self,
         phase_dir: Path,
@@ -202,6 +227,22 @@ class EscalationManager:
         strategy = self._select_stufe_1_strategy(state)
 
         if strategy == "model_switch":
+            width, max_cost_usd = self._hedge_settings(state)
+            models = self._get_next_models(state, width)
+            if len(models) > 1:
+                return EscalationAction(
+                    action_type=ActionType.MODEL_SWITCH,
+                    level=EscalationLevel.STUFE_1,
+                    parameters={
+                        "model": models[0],
+                        "models": models,
+                        "hedged": True,
+                        "max_cost_usd": max_cost_usd,
+                    },
+                    message=f"Racing {len(models)} models: {', '.join(models)}",
+                    requires_human=False,
+                )
+
             new_model = self._get_next_model(state)
             return EscalationAction(
                 action_type=ActionType.MODEL_SWITCH,
@@ -237,6 +278,7 @@ class EscalationManager:
             requires_human=False,
         )
 
+    @tracing.traced("escalation.stufe_2")
     async def trigger_stufe_2(
         self,
         phase_dir: Path,
@@ -300,6 +342,45 @@ class EscalationManager:
         except ValueError:
             return self.MODEL_ESCALATION_PATH[-1]
 
+    def _get_next_models(self, state: EscalationState, count: int) -> list[str]:
+        """Get the next models in the escalation path.
+
+        Args:
+            state: Current escalation state.
+            count: Number of models wanted.
+
+        Returns:
+            Up to count model specs after the current model. At least
+            the last model of the path if the current model is already
+            the most capable one.
+        """
+        current_model = state.context.get("current_model", self.MODEL_ESCALATION_PATH[0])
+
+        try:
+            start = self.MODEL_ESCALATION_PATH.index(current_model) + 1
+        except ValueError:
+            start = len(self.MODEL_ESCALATION_PATH) - 1
+
+        models = self.MODEL_ESCALATION_PATH[start:start + count]
+        return models or self.MODEL_ESCALATION_PATH[-1:]
+
+    def _hedge_settings(self, state: EscalationState) -> tuple[int, float | None]:
+        """Get hedge width and cost cap for a model switch.
+
+        The phase's ``hedge`` config (state.context["hedge"]) overrides
+        the manager defaults.
+
+        Args:
+            state: Current escalation state.
+
+        Returns:
+            Tuple of (number of models to race, cost cap in USD or None).
+        """
+        hedge = state.context.get("hedge") or {}
+        width = hedge.get("models", self.hedge_width)
+        max_cost_usd = hedge.get("max_cost_usd", self.hedge_max_cost_usd)
+        return max(1, min(int(width), self.MAX_HEDGE_WIDTH)), max_cost_usd
+
     def _generate_hints(self, state: EscalationState) -> list[str]:
         """Generate hints based on failure history.
 
@@ -25,6 +25,8 @@ import yaml
 
 from helix.config.paths import PathConfig
 
+from .status_sync import StatusSynchronizer
+
 
 class EvolutionStatus(str, Enum):
     """Status of an evolution project."""
@@ -118,13 +120,7 @@ class EvolutionProject:
 
     def get_status(self) -> EvolutionStatus:
         """Get current project status."""
-        if not self._status_file.exists():
-            return EvolutionStatus.PENDING
-        
-        with open(self._status_file) as f:
-            data = json.load(f)
-        
-        return EvolutionStatus(data.get("status", "pending"))
+        return EvolutionStatus(self.get_status_data().get("status", "pending"))
 
     def set_status(
         self,
@@ -139,26 +135,25 @@ class EvolutionProject:
             current_phase: Optional current phase ID
             error: Optional error message (for failed status)
         """
-        data = self.get_status_data()
-        data["status"] = status.value
-        data["updated_at"] = datetime.now().isoformat()
-        
-        if current_phase is not None:
-            data["current_phase"] = current_phase
-        
-        if error is not None:
-            data["error"] = error
-        elif status != EvolutionStatus.FAILED:
-            data["error"] = None
-        
-        with open(self._status_file, "w") as f:
-            json.dump(data, f, indent=2)
+        # Route through the shared synchronizer so pipeline phase updates
+        # and project status changes never overwrite each other on disk.
+        StatusSynchronizer.for_project(self.path).set_project_status(
+            status.value,
+            current_phase=current_phase,
+            error=error,
+        )
 
     def get_status_data(self) -> dict:
         """Get full status data dict.
         
         Always ensures 'updated_at' is present (Fix for Bug #9).
+        Includes coalesced updates not yet flushed by a write-behind
+        StatusSynchronizer for this project.
         """
+        sync = StatusSynchronizer.get_registered(self.path)
+        if sync is not None and sync.has_pending_writes:
+            return sync.snapshot()
+
         default_data = {
             "status": EvolutionStatus.PENDING.value,
             "created_at": datetime.now().isoformat(),
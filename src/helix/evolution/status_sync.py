@@ -18,6 +18,17 @@ Solution:
     All phase state changes (start, complete, fail) are immediately persisted
     to status.json with atomic writes for crash safety.
 
+Write-Behind Mode:
+    With many parallel phases, every start/complete call used to trigger a
+    full JSON dump + rename + chmod. In write-behind mode, non-terminal
+    updates are coalesced in memory and flushed once per ``flush_interval``.
+    Terminal states (phase failure, ready, integrated, ...), ``flush()``,
+    ``close()`` and interpreter shutdown always write through to disk.
+
+    ``StatusSynchronizer.for_project()`` returns one shared instance per
+    project directory, so ``EvolutionProject.set_status`` and the pipeline
+    write through the same object instead of racing on status.json.
+
 Usage:
     sync = StatusSynchronizer(project_path)
     sync.start_phase("phase-1")
@@ -25,17 +36,31 @@ Usage:
     sync.complete_phase("phase-1")
     # or
     sync.fail_phase("phase-1", "Error message")
+
+    # Coalesced writes, shared with EvolutionProject.set_status
+    sync = StatusSynchronizer.for_project(project_path, write_behind=True)
+    try:
+        ...
+    finally:
+        sync.close()
 """
 
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
+import atexit
 import json
 import logging
+import threading
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Project statuses after which nothing happens until a human or a new
+# pipeline run touches the project again - these are always written through.
+TERMINAL_PROJECT_STATUSES = frozenset({"ready", "deployed", "integrated", "failed"})
+
 
 @dataclass
 class PhaseStatus:
@@ -116,23 +141,99 @@ class StatusSynchronizer:
         sync.fail_phase("phase-1", "Error message")
 
     Thread Safety:
-        This class is NOT thread-safe. If multiple threads need to update
-        status, external synchronization is required.
+        All updates are serialized through an internal lock, so a single
+        instance may be shared between threads (the write-behind flush
+        runs on a timer thread).
     """
 
     # File permission for status.json (rw-r--r--)
     STATUS_FILE_PERMISSION = 0o644
 
-    def __init__(self, project_path: Path):
+    # Default coalescing window for write-behind mode (seconds)
+    DEFAULT_FLUSH_INTERVAL = 0.25
+
+    # Shared instances per resolved project path (see for_project)
+    _registry: ClassVar["weakref.WeakValueDictionary[Path, StatusSynchronizer]"] = (
+        weakref.WeakValueDictionary()
+    )
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        project_path: Path,
+        write_behind: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
         """Initialize StatusSynchronizer.
 
         Args:
             project_path: Path to the evolution project directory.
                          Must contain (or will contain) status.json.
+            write_behind: Coalesce non-terminal updates and flush them
+                         after ``flush_interval`` seconds.
+            flush_interval: Coalescing window for write-behind mode.
         """
         self.project_path = Path(project_path)
         self.status_file = self.project_path / "status.json"
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
         self._status_data: dict = self._load_status()
+        _live_synchronizers.add(self)
+
+    @classmethod
+    def for_project(
+        cls,
+        project_path: Path,
+        write_behind: Optional[bool] = None,
+        flush_interval: Optional[float] = None,
+    ) -> "StatusSynchronizer":
+        """Get the shared synchronizer for a project directory.
+
+        All writers of a project's status.json should go through this
+        instance so that updates are applied to one in-memory state
+        instead of racing each other on disk.
+
+        Args:
+            project_path: Path to the evolution project directory.
+            write_behind: If given, switch the shared instance to this mode.
+            flush_interval: If given, override the coalescing window.
+
+        Returns:
+            The StatusSynchronizer registered for this project.
+        """
+        key = Path(project_path).resolve()
+        with cls._registry_lock:
+            sync = cls._registry.get(key)
+            if sync is None:
+                sync = cls(project_path)
+                cls._registry[key] = sync
+        if flush_interval is not None:
+            sync.flush_interval = flush_interval
+        if write_behind is not None and write_behind != sync.write_behind:
+            if not write_behind:
+                sync.flush()
+            sync.write_behind = write_behind
+        return sync
+
+    @classmethod
+    def get_registered(cls, project_path: Path) -> Optional["StatusSynchronizer"]:
+        """Get the shared synchronizer for a project if one is alive.
+
+        Args:
+            project_path: Path to the evolution project directory.
+
+        Returns:
+            The live StatusSynchronizer or None.
+        """
+        return cls._registry.get(Path(project_path).resolve())
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Whether coalesced updates are waiting to be flushed."""
+        return self._dirty
 
     def _load_status(self) -> dict:
         """Load status from disk.
@@ -142,10 +243,13 @@ class StatusSynchronizer:
         """
         if self.status_file.exists():
             try:
-                return json.loads(self.status_file.read_text())
+                data = json.loads(self.status_file.read_text())
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load status.json: {e}, using defaults")
                 return self._default_status()
+            # status.json written by EvolutionProject.create has no phases yet
+            data.setdefault("phases", {})
+            return data
         return self._default_status()
 
     def _default_status(self) -> dict:
@@ -163,19 +267,80 @@ class StatusSynchronizer:
             "error": None
         }
 
-    def _save_status(self) -> None:
-        """Save status to disk with atomic write.
+    def _save_status(self, force: bool = False) -> None:
+        """Persist the current status.
+
+        In write-behind mode, non-forced saves only mark the state dirty
+        and schedule a flush; otherwise the state is written immediately.
+
+        Args:
+            force: Write through even in write-behind mode (terminal states).
+
+        Raises:
+            IOError: If write or rename fails
+        """
+        with self._lock:
+            self._status_data["updated_at"] = datetime.now().isoformat()
+            if self.write_behind and not force:
+                self._dirty = True
+                self._schedule_flush()
+                return
+            self._write_status()
+
+    def _schedule_flush(self) -> None:
+        """Start the coalescing timer unless one is already pending."""
+        if self._flush_timer is not None:
+            return
+        timer = threading.Timer(self.flush_interval, self._timed_flush)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _timed_flush(self) -> None:
+        """Timer callback: flush coalesced updates."""
+        try:
+            self.flush()
+        except IOError as e:
+            logger.error(f"Deferred status write failed: {e}")
+
+    def flush(self) -> None:
+        """Write pending coalesced updates to disk.
+
+        No-op if nothing is pending.
+
+        Raises:
+            IOError: If write or rename fails
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._write_status()
+
+    def close(self) -> None:
+        """Flush pending updates. Call when the pipeline run ends."""
+        self.flush()
+
+    def __enter__(self) -> "StatusSynchronizer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _write_status(self) -> None:
+        """Write status to disk with atomic write.
 
         Uses temp file + rename pattern for crash safety:
         1. Write to status.json.tmp
         2. Rename to status.json (atomic on POSIX)
         3. Normalize permissions to 0644
 
+        Must be called with ``self._lock`` held.
+
         Raises:
             IOError: If write or rename fails
         """
-        self._status_data["updated_at"] = datetime.now().isoformat()
-
         # Ensure project directory exists
         self.project_path.mkdir(parents=True, exist_ok=True)
 
@@ -184,6 +349,7 @@ class StatusSynchronizer:
         try:
             temp_file.write_text(json.dumps(self._status_data, indent=2))
             temp_file.rename(self.status_file)
+            self._dirty = False
 
             # Normalize permissions (Fix 2 integration)
             try:
@@ -209,12 +375,13 @@ class StatusSynchronizer:
         Args:
             phase_ids: List of phase IDs to initialize
         """
-        for phase_id in phase_ids:
-            if phase_id not in self._status_data["phases"]:
-                self._status_data["phases"][phase_id] = {
-                    "status": "pending"
-                }
-        self._save_status()
+        with self._lock:
+            for phase_id in phase_ids:
+                if phase_id not in self._status_data["phases"]:
+                    self._status_data["phases"][phase_id] = {
+                        "status": "pending"
+                    }
+            self._save_status()
         logger.info(f"Initialized {len(phase_ids)} phases")
 
     def start_phase(self, phase_id: str) -> None:
@@ -225,13 +392,14 @@ class StatusSynchronizer:
         Args:
             phase_id: ID of the phase to start
         """
-        self._status_data["status"] = "developing"
-        self._status_data["current_phase"] = phase_id
-        self._status_data["phases"][phase_id] = {
-            "status": "running",
-            "started_at": datetime.now().isoformat()
-        }
-        self._save_status()
+        with self._lock:
+            self._status_data["status"] = "developing"
+            self._status_data["current_phase"] = phase_id
+            self._status_data["phases"][phase_id] = {
+                "status": "running",
+                "started_at": datetime.now().isoformat()
+            }
+            self._save_status()
         logger.info(f"Phase started: {phase_id}")
 
     def complete_phase(self, phase_id: str) -> None:
@@ -243,18 +411,19 @@ class StatusSynchronizer:
         Args:
             phase_id: ID of the phase that completed
         """
-        if phase_id in self._status_data["phases"]:
-            phase_data = self._status_data["phases"][phase_id]
-            phase_data["status"] = "completed"
-            phase_data["completed_at"] = datetime.now().isoformat()
-        else:
-            # Phase wasn't initialized, create it as completed
-            self._status_data["phases"][phase_id] = {
-                "status": "completed",
-                "completed_at": datetime.now().isoformat()
-            }
-        self._status_data["current_phase"] = None
-        self._save_status()
+        with self._lock:
+            if phase_id in self._status_data["phases"]:
+                phase_data = self._status_data["phases"][phase_id]
+                phase_data["status"] = "completed"
+                phase_data["completed_at"] = datetime.now().isoformat()
+            else:
+                # Phase wasn't initialized, create it as completed
+                self._status_data["phases"][phase_id] = {
+                    "status": "completed",
+                    "completed_at": datetime.now().isoformat()
+                }
+            self._status_data["current_phase"] = None
+            self._save_status()
         logger.info(f"Phase completed: {phase_id}")
 
     def fail_phase(self, phase_id: str, error: str) -> None:
@@ -267,21 +436,22 @@ class StatusSynchronizer:
             phase_id: ID of the phase that failed
             error: Error message describing the failure
         """
-        if phase_id in self._status_data["phases"]:
-            phase_data = self._status_data["phases"][phase_id]
-            phase_data["status"] = "failed"
-            phase_data["error"] = error
-            phase_data["completed_at"] = datetime.now().isoformat()
-        else:
-            self._status_data["phases"][phase_id] = {
-                "status": "failed",
-                "error": error,
-                "completed_at": datetime.now().isoformat()
-            }
-        self._status_data["current_phase"] = None
-        self._status_data["status"] = "failed"
-        self._status_data["error"] = error
-        self._save_status()
+        with self._lock:
+            if phase_id in self._status_data["phases"]:
+                phase_data = self._status_data["phases"][phase_id]
+                phase_data["status"] = "failed"
+                phase_data["error"] = error
+                phase_data["completed_at"] = datetime.now().isoformat()
+            else:
+                self._status_data["phases"][phase_id] = {
+                    "status": "failed",
+                    "error": error,
+                    "completed_at": datetime.now().isoformat()
+                }
+            self._status_data["current_phase"] = None
+            self._status_data["status"] = "failed"
+            self._status_data["error"] = error
+            self._save_status(force=True)
         logger.error(f"Phase failed: {phase_id} - {error}")
 
     def mark_ready(self) -> None:
@@ -289,10 +459,11 @@ class StatusSynchronizer:
 
         Call this after all phases have completed successfully.
         """
-        self._status_data["status"] = "ready"
-        self._status_data["current_phase"] = None
-        self._status_data["error"] = None
-        self._save_status()
+        with self._lock:
+            self._status_data["status"] = "ready"
+            self._status_data["current_phase"] = None
+            self._status_data["error"] = None
+            self._save_status(force=True)
         logger.info("Project marked as ready")
 
     def mark_integrated(self) -> None:
@@ -300,10 +471,11 @@ class StatusSynchronizer:
 
         Call this after successful validation and integration.
         """
-        self._status_data["status"] = "integrated"
-        self._status_data["current_phase"] = None
-        self._status_data["error"] = None
-        self._save_status()
+        with self._lock:
+            self._status_data["status"] = "integrated"
+            self._status_data["current_phase"] = None
+            self._status_data["error"] = None
+            self._save_status(force=True)
         logger.info("Project marked as integrated")
 
     def get_status(self) -> dict:
@@ -312,11 +484,59 @@ class StatusSynchronizer:
         Reloads status.json to get the latest state, ensuring consistency
         even if another process has modified the file.
 
+        Pending write-behind updates are flushed first so they are not lost.
+
         Returns:
             Current status dictionary
         """
-        self._status_data = self._load_status()
-        return self._status_data.copy()
+        with self._lock:
+            self.flush()
+            self._status_data = self._load_status()
+            return self._status_data.copy()
+
+    def snapshot(self) -> dict:
+        """Get the in-memory status without touching disk.
+
+        Unlike get_status(), this includes coalesced updates that have not
+        been flushed yet and never re-reads status.json.
+
+        Returns:
+            Deep-enough copy of the current status dictionary
+        """
+        with self._lock:
+            data = dict(self._status_data)
+            data["phases"] = {
+                pid: dict(pdata) for pid, pdata in self._status_data.get("phases", {}).items()
+            }
+            return data
+
+    def set_project_status(
+        self,
+        status: str,
+        current_phase: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Set the overall project status.
+
+        Mirrors EvolutionProject.set_status() semantics, which routes through
+        this method so both writers share one in-memory state. Terminal
+        statuses (see TERMINAL_PROJECT_STATUSES) are written through.
+
+        Args:
+            status: New project status value (e.g. "developing")
+            current_phase: Optional current phase ID
+            error: Optional error message (for failed status)
+        """
+        with self._lock:
+            self._status_data["status"] = status
+            if current_phase is not None:
+                self._status_data["current_phase"] = current_phase
+            if error is not None:
+                self._status_data["error"] = error
+            elif status != "failed":
+                self._status_data["error"] = None
+            self._save_status(force=status in TERMINAL_PROJECT_STATUSES)
+        logger.info(f"Project status set: {status}")
 
     def get_phase_status(self, phase_id: str) -> Optional[PhaseStatus]:
         """Get status for a specific phase.
@@ -389,11 +609,26 @@ class StatusSynchronizer:
 
         Useful for retrying a failed pipeline from the beginning.
         """
-        for phase_id in self._status_data.get("phases", {}):
-            self._status_data["phases"][phase_id] = {"status": "pending"}
-
-        self._status_data["status"] = "pending"
-        self._status_data["current_phase"] = None
-        self._status_data["error"] = None
-        self._save_status()
+        with self._lock:
+            for phase_id in self._status_data.get("phases", {}):
+                self._status_data["phases"][phase_id] = {"status": "pending"}
+
+            self._status_data["status"] = "pending"
+            self._status_data["current_phase"] = None
+            self._status_data["error"] = None
+            self._save_status()
         logger.info("Status reset to pending")
+
+
+# Write-behind instances that may hold unflushed updates at shutdown
+_live_synchronizers: "weakref.WeakSet[StatusSynchronizer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_on_exit() -> None:
+    """Flush coalesced updates of all live synchronizers at interpreter exit."""
+    for sync in list(_live_synchronizers):
+        try:
+            sync.flush()
+        except IOError as e:
+            logger.error(f"Failed to flush {sync.status_file} at exit: {e}")
@@ -20,9 +20,14 @@ Usage:
 """
 
 import ast
+import hashlib
+import os
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, NamedTuple, Optional, TYPE_CHECKING
+
+from helix.observability import tracing
 
 if TYPE_CHECKING:
     from helix.adr.parser import ADRDocument
@@ -56,6 +61,99 @@ class VerificationResult:
         }
 
 
+class _Entry(NamedTuple):
+    """A directory entry of a snapshot."""
+    is_dir: bool
+    is_file: bool
+    is_symlink: bool
+
+
+class _FileSnapshot:
+    """Point-in-time view of the file system for one verification run.
+
+    Every directory is listed at most once (on first use), so candidate
+    locations and glob patterns sharing directories cost a single
+    scandir instead of one stat per candidate or one walk per pattern.
+    The cached listings form a lazily built tree over all roots; since
+    phase directories usually live inside the project, overlapping
+    roots share it.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[str, dict[str, _Entry]] = {}
+
+    def _entries(self, directory: str) -> dict[str, _Entry]:
+        """Entries of a directory (empty if it does not exist)."""
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = {}
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            listing[entry.name] = _Entry(
+                                entry.is_dir(), entry.is_file(), entry.is_symlink()
+                            )
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            self._listings[directory] = listing
+        return listing
+
+    def is_file(self, path: Path) -> bool:
+        """Check whether path is an existing file."""
+        directory, name = os.path.split(os.path.normpath(path))
+        entry = self._entries(directory).get(name)
+        return entry is not None and entry.is_file
+
+    def is_dir(self, path: Path) -> bool:
+        """Check whether path is an existing directory."""
+        directory, name = os.path.split(os.path.normpath(path))
+        entry = self._entries(directory).get(name)
+        return entry is not None and entry.is_dir
+
+    def glob(self, root: Path, pattern: str) -> list[Path]:
+        """Match a relative glob pattern (``*``, ``?``, ``[...]``, ``**``).
+
+        Returns:
+            Matching files and directories, sorted
+        """
+        parts = [p for p in pattern.replace("\\", "/").split("/") if p not in ("", ".")]
+        if not parts:
+            return []
+        matches = dict.fromkeys(self._match(os.path.normpath(root), parts))
+        return [Path(m) for m in sorted(matches)]
+
+    def _match(self, directory: str, parts: list[str]) -> Iterator[str]:
+        """Yield paths below directory matching the pattern parts."""
+        head, rest = parts[0], parts[1:]
+        entries = self._entries(directory)
+
+        if head == "**":
+            # Zero or more directories (symlinked ones are not descended)
+            if rest:
+                yield from self._match(directory, rest)
+            else:
+                yield directory
+            for name, entry in entries.items():
+                if entry.is_dir and not entry.is_symlink:
+                    yield from self._match(os.path.join(directory, name), parts)
+            return
+
+        if any(c in head for c in "*?["):
+            names = [name for name in entries if fnmatchcase(name, head)]
+        else:
+            names = [head] if head in entries else []
+
+        for name in names:
+            path = os.path.join(directory, name)
+            if not rest:
+                yield path
+            elif entries[name].is_dir:
+                yield from self._match(path, rest)
+
+
 class PhaseVerifier:
     """Verify phase outputs against ADR expectations.
     
@@ -92,6 +190,8 @@ class PhaseVerifier:
         self.project_path = Path(project_path)
         self._adr: Optional["ADRDocument"] = None
         self._adr_loaded = False
+        # Content hash -> syntax error (None = valid), kept across retries
+        self._syntax_cache: dict[str, Optional[str]] = {}
     
     @property
     def adr(self) -> Optional["ADRDocument"]:
@@ -143,6 +243,8 @@ class PhaseVerifier:
         4. project_path/{file}
         
         For Python files, also performs syntax validation using AST.
+        All lookups run against one snapshot of the candidate directories
+        taken per call; syntax results are cached by file content.
         
         Args:
             phase_id: ID of the phase (for logging/messages)
@@ -165,9 +267,57 @@ class PhaseVerifier:
                 message=f"Phase {phase_id}: No expected files defined"
             )
         
+        with tracing.span("verify", phase_id=phase_id, expected_files=len(expected_files)) as span:
+            found, missing, syntax_errors = self._check_expected_files(phase_dir, expected_files)
+            span.set(
+                success=not missing and not syntax_errors,
+                missing=len(missing),
+                syntax_errors=len(syntax_errors),
+            )
+        
+        # Determine success
+        success = len(missing) == 0 and len(syntax_errors) == 0
+        
+        # Build message
+        total = len(expected_files)
+        found_count = len(found)
+        
+        if success:
+            message = f"Phase {phase_id}: ✅ All {total} files verified"
+        else:
+            parts = [f"Phase {phase_id}: ❌ Verification failed"]
+            if missing:
+                parts.append(f"Missing: {missing}")
+            if syntax_errors:
+                parts.append(f"Syntax errors in {len(syntax_errors)} files")
+            message = " | ".join(parts)
+
+        return VerificationResult(
+            success=success,
+            missing_files=missing,
+            syntax_errors=syntax_errors,
+            found_files=found,
+            message=message,
+        )
+    
+    def _check_expected_files(
+        self,
+        phase_dir: Path,
+        expected_files: list[str],
+    ) -> tuple[list[str], list[str], dict[str, str]]:
+        """Resolve expected files and syntax-check the Python ones.
+
+        Args:
+            phase_dir: Phase directory
+            expected_files: Expected file paths or glob patterns
+
+        Returns:
+            Tuple of (found files, missing files, syntax errors by file)
+        """
         missing = []
         found = []
         syntax_errors = {}
+        snapshot = _FileSnapshot()
 
         for file_path in expected_files:
             # Check if this is a glob pattern
@@ -191,9 +341,8 @@ class PhaseVerifier:
 
                 matched_files = []
                 for search_dir in glob_dirs:
-                    if search_dir.exists():
-                        matches = list(search_dir.glob(clean_path))
-                        matched_files.extend(matches)
+                    if snapshot.is_dir(search_dir):
+                        matched_files.extend(snapshot.glob(search_dir, clean_path))
 
                 if matched_files:
                     for match_path in matched_files:
@@ -218,7 +367,7 @@ class PhaseVerifier:
 
                 found_path = None
                 for candidate in candidates:
-                    if candidate.exists() and candidate.is_file():
+                    if snapshot.is_file(candidate):
                         found_path = candidate
                         break
 
@@ -232,34 +381,13 @@ class PhaseVerifier:
                             syntax_errors[str(found_path)] = error
                 else:
                     missing.append(file_path)
-        
-        # Determine success
-        success = len(missing) == 0 and len(syntax_errors) == 0
-        
-        # Build message
-        total = len(expected_files)
-        found_count = len(found)
-        
-        if success:
-            message = f"Phase {phase_id}: ✅ All {total} files verified"
-        else:
-            parts = [f"Phase {phase_id}: ❌ Verification failed"]
-            if missing:
-                parts.append(f"Missing: {missing}")
-            if syntax_errors:
-                parts.append(f"Syntax errors in {len(syntax_errors)} files")
-            message = " | ".join(parts)
-        
-        return VerificationResult(
-            success=success,
-            missing_files=missing,
-            syntax_errors=syntax_errors,
-            found_files=found,
-            message=message,
-        )
-    
+
+        return found, missing, syntax_errors
+
     def _check_python_syntax(self, file_path: Path) -> Optional[str]:
         """Check Python file syntax using AST.
+
+        Unchanged content (same hash) is not parsed again.
         
         Args:
             file_path: Path to the Python file
@@ -268,13 +396,23 @@ class PhaseVerifier:
             Error message if syntax error, None if valid
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
-            ast.parse(content)
-            return None
-        except SyntaxError as e:
-            return f"Line {e.lineno}: {e.msg}"
+            data = file_path.read_bytes()
         except Exception as e:
             return f"Read error: {e}"
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self._syntax_cache:
+            return self._syntax_cache[digest]
+
+        try:
+            ast.parse(data.decode("utf-8"))
+            error = None
+        except SyntaxError as e:
+            error = f"Line {e.lineno}: {e.msg}"
+        except Exception as e:
+            error = f"Read error: {e}"
+        self._syntax_cache[digest] = error
+        return error
     
     def format_retry_prompt(
         self,
@@ -220,7 +220,7 @@ async def check_adr_complete(
 
     # Step 2: Run CompletenessValidator (Layer 2)
     rules_path = Path(rules_path_str) if rules_path_str else None
-    completeness_validator = CompletenessValidator(rules_path=rules_path)
+    completeness_validator = CompletenessValidator.shared(rules_path=rules_path)
     completeness_result = completeness_validator.check(adr)
 
     if not completeness_result.passed:
@@ -0,0 +1,294 @@
+"""Hedged model escalation for HELIX v4.
+
+Runs a phase with several escalation models at once instead of one
+after another. Every candidate works in its own copy of the phase
+directory; the first candidate whose output passes the quality gate
+wins, its copy replaces the phase directory and all other candidates
+are cancelled.
+
+Copies are created next to the phase directory
+(``phases/.<phase-id>.hedge-<n>``), so relative paths into the project
+resolve the same way as in the phase directory itself. Outputs written
+outside the phase directory are not isolated.
+
+Costs are accounted per candidate. Once the finished candidates have
+used up the cost cap without a winner, the remaining ones are cancelled.
+Cancelled candidates report no cost, since the Claude CLI only reports
+usage when a run completes.
+
+Example:
+    runner = HedgedPhaseRunner(claude_runner, gate_runner, max_cost_usd=5.0)
+    result = await runner.run(
+        phase_dir,
+        models=["claude-3-sonnet", "claude-3-opus"],
+        quality_gate={"type": "tests_pass"},
+    )
+    if result.winner:
+        print(f"{result.winner.model} passed")
+
+See Also:
+    - escalation.py: Produces hedged MODEL_SWITCH actions
+    - api/orchestrator.py: Runs them during gate escalation
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from .claude_runner import ClaudeResult, ClaudeRunner
+from .observability.metrics import calculate_cost
+from .quality_gates import GateResult, QualityGateRunner
+
+
+@dataclass
+class HedgeCandidate:
+    """One model racing in a hedged escalation.
+
+    Attributes:
+        model: Model spec the candidate runs with
+        work_dir: Isolated copy of the phase directory
+        status: pending, running, passed, failed, cancelled or over_budget
+        input_tokens: Input tokens used (including cache reads/creation)
+        output_tokens: Output tokens used
+        cost_usd: Cost of the run in USD
+        duration_seconds: Wall clock time of the run
+        message: Failure or gate message
+    """
+    model: str
+    work_dir: Path
+    status: str = "pending"
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    duration_seconds: float = 0.0
+    message: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "model": self.model,
+            "status": self.status,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "duration_seconds": round(self.duration_seconds, 2),
+            "message": self.message,
+        }
+
+
+@dataclass
+class HedgeResult:
+    """Outcome of a hedged escalation.
+
+    Attributes:
+        candidates: All candidates in start order
+        winner: First candidate that passed the gate, or None
+        gate_result: Gate result of the winner
+        budget_exhausted: True if the cost cap stopped the race
+    """
+    candidates: list[HedgeCandidate] = field(default_factory=list)
+    winner: Optional[HedgeCandidate] = None
+    gate_result: Optional[GateResult] = None
+    budget_exhausted: bool = False
+
+    @property
+    def total_cost_usd(self) -> float:
+        """Summed cost of all candidates."""
+        return sum(c.cost_usd for c in self.candidates)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "winner": self.winner.model if self.winner else None,
+            "budget_exhausted": self.budget_exhausted,
+            "total_cost_usd": round(self.total_cost_usd, 6),
+            "candidates": [c.to_dict() for c in self.candidates],
+        }
+
+
+# Called whenever a candidate settles (passed, failed, cancelled, over budget)
+CandidateCallback = Callable[[HedgeCandidate], Awaitable[None]]
+
+
+class HedgedPhaseRunner:
+    """Races a phase across several models in isolated phase copies.
+
+    Attributes:
+        claude_runner: Runner for the Claude CLI
+        gate_runner: Runner for the phase's quality gate
+        max_cost_usd: Cost cap for all candidates (None = no cap)
+        timeout: Timeout per candidate run in seconds
+    """
+
+    def __init__(
+        self,
+        claude_runner: ClaudeRunner,
+        gate_runner: QualityGateRunner,
+        max_cost_usd: float | None = None,
+        timeout: int | None = None,
+    ) -> None:
+        """Initialize the HedgedPhaseRunner.
+
+        Args:
+            claude_runner: Runner for the Claude CLI
+            gate_runner: Runner for the quality gate
+            max_cost_usd: Cost cap for all candidates (None = no cap)
+            timeout: Timeout per candidate run in seconds
+        """
+        self.claude_runner = claude_runner
+        self.gate_runner = gate_runner
+        self.max_cost_usd = max_cost_usd
+        self.timeout = timeout
+
+    async def run(
+        self,
+        phase_dir: Path,
+        models: list[str],
+        quality_gate: dict[str, Any],
+        prompt: str | None = None,
+        on_candidate: CandidateCallback | None = None,
+    ) -> HedgeResult:
+        """Run the phase with all models concurrently.
+
+        Args:
+            phase_dir: Phase working directory
+            models: Models to race
+            quality_gate: Gate configuration of the phase
+            prompt: Optional prompt (default: read CLAUDE.md)
+            on_candidate: Optional callback when a candidate settles
+
+        Returns:
+            HedgeResult; on a winner, phase_dir holds the winner's output
+        """
+        phase_dir = Path(phase_dir)
+        result = HedgeResult(candidates=[
+            HedgeCandidate(model=model, work_dir=self._work_dir(phase_dir, i))
+            for i, model in enumerate(models)
+        ])
+
+        tasks: dict[asyncio.Task, HedgeCandidate] = {}
+        try:
+            for candidate in result.candidates:
+                self._copy_phase(phase_dir, candidate.work_dir)
+                candidate.status = "running"
+                task = asyncio.create_task(self._run_candidate(candidate, quality_gate, prompt))
+                tasks[task] = candidate
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    candidate = tasks[task]
+                    try:
+                        gate_result = task.result()
+                    except Exception as e:
+                        candidate.status = "failed"
+                        candidate.message = str(e)
+                        gate_result = None
+                    if on_candidate:
+                        await on_candidate(candidate)
+                    if gate_result is not None and result.winner is None:
+                        result.winner = candidate
+                        result.gate_result = gate_result
+
+                if result.winner is None and pending and self._over_budget(result):
+                    result.budget_exhausted = True
+
+                if pending and (result.winner is not None or result.budget_exhausted):
+                    status = "cancelled" if result.winner is not None else "over_budget"
+                    await self._cancel(pending, tasks, status, on_candidate)
+                    pending = set()
+
+            if result.winner is not None:
+                self._adopt(result.winner.work_dir, phase_dir)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            for candidate in result.candidates:
+                shutil.rmtree(candidate.work_dir, ignore_errors=True)
+
+        return result
+
+    async def _run_candidate(
+        self,
+        candidate: HedgeCandidate,
+        quality_gate: dict[str, Any],
+        prompt: str | None,
+    ) -> GateResult | None:
+        """Run Claude and the gate for one candidate.
+
+        Returns:
+            The passed GateResult, or None if the candidate failed
+        """
+        claude_result: ClaudeResult = await self.claude_runner.run_phase(
+            phase_dir=candidate.work_dir,
+            model=candidate.model,
+            prompt=prompt,
+            timeout=self.timeout,
+        )
+        candidate.input_tokens = claude_result.input_tokens
+        candidate.output_tokens = claude_result.output_tokens
+        candidate.cost_usd = claude_result.cost_usd or calculate_cost(
+            candidate.input_tokens, candidate.output_tokens, candidate.model
+        )
+        candidate.duration_seconds = claude_result.duration_seconds
+
+        if not claude_result.success:
+            candidate.status = "failed"
+            candidate.message = f"Claude execution failed: {claude_result.stderr[:200]}"
+            return None
+
+        gate_result = await self.gate_runner.run_gate(candidate.work_dir, quality_gate)
+        candidate.message = gate_result.message
+        if not gate_result.passed:
+            candidate.status = "failed"
+            return None
+
+        candidate.status = "passed"
+        return gate_result
+
+    async def _cancel(
+        self,
+        pending: set[asyncio.Task],
+        tasks: dict[asyncio.Task, HedgeCandidate],
+        status: str,
+        on_candidate: CandidateCallback | None,
+    ) -> None:
+        """Cancel the still running candidates and wait for them to stop."""
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in pending:
+            candidate = tasks[task]
+            if candidate.status == "running":
+                candidate.status = status
+            if on_candidate:
+                await on_candidate(candidate)
+
+    def _over_budget(self, result: HedgeResult) -> bool:
+        """Check whether the finished candidates used up the cost cap."""
+        return self.max_cost_usd is not None and result.total_cost_usd >= self.max_cost_usd
+
+    def _work_dir(self, phase_dir: Path, index: int) -> Path:
+        """Isolated directory of a candidate (sibling of the phase dir)."""
+        return phase_dir.parent / f".{phase_dir.name}.hedge-{index}"
+
+    def _copy_phase(self, phase_dir: Path, work_dir: Path) -> None:
+        """Copy the phase directory into a fresh candidate directory."""
+        shutil.rmtree(work_dir, ignore_errors=True)
+        shutil.copytree(phase_dir, work_dir, symlinks=True)
+
+    def _adopt(self, work_dir: Path, phase_dir: Path) -> None:
+        """Replace the phase directory contents with the winner's."""
+        for entry in list(phase_dir.iterdir()):
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        for entry in list(work_dir.iterdir()):
+            entry.rename(phase_dir / entry.name)
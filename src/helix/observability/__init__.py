@@ -12,6 +12,15 @@ from .metrics import (
     COST_PER_1M_TOKENS,
     calculate_cost,
 )
+from .ledger import UsageLedger, get_usage_ledger
+from .pricing import ModelPrice, PriceTable, get_price_table
+from .registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    registry,
+)
 
 __all__ = [
     "HelixLogger",
@@ -22,4 +31,14 @@ __all__ = [
     "ProjectMetrics",
     "COST_PER_1M_TOKENS",
     "calculate_cost",
+    "UsageLedger",
+    "get_usage_ledger",
+    "ModelPrice",
+    "PriceTable",
+    "get_price_table",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "registry",
 ]
@@ -0,0 +1,268 @@
+"""Append-only usage ledger for HELIX v4.
+
+Records token usage and cost of every project, phase and model in one
+SQLite database (PathConfig.USAGE_LEDGER), so aggregate questions such
+as "spend per model per day across all projects" don't require walking
+every project's logs/metrics.json.
+
+Tables:
+- usage: one row per recorded usage, indexed by (project, phase,
+  model, day) and (day, model)
+- daily_rollup: totals per (day, project, model), updated in the same
+  transaction as each insert
+
+Queries grouped by day, project and/or model read the rollup table;
+only phase-level queries touch the usage rows.
+
+Example:
+    from helix.observability.ledger import get_usage_ledger
+
+    ledger = get_usage_ledger()
+    ledger.record("my-project", "01-build", "claude-sonnet-4", 1500, 800, 0.0165)
+    rows = ledger.query(group_by=("day", "model"), since="2026-10-01")
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from helix.config.paths import PathConfig
+
+logger = logging.getLogger(__name__)
+
+GROUP_COLUMNS = ("day", "project", "phase", "model", "source")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    day TEXT NOT NULL,
+    project TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    model TEXT NOT NULL,
+    source TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS usage_project_phase_model_day
+    ON usage (project, phase, model, day);
+CREATE INDEX IF NOT EXISTS usage_day_model ON usage (day, model);
+
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    day TEXT NOT NULL,
+    project TEXT NOT NULL,
+    model TEXT NOT NULL,
+    entries INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL,
+    PRIMARY KEY (day, project, model)
+);
+CREATE INDEX IF NOT EXISTS daily_rollup_model_day ON daily_rollup (model, day);
+CREATE INDEX IF NOT EXISTS daily_rollup_project_day ON daily_rollup (project, day);
+"""
+
+_UPSERT_ROLLUP = """
+INSERT INTO daily_rollup (day, project, model, entries, input_tokens, output_tokens, cost_usd)
+VALUES (?, ?, ?, 1, ?, ?, ?)
+ON CONFLICT (day, project, model) DO UPDATE SET
+    entries = entries + 1,
+    input_tokens = input_tokens + excluded.input_tokens,
+    output_tokens = output_tokens + excluded.output_tokens,
+    cost_usd = cost_usd + excluded.cost_usd
+"""
+
+
+class UsageLedger:
+    """SQLite-backed usage ledger with daily rollups.
+
+    Thread-safe; several processes (API server, CLI runs) can share one
+    database file (WAL mode). Write errors are logged, never raised, so
+    accounting can't fail a phase.
+
+    Attributes:
+        db_path: SQLite database file
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the UsageLedger.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record(
+        self,
+        project: str,
+        phase: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: float,
+        source: str = "helix",
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """Append one usage entry and update the rollup.
+
+        Args:
+            project: Project identifier
+            phase: Phase identifier
+            model: Model name
+            input_tokens: Input tokens used
+            output_tokens: Output tokens generated
+            cost_usd: Cost in USD
+            source: Recording component (metrics, cost_calculator, ...)
+            timestamp: Time of the usage (default: now)
+
+        Returns:
+            True if recorded, False if the database was not writable
+        """
+        ts = timestamp or datetime.now()
+        day = ts.date().isoformat()
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT INTO usage (ts, day, project, phase, model, source,"
+                        " input_tokens, output_tokens, cost_usd)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (ts.isoformat(), day, project, phase, model, source,
+                         input_tokens, output_tokens, cost_usd),
+                    )
+                    conn.execute(
+                        _UPSERT_ROLLUP,
+                        (day, project, model, input_tokens, output_tokens, cost_usd),
+                    )
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record usage in {self.db_path}: {e}")
+            return False
+
+    def query(
+        self,
+        group_by: Sequence[str] = ("day", "model"),
+        project: str | None = None,
+        phase: str | None = None,
+        model: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate usage.
+
+        Args:
+            group_by: Columns to group by (day, project, phase, model, source)
+            project: Only this project
+            phase: Only this phase
+            model: Only this model
+            since: First day to include (YYYY-MM-DD)
+            until: Last day to include (YYYY-MM-DD)
+
+        Returns:
+            One dict per group with the group columns, entries,
+            input_tokens, output_tokens and cost_usd, most expensive first
+
+        Raises:
+            ValueError: If group_by contains an unknown column
+        """
+        unknown = [c for c in group_by if c not in GROUP_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown group_by columns {unknown}, expected {GROUP_COLUMNS}")
+
+        # The rollup answers everything that doesn't need phase or source
+        use_rollup = phase is None and not {"phase", "source"} & set(group_by)
+        table = "daily_rollup" if use_rollup else "usage"
+        entries = "SUM(entries)" if use_rollup else "COUNT(*)"
+
+        where: list[str] = []
+        params: list[Any] = []
+        for column, value in (("project", project), ("phase", phase), ("model", model)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            where.append("day >= ?")
+            params.append(since)
+        if until:
+            where.append("day <= ?")
+            params.append(until)
+
+        columns = ", ".join(group_by)
+        sql = (
+            f"SELECT {columns + ', ' if columns else ''}{entries} AS entries,"
+            " SUM(input_tokens) AS input_tokens, SUM(output_tokens) AS output_tokens,"
+            f" SUM(cost_usd) AS cost_usd FROM {table}"
+        )
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if columns:
+            sql += f" GROUP BY {columns}"
+        sql += " ORDER BY cost_usd DESC"
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [dict(row) for row in rows if row["entries"]]
+
+    def totals(self, **filters: Any) -> dict[str, Any]:
+        """Overall totals (same filters as query())."""
+        rows = self.query(group_by=(), **filters)
+        if rows:
+            return rows[0]
+        return {"entries": 0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0}
+
+    def rebuild_rollups(self) -> None:
+        """Recompute daily_rollup from the usage rows."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM daily_rollup")
+                conn.execute(
+                    "INSERT INTO daily_rollup (day, project, model, entries,"
+                    " input_tokens, output_tokens, cost_usd)"
+                    " SELECT day, project, model, COUNT(*), SUM(input_tokens),"
+                    " SUM(output_tokens), SUM(cost_usd) FROM usage"
+                    " GROUP BY day, project, model"
+                )
+
+
+_ledger: Optional[UsageLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Get the process-wide usage ledger at PathConfig.USAGE_LEDGER."""
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None or _ledger.db_path != Path(PathConfig.USAGE_LEDGER):
+            if _ledger is not None:
+                _ledger.close()
+            _ledger = UsageLedger(PathConfig.USAGE_LEDGER)
+        return _ledger
@@ -11,38 +11,23 @@ import json
 import threading
 from typing import Any
 
+from .ledger import UsageLedger, get_usage_ledger
+from .pricing import BUILTIN_PRICES, get_price_table
 
-# Token-zu-Kosten Mapping (pro 1M Tokens)
-COST_PER_1M_TOKENS: dict[str, dict[str, float]] = {
-    "claude-opus-4": {"input": 15.0, "output": 75.0},
-    "claude-sonnet-4": {"input": 3.0, "output": 15.0},
-    "gpt-4o": {"input": 2.5, "output": 10.0},
-    "gpt-4o-mini": {"input": 0.15, "output": 0.6},
-}
+
+# Token-zu-Kosten Mapping (pro 1M Tokens), see pricing.PriceTable for lookups
+COST_PER_1M_TOKENS: dict[str, dict[str, float]] = BUILTIN_PRICES
 
 
 def calculate_cost(
     input_tokens: int, output_tokens: int, model: str
 ) -> float:
-    """Calculate cost in USD for given tokens and model."""
-    # Normalize model name (handle variations)
-    model_lower = model.lower()
-
-    # Find matching model
-    costs = None
-    for model_key in COST_PER_1M_TOKENS:
-        if model_key in model_lower or model_lower in model_key:
-            costs = COST_PER_1M_TOKENS[model_key]
-            break
-
-    if costs is None:
-        # Default to claude-sonnet-4 if model not found
-        costs = COST_PER_1M_TOKENS["claude-sonnet-4"]
-
-    input_cost = (input_tokens / 1_000_000) * costs["input"]
-    output_cost = (output_tokens / 1_000_000) * costs["output"]
+    """Calculate cost in USD for given tokens and model.
 
-    return input_cost + output_cost
+    Prices come from the process-wide price table (built-in prices and
+    llm-providers.yaml); unknown models are priced as claude-sonnet-4.
+    """
+    return get_price_table().cost(model, input_tokens, output_tokens)
 
 
 @dataclass
@@ -61,9 +46,18 @@ class PhaseMetrics:
     retries: int = 0
     escalations: int = 0
     success: bool | None = None
+    hedge_candidates: list[dict[str, Any]] = field(default_factory=list)
+    # Guards the counters while the phase is active
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
+        with self._lock:
+            return self._to_dict()
+
+    def _to_dict(self) -> dict[str, Any]:
         return {
             "phase_id": self.phase_id,
             "start_time": self.start_time.isoformat(),
@@ -77,6 +71,7 @@ class PhaseMetrics:
             "retries": self.retries,
             "escalations": self.escalations,
             "success": self.success,
+            "hedge_candidates": list(self.hedge_candidates),
         }
 
     @classmethod
@@ -95,6 +90,7 @@ class PhaseMetrics:
             retries=data.get("retries", 0),
             escalations=data.get("escalations", 0),
             success=data.get("success"),
+            hedge_candidates=data.get("hedge_candidates", []),
         )
 
     def duration_seconds(self) -> float | None:
@@ -186,18 +182,59 @@ class ProjectMetrics:
 
 
 class MetricsCollector:
-    """Thread-safe metrics collector for HELIX v4."""
+    """Thread-safe metrics collector for HELIX v4.
+
+    Several phases can be active at once (parallel phases, expert
+    analyses). Recording methods take the phase_id to credit; without
+    one they credit the most recently started active phase.
+
+    Each active phase has its own lock, so recording into different
+    phases never contends; the collector lock only guards starting and
+    ending phases.
 
-    def __init__(self, project_dir: Path):
+    Token usage is also appended to the usage ledger (default: the
+    process-wide ledger at PathConfig.USAGE_LEDGER) for cross-project
+    rollups.
+    """
+
+    def __init__(self, project_dir: Path, ledger: UsageLedger | None = None):
         self.project_dir = Path(project_dir)
         self.current_project: ProjectMetrics | None = None
-        self.current_phase: PhaseMetrics | None = None
+        self._active: dict[str, PhaseMetrics] = {}
         self._lock = threading.Lock()
+        self._ledger = ledger
+
+    def _record_in_ledger(
+        self, phase_id: str, model: str, input_tokens: int, output_tokens: int, cost_usd: float
+    ) -> None:
+        """Append usage to the ledger."""
+        project = self.current_project
+        (self._ledger or get_usage_ledger()).record(
+            project.project_id if project is not None else self.project_dir.name,
+            phase_id,
+            model,
+            input_tokens,
+            output_tokens,
+            cost_usd,
+            source="metrics",
+        )
+
+    @property
+    def current_phase(self) -> PhaseMetrics | None:
+        """The most recently started active phase."""
+        with self._lock:
+            return next(reversed(self._active.values()), None)
 
     def _metrics_file(self) -> Path:
         """Get the path to the metrics file."""
         return self.project_dir / "logs" / "metrics.json"
 
+    def _phase(self, phase_id: str | None) -> PhaseMetrics | None:
+        """Get an active phase (the current one if phase_id is None)."""
+        if phase_id is None:
+            return self.current_phase
+        return self._active.get(phase_id)
+
     def start_project(self, project_id: str) -> None:
         """Start tracking a new project."""
         with self._lock:
@@ -219,76 +256,134 @@ class MetricsCollector:
             self.current_project = None
             return result
 
-    def start_phase(self, phase_id: str) -> None:
-        """Start tracking a new phase."""
-        with self._lock:
-            self.current_phase = PhaseMetrics(
-                phase_id=phase_id,
-                start_time=datetime.now(),
-            )
+    def start_phase(self, phase_id: str) -> PhaseMetrics:
+        """Start tracking a new phase.
 
-    def end_phase(self, success: bool = True) -> PhaseMetrics | None:
-        """End the current phase and return its metrics."""
+        Restarting an active phase_id replaces its metrics.
+        """
+        phase = PhaseMetrics(phase_id=phase_id, start_time=datetime.now())
         with self._lock:
-            if self.current_phase is None:
+            self._active.pop(phase_id, None)
+            self._active[phase_id] = phase
+        return phase
+
+    def end_phase(
+        self, success: bool = True, phase_id: str | None = None
+    ) -> PhaseMetrics | None:
+        """End an active phase and return its metrics.
+
+        Args:
+            success: Whether the phase succeeded
+            phase_id: Phase to end (default: the current phase)
+        """
+        with self._lock:
+            if phase_id is None:
+                phase_id = next(reversed(self._active), None)
+            phase = self._active.pop(phase_id, None) if phase_id is not None else None
+            if phase is None:
                 return None
 
-            self.current_phase.end_time = datetime.now()
-            self.current_phase.success = success
+            with phase._lock:
+                phase.end_time = datetime.now()
+                phase.success = success
 
             # Add to project if tracking
             if self.current_project is not None:
-                self.current_project.add_phase(self.current_phase)
+                self.current_project.add_phase(phase)
 
-            result = self.current_phase
-            self.current_phase = None
-            return result
+            return phase
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Live metrics of all active phases, by phase_id."""
+        with self._lock:
+            phases = list(self._active.values())
+        return {phase.phase_id: phase.to_dict() for phase in phases}
 
     def record_tokens(
-        self, input_tokens: int, output_tokens: int, model: str
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+        phase_id: str | None = None,
     ) -> None:
         """Record token usage and calculate cost."""
-        with self._lock:
-            if self.current_phase is None:
-                return
-
-            self.current_phase.input_tokens += input_tokens
-            self.current_phase.output_tokens += output_tokens
-
-            cost = calculate_cost(input_tokens, output_tokens, model)
-            self.current_phase.cost_usd += cost
-
-    def record_tool_call(self, tool_name: str) -> None:
+        phase = self._phase(phase_id)
+        if phase is None:
+            return
+
+        cost = calculate_cost(input_tokens, output_tokens, model)
+        with phase._lock:
+            phase.input_tokens += input_tokens
+            phase.output_tokens += output_tokens
+            phase.cost_usd += cost
+        self._record_in_ledger(phase.phase_id, model, input_tokens, output_tokens, cost)
+
+    def record_tool_call(self, tool_name: str, phase_id: str | None = None) -> None:
         """Record a tool call."""
-        with self._lock:
-            if self.current_phase is None:
-                return
-            self.current_phase.tool_calls += 1
+        phase = self._phase(phase_id)
+        if phase is None:
+            return
+        with phase._lock:
+            phase.tool_calls += 1
 
-    def record_file_change(self, change_type: str) -> None:
+    def record_file_change(self, change_type: str, phase_id: str | None = None) -> None:
         """Record a file change (created or modified)."""
-        with self._lock:
-            if self.current_phase is None:
-                return
+        phase = self._phase(phase_id)
+        if phase is None:
+            return
 
+        with phase._lock:
             if change_type == "created":
-                self.current_phase.files_created += 1
+                phase.files_created += 1
             elif change_type == "modified":
-                self.current_phase.files_modified += 1
+                phase.files_modified += 1
 
-    def record_retry(self) -> None:
+    def record_retry(self, phase_id: str | None = None) -> None:
         """Record a retry attempt."""
-        with self._lock:
-            if self.current_phase is None:
-                return
-            self.current_phase.retries += 1
+        phase = self._phase(phase_id)
+        if phase is None:
+            return
+        with phase._lock:
+            phase.retries += 1
 
-    def record_escalation(self) -> None:
+    def record_escalation(self, phase_id: str | None = None) -> None:
         """Record an escalation."""
-        with self._lock:
-            if self.current_phase is None:
-                return
-            self.current_phase.escalations += 1
+        phase = self._phase(phase_id)
+        if phase is None:
+            return
+        with phase._lock:
+            phase.escalations += 1
+
+    def record_hedge_candidate(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: float,
+        status: str,
+        phase_id: str | None = None,
+    ) -> None:
+        """Record one candidate of a hedged escalation.
+
+        Tokens and cost count towards the phase totals, so losing and
+        cancelled candidates show up in the phase cost.
+        """
+        phase = self._phase(phase_id)
+        if phase is None:
+            return
+
+        with phase._lock:
+            phase.input_tokens += input_tokens
+            phase.output_tokens += output_tokens
+            phase.cost_usd += cost_usd
+            phase.hedge_candidates.append({
+                "model": model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost_usd": cost_usd,
+                "status": status,
+            })
+        self._record_in_ledger(phase.phase_id, model, input_tokens, output_tokens, cost_usd)
 
     def save_metrics(self) -> Path:
         """Save current project metrics to file."""
@@ -0,0 +1,185 @@
+"""Model pricing for HELIX v4 cost tracking.
+
+Resolves a model name to its price per 1M tokens. The table is built
+once from the built-in prices and config/llm-providers.yaml; every
+resolved model name is memoized, so repeated lookups are a single
+dict access instead of a substring scan over all known models.
+
+Model names are resolved in this order:
+1. Exact name, alias or provider model ID ("claude-sonnet-4",
+   "sonnet", "anthropic/claude-sonnet-4", "openrouter:gpt-4o")
+2. The longest known name contained in the model name
+   ("claude-sonnet-4-20250514" -> "claude-sonnet-4")
+3. A known name containing the model name ("opus" -> "claude-opus-4")
+4. The default model (claude-sonnet-4)
+
+Example:
+    from helix.observability.pricing import get_price_table
+
+    prices = get_price_table()
+    cost = prices.cost("claude-opus-4", input_tokens=1500, output_tokens=800)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import yaml
+
+from helix.config.paths import PathConfig
+
+logger = logging.getLogger(__name__)
+
+
+# Built-in cost per 1M tokens (USD), overridden by llm-providers.yaml
+BUILTIN_PRICES: dict[str, dict[str, float]] = {
+    # Anthropic
+    "claude-opus-4": {"input": 15.00, "output": 75.00},
+    "claude-opus-4-5": {"input": 15.00, "output": 75.00},
+    "claude-sonnet-4": {"input": 3.00, "output": 15.00},
+    "claude-sonnet-3.5": {"input": 3.00, "output": 15.00},
+    "claude-haiku-3.5": {"input": 0.80, "output": 4.00},
+    # OpenAI
+    "gpt-4o": {"input": 2.50, "output": 10.00},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "o1": {"input": 15.00, "output": 60.00},
+    "o1-mini": {"input": 3.00, "output": 12.00},
+}
+
+DEFAULT_MODEL = "claude-sonnet-4"
+
+
+class ModelPrice(NamedTuple):
+    """Price of a model in USD per 1M tokens."""
+
+    input: float
+    output: float
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Cost in USD of the given token counts."""
+        return (input_tokens * self.input + output_tokens * self.output) / 1_000_000
+
+
+class PriceTable:
+    """Precomputed model -> price lookup.
+
+    Attributes:
+        default: Price used for unknown models
+    """
+
+    def __init__(
+        self,
+        prices: dict[str, dict[str, float]] | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the PriceTable.
+
+        Args:
+            prices: Base prices by model name ({"input": .., "output": ..})
+            config: Parsed llm-providers.yaml; its model prices and
+                aliases extend and override the base prices
+        """
+        self._prices: dict[str, ModelPrice] = {}
+        for name, price in (BUILTIN_PRICES if prices is None else prices).items():
+            self._prices[name.lower()] = ModelPrice(price["input"], price["output"])
+        if config:
+            self._add_config(config)
+
+        self.default = self._prices.get(DEFAULT_MODEL) or ModelPrice(3.00, 15.00)
+        # Names used for substring matching, longest first
+        self._names = sorted(self._prices, key=len, reverse=True)
+        self._resolved: dict[str, ModelPrice] = {}
+
+    @classmethod
+    def from_file(cls, config_path: Path | None = None) -> "PriceTable":
+        """Build the table from llm-providers.yaml (built-ins if unreadable).
+
+        Args:
+            config_path: Path to llm-providers.yaml.
+                Defaults to PathConfig.LLM_PROVIDERS_CONFIG.
+        """
+        config_path = config_path or PathConfig.LLM_PROVIDERS_CONFIG
+        config: dict[str, Any] = {}
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                config = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            pass
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(f"Could not load model prices from {config_path}: {e}")
+        return cls(config=config)
+
+    def _add_config(self, config: dict[str, Any]) -> None:
+        """Add model prices and aliases from llm-providers.yaml."""
+        claimed: set[str] = set()
+        for provider, pconfig in (config.get("providers") or {}).items():
+            for name, mconfig in (pconfig.get("models") or {}).items():
+                if not isinstance(mconfig, dict) or "cost_per_1m_input" not in mconfig:
+                    continue
+                price = ModelPrice(
+                    float(mconfig["cost_per_1m_input"]),
+                    float(mconfig.get("cost_per_1m_output", 0.0)),
+                )
+                self._prices[f"{provider}:{name}".lower()] = price
+                # Bare names and IDs are priced by the first provider listing them
+                for key in (name, mconfig.get("id")):
+                    if key and key.lower() not in claimed:
+                        claimed.add(key.lower())
+                        self._prices[key.lower()] = price
+
+        for alias, target in (config.get("aliases") or {}).items():
+            price = self._prices.get(str(target).lower())
+            if price is not None:
+                self._prices.setdefault(alias.lower(), price)
+
+    def resolve(self, model: str) -> ModelPrice:
+        """Get the price of a model.
+
+        Args:
+            model: Model name, alias or provider model ID
+
+        Returns:
+            The ModelPrice (the default price for unknown models)
+        """
+        price = self._resolved.get(model)
+        if price is None:
+            price = self._match(model.lower())
+            self._resolved[model] = price
+        return price
+
+    def _match(self, model: str) -> ModelPrice:
+        """Resolve a lower-cased model name without the memo."""
+        price = self._prices.get(model)
+        if price is not None:
+            return price
+        for name in self._names:
+            if name in model:
+                return self._prices[name]
+        if model:
+            for name in reversed(self._names):
+                if model in name:
+                    return self._prices[name]
+        return self.default
+
+    def cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """Cost in USD for the given tokens and model."""
+        return self.resolve(model).cost(input_tokens, output_tokens)
+
+
+_table: Optional[PriceTable] = None
+_table_lock = threading.Lock()
+
+
+def get_price_table() -> PriceTable:
+    """Get the process-wide price table.
+
+    Built on first use from PathConfig.LLM_PROVIDERS_CONFIG.
+    """
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = PriceTable.from_file()
+        return _table
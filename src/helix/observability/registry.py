@@ -0,0 +1,340 @@
+"""In-process metrics registry for HELIX v4.
+
+Live counters, gauges and fixed-bucket histograms, rendered in the
+OpenMetrics text format for Prometheus (see the /metrics endpoint).
+Complements MetricsCollector, which records per-project token usage
+and cost after the fact.
+
+Observations are cheap: a dict lookup for the label set, a bisect over
+the bucket bounds and a few increments under a per-metric lock. Label
+sets are created on first use; keep label values low-cardinality
+(route templates, gate types - not IDs).
+
+Example:
+    from helix.observability.registry import registry
+
+    GATE_SECONDS = registry.histogram(
+        "helix_gate_duration_seconds", "Quality gate duration",
+        labelnames=("gate_type",),
+    )
+
+    with GATE_SECONDS.labels("tests_pass").time():
+        ...
+
+    text = registry.render()  # OpenMetrics exposition, ends with "# EOF"
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Sequence
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Default histogram buckets in seconds (50 ms to 10 min)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0,
+)
+
+# Buckets for in-process latencies (100 us to 10 s)
+FAST_BUCKETS: tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 10.0,
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the OpenMetrics way."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render a label set ({a="1",b="2"})."""
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base class of a metric family with optional labels."""
+
+    TYPE = "unknown"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], _Metric] = {}
+
+    def labels(self, *values: str, **kwargs: str) -> "_Metric":
+        """Get the child metric of a label set.
+
+        Args:
+            *values: Label values in labelnames order
+            **kwargs: Label values by name
+        """
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def _new_child(self) -> "_Metric":
+        raise NotImplementedError
+
+    def _samples(self) -> list[tuple[tuple[str, ...], "_Metric"]]:
+        """(label values, metric) of every label set."""
+        if not self.labelnames:
+            return [((), self)]
+        with self._lock:
+            return sorted(self._children.items())
+
+    def _check_unlabelled(self) -> None:
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}, use labels()")
+
+    def render(self) -> list[str]:
+        """OpenMetrics lines of this family."""
+        lines = [f"# TYPE {self.name} {self.TYPE}"]
+        if self.documentation:
+            lines.append(f"# HELP {self.name} {_escape(self.documentation)}")
+        for values, metric in self._samples():
+            lines.extend(metric._render_sample(self.name, self.labelnames, values))
+        return lines
+
+    def _render_sample(
+        self, name: str, labelnames: Sequence[str], values: Sequence[str]
+    ) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (rendered as <name>_total)."""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+
+    def _new_child(self) -> "Counter":
+        return Counter(self.name, "")
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._check_unlabelled()
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """Current count."""
+        return self._value
+
+    def _render_sample(
+        self, name: str, labelnames: Sequence[str], values: Sequence[str]
+    ) -> list[str]:
+        labels = _format_labels(labelnames, values)
+        return [f"{name}_total{labels} {_format_value(self._value)}"]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is computed at scrape time."""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> "Gauge":
+        return Gauge(self.name, "")
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self._check_unlabelled()
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self._check_unlabelled()
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value on every scrape instead of storing it."""
+        self._check_unlabelled()
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        """Current value."""
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:
+                return math.nan
+        return self._value
+
+    def _render_sample(
+        self, name: str, labelnames: Sequence[str], values: Sequence[str]
+    ) -> list[str]:
+        labels = _format_labels(labelnames, values)
+        return [f"{name}{labels} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        if not bounds:
+            raise ValueError("Histogram needs at least one finite bucket")
+        self.buckets = tuple(bounds)
+        # Per-bucket (non-cumulative) counts, last slot is +Inf
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, "", buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self._check_unlabelled()
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of all observations."""
+        return self._sum
+
+    def _render_sample(
+        self, name: str, labelnames: Sequence[str], values: Sequence[str]
+    ) -> list[str]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            cumulative += count
+            le = 'le="' + _format_value(bound) + '"'
+            lines.append(f"{name}_bucket{_format_labels(labelnames, values, le)} {cumulative}")
+        labels = _format_labels(labelnames, values)
+        lines.append(f"{name}_count{labels} {cumulative}")
+        lines.append(f"{name}_sum{labels} {_format_value(total)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families, rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        """Register a metric, or return the existing one of that name."""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(  # type: ignore[return-value]
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the OpenMetrics text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry
+registry = MetricsRegistry()
@@ -0,0 +1,354 @@
+"""Span tracing for HELIX v4.
+
+Records nested, timed spans of the phase lifecycle (Claude spawn, first
+output, tool calls, verification, gates, escalation) to a per-project
+trace file. Each line of logs/trace.jsonl is a Chrome trace event
+("ph": "X" complete events), so the file can be converted for
+chrome://tracing or https://ui.perfetto.dev with export_chrome_trace().
+
+Tracing is opt-in via HELIX_TRACE:
+- unset, "0" or "false": off
+- "1" or "true": trace every project run
+- a rate between 0 and 1 (e.g. "0.1"): sample that share of runs
+
+When no trace is active, span() returns a shared no-op span, so
+instrumented code costs one context variable lookup.
+
+Example:
+    from helix.observability import tracing
+
+    with tracing.trace(project / "logs" / "trace.jsonl", "project.run"):
+        with tracing.span("gate", gate_type="tests_pass") as span:
+            ...
+            span.set(passed=True)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV = "HELIX_TRACE"
+
+T = TypeVar("T")
+
+
+def sample_rate() -> float:
+    """Share of traces to record, from HELIX_TRACE."""
+    value = os.environ.get(TRACE_ENV, "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return 0.0
+    if value in ("1", "true", "yes", "on"):
+        return 1.0
+    try:
+        return min(max(float(value), 0.0), 1.0)
+    except ValueError:
+        return 0.0
+
+
+def _now_us() -> int:
+    """Monotonic timestamp in microseconds."""
+    return time.perf_counter_ns() // 1000
+
+
+class Trace:
+    """One sampled trace, appended to a JSONL file.
+
+    Attributes:
+        path: Trace file
+        trace_id: Random ID shared by all events of the trace
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.trace_id = uuid.uuid4().hex[:16]
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._span_ids = itertools.count(1)
+        self._tids = itertools.count(1)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def next_span_id(self) -> int:
+        return next(self._span_ids)
+
+    def next_tid(self) -> int:
+        return next(self._tids)
+
+    def write(self, event: dict[str, Any]) -> None:
+        """Append one trace event."""
+        line = json.dumps(event, default=str, ensure_ascii=False)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def event(
+        self,
+        name: str,
+        start_us: int,
+        end_us: int,
+        tid: int,
+        args: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build a complete ("X") Chrome trace event."""
+        return {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": start_us,
+            "dur": max(end_us - start_us, 0),
+            "pid": self._pid,
+            "tid": tid,
+            "args": {"trace_id": self.trace_id, **args},
+        }
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Use as a context manager, or call end() explicitly.
+    """
+
+    __slots__ = ("name", "attrs", "span_id", "parent_id", "tid", "start_us",
+                 "_trace", "_task", "_token", "_ended")
+
+    def __init__(self, trace: Trace, name: str, attrs: dict[str, Any]) -> None:
+        parent = _current_span.get()
+        self.name = name
+        self.attrs = attrs
+        self.span_id = trace.next_span_id()
+        self.parent_id = parent.span_id if parent is not None else None
+        self._trace = trace
+        self._task = _current_task()
+        # Spans of concurrent tasks go on separate tracks
+        if parent is not None and parent._task is self._task:
+            self.tid = parent.tid
+        else:
+            self.tid = trace.next_tid()
+        self.start_us = _now_us()
+        self._token: Optional[Token] = _current_span.set(self)
+        self._ended = False
+
+    def __bool__(self) -> bool:
+        return True
+
+    def set(self, **attrs: Any) -> None:
+        """Add attributes to the span."""
+        self.attrs.update(attrs)
+
+    def end(self, **attrs: Any) -> None:
+        """Finish the span and write it to the trace."""
+        if self._ended:
+            return
+        self._ended = True
+        self.attrs.update(attrs)
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Ended in another context than it was started in
+                pass
+            self._token = None
+        args = {"span_id": self.span_id, "parent_id": self.parent_id, **self.attrs}
+        self._trace.write(self._trace.event(self.name, self.start_us, _now_us(), self.tid, args))
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        self.end()
+
+
+class _NoopSpan:
+    """Span returned when no trace is active."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def end(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("helix_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("helix_span", default=None)
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+def is_active() -> bool:
+    """Whether the current context is being traced."""
+    return _current_trace.get() is not None
+
+
+def span(name: str, **attrs: Any) -> Span | _NoopSpan:
+    """Start a span as child of the current span.
+
+    Args:
+        name: Span name, dotted by component ("claude.run_phase")
+        **attrs: Span attributes
+
+    Returns:
+        The started Span, or NOOP_SPAN if no trace is active
+    """
+    trace_ = _current_trace.get()
+    if trace_ is None:
+        return NOOP_SPAN
+    return Span(trace_, name, attrs)
+
+
+def record_span(name: str, started: float, ended: float | None = None, **attrs: Any) -> None:
+    """Record an already finished span as child of the current span.
+
+    Args:
+        name: Span name
+        started: time.perf_counter() value at the start
+        ended: time.perf_counter() value at the end (default: now)
+        **attrs: Span attributes
+    """
+    trace_ = _current_trace.get()
+    if trace_ is None:
+        return
+    ended = time.perf_counter() if ended is None else ended
+    parent = _current_span.get()
+    args = {
+        "span_id": trace_.next_span_id(),
+        "parent_id": parent.span_id if parent is not None else None,
+        **attrs,
+    }
+    tid = parent.tid if parent is not None else trace_.next_tid()
+    trace_.write(trace_.event(name, int(started * 1_000_000), int(ended * 1_000_000), tid, args))
+
+
+@contextmanager
+def trace(
+    path: Path,
+    name: str,
+    rate: float | None = None,
+    **attrs: Any,
+) -> Iterator[Span | _NoopSpan]:
+    """Trace a block into a trace file, subject to sampling.
+
+    Inside an active trace this is just a nested span; the outer
+    trace file is kept.
+
+    Args:
+        path: JSONL trace file to append to
+        name: Name of the root span
+        rate: Sampling rate (default: from HELIX_TRACE)
+        **attrs: Root span attributes
+
+    Yields:
+        The root Span, or NOOP_SPAN if the trace is not sampled
+    """
+    if _current_trace.get() is not None:
+        with span(name, **attrs) as nested:
+            yield nested
+        return
+
+    rate = sample_rate() if rate is None else rate
+    if rate <= 0.0 or random.random() >= rate:
+        yield NOOP_SPAN
+        return
+
+    try:
+        trace_ = Trace(path)
+    except OSError as e:
+        logger.warning(f"Tracing disabled, cannot open {path}: {e}")
+        yield NOOP_SPAN
+        return
+
+    token = _current_trace.set(trace_)
+    try:
+        with Span(trace_, name, {"wall_time": time.time(), **attrs}) as root:
+            yield root
+    finally:
+        _current_trace.reset(token)
+        trace_.close()
+
+
+def traced(name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator running an async function inside a span."""
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if _current_trace.get() is None:
+                return await func(*args, **kwargs)
+            with span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def load_trace_events(path: Path) -> list[dict[str, Any]]:
+    """Read the trace events of a JSONL trace file (skipping bad lines)."""
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+
+def export_chrome_trace(path: Path, output: Path, trace_id: str | None = None) -> int:
+    """Convert a JSONL trace file to Chrome trace JSON (for Perfetto).
+
+    Args:
+        path: JSONL trace file
+        output: JSON file to write
+        trace_id: Only export this trace (default: all traces)
+
+    Returns:
+        Number of exported events
+    """
+    events = load_trace_events(path)
+    if trace_id is not None:
+        events = [e for e in events if e.get("args", {}).get("trace_id") == trace_id]
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}),
+        encoding="utf-8",
+    )
+    return len(events)
@@ -18,6 +18,7 @@ from typing import Any
 import json
 import yaml
 
+from helix.admission import Priority
 from helix.claude_runner import ClaudeRunner
 
 
@@ -147,7 +148,10 @@ IMPORTANT: Output ONLY the YAML block. No additional text.
             max_phases: Maximum number of phases to generate (1-5).
         """
         self.max_phases = min(max_phases, 5)  # Cap at 5
-        self.runner = ClaudeRunner()
+        self.runner = ClaudeRunner(
+            priority=Priority.VERIFICATION,
+            admission_key="planning-agent",
+        )
 
     async def analyze_and_plan(
         self,
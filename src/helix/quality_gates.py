@@ -6,10 +6,21 @@ Provides deterministic quality checks for phase validation.
 import asyncio
 import subprocess
 import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .observability import tracing
+from .observability.registry import registry
+
+
+GATE_SECONDS = registry.histogram(
+    "helix_gate_duration_seconds",
+    "Duration of a quality gate check",
+    labelnames=("gate_type",),
+)
+
 
 @dataclass
 class GateResult:
@@ -446,6 +457,17 @@ class QualityGateRunner:
         Returns:
             GateResult from the appropriate gate check.
         """
+        started = time.perf_counter()
+        with tracing.span("gate", gate_type=gate_config.get("type")) as span:
+            result = await self._dispatch_gate(phase_dir, gate_config)
+            span.set(passed=result.passed)
+        GATE_SECONDS.labels(result.gate_type).observe(time.perf_counter() - started)
+        return result
+
+    async def _dispatch_gate(
+        self, phase_dir: Path, gate_config: dict[str, Any]
+    ) -> GateResult:
+        """Run the gate check matching the configured type."""
         gate_type = gate_config.get("type")
 
         if gate_type == "files_exist":
@@ -20,12 +20,22 @@ Usage:
 
 CLI:
     python -m helix.quality_gates.adr_files_exist [project_root] [--strict]
+    python -m helix.quality_gates.adr_files_exist --changed-only origin/main
+
+Performance:
+    The gate runs in a single pass over the ADR corpus. ADRs whose status
+    line is not "Implemented" are skipped before any YAML parsing, all
+    declared paths are collected first and then resolved in bulk against a
+    snapshot of the file tree (one directory listing per distinct parent
+    directory instead of one stat per declared file).
 """
 
+import os
 import re
+import subprocess
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import yaml
 
@@ -112,6 +122,10 @@ class ADRFilesExistGate:
     # ADR statuses that require file existence validation
     IMPLEMENTED_STATUSES = {"Implemented", "implemented", "IMPLEMENTED"}
 
+    FRONTMATTER_PATTERN = re.compile(r"^---\n(.+?)\n---", re.DOTALL)
+    # Cheap pre-check of the status line, avoids YAML parsing for skipped ADRs
+    STATUS_LINE_PATTERN = re.compile(r"^status:\s*[\"']?([A-Za-z_-]+)", re.MULTILINE)
+
     def __init__(self, project_root: Path | None = None, adr_dir: Path | None = None):
         """Initialize the quality gate.
 
@@ -122,11 +136,17 @@ class ADRFilesExistGate:
         self.project_root = project_root or Path.cwd()
         self.adr_dir = adr_dir or self.project_root / "adr"
 
-    def _parse_adr_header(self, adr_file: Path) -> dict[str, Any] | None:
+    def _parse_adr_header(
+        self,
+        adr_file: Path,
+        implemented_only: bool = False,
+    ) -> dict[str, Any] | None:
         """Parse the YAML frontmatter from an ADR file.
 
         Args:
             adr_file: Path to ADR markdown file.
+            implemented_only: Return None without parsing the YAML if the
+                status line shows the ADR is not implemented.
 
         Returns:
             Parsed frontmatter dict if valid, None if parsing fails.
@@ -135,84 +155,193 @@ class ADRFilesExistGate:
             content = adr_file.read_text(encoding="utf-8")
 
             # Extract YAML frontmatter between --- markers
-            match = re.match(r"^---\n(.+?)\n---", content, re.DOTALL)
+            match = self.FRONTMATTER_PATTERN.match(content)
             if not match:
                 return None
 
+            if implemented_only:
+                status_match = self.STATUS_LINE_PATTERN.search(match.group(1))
+                if status_match and status_match.group(1) not in self.IMPLEMENTED_STATUSES:
+                    return None
+
             frontmatter = yaml.safe_load(match.group(1))
-            return frontmatter if frontmatter else None
+            return frontmatter if isinstance(frontmatter, dict) and frontmatter else None
 
         except Exception:
             return None
 
-    def _validate_adr(self, adr_file: Path) -> ADRValidation | None:
-        """Validate a single ADR file.
+    def _existing_paths(self, file_paths: Iterable[str]) -> set[str]:
+        """Resolve declared paths against a snapshot of the file tree.
+
+        Each distinct parent directory is listed once; membership of all
+        declared paths is then answered from those listings.
 
         Args:
-            adr_file: Path to ADR file.
+            file_paths: Paths relative to the project root.
 
         Returns:
-            ADRValidation result, or None if not applicable.
+            The subset of file_paths that exist.
         """
-        header = self._parse_adr_header(adr_file)
-        if not header:
-            return None
+        listings: dict[Path, set[str]] = {}
+        existing: set[str] = set()
 
-        adr_id = header.get("adr_id")
-        if not adr_id:
-            return None
+        for file_path in set(file_paths):
+            full_path = self.project_root / file_path
+            name = full_path.name
+            if not name:
+                continue
+            parent = full_path.parent
+            names = listings.get(parent)
+            if names is None:
+                try:
+                    names = set(os.listdir(parent))
+                except OSError:
+                    names = set()
+                listings[parent] = names
+            if name in names:
+                existing.add(file_path)
 
-        status = header.get("status", "")
-        title = header.get("title", "")
+        return existing
 
-        # Only validate implemented ADRs
-        if status not in self.IMPLEMENTED_STATUSES:
-            return None
+    def _changed_adr_names(self, revision: str) -> set[str] | None:
+        """Get names of ADR files touched since a git revision.
 
-        # Get files to check
-        files_section = header.get("files", {})
-        files_create = files_section.get("create", [])
-
-        if not files_create:
-            # No files to check - ADR passes
-            return ADRValidation(
-                adr_id=str(adr_id),
-                adr_file=str(adr_file.relative_to(self.project_root)),
-                title=title,
-                status=status,
-                expected_files=0,
-                existing_files=0,
-                missing_files=[],
-                passed=True,
-            )
+        Includes committed, staged and unstaged changes plus untracked ADRs.
 
-        # Check each file
-        missing = []
-        existing = 0
+        Args:
+            revision: Git revision to compare against (e.g. "origin/main").
 
-        for file_path in files_create:
-            full_path = self.project_root / file_path
-            if full_path.exists():
-                existing += 1
-            else:
-                missing.append(file_path)
-
-        return ADRValidation(
-            adr_id=str(adr_id),
-            adr_file=str(adr_file.relative_to(self.project_root)),
-            title=title,
-            status=status,
-            expected_files=len(files_create),
-            existing_files=existing,
-            missing_files=missing,
-            passed=len(missing) == 0,
+        Returns:
+            Set of ADR file names, or None if git is not available.
+        """
+        commands = [
+            ["git", "diff", "--name-only", revision, "--", str(self.adr_dir)],
+            ["git", "ls-files", "--others", "--exclude-standard", "--", str(self.adr_dir)],
+        ]
+        names: set[str] = set()
+        for command in commands:
+            try:
+                output = subprocess.run(
+                    command,
+                    cwd=self.project_root,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout
+            except (OSError, subprocess.CalledProcessError):
+                return None
+            names.update(Path(line).name for line in output.splitlines() if line)
+        return names
+
+    def _collect_declarations(
+        self,
+        adr_files: list[Path],
+        strict: bool,
+    ) -> list[tuple[dict[str, Any], list[tuple[str, str]]]]:
+        """Collect declared files of all Implemented ADRs in one pass.
+
+        Args:
+            adr_files: ADR files to read.
+            strict: Also collect files.modify declarations.
+
+        Returns:
+            List of (ADR info, [(file_path, action), ...]) tuples.
+        """
+        declarations = []
+
+        for adr_file in adr_files:
+            header = self._parse_adr_header(adr_file, implemented_only=True)
+            if not header:
+                continue
+
+            adr_id = header.get("adr_id")
+            if not adr_id:
+                continue
+
+            status = header.get("status", "")
+            # Only validate implemented ADRs
+            if status not in self.IMPLEMENTED_STATUSES:
+                continue
+
+            files_section = header.get("files") or {}
+            declared = [(str(p), "create") for p in files_section.get("create") or []]
+            if strict:
+                declared += [(str(p), "modify") for p in files_section.get("modify") or []]
+
+            info = {
+                "adr_id": str(adr_id),
+                "adr_file": str(adr_file.relative_to(self.project_root)),
+                "title": header.get("title", ""),
+                "status": status,
+            }
+            declarations.append((info, declared))
+
+        return declarations
+
+    def _evaluate(
+        self,
+        declarations: list[tuple[dict[str, Any], list[tuple[str, str]]]],
+    ) -> tuple[list[ADRValidation], list[MissingFile]]:
+        """Evaluate all declarations against one file tree snapshot.
+
+        Args:
+            declarations: Output of _collect_declarations().
+
+        Returns:
+            Tuple of per-ADR validations and all missing files.
+        """
+        existing = self._existing_paths(
+            file_path for _, declared in declarations for file_path, _ in declared
         )
 
-    async def check(self, strict: bool = False) -> GateResult:
+        validations: list[ADRValidation] = []
+        all_missing: list[MissingFile] = []
+
+        for info, declared in declarations:
+            missing = [file_path for file_path, _ in declared if file_path not in existing]
+            validations.append(ADRValidation(
+                adr_id=info["adr_id"],
+                adr_file=info["adr_file"],
+                title=info["title"],
+                status=info["status"],
+                expected_files=len(declared),
+                existing_files=len(declared) - len(missing),
+                missing_files=missing,
+                passed=not missing,
+            ))
+            all_missing.extend(
+                MissingFile(
+                    file_path=file_path,
+                    adr_id=f"ADR-{info['adr_id']}",
+                    adr_file=info["adr_file"],
+                    action=action,
+                )
+                for file_path, action in declared
+                if file_path not in existing
+            )
+
+        return validations, all_missing
+
+    def _validate_adr(self, adr_file: Path, strict: bool = False) -> ADRValidation | None:
+        """Validate a single ADR file.
+
+        Args:
+            adr_file: Path to ADR file.
+            strict: Also check files.modify declarations.
+
+        Returns:
+            ADRValidation result, or None if not applicable.
+        """
+        validations, _ = self._evaluate(self._collect_declarations([adr_file], strict))
+        return validations[0] if validations else None
+
+    async def check(self, strict: bool = False, changed_since: str | None = None) -> GateResult:
         """Run the validation.
 
         Args:
             strict: If True, also check files.modify declarations.
+            changed_since: Only check ADRs touched since this git revision.
+                Falls back to all ADRs if git is unavailable.
 
         Returns:
             GateResult indicating pass/fail with details.
@@ -224,7 +353,22 @@ class ADRFilesExistGate:
                 details={},
             )
 
-        adr_files = sorted(self.adr_dir.glob("*.md"))
+        # Skip INDEX.md and other non-ADR files
+        adr_files = sorted(
+            f for f in self.adr_dir.glob("*.md")
+            if f.name not in ("INDEX.md", "README.md")
+        )
+
+        if changed_since:
+            changed = self._changed_adr_names(changed_since)
+            if changed is not None:
+                adr_files = [f for f in adr_files if f.name in changed]
+                if not adr_files:
+                    return GateResult(
+                        passed=True,
+                        message=f"No ADRs changed since {changed_since} - nothing to validate",
+                        details={},
+                    )
 
         if not adr_files:
             return GateResult(
@@ -233,28 +377,9 @@ class ADRFilesExistGate:
                 details={},
             )
 
-        validations: list[ADRValidation] = []
-        all_missing: list[MissingFile] = []
-
-        for adr_file in adr_files:
-            # Skip INDEX.md and other non-ADR files
-            if adr_file.name in ("INDEX.md", "README.md"):
-                continue
-
-            validation = self._validate_adr(adr_file)
-            if validation:
-                validations.append(validation)
-
-                # Collect missing files
-                for missing_path in validation.missing_files:
-                    all_missing.append(
-                        MissingFile(
-                            file_path=missing_path,
-                            adr_id=f"ADR-{validation.adr_id}",
-                            adr_file=validation.adr_file,
-                            action="create",
-                        )
-                    )
+        validations, all_missing = self._evaluate(
+            self._collect_declarations(adr_files, strict)
+        )
 
         # Calculate summary
         total_adrs = len(validations)
@@ -289,18 +414,19 @@ class ADRFilesExistGate:
             },
         )
 
-    def check_sync(self, strict: bool = False) -> GateResult:
+    def check_sync(self, strict: bool = False, changed_since: str | None = None) -> GateResult:
         """Synchronous version of check.
 
         Args:
             strict: If True, also check files.modify declarations.
+            changed_since: Only check ADRs touched since this git revision.
 
         Returns:
             GateResult indicating pass/fail with details.
         """
         import asyncio
 
-        return asyncio.run(self.check(strict=strict))
+        return asyncio.run(self.check(strict=strict, changed_since=changed_since))
 
     def format_report(self, result: GateResult) -> str:
         """Format a human-readable report from the gate result.
@@ -395,12 +521,17 @@ def main():
         action="store_true",
         help="Output result as JSON",
     )
+    parser.add_argument(
+        "--changed-only",
+        metavar="REV",
+        help="Only check ADRs changed since git revision REV (e.g. HEAD, origin/main)",
+    )
 
     args = parser.parse_args()
 
     root = Path(args.project_root)
     gate = ADRFilesExistGate(project_root=root)
-    result = gate.check_sync(strict=args.strict)
+    result = gate.check_sync(strict=args.strict, changed_since=args.changed_only)
 
     if args.json:
         import json
@@ -3,6 +3,8 @@ import subprocess
 from pathlib import Path
 from dataclasses import dataclass
 
+from helix.admission import Priority, get_admission_controller
+
 
 @dataclass
 class VerifyResult:
@@ -31,15 +33,16 @@ class ConsultantVerifier:
         adr_content = adr_path.read_text()
         prompt = self._build_prompt(adr_content, auto_checks)
 
-        # Spawn Consultant
+        # Spawn Consultant (waits for a Claude process slot)
         try:
-            result = subprocess.run(
-                [str(self.spawn_script), prompt],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=str(self.helix_root)
-            )
+            with get_admission_controller().slot_blocking(Priority.VERIFICATION, "consultant-verify"):
+                result = subprocess.run(
+                    [str(self.spawn_script), prompt],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    cwd=str(self.helix_root)
+                )
             verdict = result.stdout
         except subprocess.TimeoutExpired:
             verdict = "VERDICT: FAILED - Timeout"
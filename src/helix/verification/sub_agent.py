@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Optional, Any
 import json
 
+from helix.admission import Priority
 from helix.claude_runner import ClaudeRunner
 
 
@@ -98,7 +99,10 @@ IMPORTANT: Output ONLY the JSON block, nothing else.
             max_retries: Maximum verification attempts per phase.
         """
         self.max_retries = max_retries
-        self.runner = ClaudeRunner()
+        self.runner = ClaudeRunner(
+            priority=Priority.VERIFICATION,
+            admission_key="sub-agent-verifier",
+        )
 
     async def verify_phase(
         self,
@@ -0,0 +1,162 @@
+"""Tests for corpus-wide ADR validation.
+
+Tests cover:
+- Validating all ADRs of a directory
+- Content-hash cache reuse and invalidation
+- Parallel execution through the process pool
+- The validate-adrs CLI command
+"""
+
+import json
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+from click.testing import CliRunner
+
+from helix.adr import batch
+from helix.adr.batch import CorpusSummary, validate_corpus
+
+
+VALID_ADR = dedent('''
+    ---
+    adr_id: "{adr_id}"
+    title: Feature {adr_id}
+    status: Proposed
+    component_type: TOOL
+    classification: NEW
+    change_scope: minor
+    ---
+
+    # ADR-{adr_id}: Feature
+
+    ## Kontext
+    Aktuelles Problem beim Schreiben von ADRs. Wir brauchen eine bessere Struktur.
+
+    ## Entscheidung
+    Wir führen ein erweitertes ADR-Template v2 ein mit klaren Richtlinien.
+
+    ## Implementation
+    Die Implementation dieses ADRs umfasst mehrere Schritte und Änderungen.
+
+    ## Dokumentation
+    Diese Section beschreibt die Doku-Anforderungen an das Feature.
+
+    ## Akzeptanzkriterien
+    - [ ] Erstes Kriterium ist erfüllt
+    - [ ] Zweites Kriterium ist erfüllt
+    - [ ] Drittes Kriterium ist erfüllt
+
+    ## Konsequenzen
+    Vorteile und Nachteile der Entscheidung werden hier beschrieben.
+''').strip()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a project with two valid ADRs, one invalid ADR and an INDEX."""
+    adr_dir = tmp_path / "adr"
+    adr_dir.mkdir()
+    (adr_dir / "001-first.md").write_text(VALID_ADR.format(adr_id="001"), encoding="utf-8")
+    (adr_dir / "002-second.md").write_text(VALID_ADR.format(adr_id="002"), encoding="utf-8")
+    (adr_dir / "003-broken.md").write_text("# No frontmatter\n", encoding="utf-8")
+    (adr_dir / "INDEX.md").write_text("# Index\n", encoding="utf-8")
+    return tmp_path
+
+
+def _by_name(results) -> dict:
+    return {Path(r.adr_file).name: r for r in results}
+
+
+class TestValidateCorpus:
+    """Tests for validate_corpus()."""
+
+    def test_validates_all_adrs(self, project: Path):
+        results = _by_name(validate_corpus(project / "adr", workers=1))
+
+        assert set(results) == {"001-first.md", "002-second.md", "003-broken.md"}
+        assert results["001-first.md"].valid is True
+        assert results["003-broken.md"].valid is False
+        assert results["003-broken.md"].errors
+
+    def test_unchanged_adrs_come_from_cache(self, project: Path):
+        list(validate_corpus(project / "adr", workers=1))
+        assert (project / ".helix" / "adr-validation-cache.json").exists()
+
+        (project / "adr" / "002-second.md").write_text("# Changed\n", encoding="utf-8")
+        results = _by_name(validate_corpus(project / "adr", workers=1))
+
+        assert results["001-first.md"].cached is True
+        assert results["002-second.md"].cached is False
+        assert results["002-second.md"].valid is False
+
+    def test_no_cache_revalidates(self, project: Path):
+        list(validate_corpus(project / "adr", workers=1))
+        results = list(validate_corpus(project / "adr", workers=1, use_cache=False))
+
+        assert not any(r.cached for r in results)
+
+    def test_rules_change_invalidates_cache(self, project: Path):
+        rules = project / "config" / "adr-completeness-rules.yaml"
+        rules.parent.mkdir()
+        rules.write_text("contextual_rules: []\n", encoding="utf-8")
+        list(validate_corpus(project / "adr", workers=1))
+
+        rules.write_text(dedent('''
+            contextual_rules:
+              - id: minor-needs-migration
+                name: Minor braucht Migration
+                when:
+                  change_scope: minor
+                require:
+                  sections:
+                    - name: Migration
+                severity: error
+                message: Migration fehlt
+        '''), encoding="utf-8")
+        results = _by_name(validate_corpus(project / "adr", workers=1))
+
+        assert not results["001-first.md"].cached
+        assert results["001-first.md"].valid is False
+        assert any("Migration fehlt" in e for e in results["001-first.md"].errors)
+
+    def test_process_pool_matches_inline(self, project: Path, monkeypatch):
+        monkeypatch.setattr(batch, "MIN_PARALLEL_ADRS", 1)
+
+        inline = _by_name(validate_corpus(project / "adr", workers=1, use_cache=False))
+        pooled = _by_name(validate_corpus(project / "adr", workers=2, use_cache=False))
+
+        assert {k: (r.valid, r.errors) for k, r in inline.items()} == {
+            k: (r.valid, r.errors) for k, r in pooled.items()
+        }
+
+    def test_summary(self, project: Path):
+        summary = CorpusSummary()
+        for result in validate_corpus(project / "adr", workers=1):
+            summary.add(result)
+
+        assert (summary.total, summary.valid, summary.invalid) == (3, 2, 1)
+        assert summary.passed is False
+
+
+class TestValidateADRsCommand:
+    """Tests for the validate-adrs CLI command."""
+
+    def test_streams_json_lines_and_fails_on_errors(self, project: Path):
+        from helix.cli.main import cli
+
+        result = CliRunner().invoke(cli, ["validate-adrs", str(project / "adr"), "-w", "1"])
+
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert result.exit_code == 1
+        assert len(lines) == 4
+        assert lines[-1]["summary"]["invalid"] == 1
+
+    def test_passes_when_all_valid(self, project: Path):
+        from helix.cli.main import cli
+
+        (project / "adr" / "003-broken.md").unlink()
+        result = CliRunner().invoke(cli, ["validate-adrs", str(project / "adr")])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output.splitlines()[-1])["summary"]["passed"] is True
@@ -0,0 +1,143 @@
+"""Tests for the adr_files_exist quality gate.
+
+Tests cover:
+- Missing and present files.create declarations
+- files.modify declarations in strict mode
+- Restricting the check to ADRs changed since a git revision
+
+The module is loaded from its file because helix/quality_gates.py
+shadows the helix.quality_gates package.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "src" / "helix" / "quality_gates" / "adr_files_exist.py"
+)
+_spec = importlib.util.spec_from_file_location("adr_files_exist", _MODULE_PATH)
+adr_files_exist = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = adr_files_exist
+_spec.loader.exec_module(adr_files_exist)
+
+ADRFilesExistGate = adr_files_exist.ADRFilesExistGate
+
+
+def _write_adr(
+    root: Path,
+    adr_id: str,
+    create: list[str],
+    modify: list[str] | None = None,
+    status: str = "Implemented",
+) -> Path:
+    lines = ["---", f'adr_id: "{adr_id}"', f"title: ADR {adr_id}", f"status: {status}", "files:"]
+    lines += ["  create:"] + [f"    - {p}" for p in create]
+    lines += ["  modify:"] + [f"    - {p}" for p in modify or []]
+    lines += ["---", "", f"# ADR-{adr_id}", ""]
+    adr_file = root / "adr" / f"{adr_id}-adr.md"
+    adr_file.parent.mkdir(parents=True, exist_ok=True)
+    adr_file.write_text("\n".join(lines))
+    return adr_file
+
+
+def _touch(root: Path, *paths: str) -> None:
+    for path in paths:
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text("")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=root, check=True, capture_output=True,
+    )
+
+
+class TestADRFilesExistGate:
+    """Tests for the bulk file existence pass."""
+
+    def test_missing_files_reported(self, tmp_path: Path):
+        """Test that missing files.create entries fail the gate."""
+        _touch(tmp_path, "src/a.py")
+        _write_adr(tmp_path, "001", ["src/a.py", "src/missing.py", "docs/gone.md"])
+
+        result = ADRFilesExistGate(project_root=tmp_path).check_sync()
+
+        assert not result.passed
+        assert sorted(m["file_path"] for m in result.details["missing"]) == [
+            "docs/gone.md", "src/missing.py",
+        ]
+        validation = result.details["validations"][0]
+        assert (validation["existing_files"], validation["expected_files"]) == (1, 3)
+
+    def test_present_files_pass(self, tmp_path: Path):
+        """Test that existing files pass and non-implemented ADRs are skipped."""
+        _touch(tmp_path, "src/a.py", "src/pkg/b.py")
+        _write_adr(tmp_path, "001", ["src/a.py", "src/pkg/b.py"])
+        _write_adr(tmp_path, "002", ["src/not_yet.py"], status="Proposed")
+
+        result = ADRFilesExistGate(project_root=tmp_path).check_sync()
+
+        assert result.passed
+        assert result.details["summary"]["total_adrs_checked"] == 1
+
+    def test_modify_declarations_only_in_strict_mode(self, tmp_path: Path):
+        """Test that files.modify entries are checked with strict=True."""
+        _touch(tmp_path, "src/a.py")
+        _write_adr(tmp_path, "001", ["src/a.py"], modify=["src/old.py"])
+        gate = ADRFilesExistGate(project_root=tmp_path)
+
+        assert gate.check_sync().passed
+
+        result = gate.check_sync(strict=True)
+        assert not result.passed
+        assert result.details["missing"] == [{
+            "file_path": "src/old.py", "adr_id": "ADR-001",
+            "adr_file": "adr/001-adr.md", "action": "modify",
+        }]
+
+
+class TestChangedOnly:
+    """Tests for --changed-only REV."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        _write_adr(tmp_path, "001", ["src/missing_old.py"])
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "base")
+        return tmp_path
+
+    def test_only_changed_adrs_checked(self, repo: Path):
+        """Test that untouched ADRs are skipped and new ones checked."""
+        _write_adr(repo, "002", ["src/missing_new.py"])
+
+        result = ADRFilesExistGate(project_root=repo).check_sync(changed_since="HEAD")
+
+        assert [m["file_path"] for m in result.details["missing"]] == ["src/missing_new.py"]
+
+    def test_nothing_changed(self, repo: Path):
+        """Test that no changed ADRs pass without validation."""
+        result = ADRFilesExistGate(project_root=repo).check_sync(changed_since="HEAD")
+
+        assert result.passed
+        assert "No ADRs changed since HEAD" in result.message
+
+    def test_cli(self, repo: Path, monkeypatch, capsys):
+        """Test the --changed-only command line option."""
+        (repo / "adr" / "001-adr.md").write_text(
+            (repo / "adr" / "001-adr.md").read_text().replace("missing_old", "still_missing")
+        )
+        monkeypatch.setattr(
+            sys, "argv", ["adr_files_exist", str(repo), "--changed-only", "HEAD", "--json"]
+        )
+
+        assert adr_files_exist.main() == 1
+        assert "src/still_missing.py" in capsys.readouterr().out
@@ -4,6 +4,7 @@ Tests the central orchestration logic from helix.api.orchestrator.
 """
 
 import asyncio
+import json
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,7 +19,7 @@ from helix.claude_runner import ClaudeResult
 from helix.phase_loader import PhaseConfig
 from helix.quality_gates import GateResult
 from helix.evolution.verification import VerificationResult
-from helix.escalation import EscalationAction, EscalationLevel, ActionType
+from helix.escalation import EscalationAction, EscalationLevel, EscalationManager, ActionType
 
 
 class TestPhaseEvent:
@@ -329,6 +330,271 @@ class TestUnifiedOrchestratorRunProject:
         assert "Failed to load phases" in result.errors[0]
 
 
+class TestSessionResumingRetries:
+    """Tests for retries that resume the previous Claude session."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Orchestrator whose first verification fails, then passes."""
+        orchestrator = UnifiedOrchestrator()
+        orchestrator.phase_loader = MagicMock()
+        orchestrator.phase_loader.load_phases.return_value = [
+            PhaseConfig(
+                id="01-test",
+                name="Test Phase",
+                type="development",
+                output=["output/result.py"],
+            ),
+        ]
+        orchestrator.claude_runner = MagicMock()
+        orchestrator.claude_runner.run_phase = AsyncMock(
+            return_value=ClaudeResult(
+                success=True,
+                exit_code=0,
+                stdout="Done",
+                stderr="",
+                session_id="session-1",
+                duration_seconds=60.0,
+                usage={"input_tokens": 50_000, "output_tokens": 2_000},
+            )
+        )
+        orchestrator.claude_runner.continue_session = AsyncMock(
+            return_value=ClaudeResult(
+                success=True,
+                exit_code=0,
+                stdout="Fixed",
+                stderr="",
+                session_id="session-1",
+                duration_seconds=5.0,
+                usage={"input_tokens": 1_000, "cache_read_input_tokens": 9_000, "output_tokens": 300},
+            )
+        )
+        return orchestrator
+
+    def _verifier(self):
+        verifier = MagicMock()
+        verifier.verify_phase_output.side_effect = [
+            VerificationResult(success=False, missing_files=["output/result.py"], message="Missing"),
+            VerificationResult(success=True, found_files=["output/result.py"]),
+        ]
+        verifier.format_retry_prompt.return_value = "Create output/result.py"
+        return verifier
+
+    @pytest.fixture
+    def project_dir(self, tmp_path):
+        project_dir = tmp_path / "test-project"
+        (project_dir / "phases" / "01-test").mkdir(parents=True)
+        return project_dir
+
+    @pytest.mark.asyncio
+    async def test_retry_resumes_previous_session(self, orchestrator, project_dir):
+        """A failed verification is retried via --resume with the feedback."""
+        with patch("helix.api.orchestrator.PhaseVerifier", return_value=self._verifier()):
+            result = await orchestrator.run_project(project_dir)
+
+        assert result.success is True
+        assert orchestrator.claude_runner.run_phase.await_count == 1
+        call = orchestrator.claude_runner.continue_session.await_args.kwargs
+        assert call["session_id"] == "session-1"
+        assert call["prompt"] == "Create output/result.py"
+        assert call["cwd"] == project_dir / "phases" / "01-test"
+
+        attempts = result.phase_results[0]["attempts"]
+        assert [a["mode"] for a in attempts] == ["cold", "resume"]
+        assert attempts[0]["input_tokens"] == 50_000
+        assert attempts[1]["input_tokens"] == 10_000
+        assert attempts[1]["duration_seconds"] == 5.0
+
+    @pytest.mark.asyncio
+    async def test_failed_resume_falls_back_to_cold_run(self, orchestrator, project_dir):
+        """If --resume fails, the retry starts a cold run."""
+        orchestrator.claude_runner.continue_session.return_value = ClaudeResult(
+            success=False, exit_code=1, stdout="", stderr="No conversation found",
+        )
+        events: list[PhaseEvent] = []
+
+        async def collect(event: PhaseEvent):
+            events.append(event)
+
+        with patch("helix.api.orchestrator.PhaseVerifier", return_value=self._verifier()):
+            orchestrator.claude_runner.run_phase_streaming = orchestrator.claude_runner.run_phase
+            result = await orchestrator.run_project(project_dir, on_event=collect)
+
+        assert result.success is True
+        assert orchestrator.claude_runner.run_phase.await_count == 2
+        assert "resume_failed" in [e.event_type for e in events]
+        modes = [e.data["mode"] for e in events if e.event_type == "attempt_complete"]
+        assert modes == ["cold", "resume", "cold"]
+
+        # The failed resume is accounted as its own run
+        attempts = result.phase_results[0]["attempts"]
+        assert [(a["attempt"], a["mode"], a["success"]) for a in attempts] == [
+            (1, "cold", True), (2, "resume", False), (2, "cold", True),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_retry_runs_real_continue_session(self, orchestrator, project_dir):
+        """The retry drives ClaudeRunner.continue_session end to end."""
+        from helix.claude_runner import ClaudeRunner
+
+        runner = ClaudeRunner(claude_cmd="claude", use_stdbuf=False, venv_path=None)
+        runner.run_phase = orchestrator.claude_runner.run_phase
+        orchestrator.claude_runner = runner
+
+        result_event = {
+            "type": "result", "session_id": "session-2",
+            "usage": {"input_tokens": 800, "output_tokens": 200},
+        }
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(
+            return_value=((json.dumps(result_event) + "\n").encode(), b"")
+        )
+        spawn = AsyncMock(return_value=process)
+
+        with patch("helix.api.orchestrator.PhaseVerifier", return_value=self._verifier()), \
+                patch("asyncio.create_subprocess_exec", spawn):
+            result = await orchestrator.run_project(project_dir)
+
+        assert result.success is True
+        cmd = spawn.await_args.args
+        assert cmd[cmd.index("--resume") + 1] == "session-1"
+        assert cmd[-1] == "Create output/result.py"
+        assert spawn.await_args.kwargs["cwd"] == project_dir / "phases" / "01-test"
+        attempts = result.phase_results[0]["attempts"]
+        assert [a["mode"] for a in attempts] == ["cold", "resume"]
+        assert attempts[1]["input_tokens"] == 800
+
+    @pytest.mark.asyncio
+    async def test_resume_disabled(self, orchestrator, project_dir):
+        """With resume_retries=False every attempt is a cold run."""
+        orchestrator.resume_retries = False
+
+        with patch("helix.api.orchestrator.PhaseVerifier", return_value=self._verifier()):
+            result = await orchestrator.run_project(project_dir)
+
+        assert result.success is True
+        assert orchestrator.claude_runner.run_phase.await_count == 2
+        orchestrator.claude_runner.continue_session.assert_not_awaited()
+
+
+class TestPhaseCache:
+    """Tests for skipping phases whose inputs are unchanged."""
+
+    @pytest.fixture
+    def project_dir(self, tmp_path):
+        project_dir = tmp_path / "test-project"
+        for phase_id in ("01-plan", "02-build"):
+            phase_dir = project_dir / "phases" / phase_id
+            (phase_dir / "input").mkdir(parents=True)
+            (phase_dir / "CLAUDE.md").write_text(f"# {phase_id}\n")
+        (project_dir / "phases" / "01-plan" / "input" / "spec.md").write_text("v1\n")
+        return project_dir
+
+    def _orchestrator(self, **kwargs):
+        orchestrator = UnifiedOrchestrator(**kwargs)
+        orchestrator.phase_loader = MagicMock()
+        orchestrator.phase_loader.load_phases.return_value = [
+            PhaseConfig(id="01-plan", name="Plan", type="meeting", output=["output/plan.md"]),
+            PhaseConfig(id="02-build", name="Build", type="development", output=["output/main.py"]),
+        ]
+
+        async def run_phase(phase_dir, **_):
+            output = phase_dir / "output"
+            output.mkdir(exist_ok=True)
+            name = "plan.md" if phase_dir.name == "01-plan" else "main.py"
+            (output / name).write_text(f"# generated by {phase_dir.name}\n")
+            return ClaudeResult(success=True, exit_code=0, stdout="Done", stderr="")
+
+        orchestrator.claude_runner = MagicMock()
+        orchestrator.claude_runner.run_phase = AsyncMock(side_effect=run_phase)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_unchanged_phases_are_restored(self, project_dir):
+        """A re-run restores outputs without invoking Claude."""
+        await self._orchestrator().run_project(project_dir)
+        (project_dir / "phases" / "02-build" / "output" / "main.py").unlink()
+
+        orchestrator = self._orchestrator()
+        events: list[PhaseEvent] = []
+
+        async def collect(event: PhaseEvent):
+            events.append(event)
+
+        result = await orchestrator.run_project(project_dir, on_event=collect)
+
+        assert result.success is True
+        assert result.phases_completed == 2
+        orchestrator.claude_runner.run_phase.assert_not_awaited()
+        assert [r["cached"] for r in result.phase_results] == [True, True]
+        assert [e.phase_id for e in events if e.event_type == "phase_cached"] == [
+            "01-plan", "02-build",
+        ]
+        restored = project_dir / "phases" / "02-build" / "output" / "main.py"
+        assert restored.read_text() == "# generated by 02-build\n"
+
+    @pytest.mark.asyncio
+    async def test_changed_input_reruns_phase(self, project_dir):
+        """Changing an input re-runs the phase; identical outputs keep downstream cached."""
+        await self._orchestrator().run_project(project_dir)
+        (project_dir / "phases" / "01-plan" / "input" / "spec.md").write_text("v2\n")
+
+        orchestrator = self._orchestrator()
+        result = await orchestrator.run_project(project_dir)
+
+        assert result.success is True
+        assert orchestrator.claude_runner.run_phase.await_count == 1
+        assert [r["cached"] for r in result.phase_results] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_changed_output_invalidates_downstream(self, project_dir):
+        """Different upstream outputs re-run the downstream phase only."""
+        await self._orchestrator().run_project(project_dir)
+        (project_dir / "phases" / "01-plan" / "CLAUDE.md").write_text("# new plan\n")
+
+        orchestrator = self._orchestrator()
+        generate = orchestrator.claude_runner.run_phase.side_effect
+
+        async def run_phase(phase_dir, **kwargs):
+            result = await generate(phase_dir, **kwargs)
+            if phase_dir.name == "01-plan":
+                (phase_dir / "output" / "plan.md").write_text("# different plan\n")
+            return result
+
+        orchestrator.claude_runner.run_phase.side_effect = run_phase
+        result = await orchestrator.run_project(project_dir)
+
+        assert result.success is True
+        assert [r["cached"] for r in result.phase_results] == [False, False]
+
+    @pytest.mark.asyncio
+    async def test_no_cache_forces_rerun(self, project_dir):
+        """use_cache=False invokes Claude for every phase."""
+        await self._orchestrator().run_project(project_dir)
+
+        orchestrator = self._orchestrator(use_cache=False)
+        result = await orchestrator.run_project(project_dir)
+
+        assert result.success is True
+        assert orchestrator.claude_runner.run_phase.await_count == 2
+        assert not any(r["cached"] for r in result.phase_results)
+
+    @pytest.mark.asyncio
+    async def test_failed_phase_is_not_cached(self, project_dir):
+        """A failing phase is re-run on the next attempt."""
+        failing = self._orchestrator()
+        failing.claude_runner.run_phase = AsyncMock(
+            return_value=ClaudeResult(success=False, exit_code=1, stdout="", stderr="boom")
+        )
+        await failing.run_project(project_dir)
+
+        orchestrator = self._orchestrator()
+        result = await orchestrator.run_project(project_dir)
+
+        assert result.success is True
+        assert orchestrator.claude_runner.run_phase.await_count == 2
+
+
 class TestUnifiedOrchestratorQualityGates:
     """Tests for quality gate handling."""
 
@@ -443,6 +709,69 @@ class TestUnifiedOrchestratorQualityGates:
         assert any(e.event_type == "gate_failed" for e in events)
         assert any(e.event_type == "escalation" for e in events)
 
+    @pytest.mark.asyncio
+    async def test_hedged_model_switch(self, orchestrator_with_gate, tmp_path):
+        """A hedged model switch races the escalation models."""
+        project_dir = tmp_path / "test-project"
+        (project_dir / "phases" / "01-test").mkdir(parents=True)
+        orchestrator_with_gate.phase_loader.load_phases.return_value[0].config = {
+            "model": "claude-3-haiku",
+            "hedge": {"models": 2},
+        }
+        orchestrator_with_gate.escalation_manager = EscalationManager()
+
+        async def run_gate(phase_dir, gate_config):
+            passed = phase_dir.name.endswith("hedge-1")
+            return GateResult(passed=passed, gate_type="files_exist", message="")
+
+        orchestrator_with_gate.gate_runner.run_gate = AsyncMock(side_effect=run_gate)
+        events: list[PhaseEvent] = []
+
+        async def collect(e: PhaseEvent):
+            events.append(e)
+
+        with patch("helix.api.orchestrator.PhaseVerifier"):
+            result = await orchestrator_with_gate.run_project(project_dir, on_event=collect)
+
+        assert result.success is True
+        hedge = [a for a in result.phase_results[0]["attempts"] if a["mode"] == "hedge"]
+        assert [a["model"] for a in hedge] == ["claude-3-sonnet", "claude-3-opus"]
+        assert [a["status"] for a in hedge] == ["failed", "passed"]
+        assert any(e.event_type == "hedge_complete" for e in events)
+
+    @pytest.mark.asyncio
+    async def test_hedge_candidates_recorded_in_metrics(self, orchestrator_with_gate, tmp_path):
+        """Every hedge candidate is credited to the phase metrics."""
+        from helix.observability import MetricsCollector
+        from helix.observability.ledger import UsageLedger
+
+        project_dir = tmp_path / "test-project"
+        (project_dir / "phases" / "01-test").mkdir(parents=True)
+        orchestrator_with_gate.phase_loader.load_phases.return_value[0].config = {
+            "model": "claude-3-haiku",
+            "hedge": {"models": 2},
+        }
+        orchestrator_with_gate.escalation_manager = EscalationManager()
+        orchestrator_with_gate.gate_runner.run_gate = AsyncMock(
+            side_effect=lambda phase_dir, _: GateResult(
+                passed=phase_dir.name.endswith("hedge-1"), gate_type="files_exist", message="",
+            )
+        )
+        orchestrator_with_gate.metrics = MetricsCollector(
+            project_dir, ledger=UsageLedger(tmp_path / "usage.db")
+        )
+        orchestrator_with_gate.metrics.start_project("test-project")
+
+        with patch("helix.api.orchestrator.PhaseVerifier"):
+            await orchestrator_with_gate.run_project(project_dir)
+
+        phase = orchestrator_with_gate.metrics.end_project().phases["01-test"]
+        # Candidates are recorded as they settle, in race order
+        assert sorted((c["model"], c["status"]) for c in phase.hedge_candidates) == [
+            ("claude-3-opus", "passed"), ("claude-3-sonnet", "failed"),
+        ]
+        assert phase.success is True
+
 
 class TestUnifiedOrchestratorStreaming:
     """Tests for streaming execution."""
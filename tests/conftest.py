@@ -36,6 +36,14 @@ import shutil
 from unittest.mock import MagicMock
 
 
+@pytest.fixture(autouse=True)
+def isolated_usage_ledger(tmp_path, monkeypatch):
+    """Keep tests from writing into the real usage ledger."""
+    from helix.config.paths import PathConfig
+
+    monkeypatch.setattr(PathConfig, "USAGE_LEDGER", tmp_path / "usage.db")
+
+
 @pytest.fixture
 def temp_dir(tmp_path):
     """Provide a temporary directory for tests.
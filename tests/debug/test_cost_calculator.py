@@ -0,0 +1,129 @@
+"""Tests for cost_calculator and the shared model price table."""
+
+import threading
+
+import pytest
+
+from helix.debug.cost_calculator import CostCalculator
+from helix.observability.metrics import MetricsCollector, calculate_cost
+from helix.observability.pricing import ModelPrice, PriceTable
+
+
+@pytest.fixture
+def calc() -> CostCalculator:
+    """Create a fresh CostCalculator instance."""
+    return CostCalculator(project_id="test-project")
+
+
+class TestPriceTable:
+    """Tests for model price resolution."""
+
+    def test_resolution_order(self):
+        """Test exact names beat substring matches."""
+        table = PriceTable()
+
+        assert table.resolve("gpt-4o-mini") == ModelPrice(0.15, 0.60)
+        assert table.resolve("gpt-4o") == ModelPrice(2.50, 10.00)
+        assert table.resolve("claude-sonnet-4-20250514") == ModelPrice(3.00, 15.00)
+        assert table.resolve("opus") == ModelPrice(15.00, 75.00)
+        assert table.resolve("unknown-model") == table.default
+
+    def test_config_prices_and_aliases(self):
+        """Test prices, IDs and aliases from llm-providers.yaml."""
+        config = {
+            "providers": {
+                "openrouter": {"models": {"gpt-4o": {
+                    "id": "openai/gpt-4o", "cost_per_1m_input": 2.5, "cost_per_1m_output": 10.0,
+                }}},
+                "openai": {"models": {"gpt-4o": {
+                    "id": "gpt-4o", "cost_per_1m_input": 5.0, "cost_per_1m_output": 15.0,
+                }}},
+            },
+            "aliases": {"gpt4": "openai:gpt-4o"},
+        }
+        table = PriceTable(config=config)
+
+        assert table.resolve("gpt-4o") == ModelPrice(2.5, 10.0)
+        assert table.resolve("openai/gpt-4o") == ModelPrice(2.5, 10.0)
+        assert table.resolve("openai:gpt-4o") == ModelPrice(5.0, 15.0)
+        assert table.resolve("gpt4") == ModelPrice(5.0, 15.0)
+
+    def test_calculate_cost(self):
+        """Test the module-level helper."""
+        assert calculate_cost(1_000_000, 1_000_000, "claude-opus-4") == pytest.approx(90.0)
+
+
+class TestCostCalculator:
+    """Tests for per-phase cost tracking."""
+
+    def test_record_usage_from_tokens(self, calc: CostCalculator):
+        """Test cost calculated from tokens."""
+        calc.start_phase("01", model="claude-opus-4")
+        calc.record_usage(input_tokens=1_000_000, output_tokens=0)
+        phase = calc.end_phase()
+
+        assert phase.cost_usd == pytest.approx(15.0)
+        assert calc.get_project_totals()["total_cost_usd"] == pytest.approx(15.0)
+
+    def test_concurrent_phases_by_id(self, calc: CostCalculator):
+        """Test explicit phase_id credits the right phase."""
+        calc.start_phase("01")
+        calc.start_phase("expert-frontend")
+
+        calc.record_usage(100, 10, cost_usd=0.5, phase_id="01")
+        calc.record_usage(200, 20, cost_usd=0.25, phase_id="expert-frontend")
+        calc.record_tool_call(phase_id="01")
+
+        snapshot = calc.snapshot()
+        assert snapshot["01"]["cost_usd"] == 0.5
+        assert snapshot["01"]["tool_calls"] == 1
+        assert snapshot["expert-frontend"]["input_tokens"] == 200
+
+        assert calc.end_phase("01").cost_usd == 0.5
+        assert calc.get_current_phase().phase_id == "expert-frontend"
+
+    def test_recording_from_threads(self, calc: CostCalculator):
+        """Test no updates are lost under concurrent recording."""
+        phase_ids = ["a", "b"]
+        for phase_id in phase_ids:
+            calc.start_phase(phase_id)
+
+        def record(phase_id: str) -> None:
+            for _ in range(1000):
+                calc.record_usage(1, 1, phase_id=phase_id)
+                calc.record_tool_call(phase_id=phase_id)
+
+        threads = [threading.Thread(target=record, args=(p,)) for p in phase_ids * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for phase_id in phase_ids:
+            phase = calc.end_phase(phase_id)
+            assert phase.input_tokens == 2000
+            assert phase.tool_calls == 2000
+
+
+class TestMetricsCollectorPhases:
+    """Tests for phase-keyed MetricsCollector recording."""
+
+    def test_parallel_phases(self, tmp_path):
+        """Test recording into several active phases."""
+        collector = MetricsCollector(tmp_path)
+        collector.start_project("p")
+        collector.start_phase("01")
+        collector.start_phase("02")
+
+        collector.record_tokens(1_000_000, 0, "claude-sonnet-4", phase_id="01")
+        collector.record_retry(phase_id="01")
+        collector.record_tool_call("Read")
+
+        assert collector.snapshot()["02"]["tool_calls"] == 1
+        first = collector.end_phase(success=False, phase_id="01")
+        assert first.cost_usd == pytest.approx(3.0)
+        assert first.retries == 1
+        assert collector.current_phase.phase_id == "02"
+
+        collector.end_phase()
+        assert collector.end_project().get_summary()["failed_phases"] == 1
@@ -310,6 +310,69 @@ class TestReverseIndexStatistics:
         assert stats["coverage_percent"] == 0
 
 
+class TestReverseIndexPersistence:
+    """Tests for the persisted, incrementally rebuilt index."""
+
+    def test_build_writes_index_file(self, reverse_index):
+        """Test that build persists per-ADR contributions."""
+        reverse_index.build()
+
+        assert reverse_index.index_file.exists()
+        assert reverse_index.index_file.parent.name == ".helix"
+
+    def test_unchanged_adrs_are_not_reparsed(self, project_with_adrs):
+        """Test that a fresh instance reuses the persisted contributions."""
+        from unittest.mock import patch
+
+        ReverseIndex(adr_dir=project_with_adrs / "adr", project_root=project_with_adrs).build()
+
+        second = ReverseIndex(adr_dir=project_with_adrs / "adr", project_root=project_with_adrs)
+        with patch.object(second, "_parse_adr_header") as parse:
+            index = second.build()
+
+        parse.assert_not_called()
+        assert index["src/helix/debug/stream_parser.py"].created_by == "ADR-013"
+
+    def test_changed_adr_replaces_only_its_entries(self, project_with_adrs, sample_adr_content_proposed):
+        """Test that only the changed ADR is re-parsed."""
+        from unittest.mock import patch
+
+        adr_dir = project_with_adrs / "adr"
+        ReverseIndex(adr_dir=adr_dir, project_root=project_with_adrs).build()
+
+        (adr_dir / "015-new-feature.md").write_text(sample_adr_content_proposed)
+
+        second = ReverseIndex(adr_dir=adr_dir, project_root=project_with_adrs)
+        with patch.object(second, "_parse_adr_header", wraps=second._parse_adr_header) as parse:
+            index = second.build()
+
+        assert [call.args[0].name for call in parse.call_args_list] == ["015-new-feature.md"]
+        assert index["src/helix/new/feature.py"].status == FileStatus.ORPHANED
+
+    def test_watch_rebuilds_on_adr_change(self, project_with_adrs, sample_adr_content_proposed):
+        """Test that watch mode picks up new ADRs without invalidate()."""
+        adr_dir = project_with_adrs / "adr"
+        index = ReverseIndex(adr_dir=adr_dir, project_root=project_with_adrs, watch=True)
+        assert index.lookup("src/helix/new/feature.py") is None
+
+        (adr_dir / "015-new-feature.md").write_text(sample_adr_content_proposed)
+
+        assert index.lookup("src/helix/new/feature.py").created_by == "ADR-015"
+        assert [f.path for f in index.get_by_adr("015")] == ["src/helix/new/feature.py"]
+
+    def test_refresh_exists(self, reverse_index, project_with_adrs):
+        """Test that exists flags can be refreshed without re-reading ADRs."""
+        assert reverse_index.lookup("src/helix/debug/event_handler.py").exists is False
+
+        (project_with_adrs / "src" / "helix" / "debug" / "event_handler.py").write_text("#")
+        reverse_index.refresh_exists()
+
+        info = reverse_index.lookup("src/helix/debug/event_handler.py")
+        assert info.exists is True
+        assert info.status == FileStatus.TRACKED
+        assert reverse_index.get_orphaned() == []
+
+
 class TestFileInfo:
     """Tests for FileInfo dataclass."""
 
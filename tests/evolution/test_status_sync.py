@@ -478,5 +478,112 @@ class TestIntegration:
         assert sync.get_status()["status"] == "integrated"
 
 
+class TestWriteBehind:
+    """Tests for coalesced write-behind persistence."""
+
+    def test_non_terminal_updates_are_deferred(self, temp_project):
+        """Test that start/complete only hit disk after the flush window."""
+        sync = StatusSynchronizer(temp_project, write_behind=True, flush_interval=60)
+
+        sync.start_phase("phase-1")
+
+        assert not (temp_project / "status.json").exists()
+        assert sync.has_pending_writes
+        assert sync.snapshot()["phases"]["phase-1"]["status"] == "running"
+
+        sync.flush()
+        disk_status = json.loads((temp_project / "status.json").read_text())
+        assert disk_status["phases"]["phase-1"]["status"] == "running"
+        assert not sync.has_pending_writes
+
+    def test_updates_are_coalesced(self, temp_project):
+        """Test that many updates in one window produce a single write."""
+        sync = StatusSynchronizer(temp_project, write_behind=True, flush_interval=60)
+
+        with patch.object(sync, "_write_status", wraps=sync._write_status) as write:
+            for i in range(10):
+                sync.start_phase(f"p{i}")
+                sync.complete_phase(f"p{i}")
+            sync.flush()
+
+        assert write.call_count == 1
+
+    def test_timer_flushes(self, temp_project):
+        """Test that the coalescing timer writes pending updates."""
+        import time
+
+        sync = StatusSynchronizer(temp_project, write_behind=True, flush_interval=0.01)
+        sync.start_phase("phase-1")
+
+        deadline = time.time() + 2
+        while sync.has_pending_writes and time.time() < deadline:
+            time.sleep(0.01)
+
+        disk_status = json.loads((temp_project / "status.json").read_text())
+        assert disk_status["phases"]["phase-1"]["status"] == "running"
+
+    def test_terminal_states_write_through(self, temp_project):
+        """Test that failure is persisted immediately with earlier updates."""
+        sync = StatusSynchronizer(temp_project, write_behind=True, flush_interval=60)
+
+        sync.start_phase("phase-1")
+        sync.fail_phase("phase-1", "boom")
+
+        disk_status = json.loads((temp_project / "status.json").read_text())
+        assert disk_status["status"] == "failed"
+        assert disk_status["phases"]["phase-1"]["error"] == "boom"
+        assert not sync.has_pending_writes
+
+    def test_close_flushes(self, temp_project):
+        """Test that close() persists pending updates."""
+        with StatusSynchronizer(temp_project, write_behind=True, flush_interval=60) as sync:
+            sync.start_phase("phase-1")
+
+        disk_status = json.loads((temp_project / "status.json").read_text())
+        assert disk_status["phases"]["phase-1"]["status"] == "running"
+
+    def test_get_status_keeps_pending_updates(self, temp_project):
+        """Test that get_status() does not discard unflushed updates."""
+        sync = StatusSynchronizer(temp_project, write_behind=True, flush_interval=60)
+        sync.start_phase("phase-1")
+
+        assert sync.get_status()["phases"]["phase-1"]["status"] == "running"
+
+
+class TestSharedSynchronizer:
+    """Tests for the per-project shared synchronizer."""
+
+    def test_for_project_returns_same_instance(self, temp_project):
+        """Test that one instance is shared per project directory."""
+        first = StatusSynchronizer.for_project(temp_project)
+        second = StatusSynchronizer.for_project(temp_project / ".." / temp_project.name)
+
+        assert first is second
+        assert StatusSynchronizer.get_registered(temp_project) is first
+
+    def test_project_set_status_shares_state(self, temp_project):
+        """Test that EvolutionProject.set_status does not drop phase updates."""
+        from helix.evolution.project import EvolutionProject, EvolutionStatus
+
+        sync = StatusSynchronizer.for_project(
+            temp_project, write_behind=True, flush_interval=60
+        )
+        project = EvolutionProject(temp_project)
+
+        sync.start_phase("phase-1")
+        project.set_status(EvolutionStatus.VALIDATING)
+
+        # Pending state is visible through the project before any flush
+        assert project.get_status() == EvolutionStatus.VALIDATING
+        assert project.get_status_data()["phases"]["phase-1"]["status"] == "running"
+
+        project.set_status(EvolutionStatus.READY)
+
+        disk_status = json.loads((temp_project / "status.json").read_text())
+        assert disk_status["status"] == "ready"
+        assert disk_status["phases"]["phase-1"]["status"] == "running"
+        sync.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
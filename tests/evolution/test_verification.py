@@ -1,9 +1,12 @@
 """Tests for phase verification system."""
 
+import ast
+import os
 import pytest
 from pathlib import Path
 import tempfile
 import shutil
+from unittest.mock import patch
 
 from helix.evolution.verification import PhaseVerifier, VerificationResult
 
@@ -163,9 +166,63 @@ class TestPhaseVerifier:
             phase_dir=phase_dir,
             expected_files=["new/src/module.py"]
         )
-        
+
         assert result.success is True
 
+    def test_verify_glob_patterns(self, temp_project):
+        """Test glob patterns, including recursive ones."""
+        project, phase_dir, output_dir = temp_project
+
+        (output_dir / "src" / "pkg").mkdir(parents=True)
+        (output_dir / "src" / "a.py").write_text("A = 1\n")
+        (output_dir / "src" / "pkg" / "b.py").write_text("B = 2\n")
+        (output_dir / "src" / "notes.md").write_text("# Notes\n")
+
+        verifier = PhaseVerifier(project)
+        result = verifier.verify_phase_output(
+            phase_id="1",
+            phase_dir=phase_dir,
+            expected_files=["src/**/*.py", "docs/*.md"]
+        )
+
+        found = {Path(f).relative_to(output_dir).as_posix() for f in result.found_files}
+        assert {"src/a.py", "src/pkg/b.py"} <= found
+        assert "src/notes.md" not in found
+        assert result.missing_files == ["docs/*.md"]
+
+    def test_verify_lists_each_directory_once(self, temp_project):
+        """Test that candidate locations share one directory snapshot."""
+        project, phase_dir, output_dir = temp_project
+        for name in ["a.py", "b.py", "c.py"]:
+            (output_dir / name).write_text("X = 1\n")
+
+        verifier = PhaseVerifier(project)
+        with patch("helix.evolution.verification.os.scandir", wraps=os.scandir) as scandir:
+            result = verifier.verify_phase_output(
+                phase_id="1",
+                phase_dir=phase_dir,
+                expected_files=["a.py", "b.py", "c.py", "missing.py", "*.py"]
+            )
+
+        listed = [str(c.args[0]) for c in scandir.call_args_list]
+        assert result.missing_files == ["missing.py"]
+        assert len(listed) == len(set(listed))
+
+    def test_syntax_cache_across_retries(self, temp_project):
+        """Test that unchanged files are not parsed again."""
+        project, phase_dir, output_dir = temp_project
+        (output_dir / "good.py").write_text("def hello():\n    return 1\n")
+
+        verifier = PhaseVerifier(project)
+        with patch("helix.evolution.verification.ast.parse", wraps=ast.parse) as parse:
+            for _ in range(3):
+                verifier.verify_phase_output("1", phase_dir, ["good.py"])
+            (output_dir / "good.py").write_text("def broken(\n")
+            result = verifier.verify_phase_output("1", phase_dir, ["good.py"])
+
+        assert parse.call_count == 2
+        assert result.success is False
+
 
 class TestRetryPrompt:
     """Test retry prompt generation."""
@@ -400,6 +400,82 @@ contextual_rules:
         assert result.passed is False
         assert any("Migration" in str(issue.message) for issue in result.issues)
 
+    def test_shared_validator_is_cached(self, temp_dir):
+        """Test that shared() reuses the compiled validator until the rules change."""
+        from helix.adr.completeness import CompletenessValidator
+
+        rules_path = temp_dir / "rules.yaml"
+        rules_path.write_text("contextual_rules: []\n", encoding="utf-8")
+
+        first = CompletenessValidator.shared(rules_path)
+        assert CompletenessValidator.shared(rules_path) is first
+
+        import os
+        stat = rules_path.stat()
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert CompletenessValidator.shared(rules_path) is not first
+
+    def test_check_many(self, minimal_adr_file, major_adr_no_migration, temp_dir):
+        """Test batch validation returns one result per ADR in order."""
+        from helix.adr.completeness import CompletenessValidator
+        from helix.adr import ADRParser
+
+        rules_path = temp_dir / "rules.yaml"
+        rules_path.write_text("""
+contextual_rules:
+  - id: major-needs-migration
+    name: "Major Changes erfordern Migrationsplan"
+    when:
+      change_scope: major
+    require:
+      sections:
+        - name: "Migration"
+    severity: error
+    message: "Migration fehlt"
+""", encoding="utf-8")
+
+        parser = ADRParser()
+        adrs = [parser.parse_file(minimal_adr_file), parser.parse_file(major_adr_no_migration)]
+
+        validator = CompletenessValidator(rules_path=rules_path)
+        results = validator.check_many(adrs)
+
+        assert [r.passed for r in results] == [validator.check(a).passed for a in adrs]
+        assert results[1].passed is False
+
+    def test_section_map_includes_subsections(self):
+        """Test that section text spans sub-sections up to the next sibling."""
+        from helix.adr.completeness import SectionMap
+        from helix.adr import ADRParser
+
+        content = """---
+adr_id: "001"
+title: Test
+status: Proposed
+---
+
+## Kontext
+
+Intro
+
+### Detail
+
+Sub text
+
+## Entscheidung
+
+Done
+"""
+        adr = ADRParser().parse_string(content)
+        section_map = SectionMap(adr)
+
+        assert section_map.find_section("kontext") is adr.sections["Kontext"]
+        text = section_map.section_text("Kontext")
+        assert text.startswith("## Kontext")
+        assert "Sub text" in text
+        assert "Entscheidung" not in text
+        assert section_map.section_text("Missing") == ""
+
 
 # ============================================================================
 # Unit Tests: ConceptDiffer
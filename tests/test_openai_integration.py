@@ -336,5 +336,31 @@ class TestOpenAIFormat:
         assert data["data"][0]["id"] == "helix-consultant"
 
 
+class TestClaudeMdRendering:
+    """Tests for lazy CLAUDE.md regeneration."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_inputs_skip_render(self, mock_session_manager):
+        """CLAUDE.md is only re-rendered when its inputs change."""
+        from helix.api.routes import openai
+
+        session_id, state = mock_session_manager.get_or_create_session(
+            first_message="Hello", conversation_id="render-test"
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        with patch.object(openai.jinja_env, "get_template", wraps=openai.jinja_env.get_template) as get_template:
+            await openai._generate_session_claude_md(session_id, state, {}, messages=messages)
+            await openai._generate_session_claude_md(session_id, state, {}, messages=messages)
+            assert get_template.call_count == 1
+
+            messages.append({"role": "user", "content": "More"})
+            await openai._generate_session_claude_md(session_id, state, {}, messages=messages)
+            assert get_template.call_count == 2
+
+        claude_md = mock_session_manager.get_session_path(session_id) / "CLAUDE.md"
+        assert "More" in claude_md.read_text()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,11 +5,15 @@ to maintain consistent sessions across multiple requests.
 """
 
 import json
+import shutil
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
 import pytest
+from unittest.mock import patch
 
 # Import the session manager module
 import sys
@@ -397,5 +401,217 @@ class TestCacheConsistency:
         assert state1.created_at == state2.created_at
 
 
+class TestSessionCache:
+    """Tests for the in-memory session cache and the append-only transcript."""
+
+    def _session(self, manager):
+        session_id, _ = manager.get_or_create_session(
+            first_message="Hello",
+            conversation_id="cache-conv",
+        )
+        return session_id
+
+    def test_new_turn_appends_instead_of_rewriting(self):
+        """Test that only the new messages are written."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        session_id = self._session(manager)
+        history = [{"role": "user", "content": "Hello"}]
+        manager.save_messages(session_id, history)
+
+        messages_file = manager.base_path / session_id / "context" / "messages.json"
+        before = messages_file.read_bytes()
+        history += [
+            {"role": "assistant", "content": "Hi!"},
+            {"role": "user", "content": "Build a CLI"},
+        ]
+        manager.save_messages(session_id, history)
+
+        assert messages_file.read_bytes().startswith(before.rstrip()[:-1])
+        assert json.loads(messages_file.read_text()) == history
+        assert manager.load_messages(session_id) == history
+
+    def test_edited_history_is_rewritten(self):
+        """Test that a changed earlier message rewrites the transcript."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        session_id = self._session(manager)
+        manager.save_messages(session_id, [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi!"},
+        ])
+
+        edited = [{"role": "user", "content": "Hello again"}]
+        manager.save_messages(session_id, edited)
+
+        assert manager.load_messages(session_id) == edited
+
+    def test_append_after_restart(self):
+        """Test appending to a transcript written by another instance."""
+        tmp_dir = Path(tempfile.mkdtemp())
+        manager1 = SessionManager(base_path=tmp_dir)
+        session_id = self._session(manager1)
+        first = [{"role": "user", "content": "Hello"}]
+        manager1.save_messages(session_id, first)
+
+        manager2 = SessionManager(base_path=tmp_dir)
+        manager2.save_messages(session_id, first + [{"role": "assistant", "content": "Hi!"}])
+
+        assert len(manager2.load_messages(session_id)) == 2
+
+    def test_context_cache_sees_external_changes(self):
+        """Test that context files changed on disk are picked up."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        session_id = self._session(manager)
+        manager.save_context(session_id, "what", "A CLI")
+        assert manager.get_context(session_id) == {"what": "A CLI"}
+
+        context_dir = manager.base_path / session_id / "context"
+        (context_dir / "why.md").write_text("Speed")
+        (context_dir / "what.md").write_text("A web app")
+
+        assert manager.get_context(session_id) == {"what": "A web app", "why": "Speed"}
+
+    def test_state_served_from_cache(self):
+        """Test that unchanged state is not re-read from disk."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        session_id = self._session(manager)
+        manager.update_state(session_id, step="why")
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert manager.get_state(session_id).step == "why"
+
+    def test_lru_eviction(self):
+        """Test that the cache is bounded."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()), cache_size=2)
+        for i in range(3):
+            manager.get_or_create_session(first_message="Hi", conversation_id=f"conv{i}")
+
+        assert list(manager._sessions) == ["conv-conv1", "conv-conv2"]
+        assert manager.get_state("conv-conv0").session_id == "conv-conv0"
+
+    def test_claude_md_render_key(self):
+        """Test the CLAUDE.md render bookkeeping."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        session_id = self._session(manager)
+
+        assert not manager.claude_md_is_current(session_id, "key")
+        (manager.base_path / session_id / "CLAUDE.md").write_text("# Session")
+        manager.mark_claude_md_rendered(session_id, "key")
+
+        assert manager.claude_md_is_current(session_id, "key")
+        assert not manager.claude_md_is_current(session_id, "other")
+
+
+class TestSessionIndex:
+    """Tests for indexed session lookup, listing and archival."""
+
+    def _legacy_session(self, manager, first_message="Build a CLI"):
+        session_id = manager.generate_session_id(first_message)
+        manager.create_session(session_id, first_message)
+        return session_id
+
+    def test_legacy_lookup_uses_index(self):
+        """Test that the first-message hash is found without a directory scan."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        session_id = self._legacy_session(manager)
+        messages = [{"role": "user", "content": "Build a CLI"}]
+
+        with patch.object(Path, "iterdir", side_effect=AssertionError("scanned")):
+            assert manager.get_session_id_from_messages(messages) == session_id
+
+    def test_only_legacy_sessions_found_by_message(self):
+        """Test that random-ID sessions are not matched by their first message."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        manager.get_or_create_session(first_message="Build a CLI")
+        manager.get_or_create_session(first_message="Build a CLI", conversation_id="c1")
+
+        messages = [{"role": "user", "content": "Build a CLI"}]
+        assert not manager.session_exists(manager.get_session_id_from_messages(messages))
+
+    def test_missing_directory_dropped_from_index(self):
+        """Test that a session deleted on disk is not returned."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        session_id = self._legacy_session(manager)
+        shutil.rmtree(manager.base_path / session_id)
+
+        messages = [{"role": "user", "content": "Build a CLI"}]
+        assert not manager.session_exists(manager.get_session_id_from_messages(messages))
+        assert manager.index.find(message_hash=session_id.split("-")[3]) is None
+
+    def test_list_sessions_by_recency(self):
+        """Test listing most recently updated first, with offset and status."""
+        manager = SessionManager(base_path=Path(tempfile.mkdtemp()))
+        for i in range(4):
+            manager.get_or_create_session(first_message="Hi", conversation_id=f"conv{i}")
+        manager.update_state("conv-conv1", status="completed")
+
+        ids = [s.session_id for s in manager.list_sessions()]
+        assert ids == ["conv-conv1", "conv-conv3", "conv-conv2", "conv-conv0"]
+        assert [s.session_id for s in manager.list_sessions(limit=2, offset=1)] == ids[1:3]
+        assert [s.session_id for s in manager.list_sessions(status="completed")] == ["conv-conv1"]
+
+    def test_index_rebuilt_for_existing_sessions(self):
+        """Test that a new index picks up sessions already on disk."""
+        tmp_dir = Path(tempfile.mkdtemp())
+        manager1 = SessionManager(base_path=tmp_dir)
+        manager1.get_or_create_session(first_message="Hi", conversation_id="conv-a")
+        manager1.index.close()
+        manager1.index.db_path.unlink()
+
+        manager2 = SessionManager(base_path=tmp_dir)
+
+        assert [s.session_id for s in manager2.list_sessions()] == ["conv-conv-a"]
+        assert manager2.index.find(conversation_id="conv-a") == "conv-conv-a"
+        assert manager2.rebuild_index() == 1
+
+    def test_index_built_once_by_concurrent_callers(self):
+        """Test that concurrent first lookups share one index rebuild."""
+        tmp_dir = Path(tempfile.mkdtemp())
+        manager1 = SessionManager(base_path=tmp_dir)
+        manager1.get_or_create_session(first_message="Hi", conversation_id="conv-a")
+        manager1.index.close()
+        manager1.index.db_path.unlink()
+        manager = SessionManager(base_path=tmp_dir)
+        rebuild = manager.index.rebuild
+
+        def slow_rebuild(base_path):
+            time.sleep(0.05)
+            return rebuild(base_path)
+
+        results = []
+        with patch.object(manager.index, "rebuild", side_effect=slow_rebuild) as mock:
+            threads = [
+                threading.Thread(target=lambda: results.append(
+                    [state.session_id for state in manager.list_sessions()]
+                ))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock.call_count == 1
+        assert results == [["conv-conv-a"]] * 4
+
+    def test_archive_stale_sessions(self):
+        """Test that stale sessions are compressed and no longer listed."""
+        tmp_dir = Path(tempfile.mkdtemp()) / "sessions"
+        manager = SessionManager(base_path=tmp_dir)
+        manager.get_or_create_session(first_message="Hi", conversation_id="old")
+        manager.get_or_create_session(first_message="Hi", conversation_id="new")
+        with manager.index._conn:
+            manager.index._conn.execute(
+                "UPDATE sessions SET updated_at = '2000-01-01T00:00:00' WHERE session_id = 'conv-old'"
+            )
+
+        assert manager.archive_stale_sessions(30, dry_run=True) == ["conv-old"]
+        assert (tmp_dir / "conv-old").exists()
+
+        assert manager.archive_stale_sessions(30) == ["conv-old"]
+        assert not (tmp_dir / "conv-old").exists()
+        assert (tmp_dir.parent / "sessions-archive" / "conv-old.tar.gz").is_file()
+        assert [s.session_id for s in manager.list_sessions()] == ["conv-new"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
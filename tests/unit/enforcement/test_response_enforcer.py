@@ -410,3 +410,85 @@ class TestContextPassing:
         )
 
         assert received_context.get("custom_key") == "custom_value"
+
+
+class TestStreamValidation:
+    """Tests for in-stream validation and early retry."""
+
+    def test_stream_aborts_on_final_error(self, mock_runner):
+        """should_abort becomes True once a final error streamed in."""
+        from helix.enforcement.validators.adr_structure import ADRStructureValidator
+
+        enforcer = ResponseEnforcer(
+            runner=mock_runner,
+            validators=[StepMarkerValidator(), ADRStructureValidator()],
+        )
+        stream = enforcer.start_stream_validation()
+
+        # Only the ADR validator takes part in-stream
+        assert len(stream.checks) == 1
+
+        stream.feed('---\nadr_id: "001"\n')
+        assert not stream.should_abort
+
+        new_issues = stream.feed("title: Test\n---\n")
+        assert [i.code for i in new_issues] == ["MISSING_ADR_FIELD"]
+        assert stream.should_abort
+        assert stream.text == '---\nadr_id: "001"\ntitle: Test\n---\n'
+
+    def test_reset_replaces_rewritten_response(self, mock_runner):
+        """A rewritten response is checked on its own, not appended."""
+        from helix.enforcement.validators.adr_structure import ADRStructureValidator
+
+        enforcer = ResponseEnforcer(runner=mock_runner, validators=[ADRStructureValidator()])
+        stream = enforcer.start_stream_validation()
+        header = (
+            '---\nadr_id: "001"\ntitle: Test\nstatus: Proposed\n'
+            'component_type: TOOL\nclassification: NEW\nchange_scope: minor\n---\n'
+        )
+
+        stream.reset(header + "# ADR-001\n")
+        stream.reset(header + "# ADR-001 (revised)\n")
+
+        assert stream.text == header + "# ADR-001 (revised)\n"
+        assert not stream.should_abort
+
+        stream.reset('---\nadr_id: "001"\n---\n')
+        assert stream.should_abort
+
+    def test_validator_without_incremental_support(self, mock_runner, failing_validator):
+        """Validators without start_incremental() never abort the stream."""
+        enforcer = ResponseEnforcer(runner=mock_runner, validators=[failing_validator])
+        stream = enforcer.start_stream_validation()
+
+        stream.feed("anything")
+
+        assert stream.checks == []
+        assert not stream.should_abort
+
+    @pytest.mark.asyncio
+    async def test_early_issues_retry_right_away(self, mock_runner):
+        """With early issues the retry starts right away with all issues."""
+        from .conftest import MockRunResult
+
+        validator = StepMarkerValidator()
+        mock_runner.continue_session.return_value = MockRunResult(
+            stdout="Fixed response\n<!-- STEP: done -->"
+        )
+        mock_runner.continue_session.return_value.session_id = "session-2"
+        enforcer = ResponseEnforcer(runner=mock_runner, validators=[validator])
+        early = [ValidationIssue(code="INVALID_YAML", message="bad", fix_hint="fix")]
+
+        result = await enforcer.enforce_streaming_response(
+            response="partial",
+            session_id="session-1",
+            runner=mock_runner,
+            early_issues=early,
+        )
+
+        assert result.success is True
+        assert result.attempts == 2
+        feedback = mock_runner.continue_session.call_args.kwargs["prompt"]
+        assert "INVALID_YAML" in feedback
+        # Issues of the full validation are merged into the feedback
+        assert "MISSING_STEP_MARKER" in feedback
@@ -454,3 +454,63 @@ class TestValidatorProperties:
         """File validator should have correct name."""
         validator = FileExistenceValidator(helix_root=tmp_path)
         assert validator.name == "file_existence"
+
+
+class TestIncrementalChecks:
+    """Tests for in-stream validation of the YAML header."""
+
+    @staticmethod
+    def _feed_in_chunks(check, text: str, size: int = 7) -> list:
+        """Feed text in small chunks, return issues with the chunk index."""
+        found = []
+        for end in range(size, len(text) + size, size):
+            for issue in check.feed(text[:end]):
+                found.append((end, issue))
+        return found
+
+    def test_adr_header_error_reported_when_header_closes(self):
+        """Missing header fields are reported as soon as the header is complete."""
+        text = '---\nadr_id: "001"\ntitle: Test\n---\n\n## Kontext\n' + "x" * 200
+        check = ADRStructureValidator().start_incremental({})
+
+        found = self._feed_in_chunks(check, text)
+
+        assert [issue.code for _, issue in found] == ["MISSING_ADR_FIELD"]
+        assert found[0][0] < len(text) - 150
+        assert check.done
+
+    def test_adr_valid_header_reports_nothing(self):
+        """A valid header produces no early issues."""
+        text = '---\nadr_id: "001"\ntitle: Test\nstatus: Proposed\n---\n\n## Kontext\n'
+        check = ADRStructureValidator().start_incremental({})
+
+        assert self._feed_in_chunks(check, text) == []
+        assert check.done
+
+    def test_non_adr_frontmatter_ignored(self):
+        """Frontmatter without adr_id is not checked."""
+        check = ADRStructureValidator().start_incremental({})
+
+        assert check.feed("---\nname: other\n---\nbody") == []
+
+    def test_open_header_not_checked(self):
+        """Nothing is reported while the header is still streaming."""
+        check = ADRStructureValidator().start_incremental({})
+
+        assert check.feed('---\nadr_id: "001"\n') == []
+        assert not check.done
+
+    def test_missing_modify_file_reported_early(self, tmp_path):
+        """files.modify references are checked once the header is complete."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "existing.py").write_text("# existing")
+        text = (
+            '---\nadr_id: "001"\ntitle: T\nstatus: Proposed\n'
+            "files:\n  modify:\n    - src/existing.py\n    - src/missing.py\n---\n"
+        )
+        check = FileExistenceValidator(helix_root=tmp_path).start_incremental({})
+
+        found = self._feed_in_chunks(check, text + "## Kontext\n" + "x" * 100)
+
+        assert [issue.code for _, issue in found] == ["FILE_NOT_FOUND"]
+        assert "src/missing.py" in found[0][1].message
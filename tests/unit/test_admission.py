@@ -0,0 +1,148 @@
+"""Tests for the Claude process admission controller.
+
+Tests cover:
+- The global concurrency cap
+- Priority classes and fair queuing per key
+- Cancellation while queued
+- Blocking (thread) callers
+- Queue depth and wait-time metrics
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from helix.admission import AdmissionController, Priority
+
+
+async def _hold(controller, order, name, priority, key, release: asyncio.Event):
+    async with controller.slot(priority, key):
+        order.append(name)
+        await release.wait()
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_cap_queues_instead_of_rejecting(self):
+        controller = AdmissionController(max_concurrent=2)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        tasks = [
+            asyncio.create_task(_hold(controller, order, f"job{i}", Priority.BACKGROUND, "k", release))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        assert controller.active == 2
+        assert controller.queue_depth() == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert order == ["job0", "job1", "job2"]
+        assert controller.active == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_before_background(self):
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+        order: list[str] = []
+        release = asyncio.Event()
+        release.set()
+
+        background = asyncio.create_task(
+            _hold(controller, order, "job", Priority.BACKGROUND, "project", release)
+        )
+        await asyncio.sleep(0)
+        chat = asyncio.create_task(
+            _hold(controller, order, "chat", Priority.INTERACTIVE, "user", release)
+        )
+        await asyncio.sleep(0)
+
+        controller.release()
+        await asyncio.gather(background, chat)
+        assert order == ["chat", "job"]
+
+    @pytest.mark.asyncio
+    async def test_round_robin_between_keys(self):
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+        order: list[str] = []
+        release = asyncio.Event()
+        release.set()
+
+        tasks = []
+        for name, key in [("a1", "alice"), ("a2", "alice"), ("a3", "alice"), ("b1", "bob")]:
+            tasks.append(asyncio.create_task(
+                _hold(controller, order, name, Priority.INTERACTIVE, key, release)
+            ))
+            await asyncio.sleep(0)
+
+        controller.release()
+        await asyncio.gather(*tasks)
+        assert order == ["a1", "b1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.queue_depth() == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.queue_depth() == 0
+
+        controller.release()
+        assert controller.active == 0
+
+    @pytest.mark.asyncio
+    async def test_blocking_slot_from_thread(self):
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+        entered = threading.Event()
+
+        def worker():
+            with controller.slot_blocking(Priority.VERIFICATION, "consultant"):
+                entered.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        await asyncio.sleep(0.05)
+        assert not entered.is_set()
+        assert controller.queue_depth(Priority.VERIFICATION) == 1
+
+        controller.release()
+        thread.join(timeout=5)
+        assert entered.is_set()
+        assert controller.active == 0
+
+    @pytest.mark.asyncio
+    async def test_snapshot_metrics(self):
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire(Priority.BACKGROUND, "project")
+        waiter = asyncio.create_task(controller.acquire(Priority.INTERACTIVE, "user"))
+        await asyncio.sleep(0.01)
+
+        snapshot = controller.snapshot()
+        assert snapshot["active"] == 1
+        assert snapshot["queued"] == 1
+        assert snapshot["priorities"]["interactive"]["queued"] == 1
+
+        controller.release()
+        await waiter
+        stats = controller.snapshot()["priorities"]["interactive"]
+        assert stats["admitted"] == 1
+        assert stats["queued_total"] == 1
+        assert stats["wait_seconds_max"] > 0
+        controller.release()
+
+    def test_invalid_cap(self):
+        with pytest.raises(ValueError):
+            AdmissionController(max_concurrent=0)
@@ -0,0 +1,131 @@
+"""Tests for the Claude CLI simulator and the benchmark suite.
+
+Tests cover:
+- Deterministic stream-json output the StreamParser understands
+- ClaudeRunner runs against the simulator executable
+- The SSE fan-out benchmark
+- Regression detection between results
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from helix.admission import AdmissionController
+from helix.benchmarks import (
+    SimulatorConfig,
+    compare_results,
+    generate_events,
+    install_simulator,
+    run_suite,
+)
+from helix.claude_runner import ClaudeRunner
+from helix.debug import EventType, StreamParser
+
+
+def _results(**metrics: float) -> dict:
+    return {"benchmarks": {"bench": {"params": {}, "metrics": metrics}}}
+
+
+class TestSimulator:
+    """Tests for the simulated stream-json session."""
+
+    def test_same_seed_same_stream(self):
+        config = SimulatorConfig(seed=7, turns=2)
+
+        assert list(generate_events(config, "prompt")) == list(generate_events(config, "prompt"))
+        assert list(generate_events(config)) != list(generate_events(SimulatorConfig(seed=8, turns=2)))
+
+    @pytest.mark.asyncio
+    async def test_stream_parser_understands_output(self):
+        config = SimulatorConfig(turns=3, tools_per_turn=2, tool_mix={"Read": 1.0})
+        parser = StreamParser()
+
+        for event in generate_events(config):
+            await parser.parse_line(json.dumps(event))
+
+        events = parser.get_events()
+        assert len(events) == config.event_count
+        assert events[0].event_type == EventType.SYSTEM_INIT
+        assert events[-1].event_type == EventType.RESULT_SUCCESS
+        assert parser.get_summary()["tool_counts"] == {"Read": 6}
+
+    def test_payload_sizes(self):
+        config = SimulatorConfig(turns=1, tools_per_turn=1, text_bytes=50, tool_result_bytes=300)
+
+        events = list(generate_events(config))
+
+        assert len(events[1]["text"]) == 50
+        assert len(events[3]["content"]) == 300
+
+    @pytest.mark.asyncio
+    async def test_claude_runner_against_simulator(self, tmp_path: Path):
+        config = SimulatorConfig(turns=1, write_files={"output/result.md": "# Result\n"})
+        claude_cmd = install_simulator(tmp_path / "bin", config)
+        phase_dir = tmp_path / "phase"
+        phase_dir.mkdir()
+        runner = ClaudeRunner(
+            claude_cmd=str(claude_cmd),
+            use_stdbuf=False,
+            admission=AdmissionController(max_concurrent=1),
+        )
+
+        result = await runner.run_phase(phase_dir, prompt="hello")
+        resumed = await runner.continue_session(result.session_id, "again", cwd=phase_dir)
+
+        assert result.success is True
+        assert result.cost_usd > 0
+        assert result.output_tokens > 0
+        assert (phase_dir / "output" / "result.md").read_text() == "# Result\n"
+        assert resumed.session_id == result.session_id
+        assert await runner.check_availability() is True
+
+    @pytest.mark.asyncio
+    async def test_error_exit_code(self, tmp_path: Path):
+        claude_cmd = install_simulator(tmp_path / "bin", SimulatorConfig(exit_code=2))
+        runner = ClaudeRunner(
+            claude_cmd=str(claude_cmd),
+            use_stdbuf=False,
+            admission=AdmissionController(max_concurrent=1),
+        )
+
+        result = await runner.run_phase(tmp_path, prompt="hello")
+
+        assert result.success is False
+        assert result.exit_code == 2
+
+
+class TestBenchmarkSuite:
+    """Tests for running and comparing benchmarks."""
+
+    @pytest.mark.asyncio
+    async def test_sse_fanout_quick(self, tmp_path: Path):
+        results = await run_suite(tmp_path, only=["sse_fanout"], quick=True)
+
+        metrics = results["benchmarks"]["sse_fanout"]["metrics"]
+        assert results["version"] == 1
+        assert metrics["events_per_second"] > 0
+        assert metrics["latency_max_seconds"] >= metrics["latency_p50_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_benchmark(self):
+        with pytest.raises(ValueError):
+            await run_suite(only=["nope"])
+
+    def test_compare_directions(self):
+        baseline = _results(run_seconds=1.0, events_per_second=100.0, events=10.0)
+        current = _results(run_seconds=1.5, events_per_second=25.0, events=1.0)
+
+        regressions = compare_results(baseline, current)
+
+        assert [(r.metric, round(r.change, 2)) for r in regressions] == [
+            ("events_per_second", 0.75),
+            ("run_seconds", 0.5),
+        ]
+
+    def test_compare_within_threshold(self):
+        baseline = _results(run_seconds=1.0, events_per_second=100.0)
+        current = _results(run_seconds=1.05, events_per_second=120.0)
+
+        assert compare_results(baseline, current, threshold=0.10) == []
@@ -2,7 +2,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-from helix.consultant import ConsultantMeeting, ExpertManager, ExpertConfig
+from helix.consultant import ConsultantMeeting, ExpertManager, ExpertConfig, TriggerMatcher
 
 
 class TestExpertManager:
@@ -41,3 +41,167 @@ class TestExpertManager:
             assert hasattr(config, "triggers")
 
 
+
+    def test_suggest_experts_prefers_whole_words(self):
+        """Whole-word trigger matches should outrank substring matches."""
+        manager = ExpertManager(config_path=Path("/nonexistent/experts.yaml"))
+        # "posital" is a whole word (encoder), "sap" only occurs in "sapling"
+        selected = manager.suggest_experts("posital sapling")
+
+        assert selected[0] == "encoder"
+        assert "erp" in selected
+
+    def test_suggest_experts_default(self):
+        """Should fall back to helix when nothing matches."""
+        manager = ExpertManager(config_path=Path("/nonexistent/experts.yaml"))
+
+        assert manager.suggest_experts("hello there") == ["helix"]
+
+    def test_matcher_reloads_on_config_change(self, tmp_path):
+        """Should rebuild the matcher when the YAML file changes."""
+        import os
+
+        config = tmp_path / "experts.yaml"
+        config.write_text("experts:\n  alpha:\n    name: Alpha\n    triggers: [foo]\n")
+        manager = ExpertManager(config_path=config)
+        assert manager.suggest_experts("foo") == ["alpha"]
+
+        config.write_text(
+            "experts:\n  beta:\n    name: Beta\n"
+            "    triggers:\n      - {term: foo, weight: 3}\n"
+        )
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.suggest_experts("foo") == ["beta"]
+        assert manager.load_experts()["beta"].trigger_weights == {"foo": 3.0}
+
+
+class TestTriggerMatcher:
+    """Tests for the Aho-Corasick TriggerMatcher."""
+
+    def test_overlapping_triggers(self):
+        """Should find triggers that overlap or contain each other."""
+        matcher = TriggerMatcher({
+            "db": {"postgres": 1.0, "postgresql": 1.0, "sql": 1.0},
+        })
+
+        matches = matcher.find_matches("Migrate to PostgreSQL now")
+
+        assert matches == {"postgres": 1, "postgresql": 2, "sql": 1}
+
+    def test_multi_word_and_punctuated_triggers(self):
+        """Should match triggers with spaces and punctuation as whole words."""
+        matcher = TriggerMatcher({
+            "helix": {"quality gate": 1.0},
+            "infra": {"ci/cd": 1.0},
+        })
+
+        scores = matcher.score("Add a Quality Gate to the CI/CD pipeline")
+
+        assert scores == {"helix": 2, "infra": 2}
+
+    def test_weighted_scoring_shared_trigger(self):
+        """Should credit a shared trigger to every owner with its weight."""
+        matcher = TriggerMatcher({
+            "pdm": {"material": 1.0},
+            "erp": {"material": 2.5},
+        })
+
+        assert matcher.score("material list") == {"pdm": 2.0, "erp": 5.0}
+
+
+class _DelayedLLM:
+    """Fake LLM answering each expert prompt after a per-expert delay."""
+
+    def __init__(self, delays: dict[str, float]):
+        self.delays = delays
+
+    async def complete(self, prompt: str) -> str:
+        import asyncio
+        import json
+
+        if prompt.startswith("Analyze the following user request"):
+            return "{}"  # keep keyword-based selection
+        if prompt.startswith("As Meta-Consultant"):
+            await asyncio.sleep(self.delays.get("synthesis", 0))
+            return json.dumps({
+                "combined_requirements": ["from-llm"],
+                "conflicts_resolved": [],
+                "open_questions": [],
+                "recommended_phases": ["Phase 1: Build"],
+            })
+        for expert_id, delay in self.delays.items():
+            if f'"domain": "{expert_id}"' in prompt:
+                await asyncio.sleep(delay)
+                return json.dumps({
+                    "domain": expert_id,
+                    "findings": [f"{expert_id} finding"],
+                    "requirements": [f"{expert_id} requirement"],
+                })
+        raise AssertionError("unexpected prompt")
+
+
+class TestStreamingAnalyses:
+    """Tests for streamed expert analyses and early synthesis."""
+
+    @pytest.mark.asyncio
+    async def test_analyses_stream_in_completion_order(self, tmp_path):
+        """Should yield the fastest expert first."""
+        llm = _DelayedLLM({"pdm": 0.05, "erp": 0.0})
+        meeting = ConsultantMeeting(llm, ExpertManager())
+
+        order = [
+            expert_id async for expert_id, _ in meeting.stream_expert_analyses(
+                ["pdm", "erp"], "request", {}, tmp_path
+            )
+        ]
+
+        assert order == ["erp", "pdm"]
+        assert (tmp_path / "erp-expert" / "output" / "analysis.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_late_expert_folded_into_synthesis(self, tmp_path):
+        """Late expert finishing during synthesis should be folded in."""
+        llm = _DelayedLLM({"erp": 0.0, "pdm": 0.05, "synthesis": 0.2})
+        meeting = ConsultantMeeting(llm, ExpertManager(), expert_deadline=0.01)
+
+        events = [
+            event async for event in meeting.stream_analyses_and_synthesis(
+                ["pdm", "erp"], "request", {}, tmp_path
+            )
+        ]
+        types = [(e.event_type, e.expert_id) for e in events]
+
+        assert ("expert_late", "pdm") in types
+        assert any(e.event_type == "analysis" and e.late for e in events)
+        final = events[-1]
+        assert final.event_type == "synthesis"
+        assert "pdm requirement" in final.synthesis.combined_requirements
+        assert list(final.analyses) == ["pdm", "erp"]
+
+    @pytest.mark.asyncio
+    async def test_late_expert_dropped_after_synthesis(self, tmp_path):
+        """Late expert still running after synthesis should be dropped."""
+        llm = _DelayedLLM({"erp": 0.0, "pdm": 5.0})
+        meeting = ConsultantMeeting(llm, ExpertManager(), expert_deadline=0.01)
+
+        events = [
+            event async for event in meeting.stream_analyses_and_synthesis(
+                ["pdm", "erp"], "request", {}, tmp_path
+            )
+        ]
+
+        assert ("expert_dropped", "pdm") in [(e.event_type, e.expert_id) for e in events]
+        assert list(events[-1].analyses) == ["erp"]
+
+    @pytest.mark.asyncio
+    async def test_run_still_returns_result(self, tmp_path):
+        """run() should consume the stream and return the MeetingResult."""
+        llm = _DelayedLLM({"erp": 0.0})
+        meeting = ConsultantMeeting(llm, ExpertManager())
+
+        result = await meeting.run(tmp_path, "Export orders to SAP")
+
+        assert result.experts_consulted
+        assert (tmp_path / "output" / "phases.yaml").exists()
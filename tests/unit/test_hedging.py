@@ -0,0 +1,154 @@
+"""Tests for hedged model escalation.
+
+Tests cover:
+- Hedged MODEL_SWITCH actions from the EscalationManager
+- Racing candidates in isolated phase copies
+- Cancelling the losers and the cost cap
+- Per-candidate accounting in the metrics
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from helix.claude_runner import ClaudeResult
+from helix.escalation import ActionType, EscalationManager, EscalationState
+from helix.hedging import HedgedPhaseRunner
+from helix.observability.metrics import MetricsCollector
+from helix.quality_gates import GateResult
+
+
+@pytest.fixture
+def phase_dir(tmp_path: Path) -> Path:
+    phase_dir = tmp_path / "project" / "phases" / "01-build"
+    phase_dir.mkdir(parents=True)
+    (phase_dir / "CLAUDE.md").write_text("# Build\n")
+    return phase_dir
+
+
+def _runner(
+    delays: dict[str, float], passing: set[str], cost: float = 1.0
+) -> tuple[MagicMock, MagicMock]:
+    """Claude and gate runner mocks: each model writes its name, then sleeps."""
+    async def run_phase(phase_dir, model, **_):
+        (phase_dir / "result.txt").write_text(model)
+        await asyncio.sleep(delays[model])
+        return ClaudeResult(
+            success=True, exit_code=0, stdout="", stderr="",
+            usage={"input_tokens": 100, "output_tokens": 10}, cost_usd=cost,
+        )
+
+    async def run_gate(phase_dir, gate_config):
+        model = (phase_dir / "result.txt").read_text()
+        return GateResult(passed=model in passing, gate_type="files_exist", message=model)
+
+    claude_runner = MagicMock()
+    claude_runner.run_phase = AsyncMock(side_effect=run_phase)
+    gate_runner = MagicMock()
+    gate_runner.run_gate = AsyncMock(side_effect=run_gate)
+    return claude_runner, gate_runner
+
+
+class TestHedgedEscalationAction:
+    """Tests for hedged model switches in the EscalationManager."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_by_default(self, tmp_path: Path):
+        state = EscalationState(phase_id="01", attempt_count=2)
+
+        action = await EscalationManager().trigger_stufe_1(tmp_path, state)
+
+        assert action.action_type == ActionType.MODEL_SWITCH
+        assert "hedged" not in action.parameters
+
+    @pytest.mark.asyncio
+    async def test_phase_config_enables_hedging(self, tmp_path: Path):
+        state = EscalationState(
+            phase_id="01",
+            attempt_count=2,
+            context={"hedge": {"models": 5, "max_cost_usd": 3.0}},
+        )
+
+        action = await EscalationManager().trigger_stufe_1(tmp_path, state)
+
+        assert action.parameters["hedged"] is True
+        assert action.parameters["models"] == ["claude-3-sonnet", "claude-3-opus"]
+        assert action.parameters["max_cost_usd"] == 3.0
+
+    def test_next_models_at_end_of_path(self):
+        manager = EscalationManager(hedge_width=3)
+        state = EscalationState(phase_id="01", context={"current_model": "claude-3-opus"})
+
+        assert manager._get_next_models(state, 3) == ["claude-3-opus"]
+
+
+class TestHedgedPhaseRunner:
+    """Tests for HedgedPhaseRunner."""
+
+    @pytest.mark.asyncio
+    async def test_first_passing_candidate_wins(self, phase_dir: Path):
+        claude_runner, gate_runner = _runner({"fast": 0.0, "slow": 5.0}, passing={"fast", "slow"})
+
+        result = await HedgedPhaseRunner(claude_runner, gate_runner).run(
+            phase_dir, ["slow", "fast"], {"type": "files_exist"}
+        )
+
+        assert result.winner.model == "fast"
+        assert {c.model: c.status for c in result.candidates} == {
+            "slow": "cancelled", "fast": "passed",
+        }
+        assert (phase_dir / "result.txt").read_text() == "fast"
+        assert (phase_dir / "CLAUDE.md").exists()
+        assert sorted(p.name for p in phase_dir.parent.iterdir()) == ["01-build"]
+
+    @pytest.mark.asyncio
+    async def test_failing_candidate_does_not_win(self, phase_dir: Path):
+        claude_runner, gate_runner = _runner({"fast": 0.0, "slow": 0.01}, passing={"slow"})
+
+        result = await HedgedPhaseRunner(claude_runner, gate_runner).run(
+            phase_dir, ["fast", "slow"], {"type": "files_exist"}
+        )
+
+        assert result.winner.model == "slow"
+        assert result.candidates[0].status == "failed"
+        assert result.total_cost_usd == 2.0
+
+    @pytest.mark.asyncio
+    async def test_no_winner_leaves_phase_dir_untouched(self, phase_dir: Path):
+        claude_runner, gate_runner = _runner({"a": 0.0, "b": 0.0}, passing=set())
+
+        result = await HedgedPhaseRunner(claude_runner, gate_runner).run(
+            phase_dir, ["a", "b"], {"type": "files_exist"}
+        )
+
+        assert result.winner is None
+        assert not (phase_dir / "result.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_cost_cap_cancels_remaining(self, phase_dir: Path):
+        claude_runner, gate_runner = _runner({"a": 0.0, "b": 5.0}, passing=set(), cost=2.0)
+
+        result = await HedgedPhaseRunner(claude_runner, gate_runner, max_cost_usd=1.5).run(
+            phase_dir, ["a", "b"], {"type": "files_exist"}
+        )
+
+        assert result.budget_exhausted is True
+        assert result.candidates[1].status == "over_budget"
+
+
+class TestHedgeMetrics:
+    """Tests for per-candidate accounting."""
+
+    def test_candidates_count_towards_phase_cost(self, tmp_path: Path):
+        collector = MetricsCollector(tmp_path)
+        collector.start_phase("01-build")
+
+        collector.record_hedge_candidate("claude-3-sonnet", 100, 10, 0.5, "passed")
+        collector.record_hedge_candidate("claude-3-opus", 0, 0, 0.0, "cancelled")
+        phase = collector.end_phase()
+
+        assert phase.cost_usd == 0.5
+        assert [c["status"] for c in phase.hedge_candidates] == ["passed", "cancelled"]
+        assert type(phase).from_dict(phase.to_dict()).hedge_candidates == phase.hedge_candidates
@@ -0,0 +1,88 @@
+"""Tests for the OpenMetrics registry and the /metrics endpoint.
+
+Tests cover:
+- Counter, gauge and histogram rendering
+- Label handling and registration conflicts
+- The /metrics endpoint and HTTP request instrumentation
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from helix.observability.registry import CONTENT_TYPE, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Tests for metric families and exposition."""
+
+    def test_counter_and_gauge(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("app_requests", "Requests", labelnames=("status",))
+        depth = registry.gauge("app_depth", "Depth")
+
+        requests.labels("200").inc()
+        requests.labels(status="200").inc(2)
+        requests.labels("500").inc()
+        depth.set_function(lambda: 7)
+
+        text = registry.render()
+        assert 'app_requests_total{status="200"} 3.0' in text
+        assert 'app_requests_total{status="500"} 1.0' in text
+        assert "# TYPE app_depth gauge" in text
+        assert "app_depth 7.0" in text
+        assert text.endswith("# EOF\n")
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("app_seconds", "Latency", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 5.0):
+            latency.observe(value)
+
+        text = registry.render()
+        assert 'app_seconds_bucket{le="0.1"} 2' in text
+        assert 'app_seconds_bucket{le="1.0"} 3' in text
+        assert 'app_seconds_bucket{le="+Inf"} 4' in text
+        assert "app_seconds_count 4" in text
+        assert "app_seconds_sum 5.65" in text
+
+    def test_get_or_create(self):
+        registry = MetricsRegistry()
+        first = registry.counter("app_total_things", "Things")
+
+        assert registry.counter("app_total_things", "Things") is first
+        with pytest.raises(ValueError):
+            registry.gauge("app_total_things", "Things")
+
+    def test_label_errors(self):
+        registry = MetricsRegistry()
+        labelled = registry.histogram("app_gate_seconds", "Gates", labelnames=("gate",))
+
+        with pytest.raises(ValueError):
+            labelled.observe(1.0)
+        with pytest.raises(ValueError):
+            labelled.labels("a", "b")
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("app_errors", "Errors", labelnames=("msg",)).labels('say "hi"\n').inc()
+
+        assert 'app_errors_total{msg="say \\"hi\\"\\n"} 1.0' in registry.render()
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_scrape_includes_http_metrics(self):
+        from helix.api.main import app
+
+        client = TestClient(app)
+        client.get("/health")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert 'helix_http_requests_total{method="GET",route="/health",status="200"}' in response.text
+        assert "# TYPE helix_http_request_duration_seconds histogram" in response.text
+        assert "helix_sse_queue_depth" in response.text
+        assert response.text.endswith("# EOF\n")
@@ -0,0 +1,136 @@
+"""Tests for the MCP hardware server's audit store.
+
+Tests cover:
+- Per-station and time-window queries across days
+- Import of pre-existing JSONL files
+- Retention compaction
+- Durability of queued entries at close and interpreter exit
+- Writer survival of bad entries and use after close
+"""
+
+import json
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+HARDWARE_DIR = Path(__file__).resolve().parents[2] / "mcp" / "hardware"
+sys.path.insert(0, str(HARDWARE_DIR))
+
+from audit import AuditEntry, AuditLogger  # noqa: E402
+
+
+@pytest.fixture
+def audit_logger(tmp_path: Path):
+    logger = AuditLogger(log_dir=tmp_path)
+    yield logger
+    logger.close()
+
+
+def _entry(station: str, days_ago: int, operation: str = "connect") -> dict:
+    ts = datetime.utcnow() - timedelta(days=days_ago)
+    return {
+        "timestamp": ts.isoformat() + "Z", "station": station, "operation": operation,
+        "session_id": "s1", "result": "success", "duration_ms": 5, "details": None,
+    }
+
+
+class TestAuditLogger:
+    """Tests for the indexed audit store."""
+
+    def test_station_history_newest_first(self, audit_logger: AuditLogger):
+        for i in range(5):
+            audit_logger.log("alpha", "halt", "s1", "success", i, {"n": i})
+        audit_logger.log("beta", "go", "s2", "success", 1)
+
+        history = audit_logger.get_station_history("alpha", limit=3)
+
+        assert [e["duration_ms"] for e in history] == [4, 3, 2]
+        assert history[0]["details"] == {"n": 4}
+        assert len(audit_logger.get_recent()) == 6
+        assert audit_logger.get_station_history("gamma") == []
+
+    def test_jsonl_written_in_batches(self, audit_logger: AuditLogger, tmp_path: Path):
+        for _ in range(50):
+            audit_logger.log("alpha", "memory_read", "s1", "success", 1)
+        audit_logger.flush()
+
+        daily = tmp_path / f"audit-{datetime.utcnow():%Y-%m-%d}.jsonl"
+        assert len(daily.read_text().splitlines()) == 50
+
+    def test_imports_jsonl_and_queries_window(self, tmp_path: Path):
+        old = tmp_path / "audit-2000-01-01.jsonl"
+        entries = [_entry("alpha", 3), _entry("alpha", 1), _entry("beta", 1)]
+        old.write_text("".join(json.dumps(e) + "\n" for e in entries) + "not json\n")
+
+        logger = AuditLogger(log_dir=tmp_path, retention_days=0)
+        try:
+            since = (datetime.utcnow() - timedelta(days=2)).isoformat()
+            window = logger.get_station_history("alpha", since=since)
+
+            assert len(logger.get_station_history("alpha")) == 2
+            assert [e["timestamp"] for e in window] == [entries[1]["timestamp"]]
+        finally:
+            logger.close()
+
+    def test_compact_applies_retention(self, audit_logger: AuditLogger, tmp_path: Path):
+        audit_logger.flush()
+        old_day = datetime.utcnow() - timedelta(days=40)
+        (tmp_path / f"audit-{old_day:%Y-%m-%d}.jsonl").write_text("")
+        with audit_logger._conn:
+            audit_logger._conn.execute(
+                audit_logger._insert_sql(),
+                audit_logger._row(AuditEntry(**_entry("alpha", 40))),
+            )
+        audit_logger.log("alpha", "halt", "s1", "success", 1)
+        audit_logger.flush()
+
+        assert audit_logger.compact() == 1
+        assert len(audit_logger.get_station_history("alpha")) == 1
+        assert not list(tmp_path.glob(f"audit-{old_day:%Y-%m-%d}.jsonl"))
+
+    def test_close_writes_all_queued_entries(self, tmp_path: Path):
+        logger = AuditLogger(log_dir=tmp_path)
+        for i in range(2000):
+            logger.log("alpha", "memory_read", "s1", "success", i)
+        logger.close()
+
+        reopened = AuditLogger(log_dir=tmp_path)
+        try:
+            assert len(reopened.query(limit=5000)) == 2000
+        finally:
+            reopened.close()
+
+    def test_bad_details_do_not_stop_writer(self, audit_logger: AuditLogger):
+        audit_logger.log("alpha", "flash", "s1", "success", 1, details={"path": object()})
+        audit_logger.flush()
+        audit_logger.log("alpha", "halt", "s1", "success", 2)
+
+        assert [e["operation"] for e in audit_logger.query()] == ["halt"]
+        assert audit_logger._writer.is_alive()
+
+    def test_log_and_query_after_close(self, audit_logger: AuditLogger):
+        audit_logger.log("alpha", "connect", "s1", "success", 1)
+        audit_logger.close()
+
+        audit_logger.log("alpha", "release", "s1", "success", 2)
+
+        assert [e["operation"] for e in audit_logger.query()] == ["release", "connect"]
+
+    def test_global_logger_written_at_exit(self, tmp_path: Path):
+        script = (
+            "import sys; from pathlib import Path; import audit as m\n"
+            "m.audit._log_dir = Path(sys.argv[1]); m.audit.db_path = Path(sys.argv[1]) / 'audit.db'\n"
+            "for i in range(2000): m.audit.log('alpha', 'halt', 's1', 'success', i)\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", script, str(tmp_path)], cwd=HARDWARE_DIR, check=True
+        )
+
+        reopened = AuditLogger(log_dir=tmp_path)
+        try:
+            assert len(reopened.query(limit=5000)) == 2000
+        finally:
+            reopened.close()
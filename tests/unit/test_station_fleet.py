@@ -0,0 +1,113 @@
+"""Tests for the MCP hardware server's fleet operations.
+
+Tests cover:
+- Lock-aware station selection
+- Holding station locks while the operation runs
+- Bounded parallelism and per-station error isolation
+- Result table formatting
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "mcp" / "hardware"))
+
+from fleet import (  # noqa: E402
+    FleetResult,
+    format_fleet_table,
+    hold_lock,
+    run_fleet,
+    select_stations,
+)
+from locking import StationLocker  # noqa: E402
+
+STATIONS = ["alpha", "beta", "gamma"]
+
+
+class TestSelectStations:
+    """Tests for choosing the stations a fleet run may touch."""
+
+    def test_skips_stations_of_other_sessions(self):
+        locker = StationLocker()
+        locker.acquire("alpha", "me")
+        locker.acquire("beta", "other")
+
+        runnable, skipped = select_stations(STATIONS, None, locker, "me")
+
+        assert runnable == ["alpha", "gamma"]
+        assert skipped == [FleetResult("beta", "skipped", "locked by other")]
+
+    def test_requested_and_unknown_stations(self):
+        runnable, skipped = select_stations(
+            STATIONS, ["gamma", "delta", "gamma"], StationLocker(), "me"
+        )
+
+        assert runnable == ["gamma"]
+        assert [(r.station, r.result) for r in skipped] == [("delta", "unknown")]
+
+
+class TestRunFleet:
+    """Tests for concurrent fleet runs."""
+
+    async def test_bounded_parallelism(self):
+        running = 0
+        peak = 0
+
+        async def operation(station: str) -> tuple[str, str]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return "success", station.upper()
+
+        results = await run_fleet([f"s{i}" for i in range(8)], operation, max_parallel=3)
+
+        assert peak == 3
+        assert [r.message for r in results] == [f"S{i}" for i in range(8)]
+
+    async def test_errors_stay_per_station(self):
+        async def operation(station: str) -> tuple[str, str]:
+            if station == "beta":
+                raise ConnectionError("unreachable")
+            return "success", "ok"
+
+        results = await run_fleet(STATIONS, operation)
+
+        assert [r.result for r in results] == ["success", "error", "success"]
+        assert results[1].message == "unreachable"
+
+    async def test_station_locked_during_run_is_skipped(self):
+        locker = StationLocker()
+        locker.acquire("gamma", "me")
+        held = []
+
+        async def operation(station: str) -> tuple[str, str]:
+            held.append(locker.is_locked(station).session_id)
+            if station == "alpha":
+                locker.acquire("beta", "other")
+            return "success", "ok"
+
+        results = await run_fleet(
+            STATIONS, hold_lock(operation, locker, "me"), max_parallel=1
+        )
+
+        assert [r.result for r in results] == ["success", "skipped", "success"]
+        assert results[1].message == "locked by other"
+        assert held == ["me", "me"]
+        # Locks taken for the run are released, the session's own lock stays
+        assert locker.is_locked("alpha") is None
+        assert locker.is_locked("gamma").session_id == "me"
+
+    def test_table(self):
+        results = [
+            FleetResult("alpha", "success", "CPU halted", 12),
+            FleetResult("station-beta", "skipped", "locked by other"),
+        ]
+
+        lines = format_fleet_table("fleet_halt", results, 15).splitlines()
+
+        assert lines[0] == "fleet_halt: 1/2 stations ok (15ms)"
+        assert lines[1].startswith("  alpha        | success ")
+        assert lines[2].endswith("| locked by other")
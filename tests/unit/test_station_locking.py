@@ -0,0 +1,112 @@
+"""Tests for the MCP hardware server's station locker.
+
+Tests cover:
+- FIFO hand-over to waiting sessions (threads and asyncio)
+- Lease renewal and expiry hand-over
+- Persistence across locker instances
+- Wait-time statistics
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "mcp" / "hardware"))
+
+from locking import StationLocker  # noqa: E402
+
+
+class TestStationLocker:
+    """Tests for blocking, fair station locks."""
+
+    def test_non_blocking_acquire(self):
+        locker = StationLocker()
+
+        assert locker.acquire("alpha", "s1")
+        assert locker.acquire("alpha", "s1")  # same session extends
+        assert not locker.acquire("alpha", "s2")
+        assert locker.stats("alpha")["alpha"]["acquisitions"] == 1
+
+    def test_waiters_served_in_fifo_order(self):
+        locker = StationLocker()
+        locker.acquire("alpha", "holder")
+        order: list[str] = []
+
+        def wait_for_lock(session_id: str) -> None:
+            assert locker.acquire("alpha", session_id, wait=5)
+            order.append(session_id)
+            time.sleep(0.01)
+            locker.release("alpha", session_id)
+
+        threads = []
+        for session_id in ("s1", "s2", "s3"):
+            thread = threading.Thread(target=wait_for_lock, args=(session_id,))
+            thread.start()
+            threads.append(thread)
+            while locker.queue_position("alpha", session_id) is None:
+                time.sleep(0.001)
+
+        assert locker.waiting("alpha") == ["s1", "s2", "s3"]
+        locker.release("alpha", "holder")
+        for thread in threads:
+            thread.join()
+
+        assert order == ["s1", "s2", "s3"]
+        stats = locker.stats("alpha")["alpha"]
+        assert stats["waited"] == 3
+        assert stats["max_wait_s"] > 0
+
+    async def test_async_wait_and_timeout(self):
+        locker = StationLocker()
+        locker.acquire("alpha", "holder")
+
+        assert not await locker.acquire_async("alpha", "s1", wait=0.1)
+        assert locker.waiting("alpha") == []
+        assert locker.stats("alpha")["alpha"]["timeouts"] == 1
+
+        waiter = asyncio.create_task(locker.acquire_async("alpha", "s1", wait=5))
+        await asyncio.sleep(0.1)
+        assert locker.queue_position("alpha", "s1") == 1
+        locker.release("alpha", "holder")
+
+        assert await waiter
+        assert locker.is_locked("alpha").session_id == "s1"
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        locker = StationLocker()
+        locker.acquire("alpha", "holder")
+
+        waiter = asyncio.create_task(locker.acquire_async("alpha", "s1", wait=5))
+        await asyncio.sleep(0.1)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert locker.waiting("alpha") == []
+
+    def test_renew_and_expiry_handover(self):
+        locker = StationLocker()
+        locker.acquire("alpha", "s1", timeout=1)
+
+        assert locker.renew("alpha", "s1", timeout=1)
+        assert not locker.renew("alpha", "s2")
+
+        locker.renew("alpha", "s1", timeout=0)
+        assert locker.acquire("alpha", "s2", wait=2)
+        assert not locker.renew("alpha", "s1")
+
+    def test_locks_survive_restart(self, tmp_path: Path):
+        state_file = tmp_path / "locks.json"
+        StationLocker(state_file).acquire("alpha", "s1", timeout=60)
+        StationLocker(state_file).acquire("beta", "s2", timeout=0)
+
+        restarted = StationLocker(state_file)
+        time.sleep(0.01)
+
+        assert restarted.is_locked("alpha").session_id == "s1"
+        assert restarted.is_locked("beta") is None
+        assert not restarted.acquire("alpha", "s3")
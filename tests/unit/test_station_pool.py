@@ -0,0 +1,204 @@
+"""Tests for the MCP hardware server's station connection pool.
+
+Tests cover:
+- Keep-alive reuse against a local fake FPGA controller
+- Per-station concurrency limit
+- Reconnect backoff and health probing
+- Client replacement without aborting concurrent requests
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "mcp" / "hardware"))
+
+from pool import PoolSettings, StationPool, StationUnavailable  # noqa: E402
+
+
+class FakeFpga:
+    """Minimal HTTP/1.1 keep-alive server answering {"success": true}."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._server: asyncio.AbstractServer | None = None
+        self.port = 0
+
+    async def start(self, port: int = 0) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+
+                self.requests += 1
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(self.delay)
+                self.in_flight -= 1
+
+                body = json.dumps({"success": True}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def fpga():
+    server = FakeFpga()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestStationPool:
+    """Tests for pooled FPGA controller connections."""
+
+    async def test_sequential_calls_reuse_connection(self, fpga: FakeFpga):
+        pool = StationPool()
+        client = pool.get("alpha", {"host": "127.0.0.1", "port": fpga.port})
+
+        for _ in range(10):
+            r = await client.request("POST", "/jlink/halt")
+            assert r.json()["success"] is True
+
+        assert pool.get("alpha", {"host": "127.0.0.1", "port": fpga.port}) is client
+        assert fpga.requests == 10
+        assert fpga.connections == 1
+        status = pool.status()["alpha"]
+        assert status["healthy"] and status["requests"] == 10
+        assert status["connections_opened"] == 1
+        await pool.aclose()
+
+    async def test_concurrency_limit(self, fpga: FakeFpga):
+        fpga.delay = 0.02
+        pool = StationPool(PoolSettings(max_concurrent=2))
+        client = pool.get("alpha", {"host": "127.0.0.1", "port": fpga.port})
+
+        await asyncio.gather(*(client.request("GET", "/jlink/registers") for _ in range(8)))
+
+        assert fpga.requests == 8
+        assert fpga.max_in_flight == 2
+        assert fpga.connections <= 2
+        await pool.aclose()
+
+    async def test_backoff_and_probe_recovery(self):
+        fpga = FakeFpga()
+        await fpga.start()
+        port = fpga.port
+        await fpga.stop()
+
+        pool = StationPool(PoolSettings(initial_backoff=0.05, max_backoff=0.2))
+        client = pool.get("alpha", {"host": "127.0.0.1", "port": port})
+
+        with pytest.raises(httpx.ConnectError):
+            await client.request("POST", "/jlink/connect")
+        assert not client.healthy
+
+        # Fails fast while backing off, without touching the network
+        with pytest.raises(StationUnavailable):
+            await client.request("POST", "/jlink/connect")
+        assert client.stats.requests == 1
+
+        await fpga.start(port)
+        try:
+            for _ in range(50):
+                if client.healthy:
+                    break
+                await asyncio.sleep(0.02)
+            assert client.healthy
+
+            r = await client.request("POST", "/jlink/connect")
+            assert r.status_code == 200
+        finally:
+            await pool.aclose()
+            await fpga.stop()
+
+    async def test_failure_does_not_abort_concurrent_requests(self):
+        class Transport(httpx.AsyncBaseTransport):
+            def __init__(self):
+                self.release = asyncio.Event()
+                self.closed = False
+
+            async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+                if request.url.path == "/jlink/connect":
+                    raise httpx.ConnectError("refused", request=request)
+                await self.release.wait()
+                if self.closed:
+                    raise httpx.ReadError("closed", request=request)
+                return httpx.Response(200, json={"success": True})
+
+            async def aclose(self) -> None:
+                self.closed = True
+
+        transport = Transport()
+        pool = StationPool(PoolSettings(max_concurrent=4), transport=transport)
+        client = pool.get("alpha", {"host": "127.0.0.1", "port": 1})
+
+        slow = asyncio.create_task(client.request("GET", "/jlink/registers"))
+        await asyncio.sleep(0)
+        with pytest.raises(httpx.ConnectError):
+            await client.request("POST", "/jlink/connect")
+        assert not transport.closed
+
+        transport.release.set()
+        assert (await slow).status_code == 200
+        # The replaced client is closed once its last request finished
+        assert transport.closed
+        await pool.aclose()
+
+    async def test_moved_station_closes_old_client(self):
+        class Transport(httpx.AsyncBaseTransport):
+            closed = False
+
+            async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+                return httpx.Response(200, json={"success": True})
+
+            async def aclose(self) -> None:
+                self.closed = True
+
+        transport = Transport()
+        pool = StationPool(transport=transport)
+        old = pool.get("alpha", {"host": "127.0.0.1", "port": 1})
+        await old.request("POST", "/jlink/halt")
+
+        new = pool.get("alpha", {"host": "127.0.0.1", "port": 2})
+        assert new is not old and new.base_url == "http://127.0.0.1:2"
+        await asyncio.sleep(0)
+        assert transport.closed
+        await pool.aclose()
+
+    def test_settings_from_config(self):
+        settings = PoolSettings.from_config({"max_concurrent": 4, "unknown": 1})
+
+        assert settings.max_concurrent == 4
+        assert PoolSettings.from_config(None) == PoolSettings()
@@ -0,0 +1,227 @@
+"""Tests for the MCP hardware server's memory and flash transfers.
+
+Tests cover:
+- Hex dump / hex / base64 formatting
+- Batched region reads and the per-region fallback
+- Chunked firmware upload with resume and the multipart fallback
+- Flash history for skip-if-identical
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "mcp" / "hardware"))
+
+from pool import PoolSettings, StationPool  # noqa: E402
+from transfer import (  # noqa: E402
+    FlashHistory,
+    TransferError,
+    file_sha256,
+    format_memory,
+    parse_region,
+    read_regions,
+    upload_firmware,
+)
+
+FPGA = {"host": "fpga", "port": 5000}
+
+
+class FakeController:
+    """In-process FPGA controller for httpx.MockTransport."""
+
+    def __init__(self, batch: bool = True, upload: bool = True):
+        self.batch = batch
+        self.upload = upload
+        self.memory = bytes(range(256)) * 16
+        self.calls: list[str] = []
+        self.received = bytearray()
+        self.fail_chunks = 0
+        self.stuck = False
+        self.batch_limit: int | None = None
+        self.flashed: bytes | None = None
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls.append(f"{request.method} {path}")
+
+        if path == "/jlink/memory":
+            address = int(request.url.params["address"])
+            length = int(request.url.params["length"])
+            return httpx.Response(200, json={
+                "success": True, "data": self.memory[address:address + length].hex(),
+            })
+        if path == "/jlink/memory/batch" and self.batch:
+            regions = json.loads(request.content)["regions"]
+            return httpx.Response(200, json={"success": True, "regions": [
+                {"address": r["address"], "data": self.memory[r["address"]:r["address"] + r["length"]].hex()}
+                if r["address"] < len(self.memory) else {"address": r["address"], "error": "Access fault"}
+                for r in regions[:self.batch_limit]
+            ]})
+        if path == "/jlink/flash/upload" and self.upload:
+            return httpx.Response(200, json={
+                "success": True, "upload_id": "u1", "offset": len(self.received),
+            })
+        if path == "/jlink/flash/upload/u1":
+            if self.fail_chunks:
+                self.fail_chunks -= 1
+                raise httpx.ReadError("connection reset")
+            assert int(request.url.params["offset"]) == len(self.received)
+            if self.stuck:
+                return httpx.Response(200, json={"success": True, "offset": len(self.received)})
+            self.received.extend(request.content)
+            return httpx.Response(200, json={"success": True, "offset": len(self.received)})
+        if path == "/jlink/flash/upload/u1/commit":
+            self.flashed = bytes(self.received)
+            return httpx.Response(200, json={"success": True, "message": "Flashed"})
+        if path == "/jlink/flash":
+            self.flashed = b"multipart"
+            return httpx.Response(200, json={"success": True, "message": "Flashed"})
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+
+def _client(controller: FakeController):
+    pool = StationPool(
+        PoolSettings(initial_backoff=0.0),
+        transport=httpx.MockTransport(controller.handle),
+    )
+    return pool.get("alpha", FPGA)
+
+
+class TestFormatting:
+    """Tests for memory formatting."""
+
+    def test_hexdump_matches_per_byte_format(self):
+        data = bytes(range(40))
+
+        lines = format_memory(data, 0x20000000).splitlines()
+
+        assert lines[0] == "Memory at 0x20000000 (40 bytes):"
+        hex_str = " ".join(f"{b:02X}" for b in data[32:40])
+        ascii_str = "".join(chr(b) if 32 <= b < 127 else "." for b in data[32:40])
+        assert lines[3] == f"  20000020: {hex_str:<48} {ascii_str}"
+        assert lines[2].endswith("................")
+        assert len(lines) == 4
+
+    def test_raw_formats(self):
+        assert format_memory(b"\x01\xab", 0, "hex").splitlines()[1] == "01AB"
+        assert format_memory(b"AB", 0, "base64").splitlines()[1] == "QUI="
+        with pytest.raises(ValueError):
+            format_memory(b"", 0, "octal")
+
+    def test_parse_region(self):
+        assert parse_region("0x40000000:0x20") == (0x40000000, 32)
+        assert parse_region("1024: 16") == (1024, 16)
+        with pytest.raises(ValueError):
+            parse_region("0x40000000")
+
+
+class TestReadRegions:
+    """Tests for batched memory reads."""
+
+    async def test_single_round_trip(self):
+        controller = FakeController()
+        client = _client(controller)
+
+        results = await read_regions(client, [(0, 4), (16, 2), (1 << 20, 4)])
+
+        assert controller.calls == ["POST /jlink/memory/batch"]
+        assert results[0].data == b"\x00\x01\x02\x03"
+        assert results[1].data == b"\x10\x11"
+        assert results[2].error == "Access fault"
+
+    async def test_fallback_without_batch_endpoint(self):
+        controller = FakeController(batch=False)
+        client = _client(controller)
+
+        results = await read_regions(client, [(0, 4), (16, 2)])
+        await read_regions(client, [(32, 1)])
+
+        assert [r.data for r in results] == [b"\x00\x01\x02\x03", b"\x10\x11"]
+        # The missing endpoint is only tried once per station
+        assert controller.calls.count("POST /jlink/memory/batch") == 1
+        assert controller.calls.count("GET /jlink/memory") == 3
+
+    async def test_truncated_batch_response(self):
+        controller = FakeController()
+        controller.batch_limit = 1
+        client = _client(controller)
+
+        results = await read_regions(client, [(0, 4), (16, 2), (32, 1)])
+
+        assert [r.data for r in results] == [b"\x00\x01\x02\x03", b"\x10\x11", b"\x20"]
+        assert controller.calls.count("GET /jlink/memory") == 2
+
+
+class TestUploadFirmware:
+    """Tests for chunked firmware upload."""
+
+    async def test_chunks_with_progress(self, tmp_path: Path):
+        firmware = tmp_path / "app.bin"
+        firmware.write_bytes(bytes(range(256)) * 10)
+        controller = FakeController()
+        progress: list[tuple[int, int]] = []
+
+        async def on_progress(sent: int, total: int) -> None:
+            progress.append((sent, total))
+
+        result = await upload_firmware(
+            _client(controller), firmware, chunk_size=1000, on_progress=on_progress
+        )
+
+        assert result["success"] is True
+        assert controller.flashed == firmware.read_bytes()
+        assert progress == [(1000, 2560), (2000, 2560), (2560, 2560)]
+
+    async def test_resumes_after_network_error(self, tmp_path: Path):
+        firmware = tmp_path / "app.bin"
+        firmware.write_bytes(b"x" * 3000)
+        controller = FakeController()
+        controller.received.extend(b"x" * 1000)  # earlier interrupted upload
+        controller.fail_chunks = 1
+
+        result = await upload_firmware(_client(controller), firmware, chunk_size=1000)
+
+        assert result["success"] is True
+        assert controller.flashed == firmware.read_bytes()
+        assert controller.calls.count("POST /jlink/flash/upload") == 2
+
+    async def test_stuck_offset_fails(self, tmp_path: Path):
+        firmware = tmp_path / "app.bin"
+        firmware.write_bytes(b"x" * 3000)
+        controller = FakeController()
+        controller.stuck = True
+
+        with pytest.raises(TransferError, match="offset 0"):
+            await upload_firmware(_client(controller), firmware, chunk_size=1000)
+
+        assert controller.calls.count("PUT /jlink/flash/upload/u1") == 1
+        assert controller.flashed is None
+
+    async def test_multipart_fallback(self, tmp_path: Path):
+        firmware = tmp_path / "app.hex"
+        firmware.write_text(":00000001FF\n")
+        controller = FakeController(upload=False)
+
+        result = await upload_firmware(_client(controller), firmware)
+
+        assert result["success"] is True
+        assert controller.flashed == b"multipart"
+
+
+class TestFlashHistory:
+    """Tests for the last flashed image per station."""
+
+    def test_persisted(self, tmp_path: Path):
+        firmware = tmp_path / "app.bin"
+        firmware.write_bytes(b"image")
+        path = tmp_path / "flash_history.json"
+
+        FlashHistory(path).record("alpha", firmware.name, file_sha256(firmware))
+
+        history = FlashHistory(path)
+        assert history.last_sha256("alpha") == file_sha256(firmware)
+        assert history.last_sha256("beta") is None
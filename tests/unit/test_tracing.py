@@ -0,0 +1,124 @@
+"""Tests for span tracing.
+
+Tests cover:
+- No-op spans when tracing is off or not sampled
+- Nesting, attributes and the Chrome trace event format
+- Tool spans from a simulated Claude CLI run
+- Export for Perfetto
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from helix.admission import AdmissionController
+from helix.benchmarks import SimulatorConfig, install_simulator
+from helix.claude_runner import ClaudeRunner
+from helix.observability import tracing
+
+
+def _events(path: Path) -> dict[str, dict]:
+    return {e["name"]: e for e in tracing.load_trace_events(path)}
+
+
+class TestSpans:
+    """Tests for span recording."""
+
+    def test_noop_without_trace(self):
+        span = tracing.span("orphan", a=1)
+
+        assert span is tracing.NOOP_SPAN
+        assert not tracing.is_active()
+        with span:
+            span.set(b=2)
+
+    def test_not_sampled(self, tmp_path: Path):
+        path = tmp_path / "trace.jsonl"
+
+        with tracing.trace(path, "root", rate=0.0) as root:
+            assert root is tracing.NOOP_SPAN
+            assert tracing.span("child") is tracing.NOOP_SPAN
+
+        assert not path.exists()
+
+    def test_sample_rate_from_env(self, monkeypatch):
+        monkeypatch.setenv(tracing.TRACE_ENV, "0.25")
+        assert tracing.sample_rate() == 0.25
+        monkeypatch.setenv(tracing.TRACE_ENV, "true")
+        assert tracing.sample_rate() == 1.0
+        monkeypatch.delenv(tracing.TRACE_ENV)
+        assert tracing.sample_rate() == 0.0
+
+    def test_nested_spans(self, tmp_path: Path):
+        path = tmp_path / "trace.jsonl"
+
+        with tracing.trace(path, "root", rate=1.0, project="demo"):
+            with tracing.span("gate", gate_type="files_exist") as gate:
+                gate.set(passed=True)
+            with pytest.raises(ValueError):
+                with tracing.span("verify"):
+                    raise ValueError("boom")
+
+        events = _events(path)
+        root, gate, verify = events["root"], events["gate"], events["verify"]
+        assert root["ph"] == "X"
+        assert root["args"]["project"] == "demo"
+        assert gate["args"]["parent_id"] == root["args"]["span_id"]
+        assert gate["args"]["passed"] is True
+        assert verify["args"]["error"] == "ValueError: boom"
+        assert root["ts"] <= gate["ts"] and gate["ts"] + gate["dur"] <= root["ts"] + root["dur"]
+        assert len({e["args"]["trace_id"] for e in events.values()}) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_get_own_tracks(self, tmp_path: Path):
+        path = tmp_path / "trace.jsonl"
+
+        @tracing.traced("work")
+        async def work() -> None:
+            await asyncio.sleep(0.01)
+
+        with tracing.trace(path, "root", rate=1.0):
+            await asyncio.gather(work(), work())
+
+        work_events = [e for e in tracing.load_trace_events(path) if e["name"] == "work"]
+        assert len(work_events) == 2
+        assert work_events[0]["tid"] != work_events[1]["tid"]
+
+    def test_export_chrome_trace(self, tmp_path: Path):
+        path = tmp_path / "trace.jsonl"
+        with tracing.trace(path, "root", rate=1.0):
+            tracing.record_span("step", 1.0, 1.5)
+
+        count = tracing.export_chrome_trace(path, tmp_path / "trace.json")
+
+        exported = json.loads((tmp_path / "trace.json").read_text())
+        assert count == 2
+        assert exported["traceEvents"][0]["dur"] == 500_000
+
+
+class TestClaudeRunnerSpans:
+    """Tests for spans recorded by ClaudeRunner."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_run_records_tool_spans(self, tmp_path: Path):
+        config = SimulatorConfig(turns=2, tools_per_turn=1, tool_mix={"Read": 1.0})
+        runner = ClaudeRunner(
+            claude_cmd=str(install_simulator(tmp_path / "bin", config)),
+            use_stdbuf=False,
+            admission=AdmissionController(max_concurrent=1),
+        )
+        path = tmp_path / "trace.jsonl"
+
+        async def on_output(stream: str, line: str) -> None:
+            pass
+
+        with tracing.trace(path, "root", rate=1.0):
+            await runner.run_phase_streaming(tmp_path, on_output, prompt="hi")
+
+        names = [e["name"] for e in tracing.load_trace_events(path)]
+        assert names.count("tool.Read") == 2
+        for name in ("claude.admission_wait", "claude.spawn", "claude.first_event",
+                     "claude.run_phase_streaming"):
+            assert name in names
@@ -0,0 +1,127 @@
+"""Tests for the usage ledger and its query surfaces."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from fastapi.testclient import TestClient
+
+from helix.debug.cost_calculator import CostCalculator
+from helix.observability.ledger import UsageLedger, get_usage_ledger
+from helix.observability.metrics import MetricsCollector
+
+
+@pytest.fixture
+def ledger(tmp_path: Path) -> UsageLedger:
+    ledger = UsageLedger(tmp_path / "ledger.db")
+    day1 = datetime(2026, 10, 1, 12, 0)
+    day2 = datetime(2026, 10, 2, 12, 0)
+    ledger.record("alpha", "01", "claude-sonnet-4", 100, 10, 1.0, timestamp=day1)
+    ledger.record("alpha", "02", "claude-sonnet-4", 200, 20, 2.0, timestamp=day1)
+    ledger.record("beta", "01", "claude-opus-4", 300, 30, 5.0, timestamp=day1)
+    ledger.record("beta", "01", "claude-sonnet-4", 400, 40, 0.5, timestamp=day2)
+    yield ledger
+    ledger.close()
+
+
+class TestUsageLedger:
+    """Tests for recording and aggregating usage."""
+
+    def test_spend_per_model_per_day(self, ledger: UsageLedger):
+        rows = ledger.query(("day", "model"))
+
+        assert rows == [
+            {"day": "2026-10-01", "model": "claude-opus-4", "entries": 1,
+             "input_tokens": 300, "output_tokens": 30, "cost_usd": 5.0},
+            {"day": "2026-10-01", "model": "claude-sonnet-4", "entries": 2,
+             "input_tokens": 300, "output_tokens": 30, "cost_usd": 3.0},
+            {"day": "2026-10-02", "model": "claude-sonnet-4", "entries": 1,
+             "input_tokens": 400, "output_tokens": 40, "cost_usd": 0.5},
+        ]
+
+    def test_filters_and_phase_grouping(self, ledger: UsageLedger):
+        rows = ledger.query(("phase",), project="alpha", since="2026-10-01", until="2026-10-01")
+
+        assert [(r["phase"], r["cost_usd"]) for r in rows] == [("02", 2.0), ("01", 1.0)]
+        assert ledger.totals(model="claude-sonnet-4")["cost_usd"] == pytest.approx(3.5)
+        assert ledger.totals(project="nobody")["entries"] == 0
+
+    def test_rebuild_rollups(self, ledger: UsageLedger):
+        before = ledger.query(("day", "project", "model"))
+
+        ledger.rebuild_rollups()
+
+        assert ledger.query(("day", "project", "model")) == before
+
+    def test_unknown_column(self, ledger: UsageLedger):
+        with pytest.raises(ValueError):
+            ledger.query(("cost_usd; DROP TABLE usage",))
+
+    def test_unwritable_database(self, tmp_path: Path):
+        (tmp_path / "dir.db").mkdir()
+
+        assert UsageLedger(tmp_path / "dir.db").record("p", "01", "m", 1, 1, 0.1) is False
+
+
+class TestCollectorsWriteLedger:
+    """Tests for MetricsCollector and CostCalculator ledger entries."""
+
+    def test_metrics_collector(self, tmp_path: Path, ledger: UsageLedger):
+        collector = MetricsCollector(tmp_path, ledger=ledger)
+        collector.start_project("gamma")
+        collector.start_phase("01")
+        collector.record_tokens(1_000_000, 0, "claude-sonnet-4")
+        collector.record_hedge_candidate("claude-opus-4", 10, 10, 0.25, "cancelled")
+
+        rows = ledger.query(("model",), project="gamma")
+        assert {r["model"]: r["cost_usd"] for r in rows} == {
+            "claude-sonnet-4": pytest.approx(3.0),
+            "claude-opus-4": 0.25,
+        }
+
+    def test_cost_calculator_records_phase_totals(self, ledger: UsageLedger):
+        calc = CostCalculator(project_id="delta", ledger=ledger)
+        calc.start_phase("01", model="claude-opus-4")
+        calc.record_usage(100, 10, cost_usd=0.1)
+        calc.record_usage(100, 10, cost_usd=0.3)
+        calc.end_phase()
+
+        totals = ledger.totals(project="delta")
+        assert totals["entries"] == 1
+        assert totals["input_tokens"] == 200
+        assert totals["cost_usd"] == pytest.approx(0.3)
+
+    def test_default_ledger(self, tmp_path: Path):
+        calc = CostCalculator(project_id="eps")
+        calc.start_phase("01")
+        calc.end_phase()
+
+        assert get_usage_ledger().db_path == tmp_path / "usage.db"
+        assert get_usage_ledger().totals(project="eps")["entries"] == 1
+
+
+class TestUsageQuerySurfaces:
+    """Tests for the CLI command and the API endpoint."""
+
+    def test_cli_json(self):
+        from helix.cli.main import cli
+
+        get_usage_ledger().record("cli-project", "01", "gpt-4o", 10, 5, 0.01)
+        result = CliRunner().invoke(cli, ["usage", "--by", "project", "--json"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)[0]["project"] == "cli-project"
+
+    def test_api_endpoint(self):
+        from helix.api.main import app
+
+        get_usage_ledger().record("api-project", "01", "gpt-4o", 10, 5, 0.01)
+        client = TestClient(app)
+
+        response = client.get("/helix/usage", params={"by": ["project", "model"]})
+        assert response.status_code == 200
+        assert response.json()["rows"][0]["project"] == "api-project"
+        assert response.json()["totals"]["entries"] == 1
+        assert client.get("/helix/usage", params={"by": "nope"}).status_code == 400